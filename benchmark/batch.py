@@ -0,0 +1,74 @@
+"""Compare compiling the methods of a module one by one with compiling them
+in a batch, in parallel.
+
+Run with `python benchmark/batch.py`, the speedup depends on the number of
+CPUs.
+"""
+
+import os
+import time
+import tempfile
+import importlib.util
+
+from kirin import batch
+
+KERNEL = """
+@basic(typeinfer=True)
+def kernel_{i}(x: int):
+    acc = 0
+    for i in range(10):
+        acc = acc + i * {i} + helper_{j}(x)
+    if acc > {i}:
+        return acc - x
+    return acc + x
+
+"""
+
+HELPER = """
+@basic(typeinfer=True)
+def helper_{j}(x: int) -> int:
+    return x * {j} + 1
+
+"""
+
+
+def write_module(path: str, n: int, n_helpers: int = 10) -> None:
+    with open(path, "w") as f:
+        f.write("from kirin.prelude import basic\n\n")
+        for j in range(n_helpers):
+            f.write(HELPER.format(j=j))
+        for i in range(n):
+            f.write(KERNEL.format(i=i, j=i % n_helpers))
+
+
+def load(path: str, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def main():
+    n = 200
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "kernels.py")
+        write_module(path, n)
+
+        start = time.perf_counter()
+        load(path, "kernels_serial")
+        serial = time.perf_counter() - start
+        print(f"{'one by one':12} {serial * 1e3:9.1f} ms")
+
+        for workers in sorted({1, 2, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            with batch.compiling(max_workers=workers) as b:
+                load(path, f"kernels_batch_{workers}")
+            elapsed = time.perf_counter() - start
+            print(f"{'batch':6} {workers:3} w  {elapsed * 1e3:9.1f} ms")
+            assert b.report is not None
+            print(b.report.summary())
+
+
+if __name__ == "__main__":
+    main()
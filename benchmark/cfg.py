@@ -0,0 +1,47 @@
+"""Time the analyses cached on a control flow graph: reverse postorder,
+dominator and post-dominator trees, dominance frontiers and loop nest.
+
+Run with `python benchmark/cfg.py`.
+"""
+
+import time
+
+from synthetic import block_chain
+
+from kirin.analysis import CFG
+
+PROPERTIES = (
+    "successors",
+    "reverse_postorder",
+    "dominators",
+    "post_dominators",
+    "dominance_frontiers",
+    "loops",
+)
+
+
+def run(n_blocks: int):
+    cfg = CFG(block_chain(n_blocks).callable_region)
+    times = []
+    for name in PROPERTIES:
+        start = time.perf_counter()
+        getattr(cfg, name)
+        times.append(f"{name} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+    start = time.perf_counter()
+    for name in PROPERTIES:
+        getattr(cfg, name)
+    cached = time.perf_counter() - start
+    print(f"{n_blocks:7} blocks, {len(cfg.loops):5} loops")
+    for line in times:
+        print(f"  {line}")
+    print(f"  cached {cached * 1e6:8.1f} us")
+
+
+def main():
+    run(10_000)
+    run(50_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare `Chain` with and without dispatching rules by statement type.
+
+Run with `python benchmark/chain.py`.
+"""
+
+import timeit
+
+from synthetic import straight_line
+
+from kirin import ir
+from kirin.rewrite import (
+    Walk,
+    Chain,
+    Call2Invoke,
+    InlineAlias,
+    ConstantFold,
+    InlineGetItem,
+    InlineGetField,
+    InlineTypeAssert,
+    DeadCodeElimination,
+)
+
+
+class UnindexedChain(Chain):
+    """Call every rule on every node, like `Chain` before `matches`."""
+
+    def rules_for(self, node_type: type[ir.IRNode]) -> list:
+        return self.rules
+
+
+def main():
+    rules = (
+        ConstantFold(),
+        InlineGetItem(),
+        InlineGetField(),
+        InlineAlias(),
+        InlineTypeAssert(),
+        Call2Invoke(),
+        DeadCodeElimination(),
+    )
+    for n in (10_000, 100_000):
+        method = straight_line(n)
+        old = min(
+            timeit.repeat(
+                lambda: Walk(UnindexedChain(rules)).rewrite(method.code),
+                number=1,
+                repeat=3,
+            )
+        )
+        new = min(
+            timeit.repeat(
+                lambda: Walk(Chain(rules)).rewrite(method.code), number=1, repeat=3
+            )
+        )
+        print(
+            f"{len(rules)} rules, {n:>7} stmts: unindexed {old * 1e3:8.1f} ms, "
+            f"indexed {new * 1e3:8.1f} ms ({old / new:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
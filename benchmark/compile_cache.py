@@ -0,0 +1,60 @@
+"""Time the import of a module defining 100 kernels without the compile
+cache, with a cold cache and with a warm cache.
+
+Run with `python benchmark/compile_cache.py`.
+"""
+
+import time
+import tempfile
+import importlib.util
+from pathlib import Path
+
+from kirin.cache import CompileCache, set_compile_cache
+
+KERNEL = """
+@basic(typeinfer=True)
+def kernel_{i}(x: int, y: float):
+    acc = 0.0
+    for i in range(x):
+        if i > {i}:
+            acc = acc + y * i
+        else:
+            acc = acc - i
+    z = (acc, x, y)
+    return z[0] + helper(x)
+"""
+
+
+def write_module(path: Path, n_kernels: int) -> Path:
+    source = "from kirin.prelude import basic\n\n\n@basic\ndef helper(x: int):\n"
+    source += "    return x * 2\n"
+    source += "".join(KERNEL.format(i=i) for i in range(n_kernels))
+    file = path / "kernels.py"
+    file.write_text(source)
+    return file
+
+
+def import_module(file: Path, name: str) -> float:
+    spec = importlib.util.spec_from_file_location(name, file)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    start = time.perf_counter()
+    spec.loader.exec_module(mod)
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        file = write_module(Path(tmp), 100)
+        print(f"no cache:   {import_module(file, 'kernels_0') * 1e3:8.1f} ms")
+
+        cache = CompileCache(Path(tmp) / "cache")
+        set_compile_cache(cache)
+        print(f"cold cache: {import_module(file, 'kernels_1') * 1e3:8.1f} ms")
+        print(f"warm cache: {import_module(file, 'kernels_2') * 1e3:8.1f} ms")
+        print(f"hits {cache.hits} misses {cache.misses}")
+        set_compile_cache(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare the block-local common subexpression elimination with the
+global value numbering over the dominator tree.
+
+Run with `python benchmark/gvn.py`.
+"""
+
+import time
+
+from synthetic import redundant_blocks
+
+from kirin.rewrite import Walk, Fixpoint, GlobalValueNumbering
+from kirin.rewrite.cse import CommonSubexpressionElimination
+
+
+def run(name: str, n_blocks: int, stmts_per_block: int):
+    def n_stmts(method):
+        return sum(1 for _ in method.code.walk())
+
+    method = redundant_blocks(n_blocks, stmts_per_block)
+    before = n_stmts(method)
+    start = time.perf_counter()
+    Fixpoint(Walk(CommonSubexpressionElimination())).rewrite(method.code)
+    cse = time.perf_counter() - start
+    after_cse = n_stmts(method)
+
+    method = redundant_blocks(n_blocks, stmts_per_block)
+    start = time.perf_counter()
+    GlobalValueNumbering().rewrite(method.code)
+    gvn = time.perf_counter() - start
+    after_gvn = n_stmts(method)
+
+    print(
+        f"{name:14} {before:7} stmts "
+        f"cse {cse * 1e3:9.1f} ms -> {after_cse:7} stmts "
+        f"gvn {gvn * 1e3:9.1f} ms -> {after_gvn:7} stmts"
+    )
+
+
+def main():
+    run("one block", 1, 4_000)
+    run("10k blocks", 10_000, 6)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare the structural comparison of two methods with the comparison of
+their structural hashes, and measure the rehash after a change.
+
+Run with `python benchmark/hashing.py`.
+"""
+
+import time
+
+from synthetic import block_chain, straight_line
+
+from kirin.dialects import py
+
+
+def run(name: str, make, n: int):
+    a, b = make(n), make(n)
+    n_stmts = sum(1 for _ in a.code.walk())
+
+    start = time.perf_counter()
+    assert a.callable_region.is_equal(b.callable_region, {})
+    compare = time.perf_counter() - start
+
+    start = time.perf_counter()
+    a.code.structural_hash()
+    first = time.perf_counter() - start
+    b.code.structural_hash()
+
+    start = time.perf_counter()
+    assert a.code.structural_hash() == b.code.structural_hash()
+    cached = time.perf_counter() - start
+
+    stmt = a.callable_region.blocks[-1].first_stmt
+    py.Constant(0).insert_before(stmt)
+    start = time.perf_counter()
+    a.code.structural_hash()
+    rehash = time.perf_counter() - start
+
+    print(
+        f"{name:14} {n_stmts:7} stmts compare {compare * 1e3:8.2f} ms "
+        f"hash {first * 1e3:8.2f} ms cached {cached * 1e6:6.2f} us "
+        f"rehash {rehash * 1e3:8.2f} ms"
+    )
+
+
+def main():
+    run("straight_line", straight_line, 100_000)
+    run("block_chain", block_chain, 10_000)
+
+
+if __name__ == "__main__":
+    main()
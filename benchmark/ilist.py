@@ -0,0 +1,59 @@
+"""Interpret list kernels with the Python and the NumPy backends of
+`ilist`: building a list in a loop, and mapping and folding simple
+arithmetic methods over a range.
+
+Run with `python benchmark/ilist.py`.
+"""
+
+import time
+
+from kirin.prelude import basic
+from kirin.dialects import ilist
+from kirin.dialects.ilist import array
+
+
+@basic(typeinfer=True)
+def affine(x: int):
+    return x * 3 - 1
+
+
+@basic(typeinfer=True)
+def sum_squares(acc: int, x: int):
+    return acc + x * x
+
+
+@basic(typeinfer=True)
+def map_fold(n: int):
+    return ilist.foldl(sum_squares, ilist.map(affine, ilist.range(n)), 0)
+
+
+@basic(typeinfer=True)
+def build(n: int):
+    xs = []
+    for i in range(n):
+        xs = xs + [i * 2]
+    return xs
+
+
+def run(name: str, method, n: int):
+    times = []
+    for enabled in (False, True):
+        array.set_numpy_backend(enabled)
+        start = time.perf_counter()
+        method(n)
+        times.append(time.perf_counter() - start)
+    array.set_numpy_backend(False)
+    print(
+        f"{name:10} n={n:7}: python {times[0] * 1e3:9.1f} ms, "
+        f"numpy {times[1] * 1e3:9.1f} ms"
+    )
+
+
+def main():
+    run("map+foldl", map_fold, 20_000)
+    run("build", build, 5_000)
+    run("build", build, 20_000)
+
+
+if __name__ == "__main__":
+    main()
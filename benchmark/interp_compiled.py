@@ -0,0 +1,42 @@
+"""Compare the default concrete interpreter with the compiled block mode.
+
+Run with `python benchmark/interp_compiled.py`.
+"""
+
+import timeit
+
+from kirin import interp
+from kirin.prelude import basic, basic_no_opt
+
+
+def make_kernel(group):
+    @group
+    def kernel(n: int):
+        acc = 0
+        for i in range(n):
+            acc = acc + i * 2 - 1
+            if acc > 100000:
+                acc = acc - 100000
+        return acc
+
+    return kernel
+
+
+def main(n: int = 2000, number: int = 5):
+    for name, group in (("basic_no_opt", basic_no_opt), ("basic", basic)):
+        kernel = make_kernel(group)
+        plain = interp.Interpreter(group)
+        fast = interp.Interpreter(group, compiled=True)
+        assert plain.run(kernel, n)[1] == fast.run(kernel, n)[1]
+
+        t_plain = timeit.timeit(lambda: plain.run(kernel, n), number=number)
+        t_fast = timeit.timeit(lambda: fast.run(kernel, n), number=number)
+        print(
+            f"{name:>12}: default {t_plain / number * 1e3:8.2f} ms, "
+            f"compiled {t_fast / number * 1e3:8.2f} ms, "
+            f"speedup {t_plain / t_fast:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare the interpreter, the methods compiled into Python functions by the
+JIT and the same kernels in plain Python.
+
+Run with `python benchmark/jit.py`.
+"""
+
+import time
+
+from kirin.jit import JIT, set_jit
+from kirin.prelude import basic
+
+
+def kernel(n: int, y: float):
+    x = 0.0
+    for i in range(n):
+        if i % 3 == 0:
+            x = x + i * y
+        else:
+            x = x - y
+    return x
+
+
+def nested(n: int):
+    total = 0
+    for i in range(n):
+        for j in range(i, 0, -1):
+            total = total + j % 7
+    return total
+
+
+def run(name: str, function, *args):
+    def elapsed(f, *args) -> float:
+        start = time.perf_counter()
+        f(*args)
+        return time.perf_counter() - start
+
+    set_jit(None)
+    method = basic(typeinfer=True)(function)
+    expected = method(*args)
+    interpreted = elapsed(method, *args)
+
+    set_jit(JIT(threshold=0))
+    start = time.perf_counter()
+    assert method(*args) == expected
+    first = time.perf_counter() - start
+    compiled = elapsed(method, *args)
+    set_jit(None)
+
+    native = elapsed(function, *args)
+    print(
+        f"{name:8} {interpreted * 1e3:8.1f} ms -> {compiled * 1e3:7.2f} ms "
+        f"(first call {first * 1e3:.2f} ms, plain Python {native * 1e3:.2f} ms)"
+    )
+
+
+def main():
+    run("loop", kernel, 100_000, 0.5)
+    run("nested", nested, 450)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure the memory used per statement and the rewrite throughput of
+the core IR nodes.
+
+Run with `python benchmark/layout.py`.
+"""
+
+import gc
+import time
+import tracemalloc
+
+from synthetic import block_chain, dead_chains, straight_line
+
+from kirin.rewrite import Walk, Greedy, Fixpoint
+from kirin.rewrite.dce import DeadCodeElimination
+
+
+def memory(name: str, make, n: int):
+    gc.collect()
+    tracemalloc.start()
+    method = make(n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    n_stmts = sum(1 for _ in method.code.walk())
+    print(f"{name:16} {size / n_stmts:8.1f} bytes/stmt ({n_stmts} stmts)")
+
+
+def rewrite(name: str, make, n: int, rule):
+    method = make(n)
+    n_stmts = sum(1 for _ in method.code.walk())
+    start = time.perf_counter()
+    rule.rewrite(method.code)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:16} {n_stmts / elapsed / 1e3:8.1f} k stmts/s ({elapsed * 1e3:.1f} ms)"
+    )
+
+
+def main():
+    memory("straight_line", straight_line, 100_000)
+    memory("block_chain", block_chain, 10_000)
+
+    rewrite("walk dce", dead_chains, 100_000, Fixpoint(Walk(DeadCodeElimination())))
+    rewrite("greedy dce", dead_chains, 100_000, Greedy(DeadCodeElimination()))
+
+    start = time.perf_counter()
+    method = straight_line(100_000)
+    elapsed = time.perf_counter() - start
+    print(f"{'build':16} {100_000 / elapsed / 1e3:8.1f} k stmts/s")
+    start = time.perf_counter()
+    for stmt in method.callable_region.walk():
+        for arg in stmt.args:
+            arg.uses
+        for result in stmt.results:
+            result.uses, result.type
+    elapsed = time.perf_counter() - start
+    print(f"{'traverse':16} {100_000 / elapsed / 1e3:8.1f} k stmts/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Interpret a kernel with index math in nested loops, before and after
+hoisting the loop-invariant statements.
+
+Run with `python benchmark/licm.py`.
+"""
+
+import time
+
+from kirin.passes import TypeInfer
+from kirin.prelude import basic_no_opt, structural_no_opt
+from kirin.rewrite import LoopInvariantCodeMotion
+
+
+def kernel(n: int, stride: int, offset: int):
+    total = 0
+    for i in range(n):
+        for j in range(n):
+            total = total + (i * (stride * 4 + 1) + j * (offset * stride - 3)) % 7
+    return total
+
+
+def run(name: str, dialects, n: int):
+    def elapsed(method) -> float:
+        start = time.perf_counter()
+        method(n, 3, 5)
+        return time.perf_counter() - start
+
+    method = dialects(kernel)
+    # NOTE: the arithmetic is only hoisted once its operands are known numbers
+    TypeInfer(method.dialects)(method)
+    before = elapsed(method)
+    start = time.perf_counter()
+    LoopInvariantCodeMotion().rewrite(method.code)
+    rewrite = time.perf_counter() - start
+    after = elapsed(method)
+    print(
+        f"{name:10} {n}x{n} loop: {before * 1e3:8.1f} ms -> {after * 1e3:8.1f} ms "
+        f"(rewrite {rewrite * 1e3:.2f} ms)"
+    )
+
+
+def main():
+    run("cf", basic_no_opt, 150)
+    run("scf", structural_no_opt, 150)
+
+
+if __name__ == "__main__":
+    main()
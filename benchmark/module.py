@@ -0,0 +1,110 @@
+"""Time symbol lookups in a `module.Module` with thousands of functions: the
+entry point, and `module.invoke` calls through the cached callee methods,
+compared to a linear scan of the module and a new `Method` per call.
+
+Run with `python benchmark/module.py`.
+"""
+
+import time
+
+from kirin import ir, types
+from kirin.prelude import basic_no_opt
+from kirin.dialects import py, func, module
+
+
+def make_module(n: int, n_calls: int) -> ir.Method:
+    """A module of `n` functions returning a constant, and a `main` function
+    summing `n_calls` invokes of functions spread over the module.
+    """
+    stmts: list[ir.Statement] = [
+        func.Function(
+            sym_name=f"f{i}",
+            body=ir.Region(
+                ir.Block(
+                    [x := py.Constant(i), func.Return(x.result)],
+                    argtypes=(types.Any,),
+                )
+            ),
+            signature=func.Signature(inputs=(), output=types.Int),
+        )
+        for i in range(n)
+    ]
+    body: list[ir.Statement] = [acc := py.Constant(0)]
+    value = acc.result
+    for i in range(n_calls):
+        body.append(call := module.Invoke((), (), callee=f"f{i * n // n_calls}"))
+        body.append(add := py.Add(value, call.result))
+        value = add.result
+    body.append(func.Return(value))
+    stmts.append(
+        func.Function(
+            sym_name="main",
+            body=ir.Region(ir.Block(body, argtypes=(types.Any,))),
+            signature=func.Signature(inputs=(), output=types.Int),
+        )
+    )
+    mod = module.Module(sym_name="bench", entry="main", body=ir.Region(ir.Block(stmts)))
+    dialects = basic_no_opt.add(module)
+    method = ir.Method(dialects=dialects, code=mod)
+    dialects.update_symbol_table(method)
+    return method
+
+
+def linear_scan(mod: module.Module, name: str) -> ir.Statement:
+    for node in mod.body.blocks[0].stmts:
+        trait = node.get_trait(ir.SymbolOpInterface)
+        if trait is not None and trait.get_sym_name(node).unwrap() == name:
+            return node
+    raise KeyError(name)
+
+
+def bench(n: int, n_calls: int = 1_000, repeat: int = 1_000):
+    method = make_module(n, n_calls)
+    mod = method.code
+    assert isinstance(mod, module.Module)
+    entry = module.ModuleEntryPoint()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        linear_scan(mod, "main")
+    scan = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        entry.get_entry_point(mod)
+    indexed = (time.perf_counter() - start) / repeat
+
+    dialects = method.dialects
+    names = [f"f{i * n // n_calls}" for i in range(n_calls)]
+    start = time.perf_counter()
+    for name in names:
+        ir.Method(dialects, dialects.symbol_table[name])
+    fresh = (time.perf_counter() - start) / n_calls
+
+    for name in names:  # NOTE: fill the cache first
+        dialects.symbol_method(name)
+    start = time.perf_counter()
+    for name in names:
+        dialects.symbol_method(name)
+    cached = (time.perf_counter() - start) / n_calls
+
+    start = time.perf_counter()
+    result = method()
+    run = time.perf_counter() - start
+    assert result == sum(i * n // n_calls for i in range(n_calls))
+
+    print(
+        f"{n:6} functions: entry point scan {scan * 1e6:8.1f} us,"
+        f" indexed {indexed * 1e6:5.2f} us;"
+        f" callee new Method {fresh * 1e6:6.1f} us, cached {cached * 1e6:5.2f} us;"
+        f" main ({n_calls} invokes) {run * 1e3:6.1f} ms"
+    )
+
+
+def main():
+    for n in (100, 1_000, 10_000):
+        bench(n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Time parsing the text of synthetic methods with `kirin.parse`, compared
+to printing it and to reading the binary format of `kirin.serialization`.
+
+Run with `python benchmark/parse.py`.
+"""
+
+import io
+import time
+
+from synthetic import block_chain, straight_line
+
+from kirin import parse, serialization
+from kirin.print import PlainPrinter
+
+
+def bench(name: str, method):
+    start = time.perf_counter()
+    text = method.print_str(PlainPrinter())
+    printed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded = parse.parse_method(text, method.dialects)
+    parsed = time.perf_counter() - start
+    assert loaded.print_str(PlainPrinter()) == text
+
+    data = serialization.dumps(method)
+    start = time.perf_counter()
+    serialization.Reader(io.BytesIO(data), method.dialects).read_method()
+    read = time.perf_counter() - start
+
+    size = len(text) / 1e6
+    print(
+        f"{name:24} {size:5.2f} MB  print {printed:6.2f} s"
+        f"  parse {parsed:6.2f} s ({size / parsed:5.2f} MB/s)"
+        f"  binary read {read:6.2f} s"
+    )
+
+
+def main():
+    for n in (2_000, 20_000, 200_000):
+        bench(f"straight_line({n})", straight_line(n))
+    for n in (250, 2_500, 25_000):
+        bench(f"block_chain({n}, 8)", block_chain(n, 8))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure the time spent in the default pass pipeline.
+
+Run with `python benchmark/passes.py`.
+"""
+
+import time
+
+from synthetic import straight_line, foldable_chain
+
+from kirin import passes
+from kirin.prelude import basic, structural
+
+
+def compile_kernels():
+    @basic(typeinfer=True)
+    def branch(x: int):
+        y = x + 1
+        z = 2 * 3
+        if y > z:
+            return y
+        return z + x
+
+    @structural(typeinfer=True)
+    def loop(n: int):
+        acc = 0
+        for i in range(10):
+            acc = acc + i * 2
+        return acc + n
+
+    return branch, loop
+
+
+def run(name: str, make, n: int):
+    method = make(n)
+    default = passes.Default(method.dialects, typeinfer=True)
+    start = time.perf_counter()
+    default.fixpoint(method)
+    elapsed = time.perf_counter() - start
+    print(f"{name:16} {n:7} stmts {elapsed * 1e3:9.1f} ms")
+    if hasattr(default, "manager"):
+        print(default.manager.summary())
+
+
+def main():
+    repeat = 20
+    start = time.perf_counter()
+    for _ in range(repeat):
+        compile_kernels()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{'kernels':16} {elapsed * 1e3:9.1f} ms per compile of 2 kernels")
+
+    run("straight_line", straight_line, 2_000)
+    run("foldable_chain", foldable_chain, 2_000)
+
+
+if __name__ == "__main__":
+    main()
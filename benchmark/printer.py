@@ -0,0 +1,48 @@
+"""Compare printing a large method with the Rich printer and the plain-text
+printer, to a string and to a file.
+
+Run with `python benchmark/printer.py`.
+"""
+
+import os
+import time
+
+from synthetic import block_chain, straight_line
+from rich.console import Console
+
+from kirin.print import Printer, PlainPrinter
+
+
+def run(name: str, make, n: int):
+    mt = make(n)
+    n_stmts = sum(1 for _ in mt.code.walk())
+
+    start = time.perf_counter()
+    text = mt.print_str(Printer())
+    rich = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert mt.print_str(PlainPrinter()) == text
+    plain = time.perf_counter() - start
+
+    with open(os.devnull, "w") as file:
+        start = time.perf_counter()
+        mt.print(Printer(console=Console(file=file)))
+        rich_file = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mt.print(PlainPrinter(stream=file))
+        plain_file = time.perf_counter() - start
+
+    print(f"{name} ({n_stmts} stmts, {len(text) / 1e6:.1f} MB)")
+    print(f"  string: rich {rich:7.2f} s, plain {plain:7.2f} s")
+    print(f"  file:   rich {rich_file:7.2f} s, plain {plain_file:7.2f} s")
+
+
+def main():
+    run("straight_line", straight_line, 10_000)
+    run("block_chain", block_chain, 2_500)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Interpret integer loops over `range`, before and after rewriting them into
+counted loops.
+
+Run with `python benchmark/range_loop.py`.
+"""
+
+import time
+
+from kirin.prelude import basic_no_opt
+from kirin.dialects import cf
+
+
+def kernel(n: int):
+    total = 0
+    for i in range(n):
+        total = total + i
+    return total
+
+
+def nested(n: int):
+    total = 0
+    for i in range(n):
+        for j in range(i, 0, -1):
+            total = total + j
+    return total
+
+
+def run(name: str, function, n: int):
+    def elapsed(method) -> float:
+        start = time.perf_counter()
+        method(n)
+        return time.perf_counter() - start
+
+    method = basic_no_opt(function)
+    expected = method(n)
+    before = elapsed(method)
+    start = time.perf_counter()
+    cf.rewrite.RangeLoop().rewrite(method.code)
+    rewrite = time.perf_counter() - start
+    assert method(n) == expected
+    after = elapsed(method)
+    print(
+        f"{name:10} n={n}: {before * 1e3:8.1f} ms -> {after * 1e3:8.1f} ms "
+        f"(rewrite {rewrite * 1e3:.2f} ms)"
+    )
+
+
+def main():
+    run("loop", kernel, 100_000)
+    run("nested", nested, 450)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Time writing and reading synthetic methods with `kirin.serialization`,
+compared to printing them as text for the smaller ones.
+
+Run with `python benchmark/serialization.py`.
+"""
+
+import io
+import time
+
+from synthetic import block_chain, straight_line
+
+from kirin import serialization
+
+
+def bench(name: str, method, text: bool = False):
+    if text:
+        start = time.perf_counter()
+        size = len(method.print_str())
+        elapsed = time.perf_counter() - start
+        print(f"{name:24} print {elapsed * 1e3:8.1f} ms ({size / 1e6:5.2f} MB)")
+
+    start = time.perf_counter()
+    data = serialization.dumps(method)
+    written = time.perf_counter() - start
+
+    start = time.perf_counter()
+    serialization.Reader(io.BytesIO(data), method.dialects).read_method()
+    read = time.perf_counter() - start
+
+    print(
+        f"{name:24} write {written * 1e3:8.1f} ms ({len(data) / 1e6:5.2f} MB)"
+        f"  read {read * 1e3:8.1f} ms"
+    )
+
+
+def main():
+    for n in (2_000, 20_000, 200_000):
+        bench(f"straight_line({n})", straight_line(n), text=n <= 2_000)
+    for n in (250, 2_500, 25_000):
+        bench(f"block_chain({n}, 8)", block_chain(n, 8), text=n <= 250)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare interprocedural constant propagation and type inference with and
+without the method summary cache, on a method calling a helper from 200
+call sites.
+
+Run with `python benchmark/summary.py`.
+"""
+
+import time
+import linecache
+
+from kirin import types
+from kirin.prelude import basic_no_opt
+from kirin.analysis import const
+from kirin.analysis.typeinfer import TypeInference
+
+
+@basic_no_opt
+def helper(x: int) -> int:
+    y = x
+    for i in range(10):
+        if y > 100:
+            y = y - 100
+        else:
+            y = y * 2 + i
+    return y
+
+
+def make_caller(n_sites: int):
+    body = "\n".join(f"    acc = acc + helper(x + {i % 4})" for i in range(n_sites))
+    source = f"def caller(x: int):\n    acc = 0\n{body}\n    return acc\n"
+    # register the source so that the lowering can find it
+    filename = f"<caller-{n_sites}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    scope = {"helper": helper}
+    exec(compile(source, filename, "exec"), scope)
+    return basic_no_opt(scope["caller"])
+
+
+def bench(analysis, method, *args, number: int = 3) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        analysis.run(method, *args)
+    return (time.perf_counter() - start) / number
+
+
+def main():
+    caller = make_caller(200)
+    for name, make, args in (
+        ("constprop", lambda: const.Propagate(basic_no_opt), ()),
+        ("typeinfer", lambda: TypeInference(basic_no_opt), (types.Int,)),
+    ):
+        uncached = make()
+        uncached.summary_key = lambda value: None
+        cached = make()
+        old = bench(uncached, caller, *args)
+        new = bench(cached, caller, *args)
+        print(
+            f"{name}: no summaries {old * 1e3:8.1f} ms, "
+            f"summaries {new * 1e3:8.1f} ms ({old / new:.1f}x), "
+            f"hits {cached.summary_hits} misses {cached.summary_misses}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Synthetic methods used by the benchmarks in this directory."""
+
+from kirin import ir, types
+from kirin.prelude import basic_no_opt
+from kirin.dialects import cf, py, func
+
+
+def make_method(body: ir.Region, name: str = "synthetic") -> ir.Method:
+    code = func.Function(
+        sym_name=name,
+        signature=func.Signature((types.Int,), types.Int),
+        body=body,
+    )
+    return ir.Method(dialects=basic_no_opt, code=code, arg_names=["#self#", "x"])
+
+
+def straight_line(n: int) -> ir.Method:
+    """A single block with `n` arithmetic statements."""
+    block = ir.Block(argtypes=(types.MethodType, types.Int))
+    value: ir.SSAValue = block.args[1]
+    for i in range(n // 2):
+        const = py.Constant(i)
+        block.stmts.append(const)
+        add = py.Add(value, const.result)
+        block.stmts.append(add)
+        value = add.result
+    block.stmts.append(func.Return(value))
+    return make_method(ir.Region(block))
+
+
+def block_chain(n_blocks: int, stmts_per_block: int = 2) -> ir.Method:
+    """A chain of `n_blocks` blocks, each branching to the next one with
+    `stmts_per_block` arithmetic statements per block. Every 8th block
+    also branches back to its predecessor to form a loop.
+    """
+    blocks = [ir.Block(argtypes=(types.MethodType, types.Int))]
+    blocks.extend(ir.Block(argtypes=(types.Int,)) for _ in range(n_blocks - 1))
+    value: ir.SSAValue = blocks[0].args[1]
+    for idx, block in enumerate(blocks):
+        if idx > 0:
+            value = block.args[0]
+        for i in range(stmts_per_block // 2):
+            const = py.Constant(i)
+            block.stmts.append(const)
+            add = py.Add(value, const.result)
+            block.stmts.append(add)
+            value = add.result
+
+        if idx == len(blocks) - 1:
+            block.stmts.append(func.Return(value))
+        elif idx % 8 == 7:
+            cond = py.Constant(True)
+            block.stmts.append(cond)
+            block.stmts.append(
+                cf.ConditionalBranch(
+                    cond.result,
+                    (value,),
+                    (value,),
+                    then_successor=blocks[idx + 1],
+                    else_successor=blocks[idx - 1],
+                )
+            )
+        else:
+            block.stmts.append(cf.Branch((value,), successor=blocks[idx + 1]))
+    return make_method(ir.Region(blocks))
+
+
+def foldable_chain(n: int) -> ir.Method:
+    """A single block with `n` arithmetic statements on constants, only
+    the returned value depends on the argument.
+    """
+    block = ir.Block(argtypes=(types.MethodType, types.Int))
+    const = py.Constant(0)
+    block.stmts.append(const)
+    value: ir.SSAValue = const.result
+    for i in range(n // 2 - 1):
+        const = py.Constant(i)
+        block.stmts.append(const)
+        add = py.Add(value, const.result)
+        block.stmts.append(add)
+        value = add.result
+    add = py.Add(value, block.args[1])
+    block.stmts.append(add)
+    block.stmts.append(func.Return(add.result))
+    return make_method(ir.Region(block))
+
+
+def dead_chains(n: int, depth: int = 16) -> ir.Method:
+    """A single block with `n` statements forming dead chains of `depth`
+    dependent additions, dead code elimination has to remove each chain
+    from its end.
+    """
+    block = ir.Block(argtypes=(types.MethodType, types.Int))
+    x = block.args[1]
+    for _ in range(n // depth):
+        value: ir.SSAValue = x
+        for _ in range(depth):
+            add = py.Add(value, x)
+            block.stmts.append(add)
+            value = add.result
+    block.stmts.append(func.Return(x))
+    return make_method(ir.Region(block))
+
+
+def redundant_blocks(n_blocks: int, stmts_per_block: int = 4) -> ir.Method:
+    """A chain of `n_blocks` blocks, each recomputing the same index
+    arithmetic `x * 4 + i % 8` on the argument `x` of the entry block, with the
+    operands of the multiplication swapped in every other block.
+    """
+    blocks = [ir.Block(argtypes=(types.MethodType, types.Int))]
+    blocks.extend(ir.Block(argtypes=(types.Int,)) for _ in range(n_blocks - 1))
+    x = blocks[0].args[1]
+    for idx, block in enumerate(blocks):
+        value: ir.SSAValue = block.args[0] if idx > 0 else x
+        four = py.Constant(4)
+        block.stmts.append(four)
+        operands = (x, four.result) if idx % 2 == 0 else (four.result, x)
+        scaled = py.Mult(*operands)
+        block.stmts.append(scaled)
+        for i in range(stmts_per_block // 2 - 1):
+            const = py.Constant(i % 8)
+            block.stmts.append(const)
+            add = py.Add(scaled.result, const.result)
+            block.stmts.append(add)
+            value = add.result
+
+        if idx == len(blocks) - 1:
+            block.stmts.append(func.Return(value))
+        else:
+            block.stmts.append(cf.Branch((value,), successor=blocks[idx + 1]))
+    return make_method(ir.Region(blocks))
@@ -0,0 +1,71 @@
+"""Time type inference on a large generated method mixing integers, floats,
+tuples and branches, so that most of the time is spent joining and
+comparing types.
+
+Run with `python benchmark/typeinfer.py`.
+"""
+
+import sys
+import time
+import linecache
+
+from kirin import types
+from kirin.prelude import basic_no_opt
+from kirin.analysis.typeinfer import TypeInference
+
+SEGMENT = """\
+    a{i} = x + {i}
+    b{i} = a{i} * 2.0
+    if a{i} > {i}:
+        c{i} = a{i}
+    else:
+        c{i} = b{i}
+    t{i} = (a{i}, b{i}, c{i}, acc)
+    acc = t{i}[2]
+"""
+
+
+def make_method(n_segments: int):
+    body = "".join(SEGMENT.format(i=i) for i in range(n_segments))
+    source = f"def generated(x: int):\n    acc = 0\n{body}    return acc\n"
+    # register the source so that the lowering can find it
+    filename = f"<generated-{n_segments}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    scope = {}
+    exec(compile(source, filename, "exec"), scope)
+    return basic_no_opt(scope["generated"])
+
+
+def type_ops(number: int = 20) -> float:
+    """Join and compare every pair of a set of nested types."""
+    base = [types.Int, types.Float, types.String, types.Bool, types.NoneType]
+    typs = base + [types.Tuple[a, b] for a in base for b in base]
+    typs += [types.Union(a, b) for a, b in zip(typs, typs[3:])]
+    start = time.perf_counter()
+    for _ in range(number):
+        for a in typs:
+            for b in typs:
+                a.join(b).is_subseteq(a.meet(b))
+    return (time.perf_counter() - start) / number
+
+
+def main():
+    print(f"join/meet/is_subseteq on all pairs: {type_ops() * 1e3:8.1f} ms")
+    # NOTE: each branch nests a lowering frame
+    sys.setrecursionlimit(20_000)
+    for n_segments in (100, 300, 1_000):
+        method = make_method(n_segments)
+        infer = TypeInference(basic_no_opt)
+        number = 3
+        start = time.perf_counter()
+        for _ in range(number):
+            _, ret = infer.run(method, types.Int)
+        elapsed = (time.perf_counter() - start) / number
+        print(
+            f"{n_segments:5d} segments ({len(method.callable_region.blocks):5d} "
+            f"blocks): {elapsed * 1e3:8.1f} ms -> {ret}"
+        )
+
+
+if __name__ == "__main__":
+    main()
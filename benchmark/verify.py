@@ -0,0 +1,56 @@
+"""Compare the full verification of a method with the incremental
+verification of the statements modified since the last one.
+
+Run with `python benchmark/verify.py`.
+"""
+
+import time
+
+from synthetic import block_chain, straight_line
+
+from kirin.dialects import py
+
+
+def change(method, n_changes: int) -> None:
+    """Insert `n_changes` constants in front of the first statement."""
+    stmt = method.callable_region.blocks[0].first_stmt
+    for i in range(n_changes):
+        py.Constant(i).insert_before(stmt)
+
+
+def run(name: str, make, n: int, n_changes: int, repeat: int = 10):
+    method = make(n)
+    n_stmts = sum(1 for _ in method.code.walk())
+
+    full = incremental = 0.0
+    for _ in range(repeat):
+        change(method, n_changes)
+        start = time.perf_counter()
+        method.verify()
+        full += time.perf_counter() - start
+    full /= repeat
+
+    method.verify(incremental=True)  # start tracking the changes
+    for _ in range(repeat):
+        change(method, n_changes)
+        start = time.perf_counter()
+        method.verify(incremental=True)
+        incremental += time.perf_counter() - start
+    incremental /= repeat
+
+    print(
+        f"{name:14} {n_stmts:7} stmts {n_changes:5} changes "
+        f"full {full * 1e3:8.2f} ms incremental {incremental * 1e3:8.2f} ms "
+        f"({full / incremental:.0f}x)"
+    )
+
+
+def main():
+    for n_changes in (1, 10, 100, 1000):
+        run("straight_line", straight_line, 100_000, n_changes)
+    for n_changes in (1, 100):
+        run("block_chain", block_chain, 10_000, n_changes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare the deque-backed `WorkList` with the previous `list.pop(0)` one
+on `Walk` and `CFG` over large synthetic methods.
+
+Run with `python benchmark/worklist.py`.
+"""
+
+import timeit
+from dataclasses import field, dataclass
+
+from synthetic import block_chain, straight_line
+
+from kirin import ir
+from kirin.rewrite import Walk
+from kirin.analysis import cfg
+from kirin.worklist import WorkList
+from kirin.rewrite.abc import RewriteRule, RewriteResult
+
+
+@dataclass
+class ListWorkList(WorkList):
+    """The previous worklist implementation, popping from the front of a list."""
+
+    _stack: list = field(default_factory=list, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
+    def append(self, item) -> None:
+        self._stack.append(item)
+
+    def extend(self, items) -> None:
+        self._stack.extend(items)
+
+    def pop(self):
+        if self._stack:
+            return self._stack.pop(0)
+        return None
+
+
+class NoOp(RewriteRule):
+
+    def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
+        return RewriteResult()
+
+
+def bench_walk(method: ir.Method, worklist_type: type[WorkList]) -> float:
+    def run():
+        Walk(NoOp(), worklist=worklist_type()).rewrite(method.code)
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def bench_cfg(method: ir.Method, worklist_type: type[WorkList]) -> float:
+    def run():
+        cfg.CFG(method.callable_region).successors
+
+    original = cfg.WorkList
+    cfg.WorkList = worklist_type
+    try:
+        return min(timeit.repeat(run, number=1, repeat=3))
+    finally:
+        cfg.WorkList = original
+
+
+def main():
+    for n in (10_000, 100_000):
+        method = straight_line(n)
+        old, new = bench_walk(method, ListWorkList), bench_walk(method, WorkList)
+        print(
+            f"Walk {n:>7} stmts: list {old * 1e3:9.2f} ms, "
+            f"deque {new * 1e3:9.2f} ms ({old / new:.1f}x)"
+        )
+
+    for n in (10_000, 100_000):
+        method = block_chain(n // 2)
+        old, new = bench_cfg(method, ListWorkList), bench_cfg(method, WorkList)
+        print(
+            f"CFG  {n:>7} stmts: list {old * 1e3:9.2f} ms, "
+            f"deque {new * 1e3:9.2f} ms ({old / new:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ and frameworks for implementing compiler analysis passes on the IR.
 The analysis framework contains the following modules:
 
 - [`cfg`][kirin.analysis.cfg]: Control flow graph for a given IR.
+- [`dominance`][kirin.analysis.dominance]: Dominator and post-dominator trees of a
+    control flow graph.
+- [`loops`][kirin.analysis.loops]: Natural loops of a control flow graph.
 - [`forward`][kirin.analysis.forward]: Forward dataflow analysis.
 - [`callgraph`][kirin.analysis.callgraph]: Call graph for a given IR.
 - [`typeinfer`][kirin.analysis.typeinfer]: Type inference analysis.
@@ -14,11 +17,16 @@ The analysis framework contains the following modules:
 """
 
 from kirin.analysis import const as const
-from kirin.analysis.cfg import CFG as CFG
+from kirin.analysis.cfg import CFG as CFG, reverse_postorder as reverse_postorder
+from kirin.analysis.loops import Loop as Loop, LoopNest as LoopNest
 from kirin.analysis.forward import (
     Forward as Forward,
     ForwardExtra as ForwardExtra,
     ForwardFrame as ForwardFrame,
 )
 from kirin.analysis.callgraph import CallGraph as CallGraph
+from kirin.analysis.dominance import (
+    DominatorTree as DominatorTree,
+    PostDominatorTree as PostDominatorTree,
+)
 from kirin.analysis.typeinfer import TypeInference as TypeInference
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from kirin import ir
 from kirin.print import Printer, Printable
 from kirin.worklist import WorkList
+from kirin.analysis.loops import LoopNest
+from kirin.analysis.dominance import DominatorTree, PostDominatorTree
 
 
 @dataclass
@@ -13,6 +15,10 @@ class CFG(Printable):
 
     This class implements the [`kirin.graph.Graph`][kirin.graph.Graph] protocol.
 
+    The dominator tree, post-dominator tree, dominance frontiers and loop nest
+    of the graph are computed lazily on first access and cached, a new `CFG`
+    has to be created once the blocks of the region are modified.
+
     !!! note "Pretty Printing"
         This object is pretty printable via
         [`.print()`][kirin.print.printable.Printable.print] method.
@@ -62,6 +68,31 @@ class CFG(Printable):
                 block = worklist.pop()
         return graph
 
+    @cached_property
+    def reverse_postorder(self) -> dict[ir.Block, int]:
+        """The index of each block reachable from the entry in reverse postorder."""
+        return reverse_postorder(self.parent)
+
+    @cached_property
+    def dominators(self) -> DominatorTree:
+        """The dominator tree of the graph."""
+        return DominatorTree(self)
+
+    @cached_property
+    def post_dominators(self) -> PostDominatorTree:
+        """The post-dominator tree of the graph, rooted at the exit blocks."""
+        return PostDominatorTree(self)
+
+    @cached_property
+    def dominance_frontiers(self) -> dict[ir.Block, set[ir.Block]]:
+        """The dominance frontier of each block reachable from the entry."""
+        return self.dominators.frontiers()
+
+    @cached_property
+    def loops(self) -> LoopNest:
+        """The natural loops of the graph."""
+        return LoopNest(self)
+
     # graph interface
     def get_neighbors(self, node: ir.Block) -> Iterable[ir.Block]:
         return self.successors[node]
@@ -110,3 +141,39 @@ class CFG(Printable):
                     ),
                 )
                 printer.print_newline()
+
+
+def reverse_postorder(region: ir.Region) -> dict[ir.Block, int]:
+    """Number the blocks of a region reachable from its entry block in
+    reverse postorder.
+
+    Args:
+        region: the region.
+
+    Returns:
+        dict[ir.Block, int]: the index of each reachable block.
+    """
+    if region.blocks.isempty():
+        return {}
+
+    postorder: list[ir.Block] = []
+    entry = region.blocks[0]
+    visited = {entry}
+    stack = [(entry, iter(_successors(entry)))]
+    while stack:
+        block, succs = stack[-1]
+        for succ in succs:
+            if succ not in visited:
+                visited.add(succ)
+                stack.append((succ, iter(_successors(succ))))
+                break
+        else:
+            stack.pop()
+            postorder.append(block)
+    return {block: idx for idx, block in enumerate(reversed(postorder))}
+
+
+def _successors(block: ir.Block) -> list[ir.Block]:
+    if (stmt := block.last_stmt) is None:
+        return []
+    return stmt.successors
@@ -1,10 +1,25 @@
-from typing import final
+from typing import Any, Hashable, final
 from dataclasses import field, dataclass
 
 from kirin import ir, types, interp
 from kirin.analysis.forward import ForwardExtra, ForwardFrame
 
-from .lattice import Value, Result, Unknown
+from .lattice import Value, Bottom, Result, Unknown, PartialTuple
+
+_VALUE_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+
+@dataclass(frozen=True, eq=False)
+class _Ref:
+    """Summary key of constants compared by identity, e.g. methods."""
+
+    data: Any
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Ref) and self.data is other.data
+
+    def __hash__(self) -> int:
+        return id(self.data)
 
 
 @dataclass
@@ -61,6 +76,23 @@ class Propagate(ForwardExtra[Frame, Result]):
     def method_self(self, method: ir.Method) -> Result:
         return Value(method)
 
+    def is_pure(self, frame: Frame) -> bool:
+        return not frame.frame_is_not_pure
+
+    def summary_key(self, value: Result) -> Hashable | None:
+        if isinstance(value, Value):
+            if type(value.data) in _VALUE_TYPES:
+                return (type(value.data), value.data)
+            return _Ref(value.data)
+        elif isinstance(value, PartialTuple):
+            keys = tuple(self.summary_key(each) for each in value.data)
+            if any(key is None for key in keys):
+                return None
+            return (PartialTuple, keys)
+        elif isinstance(value, (Unknown, Bottom)):
+            return value  # singletons
+        return None
+
     def frame_eval(
         self, frame: Frame, node: ir.Statement
     ) -> interp.StatementResult[Result]:
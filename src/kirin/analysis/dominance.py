@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+from dataclasses import field, dataclass
+
+from kirin import ir
+
+if TYPE_CHECKING:
+    from kirin.analysis.cfg import CFG
+
+
+@dataclass
+class DominatorTree:
+    """The dominator tree of a [`CFG`][kirin.analysis.CFG], usually obtained
+    with [`CFG.dominators`][kirin.analysis.CFG.dominators].
+
+    A block dominates another block if every path from the entry block to the
+    other block goes through it. The immediate dominators are computed with
+    the iterative algorithm of Cooper, Harvey and Kennedy over the reverse
+    postorder of the blocks. Blocks unreachable from the entry block are not
+    part of the tree.
+    """
+
+    cfg: CFG
+    """The control flow graph."""
+    order: dict[ir.Block, int] = field(init=False, repr=False)
+    """The index of each block of the tree in the order it is computed in,
+    the reverse postorder from the roots."""
+    idom: dict[ir.Block, ir.Block | None] = field(init=False, repr=False)
+    """The immediate dominator of each block of the tree, `None` for the roots."""
+    children: dict[ir.Block, list[ir.Block]] = field(init=False, repr=False)
+    """The blocks immediately dominated by each block of the tree."""
+    roots: list[ir.Block] = field(init=False, repr=False)
+    """The roots of the tree, the entry block."""
+    _pre: dict[ir.Block, int] = field(init=False, repr=False)
+    _last: dict[ir.Block, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.order = self.cfg.reverse_postorder
+        self.roots = [self.cfg.entry] if self.order else []  # type: ignore
+        self._build(self.cfg.predecessors)
+
+    def _build(self, preds: dict[ir.Block, set[ir.Block]]) -> None:
+        order = self.order
+        roots = set(self.roots)
+        blocks = sorted(order, key=order.__getitem__)
+
+        # NOTE: the roots are their own immediate dominator during the
+        # iterations, the blocks whose only common dominator is the virtual
+        # root joining several roots become roots too
+        idom: dict[ir.Block, ir.Block] = {root: root for root in roots}
+        virtual = len(roots) > 1
+
+        def intersect(a: ir.Block, b: ir.Block) -> ir.Block | None:
+            while a is not b:
+                while order[a] > order[b]:
+                    if idom[a] is a:
+                        return None
+                    a = idom[a]
+                while order[b] > order[a]:
+                    if idom[b] is b:
+                        return None
+                    b = idom[b]
+            return a
+
+        changed = True
+        while changed:
+            changed = False
+            for block in blocks:
+                if block in roots:
+                    continue
+                new_idom: ir.Block | None = None
+                first = True
+                for pred in preds.get(block, ()):
+                    if pred not in idom:
+                        continue
+                    elif first:
+                        new_idom, first = pred, False
+                    elif new_idom is not None:
+                        new_idom = intersect(pred, new_idom)
+                if first:
+                    continue
+                if new_idom is None:  # NOTE: only dominated by the virtual root
+                    assert virtual
+                    new_idom = block
+                if idom.get(block) is not new_idom:
+                    idom[block] = new_idom
+                    changed = True
+
+        self.idom = {}
+        self.children = {block: [] for block in blocks if block in idom}
+        for block in blocks:
+            if (parent := idom.get(block)) is None:
+                continue
+            elif parent is block:
+                self.idom[block] = None
+                if block not in roots:
+                    self.roots.append(block)
+            else:
+                self.idom[block] = parent
+                self.children[parent].append(block)
+
+        self._pre, self._last = {}, {}
+        preorder = list(self.preorder())
+        for idx, block in enumerate(preorder):
+            self._pre[block] = idx
+        for block in reversed(preorder):
+            self._last[block] = max(
+                (self._last[child] for child in self.children[block]),
+                default=self._pre[block],
+            )
+
+    @property
+    def root(self) -> ir.Block | None:
+        """The entry block, root of the tree."""
+        return self.roots[0] if self.roots else None
+
+    def dominates(self, a: ir.Block, b: ir.Block) -> bool:
+        """Check if block `a` dominates block `b`, a block dominates itself."""
+        if a not in self._pre or b not in self._pre:
+            return False
+        return self._pre[a] <= self._pre[b] <= self._last[a]
+
+    def strictly_dominates(self, a: ir.Block, b: ir.Block) -> bool:
+        """Check if block `a` dominates block `b` and is not `b`."""
+        return a is not b and self.dominates(a, b)
+
+    def preorder(self) -> Iterator[ir.Block]:
+        """Iterate over the blocks of the tree, each one before the blocks it
+        dominates."""
+        stack = list(reversed(self.roots))
+        while stack:
+            block = stack.pop()
+            yield block
+            stack.extend(reversed(self.children[block]))
+
+    def frontiers(self) -> dict[ir.Block, set[ir.Block]]:
+        """Compute the dominance frontier of each block of the tree: the blocks
+        where its dominance ends, i.e. with a predecessor it dominates while it
+        does not strictly dominate them.
+        """
+        return self._frontiers(self.cfg.predecessors)
+
+    def _frontiers(
+        self, preds: dict[ir.Block, set[ir.Block]]
+    ) -> dict[ir.Block, set[ir.Block]]:
+        frontiers: dict[ir.Block, set[ir.Block]] = {block: set() for block in self.idom}
+        for block, idom in self.idom.items():
+            block_preds = [pred for pred in preds.get(block, ()) if pred in self.idom]
+            if len(block_preds) < 2:
+                continue
+            for runner in block_preds:
+                while runner is not None and runner is not idom:
+                    frontiers[runner].add(block)
+                    runner = self.idom[runner]
+        return frontiers
+
+
+@dataclass
+class PostDominatorTree(DominatorTree):
+    """The post-dominator tree of a [`CFG`][kirin.analysis.CFG], usually
+    obtained with [`CFG.post_dominators`][kirin.analysis.CFG.post_dominators].
+
+    A block post-dominates another block if every path from the other block
+    to an exit block goes through it. This is the dominator tree of the
+    reversed graph, whose roots are the exit blocks, i.e. the blocks without
+    successors. Blocks that cannot reach an exit block, e.g. in an infinite
+    loop, are not part of the tree.
+    """
+
+    def __post_init__(self):
+        successors = self.cfg.successors
+        exits = [block for block in self.cfg.reverse_postorder if not successors[block]]
+        self.order = _reverse_postorder(exits, self.cfg.predecessors)
+        self.roots = exits
+        self._build(successors)
+
+    def frontiers(self) -> dict[ir.Block, set[ir.Block]]:
+        """Compute the post-dominance frontier of each block of the tree, the
+        control dependences of the blocks."""
+        return self._frontiers(self.cfg.successors)
+
+
+def _reverse_postorder(
+    roots: Iterable[ir.Block], successors: dict[ir.Block, set[ir.Block]]
+) -> dict[ir.Block, int]:
+    postorder: list[ir.Block] = []
+    visited: set[ir.Block] = set()
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(successors.get(root, ())))]
+        while stack:
+            block, succs = stack[-1]
+            for succ in succs:
+                if succ not in visited:
+                    visited.add(succ)
+                    stack.append((succ, iter(successors.get(succ, ()))))
+                    break
+            else:
+                stack.pop()
+                postorder.append(block)
+    return {block: idx for idx, block in enumerate(reversed(postorder))}
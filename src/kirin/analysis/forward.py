@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Iterable
-from dataclasses import dataclass
+from typing import Generic, TypeVar, Hashable, Iterable
+from dataclasses import field, dataclass
 
 from kirin import ir, interp, lattice
 
@@ -25,6 +25,36 @@ class ForwardFrame(interp.AbstractFrame[LatticeType]):
 FrameType = TypeVar("FrameType", bound=ForwardFrame)
 
 
+@dataclass
+class Summary(Generic[LatticeType]):
+    """The result of analysing a method for a tuple of abstract arguments."""
+
+    code: ir.Statement
+    """The code of the method when it was analysed."""
+    version: int
+    """The version of the method when it was analysed."""
+    ret: LatticeType
+    """The abstract return value."""
+    pure: bool
+    """If the method has no side effect, see
+    [`ForwardExtra.is_pure`][kirin.analysis.forward.ForwardExtra.is_pure].
+    """
+
+    def is_valid(self, method: ir.Method) -> bool:
+        return self.code is method.code and self.version == method.version
+
+
+@dataclass
+class _PendingSummary(Generic[LatticeType]):
+    key: tuple
+    args: tuple[LatticeType, ...]
+    summary: Summary[LatticeType]
+    recursive: bool = False
+    """If the approximated summary was used by a recursive call."""
+    depends: bool = False
+    """If the result depends on the approximated summary of a caller."""
+
+
 @dataclass
 class ForwardExtra(interp.AbstractInterpreter[FrameType, LatticeType], ABC):
     """Forward dataflow analysis but with custom frame for extra information/state
@@ -33,7 +63,36 @@ class ForwardExtra(interp.AbstractInterpreter[FrameType, LatticeType], ABC):
     Params:
         FrameType: The type of the frame used for the analysis.
         LatticeType: The type of the lattice used for the analysis.
+
+    Calls to other methods through
+    [`call_method`][kirin.analysis.forward.ForwardExtra.call_method] are
+    memoized per (method, abstract arguments) in `summaries`, which is kept
+    across runs of the same analysis object.
+    """
+
+    max_summary_depth: int = field(default=32, kw_only=True)
+    """The maximum number of nested recursive calls of a method with different
+    arguments before the arguments are widened.
     """
+    max_summary_iter: int = field(default=8, kw_only=True)
+    """The maximum number of iterations to analyse a recursive method before
+    widening its return value to top."""
+    summaries: dict[Hashable, Summary[LatticeType]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """The cached summaries of analysed methods."""
+    summary_hits: int = field(default=0, init=False, compare=False)
+    """The number of calls answered from `summaries`."""
+    summary_misses: int = field(default=0, init=False, compare=False)
+    """The number of calls that had to analyse the callee."""
+    _pending: list[_PendingSummary[LatticeType]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def initialize(self):
+        super().initialize()
+        self._pending = []
+        return self
 
     def run(self, method: ir.Method, *args: LatticeType, **kwargs: LatticeType):
         if not args and not kwargs:  # empty args and kwargs
@@ -53,6 +112,138 @@ class ForwardExtra(interp.AbstractInterpreter[FrameType, LatticeType], ABC):
         """Return the self value for the given method."""
         ...
 
+    def is_pure(self, frame: FrameType) -> bool:
+        """Whether the call that produced the frame has no side effect. Analyses
+        that do not track side effects return `False`.
+        """
+        return False
+
+    def summary_key(self, value: LatticeType) -> Hashable | None:
+        """Return a hashable key identifying the abstract value, or `None` if
+        calls with this value should not be cached.
+        """
+        return value
+
+    def invalidate(self, method: ir.Method | None = None) -> None:
+        """Drop the cached summaries of the given method, or all summaries."""
+        if method is None:
+            self.summaries.clear()
+            return
+
+        for key in [key for key in self.summaries if key[0] is method]:
+            del self.summaries[key]
+
+    def call_method(
+        self, method: ir.Method, *args: LatticeType, **kwargs: LatticeType
+    ) -> Summary[LatticeType]:
+        """Analyse a call to a method with the given abstract arguments
+        (excluding `self`).
+
+        The summary is cached per (method, arguments) and reused until the
+        method's code is replaced or its `version` changes. Recursive calls
+        use the summary computed so far (starting from bottom), the method is
+        re-analysed until its return value is stable. After `max_summary_depth`
+        nested calls with different arguments, the arguments are widened by
+        joining them with the arguments of the innermost pending call.
+
+        Args:
+            method: the callee.
+            args: the abstract arguments.
+            kwargs: the abstract keyword arguments.
+
+        Returns:
+            Summary[LatticeType]: the summary of the call.
+        """
+        if kwargs:
+            trait = method.code.get_present_trait(ir.CallableStmtInterface)
+            args = trait.align_input_args(
+                method.code, self.method_self(method), *args, **kwargs
+            )[1:]
+
+        key = self.__summary_key(method, args)
+        if key is None:
+            return self.__analyse_uncached(method, args)
+
+        if (entry := self.__find_pending(key)) is not None:
+            return entry.summary
+
+        if (summary := self.summaries.get(key)) is not None:
+            if summary.is_valid(method):
+                self.summary_hits += 1
+                return summary
+            del self.summaries[key]
+
+        pending = [entry for entry in self._pending if entry.key[0] is method]
+        if len(pending) >= self.max_summary_depth:  # widen the arguments
+            if len(pending[-1].args) == len(args):
+                args = tuple(x.join(y) for x, y in zip(pending[-1].args, args))
+            else:
+                args = tuple(self.lattice.top() for _ in args)
+            key = self.__summary_key(method, args)
+            if key is None:
+                return self.__analyse_uncached(method, args)
+            elif (entry := self.__find_pending(key)) is not None:
+                return entry.summary
+
+        self.summary_misses += 1
+        entry = _PendingSummary(
+            key, args, Summary(method.code, method.version, self.lattice.bottom(), True)
+        )
+        self._pending.append(entry)
+        try:
+            summary = self.__analyse(method, entry)
+        finally:
+            self._pending.pop()
+
+        if not entry.depends:  # not computed from a pending approximation
+            self.summaries[key] = summary
+        return summary
+
+    def __analyse_uncached(
+        self, method: ir.Method, args: tuple[LatticeType, ...]
+    ) -> Summary[LatticeType]:
+        self.summary_misses += 1
+        frame, ret = self.call(method.code, self.method_self(method), *args)
+        return Summary(method.code, method.version, ret, self.is_pure(frame))
+
+    def __analyse(
+        self, method: ir.Method, entry: _PendingSummary[LatticeType]
+    ) -> Summary[LatticeType]:
+        for _ in range(self.max_summary_iter):
+            entry.recursive = False
+            frame, ret = self.call(method.code, self.method_self(method), *entry.args)
+            summary = Summary(method.code, method.version, ret, self.is_pure(frame))
+            if not entry.recursive:
+                return summary
+
+            approx = entry.summary
+            if ret.is_subseteq(approx.ret) and summary.pure == approx.pure:
+                return summary
+            entry.summary = Summary(
+                method.code, method.version, approx.ret.join(ret), summary.pure
+            )
+        return Summary(method.code, method.version, self.lattice.top(), False)
+
+    def __find_pending(self, key: tuple) -> _PendingSummary[LatticeType] | None:
+        for idx in range(len(self._pending) - 1, -1, -1):
+            entry = self._pending[idx]
+            if entry.key[0] is key[0] and entry.key == key:
+                entry.recursive = True
+                for deeper in self._pending[idx + 1 :]:
+                    deeper.depends = True
+                return entry
+        return None
+
+    def __summary_key(
+        self, method: ir.Method, args: tuple[LatticeType, ...]
+    ) -> tuple | None:
+        keys = []
+        for arg in args:
+            if (key := self.summary_key(arg)) is None:
+                return None
+            keys.append(key)
+        return (method, *keys)
+
 
 @dataclass
 class Forward(ForwardExtra[ForwardFrame[LatticeType], LatticeType], ABC):
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+from dataclasses import field, dataclass
+
+from kirin import ir
+
+if TYPE_CHECKING:
+    from kirin.analysis.cfg import CFG
+
+
+@dataclass(eq=False)
+class Loop:
+    """A natural loop of a control flow graph."""
+
+    header: ir.Block
+    """The block dominating all the blocks of the loop, target of its back edges."""
+    latches: list[ir.Block] = field(default_factory=list)
+    """The blocks of the loop branching back to the header."""
+    blocks: set[ir.Block] = field(default_factory=set)
+    """The blocks of the loop, including the blocks of the nested loops."""
+    parent: Loop | None = field(default=None, repr=False)
+    """The innermost loop containing this loop, if any."""
+    children: list[Loop] = field(default_factory=list, repr=False)
+    """The loops nested immediately in this loop."""
+
+    @property
+    def depth(self) -> int:
+        """The nesting depth of the loop, 1 for the outermost loops."""
+        depth, loop = 1, self.parent
+        while loop is not None:
+            depth, loop = depth + 1, loop.parent
+        return depth
+
+    def exits(self, cfg: CFG) -> set[ir.Block]:
+        """The blocks outside of the loop branched to from the loop."""
+        return {
+            succ
+            for block in self.blocks
+            for succ in cfg.successors.get(block, ())
+            if succ not in self.blocks
+        }
+
+    def __contains__(self, block: ir.Block) -> bool:
+        return block in self.blocks
+
+
+@dataclass
+class LoopNest:
+    """The natural loops of a [`CFG`][kirin.analysis.CFG], nested in each
+    other, usually obtained with [`CFG.loops`][kirin.analysis.CFG.loops].
+
+    A back edge is an edge whose target dominates its source, the natural
+    loop of a header is made of the header and the blocks reaching one of its
+    back edges without going through the header. Loops are found innermost
+    first, visiting the headers in reverse postorder from the last one, and
+    the blocks of inner loops are skipped by jumping to their header.
+
+    !!! note
+        Cycles without a block dominating all the others, i.e. irreducible
+        control flow, have no back edge and are not reported as loops.
+    """
+
+    cfg: CFG
+    """The control flow graph."""
+    loops: list[Loop] = field(init=False, repr=False)
+    """All the loops, outer loops before the loops nested in them."""
+    top_level: list[Loop] = field(init=False, repr=False)
+    """The outermost loops."""
+    _innermost: dict[ir.Block, Loop] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        cfg = self.cfg
+        order = cfg.reverse_postorder
+        dominators = cfg.dominators
+        preds = cfg.predecessors
+
+        self._innermost = {}
+        found: list[Loop] = []
+        for header in sorted(order, key=order.__getitem__, reverse=True):
+            latches = [
+                pred
+                for pred in preds.get(header, ())
+                if dominators.dominates(header, pred)
+            ]
+            if not latches:
+                continue
+
+            loop = Loop(header, sorted(latches, key=order.__getitem__), {header})
+            stack = list(loop.latches)
+            while stack:
+                block = stack.pop()
+                if (inner := self._innermost.get(block)) is not None:
+                    while inner.parent is not None:
+                        inner = inner.parent
+                    if inner is loop:
+                        continue
+                    inner.parent = loop
+                    loop.children.append(inner)
+                    loop.blocks.update(inner.blocks)
+                    block = inner.header
+                    stack.extend(
+                        pred for pred in preds.get(block, ()) if pred not in loop.blocks
+                    )
+                elif block not in loop.blocks:
+                    loop.blocks.add(block)
+                    self._innermost[block] = loop
+                    stack.extend(preds.get(block, ()))
+            self._innermost[header] = loop
+            found.append(loop)
+
+        self.top_level = [loop for loop in reversed(found) if loop.parent is None]
+        for loop in found:
+            loop.children.sort(key=lambda child: order[child.header])
+        self.loops = list(self._preorder())
+
+    def _preorder(self) -> Iterator[Loop]:
+        stack = list(reversed(self.top_level))
+        while stack:
+            loop = stack.pop()
+            yield loop
+            stack.extend(reversed(loop.children))
+
+    def loop_of(self, block: ir.Block) -> Loop | None:
+        """Return the innermost loop containing a block, if any."""
+        return self._innermost.get(block)
+
+    def depth(self, block: ir.Block) -> int:
+        """Return the number of loops containing a block."""
+        loop = self._innermost.get(block)
+        return 0 if loop is None else loop.depth
+
+    def __iter__(self) -> Iterator[Loop]:
+        return iter(self.loops)
+
+    def __len__(self) -> int:
+        return len(self.loops)
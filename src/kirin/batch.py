@@ -0,0 +1,417 @@
+"""Compile many methods at once, in parallel.
+
+Decorating a function with a dialect group lowers it and runs its passes
+right away. Inside a [`compiling`][kirin.batch.compiling] block, the passes
+are deferred and all the methods defined in the block are compiled together
+when it exits:
+
+```python
+from kirin import batch
+
+with batch.compiling() as b:
+    import my_kernels
+
+print(b.report.summary())
+```
+
+[`compile_methods`][kirin.batch.compile_methods] compiles a given set of
+methods, or all the methods of a module. The methods are grouped by strongly
+connected components of the call graph and the components are compiled
+bottom-up, each one once all its callees are compiled, so callers always see
+the optimized IR of their callees. Independent components are compiled in
+parallel by a pool of worker processes, which send the compiled IR back
+serialized with [`kirin.serialization`][kirin.serialization].
+
+!!! note
+    The worker processes are forked from the current process, so that they
+    share its methods and dialect groups. Where `fork` is not available, or
+    when the IR of a component cannot be serialized, the components are
+    compiled in the current process instead, the reasons are listed in
+    [`BatchReport.errors`][kirin.batch.BatchReport.errors].
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import time
+import multiprocessing
+from types import ModuleType
+from typing import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import field, dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from kirin import ir, types
+from kirin.graph import strongly_connected_components
+from kirin.dialects import func
+from kirin.ir.recompile import transitive_callers
+from kirin.serialization import Reader, Writer
+
+
+@dataclass
+class BatchReport:
+    """What [`compile_methods`][kirin.batch.compile_methods] did."""
+
+    components: list[list[ir.Method]] = field(default_factory=list)
+    """The strongly connected components of the call graph, in the order
+    they have been compiled."""
+    times: dict[ir.Method, float] = field(default_factory=dict)
+    """The time spent running the passes of each method, in seconds."""
+    in_process: list[ir.Method] = field(default_factory=list)
+    """The methods compiled in the current process instead of a worker."""
+    errors: list[str] = field(default_factory=list)
+    """Why components could not be compiled by a worker."""
+    workers: int = 0
+    """The number of worker processes used, 0 if none."""
+    elapsed: float = 0.0
+    """The wall time of the whole batch, in seconds."""
+
+    def summary(self) -> str:
+        """Return a short description of the batch."""
+        total = sum(self.times.values())
+        return (
+            f"compiled {len(self.times)} methods in {len(self.components)} "
+            f"components with {self.workers} workers: {self.elapsed:.3f}s "
+            f"elapsed, {total:.3f}s in passes, "
+            f"{len(self.in_process)} methods compiled in process"
+            + (f", {len(self.errors)} worker errors" if self.errors else "")
+        )
+
+
+@dataclass
+class Batch:
+    """The methods defined in a [`compiling`][kirin.batch.compiling] block."""
+
+    max_workers: int | None = None
+    """The maximum number of worker processes, defaults to the number of CPUs."""
+    methods: dict[ir.Method, bool] = field(default_factory=dict)
+    """The methods to compile, in definition order, and whether they are new
+    rather than callers of a redefined method."""
+    report: BatchReport | None = None
+    """The report of the compilation, set when the block exits."""
+
+    def add(self, method: ir.Method) -> None:
+        """Defer the passes of a new method to the end of the block."""
+        self.methods[method] = True
+
+    def add_callers(self, method: ir.Method) -> None:
+        """Defer the recompilation of the callers of a redefined method."""
+        for component in transitive_callers([method]):
+            for caller in component:
+                if caller not in self.methods and caller.run_passes is not None:
+                    caller.version += 1
+                    self.methods[caller] = False
+
+    def compile(self) -> BatchReport:
+        """Compile the methods, see [`compile_methods`][kirin.batch.compile_methods],
+        and store the new ones in the compile cache.
+        """
+        from kirin.cache import get_compile_cache
+
+        methods, self.methods = self.methods, {}
+        self.report = compile_methods(methods, max_workers=self.max_workers)
+        if (cache := get_compile_cache()) is not None:
+            for method, new in methods.items():
+                if new and (key := cache.registered_key(method)) is not None:
+                    cache.store(key, method)
+        return self.report
+
+
+_batches: ContextVar[tuple[Batch, ...]] = ContextVar("kirin_batches", default=())
+"""The active batches of the current thread or task, innermost last."""
+
+
+def current_batch() -> Batch | None:
+    """Return the innermost active [`Batch`][kirin.batch.Batch] of the current
+    thread, if any."""
+    batches = _batches.get()
+    return batches[-1] if batches else None
+
+
+@contextmanager
+def compiling(max_workers: int | None = None) -> Iterator[Batch]:
+    """Defer the passes of the methods defined in the block, and compile them
+    together when it exits.
+
+    Only the methods defined by the current thread are deferred. The methods
+    are also compiled when the block raises an `Exception`, so that the
+    methods defined before the error are usable, the error of the block is
+    then raised with the compilation error, if any, as its context. They are
+    not compiled when the block is interrupted, e.g. by `KeyboardInterrupt`.
+
+    Args:
+        max_workers (int | None, optional): the maximum number of worker
+            processes. Defaults to the number of CPUs.
+    """
+    batch = Batch(max_workers)
+    token = _batches.set((*_batches.get(), batch))
+    try:
+        try:
+            yield batch
+        finally:
+            _batches.reset(token)
+    except Exception as e:
+        try:
+            batch.compile()
+        except Exception:
+            raise e  # NOTE: the compilation error becomes its context
+        raise
+    batch.compile()
+
+
+def compile_methods(
+    methods: Iterable[ir.Method] | ModuleType,
+    *,
+    max_workers: int | None = None,
+) -> BatchReport:
+    """Run the passes of the methods, bottom-up over the call graph.
+
+    Args:
+        methods (Iterable[ir.Method] | ModuleType): the methods, or a
+            module whose methods are compiled.
+        max_workers (int | None, optional): the maximum number of worker
+            processes, 1 compiles in the current process. Defaults to the
+            number of CPUs.
+
+    Returns:
+        BatchReport: the components compiled and the time spent.
+    """
+    if isinstance(methods, ModuleType):
+        methods = [
+            value for value in vars(methods).values() if isinstance(value, ir.Method)
+        ]
+    methods = [method for method in dict.fromkeys(methods) if method.run_passes]
+
+    start = time.perf_counter()
+    report = BatchReport()
+    batch = set(methods)
+    callees: dict[ir.Method, list[ir.Method]] = {method: [] for method in methods}
+    for method in methods:
+        for caller in method.backedges:
+            if caller in batch and caller is not method:
+                callees[caller].append(method)
+    components = strongly_connected_components(methods, callees.__getitem__)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(components))
+    if max_workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        _compile_parallel(components, callees, max_workers, report)
+    else:
+        for component in components:
+            _compile_in_process(component, report)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _compile_in_process(component: list[ir.Method], report: BatchReport) -> None:
+    for method in component:
+        _refresh_calls(method, component)
+        start = time.perf_counter()
+        method.run_passes(method)  # type: ignore
+        report.times[method] = time.perf_counter() - start
+        report.in_process.append(method)
+    report.components.append(component)
+
+
+def _compile_parallel(
+    components: list[list[ir.Method]],
+    callees: dict[ir.Method, list[ir.Method]],
+    max_workers: int,
+    report: BatchReport,
+) -> None:
+    global _known
+    _known = _reachable(callees)
+    component_of = {
+        method: idx for idx, component in enumerate(components) for method in component
+    }
+    waiting = [
+        len({component_of[callee] for m in component for callee in callees[m]} - {idx})
+        for idx, component in enumerate(components)
+    ]
+    dependents: list[set[int]] = [set() for _ in components]
+    for idx, component in enumerate(components):
+        for method in component:
+            for callee in callees[method]:
+                if component_of[callee] != idx:
+                    dependents[component_of[callee]].add(idx)
+
+    compiled: dict[ir.Method, bytes] = {}
+    failed: set[int] = set()  # compiled in process, so are their callers
+    ready = [idx for idx, count in enumerate(waiting) if count == 0]
+
+    def finish(idx: int) -> None:
+        for dependent in dependents[idx]:
+            if idx in failed:
+                failed.add(dependent)
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                ready.append(dependent)
+
+    report.workers = max_workers
+    context = multiprocessing.get_context("fork")
+    try:
+        with ProcessPoolExecutor(max_workers, mp_context=context) as pool:
+            running: dict[Future, int] = {}
+            while ready or running:
+                while ready:
+                    idx = ready.pop()
+                    component = components[idx]
+                    if idx in failed:
+                        _compile_in_process(component, report)
+                        finish(idx)
+                        continue
+                    shipped = [
+                        (id(callee), compiled[callee])
+                        for callee in _closure(component, callees)
+                    ]
+                    ids = [id(method) for method in component]
+                    running[pool.submit(_compile_component, ids, shipped)] = idx
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx = running.pop(future)
+                    component = components[idx]
+                    if not _apply(component, future, compiled, report):
+                        failed.add(idx)
+                        _compile_in_process(component, report)
+                    finish(idx)
+    finally:
+        _known = {}
+
+
+def _apply(
+    component: list[ir.Method],
+    future: Future,
+    compiled: dict[ir.Method, bytes],
+    report: BatchReport,
+) -> bool:
+    """Read the IR compiled by a worker into the methods of the component."""
+    try:
+        results = future.result()
+    except Exception as e:
+        names = ", ".join(method.sym_name or "<lambda>" for method in component)
+        report.errors.append(f"{names}: {type(e).__name__}: {e}")
+        return False
+
+    for ref, data, elapsed in results:
+        method = _known[ref]
+        _Reader(io.BytesIO(data), method.dialects, known=_known).read_method(method)
+        compiled[method] = data
+        report.times[method] = elapsed
+    report.components.append(component)
+    return True
+
+
+def _refresh_calls(method: ir.Method, component: list[ir.Method]) -> None:
+    """Set the result type of the calls to the callees outside of the
+    component, which may have been lowered before their callee was compiled.
+    """
+    for stmt in method.callable_region.walk():
+        if isinstance(stmt, func.Invoke) and stmt.callee not in component:
+            stmt.result.type = stmt.callee.return_type or types.Any
+
+
+def _reachable(callees: dict[ir.Method, list[ir.Method]]) -> dict[int, ir.Method]:
+    """All the methods the IR of the batch may refer to, by id."""
+    known: dict[int, ir.Method] = {}
+    stack = list(callees)
+    while stack:
+        method = stack.pop()
+        if id(method) in known:
+            continue
+        known[id(method)] = method
+        for stmt in method.code.walk():
+            for attr in stmt.attributes.values():
+                if isinstance(data := getattr(attr, "data", None), ir.Method):
+                    stack.append(data)
+            if (trait := stmt.get_trait(ir.StaticCall)) is not None:
+                stack.append(trait.get_callee(stmt))
+    return known
+
+
+def _closure(
+    component: list[ir.Method], callees: dict[ir.Method, list[ir.Method]]
+) -> list[ir.Method]:
+    """The callees of the component, transitively."""
+    seen: dict[ir.Method, None] = {}
+    stack = [callee for method in component for callee in callees[method]]
+    while stack:
+        method = stack.pop()
+        if method in seen:
+            continue
+        seen[method] = None
+        stack.extend(callees.get(method, ()))
+    return list(seen)
+
+
+# worker process
+
+_known: dict[int, ir.Method] = {}
+"""The methods shared with the worker processes, by id. The ids are the same
+in the forked workers."""
+_applied: set[int] = set()
+"""The methods whose compiled IR has been read by the worker."""
+
+
+def _compile_component(
+    ids: list[int], shipped: list[tuple[int, bytes]]
+) -> list[tuple[int, bytes, float]]:
+    """Compile a component in a worker process, return its compiled IR.
+
+    Errors, e.g. when the compiled IR cannot be serialized, are sent back to
+    the main process, which compiles the component again.
+    """
+    for ref, data in shipped:
+        if ref in _applied:
+            continue
+        method = _known[ref]
+        _Reader(io.BytesIO(data), method.dialects, known=_known).read_method(method)
+        _applied.add(ref)
+
+    component = [_known[ref] for ref in ids]
+    times = []
+    for method in component:
+        _refresh_calls(method, component)
+        start = time.perf_counter()
+        method.run_passes(method)  # type: ignore
+        times.append(time.perf_counter() - start)
+    _applied.update(ids)
+
+    results = []
+    for ref, elapsed in zip(ids, times):
+        stream = io.BytesIO()
+        _Writer(stream, known=_known).write_method(_known[ref])
+        results.append((ref, stream.getvalue(), elapsed))
+    return results
+
+
+@dataclass
+class _Writer(Writer):
+    """Write references to other methods as their id in the main process."""
+
+    known: dict[int, ir.Method] = field(default_factory=dict, kw_only=True)
+
+    def method_ref(self, method: ir.Method) -> int:
+        if self.known.get(id(method)) is not method:
+            raise TypeError(f"method {method.sym_name} is not shared")
+        return id(method)
+
+
+@dataclass
+class _Reader(Reader):
+    """Resolve references to other methods by their id in the main process."""
+
+    known: dict[int, ir.Method] = field(default_factory=dict, kw_only=True)
+    # NOTE: the IR is written by the workers forked from the current process
+    trusted: bool = field(default=True, kw_only=True)
+
+    def resolve_method(self, ref) -> ir.Method:
+        if (method := self.known.get(ref)) is None:
+            raise TypeError(f"cannot resolve method {ref!r}")
+        return method
@@ -0,0 +1,470 @@
+"""Persistent on-disk cache of compiled methods.
+
+The cache is opt-in, enable it with [`set_compile_cache`][kirin.cache.set_compile_cache]
+before the kernels are defined:
+
+```python
+from kirin.cache import CompileCache, set_compile_cache
+
+set_compile_cache(CompileCache(".kirin-cache"))
+```
+
+When a cache is enabled, [`DialectGroup.__call__`][kirin.ir.DialectGroup.__call__]
+looks up the lowered and optimized IR of the Python function in the cache
+and skips lowering and passes on a hit. The key of a method is computed from
+
+- the source code of the function, its file and line offset,
+- the dialects of the group and the pass generator,
+- the positional and keyword arguments passed to the passes,
+- the values of the global and closure variables used by the function,
+  methods are identified by their own key,
+- the Python and kirin versions and the `salt` of the cache.
+
+The entries are written with [`kirin.serialization`][kirin.serialization].
+Any mismatch, missing entry or error while loading an entry falls back to
+the normal compilation. Methods whose IR refers to Python objects that
+cannot be pickled, or to methods that are not compiled through the cache,
+are not cached.
+
+!!! note
+    Module attributes (e.g. `config.N`) are identified by the module name
+    only, bump the `salt` of the cache if they change. The same applies to
+    changes in the implementation of dialects outside of kirin.
+
+!!! warning
+    Only use a cache directory that is writable by trusted users. The
+    entries are read as untrusted streams, see
+    [`Reader.trusted`][kirin.serialization.Reader.trusted], which limits the
+    objects they can unpickle, but a modified entry still replaces the IR
+    of the kernels.
+
+The in-memory [`ContentCache`][kirin.cache.ContentCache] complements it:
+enabled with [`set_content_cache`][kirin.cache.set_content_cache], it reuses
+the optimized IR of methods whose lowered IR has the same structural hash,
+e.g. kernels created by the same closure.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import types
+import pickle
+import hashlib
+import inspect
+import tempfile
+from typing import Any, Callable, Hashable
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+from dataclasses import field, dataclass
+
+from kirin import ir
+from kirin.serialization import Reader, Writer
+
+FORMAT_VERSION = 2
+"""Version of the cache entry format, part of the key of all entries."""
+
+
+def _kirin_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("kirin-toolchain")
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+@dataclass
+class CompileCache:
+    """A directory of compiled methods.
+
+    ### Parameters
+    - `path`: the directory where the entries are stored, created if missing.
+    - `salt`: an extra string mixed into all keys, change it to invalidate
+        the entries when something the key does not track has changed.
+    """
+
+    path: str | os.PathLike
+    salt: str = field(default="", kw_only=True)
+    hits: int = field(default=0, init=False)
+    """Number of methods loaded from the cache."""
+    misses: int = field(default=0, init=False)
+    """Number of methods compiled because no valid entry was found."""
+    _keys: WeakKeyDictionary[ir.Method, str] = field(
+        default_factory=WeakKeyDictionary, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(
+        self,
+        group: ir.DialectGroup,
+        py_func: Callable,
+        args: tuple = (),
+        options: dict[str, Any] = {},
+        *,
+        file: str = "",
+        lineno_offset: int = 0,
+    ) -> str | None:
+        """Compute the key of a Python function compiled by the dialect group.
+
+        Returns:
+            str | None: the key, `None` if the function cannot be cached.
+        """
+        try:
+            source = inspect.getsource(py_func)
+        except (OSError, TypeError):
+            return None
+
+        namespace = self.__namespace(py_func)
+        if namespace is None:
+            return None
+
+        env = []
+        for name, value in sorted(namespace.items()):
+            fingerprint = self.__fingerprint(value)
+            if fingerprint is None:
+                return None
+            env.append((name, fingerprint))
+
+        run_pass_gen = group.run_pass_gen
+        payload = (
+            FORMAT_VERSION,
+            _kirin_version(),
+            sys.version_info[:2],
+            self.salt,
+            source,
+            py_func.__qualname__,
+            file,
+            lineno_offset,
+            sorted(dialect.name for dialect in group.data),
+            (
+                None
+                if run_pass_gen is None
+                else (run_pass_gen.__module__, run_pass_gen.__qualname__)
+            ),
+            repr(args),
+            repr(sorted(options.items())),
+            env,
+        )
+        return hashlib.sha256(repr(payload).encode()).hexdigest()
+
+    def load(
+        self,
+        key: str,
+        group: ir.DialectGroup,
+        py_func: Callable,
+        method: ir.Method,
+    ) -> tuple[ir.Statement, bool] | None:
+        """Load the code of a method from the cache.
+
+        Args:
+            key: the key of the method, see [`key`][kirin.cache.CompileCache.key].
+            group: the dialect group compiling the method.
+            py_func: the Python function of the method.
+            method: the method the code is loaded into, recursive references
+                in the IR are resolved to it. This can be an uninitialized
+                method created with `Method.__new__`, it is left untouched
+                on a miss.
+
+        Returns:
+            tuple[ir.Statement, bool] | None: the code and whether type
+                inference has been run on it, `None` on a miss.
+        """
+        filename = self.__filename(key)
+        if not os.path.exists(filename):
+            self.misses += 1
+            return None
+
+        namespace = self.__namespace(py_func) or {}
+        try:
+            with open(filename, "rb") as f:
+                if f.read(len(key)) != key.encode():
+                    raise ValueError("cache entry does not match its key")
+                _Reader(f, group, namespace=namespace).read_method(method)
+        except Exception:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return method.code, method.inferred
+
+    def store(self, key: str, method: ir.Method) -> bool:
+        """Store the code of a compiled method in the cache.
+
+        Returns:
+            bool: `True` if the method has been stored, `False` if its IR
+                refers to objects that cannot be cached.
+        """
+        buffer = io.BytesIO()
+        buffer.write(key.encode())
+        namespace = self.__namespace(method.py_func) if method.py_func else {}
+        names = {
+            id(value): name
+            for name, value in (namespace or {}).items()
+            if isinstance(value, ir.Method)
+        }
+        try:
+            _Writer(buffer, names=names).write_method(method)
+        except Exception:
+            return False
+
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buffer.getvalue())
+            os.replace(tmp, self.__filename(key))
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return False
+        return True
+
+    def register(self, method: ir.Method, key: str) -> None:
+        """Record the key of a method compiled with the cache, so that
+        methods using it can be cached too.
+        """
+        self._keys[method] = key
+
+    def registered_key(self, method: ir.Method) -> str | None:
+        """Return the key a method has been registered with, if any."""
+        return self._keys.get(method)
+
+    def clear(self) -> None:
+        """Remove all the entries of the cache."""
+        for name in os.listdir(self.path):
+            if name.endswith(".kirin"):
+                os.remove(os.path.join(self.path, name))
+
+    def __filename(self, key: str) -> str:
+        return os.path.join(self.path, key + ".kirin")
+
+    def __namespace(self, py_func: Callable) -> dict[str, Any] | None:
+        """The global and closure variables used by the function."""
+        code = getattr(py_func, "__code__", None)
+        if code is None:
+            return None
+
+        names: set[str] = set()
+        stack = [code]
+        while stack:
+            each = stack.pop()
+            names.update(each.co_names)
+            stack.extend(c for c in each.co_consts if isinstance(c, types.CodeType))
+
+        namespace = {
+            name: py_func.__globals__[name]
+            for name in names
+            if name in py_func.__globals__
+        }
+        try:
+            namespace.update(inspect.getclosurevars(py_func).nonlocals)
+        except Exception:
+            return None
+        return namespace
+
+    def __fingerprint(self, value: Any) -> Any:
+        if isinstance(value, ir.Method):
+            return self._keys.get(value)
+        elif isinstance(value, types.ModuleType):
+            return ("module", value.__name__)
+
+        try:
+            data = pickle.dumps(value)
+        except Exception:
+            return None
+        return hashlib.sha256(data).hexdigest()
+
+
+_compile_cache: CompileCache | None = None
+
+
+def set_compile_cache(cache: CompileCache | str | os.PathLike | None) -> None:
+    """Set the compile cache used by all dialect groups, `None` disables it.
+
+    Args:
+        cache: the cache or the path of its directory.
+    """
+    global _compile_cache
+    if cache is not None and not isinstance(cache, CompileCache):
+        cache = CompileCache(cache)
+    _compile_cache = cache
+
+
+def get_compile_cache() -> CompileCache | None:
+    """Return the current compile cache, if any."""
+    return _compile_cache
+
+
+@dataclass
+class _ContentEntry:
+    group: ir.DialectGroup
+    lowered: ir.Statement
+    """A copy of the code before the passes ran."""
+    callees: tuple[tuple[ir.Method, int], ...]
+    """The methods called by the code and their version."""
+    code: ir.Statement | None = None
+    """The optimized code."""
+    inferred: bool = False
+
+
+@dataclass
+class ContentCache:
+    """An in-memory cache of optimized IR, addressed by the
+    [structural hash][kirin.ir.IRNode.structural_hash] of the lowered IR.
+
+    Functions lowering to the same IR, e.g. kernels created by the same
+    closure or by code generation, are compiled once per dialect group and
+    pass arguments; the others get a copy of the optimized code. Entries are
+    confirmed with a structural comparison, and dropped once a method they
+    call is redefined.
+
+    The cache is opt-in, enable it with
+    [`set_content_cache`][kirin.cache.set_content_cache].
+
+    ### Parameters
+    - `maxsize`: the maximum number of entries, the least recently used
+        entries are dropped first.
+    """
+
+    maxsize: int = 1024
+    hits: int = field(default=0, init=False)
+    """Number of methods whose optimized code was reused."""
+    misses: int = field(default=0, init=False)
+    """Number of methods compiled because no entry was found."""
+    _entries: OrderedDict[Hashable, _ContentEntry] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+
+    def key(
+        self,
+        group: ir.DialectGroup,
+        code: ir.Statement,
+        args: tuple = (),
+        options: dict[str, Any] = {},
+    ) -> Hashable | None:
+        """Compute the key of freshly lowered code compiled by the dialect group.
+
+        Returns:
+            the key, or `None` if the pass arguments are not hashable.
+        """
+        key = (id(group), args, tuple(options.items()), code.structural_hash())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def load(
+        self, key: Hashable, group: ir.DialectGroup, code: ir.Statement
+    ) -> tuple[ir.Statement, bool] | None:
+        """Return a copy of the optimized code and whether it is inferred, or
+        `None` on a miss. On a miss, a copy of the lowered code is kept until
+        the optimized code is [stored][kirin.cache.ContentCache.store].
+        """
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry.code is not None
+            and entry.group is group
+            and all(callee.version == version for callee, version in entry.callees)
+            and _same_lowering(entry.lowered, code)
+        ):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy(entry.code), entry.inferred
+
+        self.misses += 1
+        if (callees := _callees(code)) is not None:
+            self._entries[key] = _ContentEntry(group, _copy(code), callees)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return None
+
+    def store(self, key: Hashable, method: ir.Method) -> None:
+        """Record the optimized code of a method looked up with `key`."""
+        if (entry := self._entries.get(key)) is None:
+            return
+        callees = _callees(method.code, method)
+        if callees is None:  # NOTE: refers to the method itself
+            del self._entries[key]
+            return
+        entry.code = _copy(method.code)
+        entry.inferred = method.inferred
+
+    def clear(self) -> None:
+        """Remove all the entries of the cache."""
+        self._entries.clear()
+
+
+def _copy(code: ir.Statement) -> ir.Statement:
+    return code.from_stmt(code, regions=[region.clone() for region in code.regions])
+
+
+def _callees(
+    code: ir.Statement, method: ir.Method | None = None
+) -> tuple[tuple[ir.Method, int], ...] | None:
+    """The methods referred to by the code and their version, `None` if the
+    code refers to `method` itself, which a copy cannot refer to."""
+    callees: dict[ir.Method, int] = {}
+    for stmt in code.walk():
+        for attr in stmt.attributes.values():
+            if isinstance(data := getattr(attr, "data", None), ir.Method):
+                callees[data] = data.version
+        if (trait := stmt.get_trait(ir.StaticCall)) is not None:
+            callee = trait.get_callee(stmt)
+            callees[callee] = callee.version
+    if method is not None and method in callees:
+        return None
+    return tuple(callees.items())
+
+
+def _same_lowering(a: ir.Statement, b: ir.Statement) -> bool:
+    if not a.is_equal(b):
+        return False
+    return all(
+        x.type == y.type
+        for stmt_a, stmt_b in zip(a.walk(), b.walk())
+        for x, y in zip(stmt_a._results, stmt_b._results)
+    )
+
+
+_content_cache: ContentCache | None = None
+
+
+def set_content_cache(cache: ContentCache | None) -> None:
+    """Set the content cache used by all dialect groups, `None` disables it."""
+    global _content_cache
+    _content_cache = cache
+
+
+def get_content_cache() -> ContentCache | None:
+    """Return the current content cache, if any."""
+    return _content_cache
+
+
+@dataclass
+class _Writer(Writer):
+    """Write references to other methods as their global or closure name."""
+
+    names: dict[int, str] = field(default_factory=dict, kw_only=True)
+
+    def method_ref(self, method: ir.Method) -> str:
+        if (name := self.names.get(id(method))) is None:
+            raise TypeError(f"method {method.sym_name} is not cacheable")
+        return name
+
+
+@dataclass
+class _Reader(Reader):
+    """Resolve references to other methods in the namespace of the function."""
+
+    namespace: dict[str, Any] = field(default_factory=dict, kw_only=True)
+
+    def resolve_method(self, ref) -> ir.Method:
+        if not isinstance(method := self.namespace.get(ref), ir.Method):
+            raise TypeError(f"cannot resolve method {ref!r}")
+        return method
@@ -15,11 +15,9 @@ class EmitCheck(BaseModifier):
             self._VERIFICATION_ERROR: ValidationError,
         }
         body: list[str] = []
-        for name in self.fields.blocks.keys():
-            body.append(f"{self._self_name}.{name}.verify()")
-
+        # NOTE: blocks and regions are verified by `Statement.verify`,
+        # successors are verified by the statements of their own region.
         for name, f in self.fields.regions.items():
-            body.append(f"{self._self_name}.{name}.verify()")
             if not f.multi:
                 body.append(f"if len({self._self_name}.{name}.blocks) != 1:")
                 body.append(
@@ -26,6 +26,7 @@ class EmitInit(BaseModifier):
     _ATTR_FACTORY_PREFIX = "_kirin_attr_factory_"
     _SELF_CLASS = "_kirin_self_class"
     _KIRIN_STMT = "_kirin_Statement"
+    _ARGS_SLICE = "_kirin_args_slice"
 
     def __init__(self, cls: type, **kwargs: Unpack[StatementOptions]) -> None:
         super().__init__(cls, **kwargs)
@@ -227,16 +228,12 @@ class EmitInit(BaseModifier):
 
     def _args_slice(self, has_args_groups: bool):
         if not has_args_groups:
-            return (
-                "{"
-                + ", ".join(
-                    [
-                        f"'{f.name}': {index}"
-                        for index, f in enumerate(self.fields.args.values())
-                    ]
-                )
-                + "}"
-            )
+            # NOTE: the slices do not depend on the arguments, all the
+            # statements of the class share the same mapping.
+            self._init_locals[self._ARGS_SLICE] = {
+                f.name: index for index, f in enumerate(self.fields.args.values())
+            }
+            return self._ARGS_SLICE
 
         # NOTE: SSAValue fields do not have default/default_factory
         # so we can just count the input arguments
@@ -156,7 +156,10 @@ class EmitProperty(BaseModifier):
         setter = create_fn(
             f"_set_{f.name}",
             args=[self._self_name, "value: _value_hint"],
-            body=[f"{self._self_name}.successors[{index}] = value"],
+            body=[
+                f"{self._self_name}.successors[{index}] = value",
+                f"{self._self_name}.invalidate_structural_hash()",
+            ],
             globals=self.globals,
             locals={"_value_hint": ir.Block},
             return_type=None,
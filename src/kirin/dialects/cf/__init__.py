@@ -7,9 +7,18 @@ a Python AST to this dialect, use the `kirin.dialects.lowering.cf` dialect
 with this dialect.
 """
 
-from kirin.dialects.cf import abstract as abstract, constprop as constprop
+from kirin.dialects.cf import (
+    syntax as syntax,
+    _python as _python,
+    rewrite as rewrite,
+    abstract as abstract,
+    constprop as constprop,
+    typeinfer as typeinfer,
+)
 from kirin.dialects.cf.stmts import (
     Branch as Branch,
+    RangeNext as RangeNext,
+    RangeBranch as RangeBranch,
     ConditionalBranch as ConditionalBranch,
 )
 from kirin.dialects.cf.interp import CfInterpreter as CfInterpreter
@@ -0,0 +1,82 @@
+from kirin import ir, emit, interp
+from kirin.dialects import py
+from kirin.dialects.cf.stmts import Branch, RangeNext, RangeBranch, ConditionalBranch
+from kirin.dialects.cf.dialect import dialect
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Branch)
+    def branch(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Branch):
+        emit_.emit_branch(frame, stmt.successor, frame.get_values(stmt.arguments))
+        return ()
+
+    @interp.impl(ConditionalBranch)
+    def conditional_branch(
+        self, emit_: emit.Python, frame: emit.PythonFrame, stmt: ConditionalBranch
+    ):
+        frame.write_line(f"if {frame.get(stmt.cond)}:")
+        with frame.indent():
+            emit_.emit_branch(
+                frame, stmt.then_successor, frame.get_values(stmt.then_arguments)
+            )
+        frame.write_line("else:")
+        with frame.indent():
+            emit_.emit_branch(
+                frame, stmt.else_successor, frame.get_values(stmt.else_arguments)
+            )
+        return ()
+
+    @interp.impl(RangeBranch)
+    @interp.impl(RangeNext)
+    def range_branch(
+        self,
+        emit_: emit.Python,
+        frame: emit.PythonFrame,
+        stmt: RangeBranch | RangeNext,
+    ):
+        index, stop, step = frame.get_values((stmt.index, stmt.stop, stmt.step))
+        if isinstance(stmt, RangeNext):
+            next_index = emit_.fresh("index")
+            frame.write_line(f"{next_index} = {index} + {step}")
+            index = next_index
+
+        # NOTE: the direction of constant steps is known statically
+        sign = self.step_sign(stmt.step)
+        if sign is None:
+            if isinstance(stmt, RangeBranch):
+                frame.write_line(f"if {step} == 0:")
+                with frame.indent():
+                    frame.write_line(
+                        'raise ValueError("range() arg 3 must not be zero")'
+                    )
+            cond = f"({index} < {stop} if {step} > 0 else {index} > {stop})"
+        else:
+            cond = f"{index} < {stop}" if sign > 0 else f"{index} > {stop}"
+
+        frame.write_line(f"if {cond}:")
+        with frame.indent():
+            emit_.emit_branch(
+                frame,
+                stmt.body_successor,
+                (index, *frame.get_values(stmt.body_arguments)),
+            )
+        frame.write_line("else:")
+        with frame.indent():
+            emit_.emit_branch(
+                frame, stmt.exit_successor, frame.get_values(stmt.exit_arguments)
+            )
+        return ()
+
+    @staticmethod
+    def step_sign(step: ir.SSAValue) -> int | None:
+        """Return the sign of a constant non-zero step, `None` otherwise."""
+        if not (
+            isinstance(step, ir.ResultValue)
+            and isinstance(step.owner, py.Constant)
+            and type(value := step.owner.value.unwrap()) is int
+            and value != 0
+        ):
+            return None
+        return 1 if value > 0 else -1
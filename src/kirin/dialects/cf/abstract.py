@@ -1,5 +1,5 @@
 from kirin.interp import Successor, MethodTable, AbstractFrame, impl
-from kirin.dialects.cf.stmts import Branch, ConditionalBranch
+from kirin.dialects.cf.stmts import Branch, RangeNext, RangeBranch, ConditionalBranch
 from kirin.analysis.typeinfer import TypeInference
 from kirin.dialects.cf.dialect import dialect
 
@@ -25,3 +25,23 @@ class AbstractMethodTable(MethodTable):
             Successor(stmt.then_successor, *frame.get_values(stmt.then_arguments))
         )
         return ()
+
+    @impl(RangeBranch)
+    @impl(RangeNext)
+    def range_branch(
+        self,
+        interp: TypeInference,
+        frame: AbstractFrame,
+        stmt: RangeBranch | RangeNext,
+    ):
+        frame.worklist.append(
+            Successor(stmt.exit_successor, *frame.get_values(stmt.exit_arguments))
+        )
+        frame.worklist.append(
+            Successor(
+                stmt.body_successor,
+                interp.lattice.top(),
+                *frame.get_values(stmt.body_arguments),
+            )
+        )
+        return ()
@@ -1,6 +1,6 @@
 from kirin.interp import Successor, MethodTable, impl
 from kirin.analysis import const
-from kirin.dialects.cf.stmts import Branch, ConditionalBranch
+from kirin.dialects.cf.stmts import Branch, RangeNext, RangeBranch, ConditionalBranch
 from kirin.dialects.cf.dialect import dialect
 
 
@@ -49,3 +49,42 @@ class ConstPropMethodTable(MethodTable):
 
             frame.entries[stmt.cond] = cond
         return ()
+
+    @impl(RangeBranch)
+    @impl(RangeNext)
+    def range_branch(
+        self,
+        interp: const.Propagate,
+        frame: const.Frame,
+        stmt: RangeBranch | RangeNext,
+    ):
+        frame = interp.state.current_frame
+        index, stop, step = frame.get_values((stmt.index, stmt.stop, stmt.step))
+        # NOTE: only the entry of a loop over a constant range is decided,
+        # the induction variable is not tracked
+        enter = None
+        if (
+            isinstance(stmt, RangeBranch)
+            and isinstance(index, const.Value)
+            and isinstance(stop, const.Value)
+            and isinstance(step, const.Value)
+            and step.data != 0
+        ):
+            if step.data > 0:
+                enter = bool(index.data < stop.data)
+            else:
+                enter = bool(index.data > stop.data)
+
+        if enter is not True:
+            frame.worklist.append(
+                Successor(stmt.exit_successor, *frame.get_values(stmt.exit_arguments))
+            )
+        if enter is not False:
+            frame.worklist.append(
+                Successor(
+                    stmt.body_successor,
+                    const.Unknown(),
+                    *frame.get_values(stmt.body_arguments),
+                )
+            )
+        return ()
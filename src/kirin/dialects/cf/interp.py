@@ -1,5 +1,5 @@
 from kirin.interp import Frame, Successor, Interpreter, MethodTable, impl
-from kirin.dialects.cf.stmts import Branch, ConditionalBranch
+from kirin.dialects.cf.stmts import Branch, RangeNext, RangeBranch, ConditionalBranch
 from kirin.dialects.cf.dialect import dialect
 
 
@@ -22,3 +22,28 @@ class CfInterpreter(MethodTable):
             return Successor(
                 stmt.else_successor, *frame.get_values(stmt.else_arguments)
             )
+
+    @impl(RangeBranch)
+    def range_branch(self, interp: Interpreter, frame: Frame, stmt: RangeBranch):
+        index, stop, step = frame.get_values((stmt.index, stmt.stop, stmt.step))
+        if step == 0:
+            raise ValueError("range() arg 3 must not be zero")
+        return self.range_successor(frame, stmt, index, stop, step)
+
+    @impl(RangeNext)
+    def range_next(self, interp: Interpreter, frame: Frame, stmt: RangeNext):
+        index, stop, step = frame.get_values((stmt.index, stmt.stop, stmt.step))
+        return self.range_successor(frame, stmt, index + step, stop, step)
+
+    @staticmethod
+    def range_successor(
+        frame: Frame, stmt: RangeBranch | RangeNext, index: int, stop: int, step: int
+    ):
+        if index < stop if step > 0 else index > stop:
+            return Successor(
+                stmt.body_successor, index, *frame.get_values(stmt.body_arguments)
+            )
+        else:
+            return Successor(
+                stmt.exit_successor, *frame.get_values(stmt.exit_arguments)
+            )
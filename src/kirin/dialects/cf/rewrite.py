@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from kirin import ir, types, lowering
+from kirin.analysis import CFG
+from kirin.dialects import py, func
+from kirin.rewrite.abc import RewriteRule, RewriteResult
+from kirin.dialects.cf.stmts import RangeNext, RangeBranch, ConditionalBranch
+from kirin.dialects.cf.dialect import dialect
+
+
+@dialect.canonicalize
+class RangeLoop(RewriteRule):
+    """Rewrite the loops over a `range` into counted loops.
+
+    The Python `for` loops are lowered into a `py.iterable.Iter` statement
+    followed by a `py.iterable.Next` statement, a comparison with `None` and
+    a `cf.ConditionalBranch` to enter the body of the loop, and the same
+    three statements at the end of the body. When the iterable is the result
+    of a `range`-like statement, see
+    [`FromPythonRangeLike`][kirin.lowering.FromPythonRangeLike], these are
+    replaced by a [`RangeBranch`][kirin.dialects.cf.RangeBranch] statement
+    and a [`RangeNext`][kirin.dialects.cf.RangeNext] statement, and the
+    iterator is removed.
+
+    The loop is rewritten only if the iterator is used by these two `Next`
+    statements and nothing else, the body of the loop is only entered from
+    them and the loop does not contain the entry. The bounds of the range
+    must also have the type `int`, as `range` raises on other bounds and the
+    counted loop does not check them once the `range` statement is removed.
+
+    !!! note
+        The rule rewrites all the loops nested in the node it is applied
+        to, it does not need to be wrapped in `Walk` or `Fixpoint`.
+    """
+
+    def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
+        iters = [
+            stmt
+            for stmt in node.walk()
+            if isinstance(stmt, py.iterable.Iter)
+            and isinstance(stmt.value, ir.ResultValue)
+            and stmt.value.owner.has_trait(lowering.FromPythonRangeLike)
+        ]
+        cfgs: dict[ir.Region, CFG] = {}
+        changed = False
+        for stmt in iters:
+            changed = self.rewrite_Iter(stmt, cfgs) or changed
+        return RewriteResult(has_done_something=changed)
+
+    def rewrite_Iter(self, node: py.iterable.Iter, cfgs: dict[ir.Region, CFG]):
+        uses = node.iter.uses
+        if len(uses) != 2:
+            return False
+        branches = [self.match_next(use.stmt) for use in uses]
+        if any(each is None for each in branches):
+            return False
+        if (entry_block := node.parent_block) is None:
+            return False
+
+        entry = latch = None
+        for branch in branches:
+            if branch.parent_block is entry_block:
+                entry = branch
+            else:
+                latch = branch
+        if entry is None or latch is None:
+            return False
+
+        body = entry.else_successor
+        if (
+            latch.else_successor is not body
+            or body in (entry.then_successor, latch.then_successor)
+            or (region := body.parent) is None
+        ):
+            return False
+
+        cfg = cfgs.get(region)
+        if cfg is None:
+            cfg = cfgs[region] = CFG(region)
+        if cfg.predecessors.get(body) != {entry_block, latch.parent_block}:
+            return False
+        loop = next((each for each in cfg.loops if each.header is body), None)
+        if loop is None or latch.parent_block not in loop or entry_block in loop:
+            return False
+
+        start, stop, step = node.value.owner.args  # type: ignore
+        if not all(arg.type.is_subseteq(types.Int) for arg in (start, stop, step)):
+            return False
+        self.replace(entry, RangeBranch, start, stop, step)
+        self.replace(latch, RangeNext, body.args[0], stop, step)
+        # NOTE: the bounds of the loops nested in this one may depend on it
+        body.args[0].type = types.Int
+        node.delete()
+        return True
+
+    def match_next(self, node: ir.Statement) -> ConditionalBranch | None:
+        """Return the branch on the exhaustion of the iterator advanced by
+        `node`, if `node` is a `Next` statement only used by this branch."""
+        if not isinstance(node, py.iterable.Next) or len(node.value.uses) != 2:
+            return None
+
+        cmp = branch = None
+        for use in node.value.uses:
+            if isinstance(use.stmt, py.cmp.Is):
+                cmp = use.stmt
+            elif isinstance(use.stmt, ConditionalBranch):
+                branch = use.stmt
+        if (
+            cmp is None
+            or branch is None
+            or branch.cond is not cmp.result
+            or len(cmp.result.uses) != 1
+            or not self.is_none(cmp.rhs if cmp.lhs is node.value else cmp.lhs)
+            or not branch.else_arguments
+            or branch.else_arguments[0] is not node.value
+            or node.parent_block is not branch.parent_block
+        ):
+            return None
+        return branch
+
+    @staticmethod
+    def is_none(value: ir.SSAValue) -> bool:
+        if not isinstance(value, ir.ResultValue):
+            return False
+        owner = value.owner
+        if isinstance(owner, func.ConstantNone):
+            return True
+        return (
+            isinstance(owner, py.Constant)
+            and isinstance(owner.value, ir.PyAttr)
+            and owner.value.data is None
+        )
+
+    @staticmethod
+    def replace(
+        branch: ConditionalBranch,
+        stmt_type: type[RangeBranch] | type[RangeNext],
+        index: ir.SSAValue,
+        stop: ir.SSAValue,
+        step: ir.SSAValue,
+    ) -> None:
+        cmp = branch.cond.owner
+        next_stmt = branch.else_arguments[0].owner
+        branch.replace_by(
+            stmt_type(
+                index=index,
+                stop=stop,
+                step=step,
+                body_arguments=branch.else_arguments[1:],
+                exit_arguments=branch.then_arguments,
+                body_successor=branch.else_successor,
+                exit_successor=branch.then_successor,
+            )
+        )
+        cmp.delete()  # type: ignore
+        next_stmt.delete()  # type: ignore
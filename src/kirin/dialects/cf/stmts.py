@@ -12,9 +12,6 @@ class Branch(ir.Statement):
     arguments: tuple[ir.SSAValue, ...]
     successor: ir.Block = info.block()
 
-    def verify(self) -> None:
-        return
-
     def print_impl(self, printer: Printer) -> None:
         with printer.rich(style="keyword"):
             printer.print_name(self)
@@ -64,5 +61,77 @@ class ConditionalBranch(ir.Statement):
         printer.print_seq(self.else_arguments, delim=", ")
         printer.plain_print(")")
 
-    def verify(self) -> None:
-        return
+
+@statement(dialect=dialect)
+class RangeBranch(ir.Statement):
+    """Enter a counted loop over `range(index, stop, step)`.
+
+    Branch to `body_successor` with `index` followed by `body_arguments` if
+    `index` is in the range, i.e. `index < stop` for a positive `step` and
+    `index > stop` otherwise, or to `exit_successor` with `exit_arguments`.
+    The loop continues with a [`RangeNext`][kirin.dialects.cf.RangeNext]
+    statement at the end of the body.
+    """
+
+    name = "range_br"
+    traits = frozenset({ir.IsTerminator()})
+
+    index: ir.SSAValue = info.argument(types.Int)
+    stop: ir.SSAValue = info.argument(types.Int)
+    step: ir.SSAValue = info.argument(types.Int)
+    body_arguments: tuple[ir.SSAValue, ...]
+    exit_arguments: tuple[ir.SSAValue, ...]
+
+    body_successor: ir.Block = info.block()
+    exit_successor: ir.Block = info.block()
+
+    def print_impl(self, printer: Printer) -> None:
+        _print_range_branch(self, printer)
+
+
+@statement(dialect=dialect)
+class RangeNext(ir.Statement):
+    """Continue a counted loop over `range(start, stop, step)`.
+
+    Same as [`RangeBranch`][kirin.dialects.cf.RangeBranch] with `index + step`
+    in place of `index`, the current value of the induction variable.
+    """
+
+    name = "range_next"
+    traits = frozenset({ir.IsTerminator()})
+
+    index: ir.SSAValue = info.argument(types.Int)
+    stop: ir.SSAValue = info.argument(types.Int)
+    step: ir.SSAValue = info.argument(types.Int)
+    body_arguments: tuple[ir.SSAValue, ...]
+    exit_arguments: tuple[ir.SSAValue, ...]
+
+    body_successor: ir.Block = info.block()
+    exit_successor: ir.Block = info.block()
+
+    def print_impl(self, printer: Printer) -> None:
+        _print_range_branch(self, printer)
+
+
+def _print_range_branch(stmt: RangeBranch | RangeNext, printer: Printer) -> None:
+    with printer.rich(style="keyword"):
+        printer.print_name(stmt)
+
+    printer.plain_print(" ")
+    printer.print_seq((stmt.index, stmt.stop, stmt.step), delim=", ")
+
+    with printer.rich(style="keyword"):
+        printer.plain_print(" goto ")
+
+    printer.plain_print(printer.state.block_id[stmt.body_successor])
+    printer.plain_print("(")
+    printer.print_seq(stmt.body_arguments, delim=", ")
+    printer.plain_print(")")
+
+    with printer.rich(style="keyword"):
+        printer.plain_print(" else ")
+
+    printer.plain_print(printer.state.block_id[stmt.exit_successor])
+    printer.plain_print("(")
+    printer.print_seq(stmt.exit_arguments, delim=", ")
+    printer.plain_print(")")
@@ -0,0 +1,85 @@
+from typing import TypeVar
+
+from kirin import parse
+
+from .stmts import Branch, RangeNext, RangeBranch, ConditionalBranch
+from .dialect import dialect
+
+StmtType = TypeVar("StmtType", RangeBranch, RangeNext)
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_Branch(self, parser: parse.Parser, stmt_type: type[Branch]) -> Branch:
+        # cf.br ^1(%x, %y)
+        successor = parser.parse_block()
+        arguments = parser.parse_arguments()
+        return parser.statement(
+            stmt_type,
+            args=arguments,
+            successors=(successor,),
+            args_slice={"arguments": slice(0, len(arguments))},
+        )
+
+    def parse_ConditionalBranch(
+        self, parser: parse.Parser, stmt_type: type[ConditionalBranch]
+    ) -> ConditionalBranch:
+        # cf.cond_br %cond goto ^1(%x) else ^2(%y)
+        cond = parser.parse_value()
+        parser.expect("name", "goto")
+        then_successor = parser.parse_block()
+        then_arguments = parser.parse_arguments()
+        parser.expect("name", "else")
+        else_successor = parser.parse_block()
+        else_arguments = parser.parse_arguments()
+        n_then = len(then_arguments) + 1
+        return parser.statement(
+            stmt_type,
+            args=(cond, *then_arguments, *else_arguments),
+            successors=(then_successor, else_successor),
+            args_slice={
+                "cond": 0,
+                "then_arguments": slice(1, n_then),
+                "else_arguments": slice(n_then, n_then + len(else_arguments)),
+            },
+        )
+
+    def parse_RangeBranch(
+        self, parser: parse.Parser, stmt_type: type[RangeBranch]
+    ) -> RangeBranch:
+        # cf.range_br %start, %stop, %step goto ^1(%x) else ^2(%x)
+        return _parse_range_branch(parser, stmt_type)
+
+    def parse_RangeNext(
+        self, parser: parse.Parser, stmt_type: type[RangeNext]
+    ) -> RangeNext:
+        # cf.range_next %i, %stop, %step goto ^1(%x) else ^2(%x)
+        return _parse_range_branch(parser, stmt_type)
+
+
+def _parse_range_branch(parser: parse.Parser, stmt_type: type[StmtType]) -> StmtType:
+    index = parser.parse_value()
+    parser.expect(",")
+    stop = parser.parse_value()
+    parser.expect(",")
+    step = parser.parse_value()
+    parser.expect("name", "goto")
+    body_successor = parser.parse_block()
+    body_arguments = parser.parse_arguments()
+    parser.expect("name", "else")
+    exit_successor = parser.parse_block()
+    exit_arguments = parser.parse_arguments()
+    n_body = len(body_arguments) + 3
+    return parser.statement(
+        stmt_type,
+        args=(index, stop, step, *body_arguments, *exit_arguments),
+        successors=(body_successor, exit_successor),
+        args_slice={
+            "index": 0,
+            "stop": 1,
+            "step": 2,
+            "body_arguments": slice(3, n_body),
+            "exit_arguments": slice(n_body, n_body + len(exit_arguments)),
+        },
+    )
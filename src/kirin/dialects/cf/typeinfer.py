@@ -0,0 +1,31 @@
+from kirin import types
+from kirin.interp import Successor, impl
+from kirin.analysis import ForwardFrame, TypeInference
+from kirin.dialects.cf.stmts import RangeNext, RangeBranch
+from kirin.dialects.cf.dialect import dialect
+from kirin.dialects.cf.abstract import AbstractMethodTable
+
+
+@dialect.register(key="typeinfer")
+class TypeInfer(AbstractMethodTable):
+    """Same as the abstract method table, with integer induction variables."""
+
+    @impl(RangeBranch)
+    @impl(RangeNext)
+    def range_branch(
+        self,
+        interp: TypeInference,
+        frame: ForwardFrame[types.TypeAttribute],
+        stmt: RangeBranch | RangeNext,
+    ):
+        frame.worklist.append(
+            Successor(stmt.exit_successor, *frame.get_values(stmt.exit_arguments))
+        )
+        frame.worklist.append(
+            Successor(
+                stmt.body_successor,
+                types.Int,
+                *frame.get_values(stmt.body_arguments),
+            )
+        )
+        return ()
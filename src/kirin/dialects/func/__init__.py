@@ -18,4 +18,4 @@ from kirin.dialects.func.stmts import (
 )
 from kirin.dialects.func._dialect import dialect as dialect
 
-from . import _julia as _julia
+from . import _julia as _julia, syntax as syntax, _python as _python
@@ -0,0 +1,52 @@
+from kirin import emit, interp
+
+from .stmts import Call, Invoke, Return, Function, GetField, ConstantNone
+from ._dialect import dialect
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Function)
+    def function(self, emit_: emit.Python, frame: emit.PythonFrame, node: Function):
+        args = node.body.blocks[0].args
+        frame.set_values(args, [frame.ssa[arg] for arg in args])
+        frame.write_line(f"def {emit_.entry}({', '.join(frame.get_values(args))}):")
+        with frame.indent():
+            emit_.emit_region(frame, node.body)
+        return ()
+
+    @interp.impl(Return)
+    def return_(self, emit_: emit.Python, frame: emit.PythonFrame, node: Return):
+        frame.write_line(f"return {frame.get(node.value)}")
+        return ()
+
+    @interp.impl(Invoke)
+    def invoke(self, emit_: emit.Python, frame: emit.PythonFrame, node: Invoke):
+        # NOTE: the callee runs its own compiled function, if any
+        callee = emit_.ref(node.callee, "method")
+        args = ", ".join(frame.get_values(node.inputs))
+        frame.write_line(f"{frame.ssa[node.result]} = {callee}({args})")
+        return (frame.ssa[node.result],)
+
+    @interp.impl(Call)
+    def call(self, emit_: emit.Python, frame: emit.PythonFrame, node: Call):
+        args = [
+            *frame.get_values(node.inputs),
+            *(f"{k}={v}" for k, v in zip(node.keys, frame.get_values(node.kwargs))),
+        ]
+        callee = frame.get(node.callee)
+        frame.write_line(f"{frame.ssa[node.result]} = {callee}({', '.join(args)})")
+        return (frame.ssa[node.result],)
+
+    @interp.impl(ConstantNone)
+    def const_none(
+        self, emit_: emit.Python, frame: emit.PythonFrame, node: ConstantNone
+    ):
+        return ("None",)
+
+    @interp.impl(GetField)
+    def getfield(self, emit_: emit.Python, frame: emit.PythonFrame, node: GetField):
+        obj = frame.get(node.obj)
+        frame.write_line(f"{frame.ssa[node.result]} = {obj}.fields[{node.field}]")
+        return (frame.ssa[node.result],)
@@ -36,15 +36,14 @@ class DialectConstProp(MethodTable):
             return (const.Result.bottom(),)
 
         mt: ir.Method = callee.data
-        call_frame, ret = interp.call(
-            mt.code,
-            interp.method_self(mt),
+        summary = interp.call_method(
+            mt,
             *frame.get_values(stmt.inputs),
             **{k: v for k, v in zip(stmt.keys, frame.get_values(stmt.kwargs))},
         )
-        if not call_frame.frame_is_not_pure:
+        if summary.pure:
             frame.should_be_pure.add(stmt)
-        return (ret,)
+        return (summary.ret,)
 
     @impl(Invoke)
     def invoke(
@@ -53,14 +52,10 @@ class DialectConstProp(MethodTable):
         frame: const.Frame,
         stmt: Invoke,
     ) -> StatementResult[const.Result]:
-        invoke_frame, ret = interp.call(
-            stmt.callee.code,
-            interp.method_self(stmt.callee),
-            *frame.get_values(stmt.inputs),
-        )
-        if not invoke_frame.frame_is_not_pure:
+        summary = interp.call_method(stmt.callee, *frame.get_values(stmt.inputs))
+        if summary.pure:
             frame.should_be_pure.add(stmt)
-        return (ret,)
+        return (summary.ret,)
 
     @impl(Lambda)
     def lambda_(
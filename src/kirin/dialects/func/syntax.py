@@ -0,0 +1,165 @@
+from kirin import ir, parse, types
+
+from .attrs import Signature, MethodType
+from .stmts import Call, Invoke, Lambda, Return, Function, GetField
+from ._dialect import dialect
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_Function(
+        self, parser: parse.Parser, stmt_type: type[Function]
+    ) -> Function:
+        # func.func @main(x : !py.int) -> !py.int {...} // func.func main
+        sym_name = parser.expect("symbol").text[1:]
+        slots: list[str] = []
+        inputs: list[types.TypeAttribute] = []
+        parser.expect("(")
+        while parser.peek().kind != ")":
+            slots.append(parser.expect("name").text)
+            parser.expect(":")
+            inputs.append(parser.parse_type())
+            if not parser.accept(","):
+                break
+        parser.expect(")")
+        parser.expect("->")
+        signature = Signature(tuple(inputs), parser.parse_type())
+        body = parser.parse_region()
+        _annotate_entry(body, signature)
+        return parser.statement(
+            stmt_type,
+            regions=(body,),
+            attributes={
+                "sym_name": sym_name,
+                "slots": tuple(slots),
+                "signature": signature,
+            },
+            result_types=(MethodType,),
+        )
+
+    def parse_Lambda(self, parser: parse.Parser, stmt_type: type[Lambda]) -> Lambda:
+        # func.lambda inner(%x, %y) -> !py.int {...} // func.lambda inner
+        sym_name = parser.expect("name").text
+        captured = parser.parse_arguments()
+        parser.expect("->")
+        output = parser.parse_type()
+        body = parser.parse_region()
+
+        # NOTE: the arguments are not printed, read them from the entry block
+        params = body.blocks[0].args[1:] if body.blocks else ()
+        slots = tuple(arg.name or f"arg{idx}" for idx, arg in enumerate(params))
+        signature = Signature(tuple(arg.type for arg in params), output)
+        _annotate_entry(body, signature)
+        return parser.statement(
+            stmt_type,
+            args=captured,
+            regions=(body,),
+            attributes={"sym_name": sym_name, "slots": slots, "signature": signature},
+            result_types=(MethodType,),
+            args_slice={"captured": slice(0, len(captured))},
+        )
+
+    def parse_GetField(
+        self, parser: parse.Parser, stmt_type: type[GetField]
+    ) -> GetField:
+        # func.getfield(%self, 0) : !py.int
+        parser.expect("(")
+        obj = parser.parse_value()
+        parser.expect(",")
+        field = parser.parse_python()
+        parser.expect(")")
+        parser.expect(":")
+        return parser.statement(
+            stmt_type,
+            args=(obj,),
+            attributes={"field": field},
+            result_types=(parser.parse_type(),),
+            args_slice={"obj": 0},
+        )
+
+    def parse_Return(self, parser: parse.Parser, stmt_type: type[Return]) -> Return:
+        # func.return %x
+        values = parser.parse_values()
+        return parser.statement(stmt_type, args=values, args_slice={"value": 0})
+
+    def parse_Call(self, parser: parse.Parser, stmt_type: type[Call]) -> Call:
+        # func.call %f(%x, y=%y) : !py.int maybe_pure=False
+        callee = parser.parse_value()
+        inputs, keys, kwargs = parse_call_arguments(parser)
+        result_types = parse_call_results(parser)
+        n_inputs = len(inputs) + 1
+        return parser.statement(
+            stmt_type,
+            args=(callee, *inputs, *kwargs),
+            attributes={"keys": keys, "purity": parse_purity(parser)},
+            result_types=result_types,
+            args_slice={
+                "callee": 0,
+                "inputs": slice(1, n_inputs),
+                "kwargs": slice(n_inputs, n_inputs + len(kwargs)),
+            },
+        )
+
+    def parse_Invoke(self, parser: parse.Parser, stmt_type: type[Invoke]) -> Invoke:
+        # func.invoke foo(%x, %y) : !py.int maybe_pure=False
+        callee = parser.resolve_method(parser.expect("name").text)
+        inputs = parser.parse_arguments()
+        result_types = parse_call_results(parser)
+        return parser.statement(
+            stmt_type,
+            args=inputs,
+            attributes={"callee": callee, "purity": parse_purity(parser)},
+            result_types=result_types,
+            args_slice={"inputs": slice(0, len(inputs))},
+        )
+
+
+def parse_call_arguments(
+    parser: parse.Parser,
+) -> tuple[list[ir.SSAValue], tuple[str, ...], list[ir.SSAValue]]:
+    """Parse the arguments of a call, e.g. `(%x, y=%y)`, and return the
+    positional arguments, the keywords and the keyword arguments.
+    """
+    inputs: list[ir.SSAValue] = []
+    keys: list[str] = []
+    kwargs: list[ir.SSAValue] = []
+    parser.expect("(")
+    while parser.peek().kind != ")":
+        if parser.peek(1).kind == "=":
+            keys.append(parser.expect("name").text)
+            parser.expect("=")
+            kwargs.append(parser.parse_value())
+        else:
+            inputs.append(parser.parse_value())
+        if not parser.accept(","):
+            break
+    parser.expect(")")
+    return inputs, tuple(keys), kwargs
+
+
+def parse_call_results(parser: parse.Parser) -> list[types.TypeAttribute]:
+    """Parse the result types of a call, e.g. `: !py.int`."""
+    parser.expect(":")
+    return parser.parse_types()
+
+
+def parse_purity(parser: parse.Parser) -> bool:
+    """Parse the purity of a call, e.g. `maybe_pure=False`."""
+    parser.expect("name", "maybe_pure")
+    parser.expect("=")
+    return parser.parse_python()
+
+
+def _annotate_entry(body: ir.Region, signature: Signature) -> None:
+    # NOTE: the types of unused arguments are not printed, use the signature
+    if not body.blocks or not body.blocks[0].args:
+        return
+    self_arg, *args = body.blocks[0].args
+    if self_arg.type is types.Any:
+        self_arg.type = types.Generic(
+            ir.Method, types.Tuple.where(signature.inputs), signature.output
+        )
+    for arg, typ in zip(args, signature.inputs):
+        if arg.type is types.Any:
+            arg.type = typ
@@ -44,13 +44,12 @@ class TypeInfer(MethodTable):
         if mt.inferred:  # so we don't end up in infinite loop
             return (mt.return_type,)
 
-        _, ret = interp_.call(
-            mt.code,
-            interp_.method_self(mt),
+        summary = interp_.call_method(
+            mt,
             *frame.get_values(stmt.inputs),
             **{k: v for k, v in zip(stmt.keys, frame.get_values(stmt.kwargs))},
         )
-        return (ret,)
+        return (summary.ret,)
 
     def _solve_method_type(self, interp: TypeInference, frame: Frame, stmt: Call):
         mt_inferred = frame.get(stmt.callee)
@@ -74,12 +73,8 @@ class TypeInfer(MethodTable):
         if stmt.callee.inferred:  # so we don't end up in infinite loop
             return (stmt.callee.return_type,)
 
-        _, ret = interp_.call(
-            stmt.callee.code,
-            interp_.method_self(stmt.callee),
-            *frame.get_values(stmt.inputs),
-        )
-        return (ret,)
+        summary = interp_.call_method(stmt.callee, *frame.get_values(stmt.inputs))
+        return (summary.ret,)
 
     @impl(Lambda)
     def lambda_(
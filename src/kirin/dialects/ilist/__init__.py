@@ -6,8 +6,11 @@ to Python's built-in list type.
 """
 
 from . import (
+    array as array,
     _julia as _julia,
     interp as interp,
+    syntax as syntax,
+    _python as _python,
     rewrite as rewrite,
     lowering as lowering,
     constprop as constprop,
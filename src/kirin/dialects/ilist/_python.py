@@ -0,0 +1,54 @@
+from kirin import emit, types, interp
+from kirin.dialects.py.len import Len
+from kirin.dialects.py.binop import Add
+
+from .stmts import New, Push, Range
+from .interp import IListInterpreter
+from .runtime import IList
+from ._dialect import dialect
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+    """Emit the statements the same way as the concrete implementations,
+    see [`IListInterpreter`][kirin.dialects.ilist.interp.IListInterpreter]."""
+
+    @interp.impl(Range)
+    def range(self, emit_: emit.Python, frame: emit.PythonFrame, node: Range):
+        new_range = emit_.ref(IListInterpreter.new_range, "new_range")
+        args = ", ".join(frame.get_values(node.args))
+        frame.write_line(f"{frame.ssa[node.result]} = {new_range}({args})")
+        return (frame.ssa[node.result],)
+
+    @interp.impl(New)
+    def new(self, emit_: emit.Python, frame: emit.PythonFrame, node: New):
+        new_list = emit_.ref(IListInterpreter.new_list, "new_list")
+        values = frame.get_values(node.values)
+        comma = "," if len(values) == 1 else ""
+        elem = emit_.ref(node.elem_type, "elem")
+        frame.write_line(
+            f"{frame.ssa[node.result]} = "
+            f"{new_list}(({', '.join(values)}{comma}), {elem})"
+        )
+        return (frame.ssa[node.result],)
+
+    @interp.impl(Len, types.PyClass(IList))
+    def len(self, emit_: emit.Python, frame: emit.PythonFrame, node: Len):
+        frame.write_line(
+            f"{frame.ssa[node.result]} = len({frame.get(node.value)}.data)"
+        )
+        return (frame.ssa[node.result],)
+
+    @interp.impl(Add, types.PyClass(IList), types.PyClass(IList))
+    def add(self, emit_: emit.Python, frame: emit.PythonFrame, node: Add):
+        concat = emit_.ref(IListInterpreter.concat, "concat")
+        lhs, rhs = frame.get(node.lhs), frame.get(node.rhs)
+        frame.write_line(f"{frame.ssa[node.result]} = {concat}({lhs}, {rhs})")
+        return (frame.ssa[node.result],)
+
+    @interp.impl(Push)
+    def push(self, emit_: emit.Python, frame: emit.PythonFrame, node: Push):
+        push_value = emit_.ref(IListInterpreter.push_value, "push_value")
+        lst, value = frame.get(node.lst), frame.get(node.value)
+        frame.write_line(f"{frame.ssa[node.result]} = {push_value}({lst}, {value})")
+        return (frame.ssa[node.result],)
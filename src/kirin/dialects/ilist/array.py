@@ -0,0 +1,436 @@
+"""NumPy backend of the immutable lists.
+
+With the backend enabled by
+[`set_numpy_backend`][kirin.dialects.ilist.array.set_numpy_backend], the
+interpreter stores the lists of `int`, `float` and `bool` elements it creates
+in NumPy arrays, see [`ArrayIList`][kirin.dialects.ilist.array.ArrayIList]:
+
+- `ilist.Push` appends in place to a buffer shared by the successive lists,
+    so that building a list in a loop takes linear time instead of quadratic.
+- `ilist.Map` runs the mapped method on the whole array at once when its body
+    is a single block of arithmetic, comparison and `math` statements.
+- `ilist.Foldl` does the same for the elements combined with the accumulator
+    by `+`, `-`, `*`, `&`, `|` or `^`, then reduces them with Python scalars.
+
+The vectorized kernels run with the floating point errors of NumPy raised,
+and fall back to the interpreter on any error, so that the same exceptions
+are raised as element by element. Integer operations are only vectorized
+while they cannot overflow 64 bits.
+
+!!! note
+    NumPy is an optional dependency, the backend cannot be enabled if it is
+    not installed. The transcendental functions of NumPy may differ from the
+    ones of `math` in the last bits of their results.
+"""
+
+from __future__ import annotations
+
+import weakref
+import operator
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+from dataclasses import field, dataclass
+
+from kirin import ir, types
+from kirin.dialects import py, func, math
+
+from .runtime import IList
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:
+    import numpy
+
+_enabled: bool = False
+
+
+def set_numpy_backend(enabled: bool) -> None:
+    """Enable or disable the NumPy backend of the interpreter.
+
+    Raises:
+        ImportError: if NumPy is not installed.
+    """
+    global _enabled
+    if enabled and np is None:
+        raise ImportError("the NumPy backend of ilist requires numpy")
+    _enabled = enabled
+
+
+def get_numpy_backend() -> bool:
+    """Whether the NumPy backend of the interpreter is enabled."""
+    return _enabled
+
+
+@dataclass
+class _Buffer:
+    """The storage shared by the lists built by pushing to each other."""
+
+    array: numpy.ndarray
+    size: int
+
+
+@dataclass(eq=False)
+class ArrayIList(IList):
+    """An immutable list of `int`, `float` or `bool` stored in a NumPy array.
+
+    The elements are converted to Python scalars when accessed, so the list
+    behaves as an [`IList`][kirin.dialects.ilist.IList] of the same elements.
+    """
+
+    data: numpy.ndarray  # type: ignore
+    _buffer: _Buffer | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def new(cls, values: Sequence, elem: types.TypeAttribute) -> IList:
+        """Create a list of values, stored in an array if they are all `int`,
+        `float` or `bool` values of the same type, otherwise in a list."""
+        if not values or (scalar := type(values[0])) not in (bool, int, float):
+            return IList(list(values), elem=elem)
+        elif any(type(value) is not scalar for value in values):
+            return IList(list(values), elem=elem)
+        try:
+            return cls(np.array(values, dtype=scalar), elem=elem)
+        except OverflowError:
+            return IList(list(values), elem=elem)
+
+    def push(self, value) -> IList:
+        """Return a new list with a value appended."""
+        return self.extend((value,), self.elem)
+
+    def extend(self, values: Sequence, elem: types.TypeAttribute) -> IList:
+        """Return a new list with values appended.
+
+        The values are written in place in the buffer of this list when no
+        other list has been appended to it, the buffer grows geometrically
+        otherwise, so that appending to the successive lists in a loop takes
+        amortized constant time per element.
+        """
+        n, m = len(self.data), len(values)
+        if isinstance(values, ArrayIList):
+            values = values.data
+            compatible = values.dtype == self.data.dtype
+        else:
+            values = list(values)
+            scalar = _scalar(self.data.dtype)
+            compatible = all(type(value) is scalar for value in values)
+        if not compatible:
+            return IList([*self, *values], elem=elem)
+
+        buffer = self._buffer
+        try:
+            if buffer is not None and buffer.size == n and n + m <= len(buffer.array):
+                buffer.array[n : n + m] = values
+            else:
+                array = np.empty(max(8, 2 * (n + m)), dtype=self.data.dtype)
+                array[:n] = self.data
+                array[n : n + m] = values
+                buffer = _Buffer(array, n)
+        except OverflowError:
+            return IList([*self, *values], elem=elem)
+        buffer.size = n + m
+        return ArrayIList(buffer.array[: n + m], elem=elem, _buffer=buffer)
+
+    def __add__(self, other):
+        if isinstance(other, IList):
+            return self.extend(other, self.elem.join(other.elem))
+        elif isinstance(other, list):
+            return self.extend(other, self.elem)
+        return super().__add__(other)
+
+    def __radd__(self, other):
+        # NOTE: called before IList.__add__, ArrayIList is a subclass
+        if isinstance(other, IList):
+            return add(other, self)
+        return IList(other + self.data.tolist(), elem=self.elem)
+
+    def __repr__(self) -> str:
+        return f"IList({self.data.tolist()})"
+
+    def __str__(self) -> str:
+        return f"IList({self.data.tolist()})"
+
+    def __iter__(self):
+        return iter(self.data.tolist())
+
+    def __reversed__(self):
+        return reversed(self.data.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArrayIList(self.data[index], elem=self.elem)
+        return self.data[index].item()
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.data.tolist()
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, IList):
+            return False
+        return self.data.tolist() == list(value)
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def print_impl(self, printer) -> None:
+        printer.plain_print("IList(")
+        printer.print_seq(
+            self.data.tolist(),
+            delim=", ",
+            prefix="[",
+            suffix="]",
+            emit=printer.plain_print,
+        )
+        printer.plain_print(")")
+
+
+def add(lhs: IList, rhs: IList) -> IList:
+    """Concatenate two lists, appending in place to the buffer of `lhs` if
+    possible."""
+    if isinstance(lhs, ArrayIList):
+        return lhs.extend(rhs, lhs.elem.join(rhs.elem))
+    elif not lhs.data and isinstance(rhs, ArrayIList):
+        return ArrayIList(rhs.data, elem=lhs.elem.join(rhs.elem))
+    return IList([*lhs, *rhs], elem=lhs.elem.join(rhs.elem))
+
+
+def arange(start: int, stop: int, step: int) -> IList:
+    """The list of a range of integers."""
+    try:
+        return ArrayIList(np.arange(start, stop, step, dtype=np.int64), types.Int)
+    except (OverflowError, ValueError):
+        return IList(range(start, stop, step), elem=types.Int)
+
+
+def _scalar(dtype) -> type | None:
+    return {"b": bool, "i": int, "f": float}.get(dtype.kind)
+
+
+class _Fallback(Exception):
+    """The kernel cannot run on these arrays, use the interpreter."""
+
+
+_INT_LIMIT = 1 << 62
+"""Bound of the integer operands added or subtracted without overflow."""
+_MULT_LIMIT = 1 << 31
+"""Bound of the integer operands multiplied without overflow."""
+
+
+def _int(x):
+    """Python arithmetic on `bool` is arithmetic on `int`."""
+    if isinstance(x, np.ndarray) and x.dtype.kind == "b":
+        return x.astype(np.int64)
+    elif type(x) is bool:
+        return int(x)
+    return x
+
+
+def _bounded(limit: int, *args) -> None:
+    for x in args:
+        if isinstance(x, np.ndarray):
+            if x.dtype.kind in "iu" and x.size and np.abs(x).max() >= limit:
+                raise _Fallback
+        elif type(x) is int and abs(x) >= limit:
+            raise _Fallback
+
+
+def _arith(ufunc, limit: int | None = None):
+    def apply(x, y):
+        x, y = _int(x), _int(y)
+        if limit is not None:
+            _bounded(limit, x, y)
+        return ufunc(x, y)
+
+    return apply
+
+
+def _negative(x):
+    x = _int(x)
+    _bounded(_INT_LIMIT, x)
+    return np.negative(x)
+
+
+def _float(ufunc):
+    return lambda *args: ufunc(*(np.asarray(x, dtype=np.float64) for x in args))
+
+
+def _kernels() -> dict[type[ir.Statement], Callable]:
+    return {
+        py.Add: _arith(np.add, _INT_LIMIT),
+        py.Sub: _arith(np.subtract, _INT_LIMIT),
+        py.Mult: _arith(np.multiply, _MULT_LIMIT),
+        py.Div: _arith(np.true_divide),
+        py.FloorDiv: _arith(np.floor_divide),
+        py.Mod: _arith(np.mod),
+        py.BitAnd: np.bitwise_and,
+        py.BitOr: np.bitwise_or,
+        py.BitXor: np.bitwise_xor,
+        py.USub: _negative,
+        py.UAdd: _int,
+        py.Not: np.logical_not,
+        py.Invert: lambda x: np.invert(_int(x)),
+        py.cmp.Eq: np.equal,
+        py.cmp.NotEq: np.not_equal,
+        py.cmp.Lt: np.less,
+        py.cmp.Gt: np.greater,
+        py.cmp.LtE: np.less_equal,
+        py.cmp.GtE: np.greater_equal,
+        math.stmts.sin: _float(np.sin),
+        math.stmts.cos: _float(np.cos),
+        math.stmts.tan: _float(np.tan),
+        math.stmts.asin: _float(np.arcsin),
+        math.stmts.acos: _float(np.arccos),
+        math.stmts.atan: _float(np.arctan),
+        math.stmts.atan2: _float(np.arctan2),
+        math.stmts.sinh: _float(np.sinh),
+        math.stmts.cosh: _float(np.cosh),
+        math.stmts.tanh: _float(np.tanh),
+        math.stmts.asinh: _float(np.arcsinh),
+        math.stmts.atanh: _float(np.arctanh),
+        math.stmts.exp: _float(np.exp),
+        math.stmts.expm1: _float(np.expm1),
+        math.stmts.log2: _float(np.log2),
+        math.stmts.log10: _float(np.log10),
+        math.stmts.log1p: _float(np.log1p),
+        math.stmts.sqrt: _float(np.sqrt),
+        math.stmts.fabs: _float(np.abs),
+        math.stmts.pow: _float(np.power),
+        math.stmts.fmod: _float(np.fmod),
+        math.stmts.copysign: _float(np.copysign),
+        math.stmts.degrees: _float(np.degrees),
+        math.stmts.radians: _float(np.radians),
+        math.stmts.isnan: _float(np.isnan),
+        math.stmts.isinf: _float(np.isinf),
+        math.stmts.isfinite: _float(np.isfinite),
+    }
+
+
+_REDUCTIONS: dict[type[ir.Statement], Callable[[Any, Any], Any]] = {
+    py.Add: operator.add,
+    py.Sub: operator.sub,
+    py.Mult: operator.mul,
+    py.BitAnd: operator.and_,
+    py.BitOr: operator.or_,
+    py.BitXor: operator.xor,
+}
+
+
+@dataclass
+class _Kernel:
+    """The statements of a method body, run on arrays."""
+
+    stmts: list[tuple[Callable, tuple[ir.SSAValue, ...], ir.SSAValue]]
+    args: tuple[ir.SSAValue, ...]
+    result: ir.SSAValue
+    reduce: Callable[[Any, Any], Any] | None = None
+    """For a fold, how the accumulator is combined with the result."""
+
+    def __call__(self, *arrays):
+        env: dict[ir.SSAValue, Any] = dict(zip(self.args, arrays))
+        with np.errstate(all="raise"):
+            try:
+                for fn, args, result in self.stmts:
+                    env[result] = fn(*(env[arg] for arg in args))
+            except (FloatingPointError, OverflowError, TypeError):
+                raise _Fallback
+        value = env[self.result]
+        if not isinstance(value, np.ndarray) or value.shape != arrays[0].shape:
+            value = np.broadcast_to(value, arrays[0].shape).copy()
+        return value
+
+
+_cache: weakref.WeakKeyDictionary[ir.Method, dict[bool, tuple[int, _Kernel | None]]] = (
+    weakref.WeakKeyDictionary()
+)
+"""The kernels of the methods, with the structural hash of their code."""
+
+
+def kernel(fn: ir.Method, fold: bool = False) -> _Kernel | None:
+    """Compile the body of a method mapped over, or folded over if `fold`,
+    the elements of a list to a vectorized kernel, if possible."""
+    key = fn.code.structural_hash()
+    kernels = _cache.setdefault(fn, {})
+    if (cached := kernels.get(fold)) is not None and cached[0] == key:
+        return cached[1]
+    result = _compile(fn, fold)
+    kernels[fold] = (key, result)
+    return result
+
+
+def _compile(fn: ir.Method, fold: bool) -> _Kernel | None:
+    region = fn.callable_region
+    if len(region.blocks) != 1 or fn.fields:
+        return None
+    block = region.blocks[0]
+    params = block.args[1:]
+    if len(params) != (2 if fold else 1):
+        return None
+
+    ret = block.last_stmt
+    if not isinstance(ret, func.Return):
+        return None
+    result = ret.value
+
+    reduce, skip = None, {ret}
+    if fold:  # NOTE: acc OP expr(x) or expr(x) OP acc
+        acc, elem = params
+        owner = result.owner
+        op = _REDUCTIONS.get(type(owner)) if isinstance(owner, ir.Statement) else None
+        if op is None or len(acc.uses) != 1:
+            return None
+        lhs, rhs = owner.args
+        if lhs is acc:
+            reduce, result = op, rhs
+        elif rhs is acc and op is not operator.sub:
+            reduce, result = (lambda x, y, op=op: op(y, x)), lhs
+        else:
+            return None
+        params = (elem,)
+        skip.add(owner)
+
+    kernels = _kernels()
+    stmts: list[tuple[Callable, tuple[ir.SSAValue, ...], ir.SSAValue]] = []
+    for stmt in block.stmts:
+        if stmt in skip:
+            continue
+        elif isinstance(stmt, py.Constant):
+            value = stmt.value.unwrap()
+            if type(value) not in (int, float, bool):
+                return None
+            stmts.append(((lambda value=value: value), (), stmt.result))
+        elif (impl := kernels.get(type(stmt))) is not None:
+            if len(stmt._results) != 1:
+                return None
+            stmts.append((impl, stmt.args, stmt._results[0]))
+        else:
+            return None
+    return _Kernel(stmts, tuple(params), result, reduce)
+
+
+def map(fn: ir.Method, coll: ArrayIList) -> IList | None:
+    """Map a method over the elements of a list with a vectorized kernel,
+    `None` if the method cannot be vectorized."""
+    if (run := kernel(fn)) is None or not len(coll.data):
+        return None
+    try:
+        data = run(coll.data)
+    except _Fallback:
+        return None
+    if _scalar(data.dtype) is None:
+        return None
+    return ArrayIList(data, elem=fn.return_type)
+
+
+def foldl(fn: ir.Method, coll: ArrayIList, init) -> tuple[Any] | None:
+    """Fold a method over the elements of a list from the left with a
+    vectorized kernel, `None` if the method cannot be vectorized."""
+    if (run := kernel(fn, fold=True)) is None or not len(coll.data):
+        return None
+    try:
+        data = run(coll.data)
+    except _Fallback:
+        return None
+    assert run.reduce is not None
+    return (functools.reduce(run.reduce, data.tolist(), init),)
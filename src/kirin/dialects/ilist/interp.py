@@ -3,6 +3,7 @@ from kirin.interp import Frame, Interpreter, MethodTable, impl
 from kirin.dialects.py.len import Len
 from kirin.dialects.py.binop import Add
 
+from . import array
 from .stmts import All, Any, Map, New, Push, Scan, Foldl, Foldr, Range, Sorted, ForEach
 from .runtime import IList
 from ._dialect import dialect
@@ -13,11 +14,23 @@ class IListInterpreter(MethodTable):
 
     @impl(Range)
     def _range(self, interp, frame: Frame, stmt: Range):
-        return (IList(range(*frame.get_values(stmt.args)), elem=types.Int),)
+        return (self.new_range(*frame.get_values(stmt.args)),)
+
+    @staticmethod
+    def new_range(start: int, stop: int, step: int) -> IList:
+        if array.get_numpy_backend():
+            return array.arange(start, stop, step)
+        return IList(range(start, stop, step), elem=types.Int)
 
     @impl(New)
     def new(self, interp, frame: Frame, stmt: New):
-        return (IList(list(frame.get_values(stmt.values)), elem=stmt.elem_type),)
+        return (self.new_list(frame.get_values(stmt.values), stmt.elem_type),)
+
+    @staticmethod
+    def new_list(values: tuple, elem: types.TypeAttribute) -> IList:
+        if array.get_numpy_backend():
+            return array.ArrayIList.new(values, elem)
+        return IList(list(values), elem=elem)
 
     @impl(Len, types.PyClass(IList))
     def len(self, interp, frame: Frame, stmt: Len):
@@ -26,19 +39,37 @@ class IListInterpreter(MethodTable):
     @impl(Add, types.PyClass(IList), types.PyClass(IList))
     def add(self, interp, frame: Frame, stmt: Add):
         lhs, rhs = frame.get_casted(stmt.lhs, IList), frame.get_casted(stmt.rhs, IList)
-        return (IList([*lhs.data, *rhs.data], elem=lhs.elem.join(rhs.elem)),)
+        return (self.concat(lhs, rhs),)
+
+    @staticmethod
+    def concat(lhs: IList, rhs: IList) -> IList:
+        if array.get_numpy_backend():
+            return array.add(lhs, rhs)
+        return IList([*lhs, *rhs], elem=lhs.elem.join(rhs.elem))
 
     @impl(Push)
     def push(self, interp, frame: Frame, stmt: Push):
-        lst = frame.get_casted(stmt.lst, IList)
-        return (IList([*lst.data, frame.get(stmt.value)], elem=lst.elem),)
+        return (
+            self.push_value(frame.get_casted(stmt.lst, IList), frame.get(stmt.value)),
+        )
+
+    @staticmethod
+    def push_value(lst: IList, value) -> IList:
+        if isinstance(lst, array.ArrayIList):
+            return lst.push(value)
+        return IList([*lst.data, value], elem=lst.elem)
 
     @impl(Map)
     def map(self, interp: Interpreter, frame: Frame, stmt: Map):
         fn: ir.Method = frame.get(stmt.fn)
         coll: IList = frame.get(stmt.collection)
+        if (
+            isinstance(coll, array.ArrayIList)
+            and (result := array.map(fn, coll)) is not None
+        ):
+            return (result,)
         ret = []
-        for elem in coll.data:
+        for elem in coll:
             # NOTE: assume fn has been type checked
             _, item = interp.call(fn.code, fn, elem)
             ret.append(item)
@@ -52,7 +83,7 @@ class IListInterpreter(MethodTable):
 
         carry = init
         ys = []
-        for elem in coll.data:
+        for elem in coll:
             # NOTE: assume fn has been type checked
             _, (carry, y) = interp.call(fn.code, fn, carry, elem)
             ys.append(y)
@@ -69,14 +100,19 @@ class IListInterpreter(MethodTable):
     @impl(Foldr)
     def foldr(self, interp: Interpreter, frame: Frame, stmt: Foldr):
         return self.fold(
-            interp, frame, stmt, reversed(frame.get_casted(stmt.collection, IList).data)
+            interp, frame, stmt, reversed(frame.get_casted(stmt.collection, IList))
         )
 
     @impl(Foldl)
     def foldl(self, interp: Interpreter, frame: Frame, stmt: Foldl):
-        return self.fold(
-            interp, frame, stmt, frame.get_casted(stmt.collection, IList).data
-        )
+        coll = frame.get_casted(stmt.collection, IList)
+        if (
+            isinstance(coll, array.ArrayIList)
+            and (result := array.foldl(frame.get(stmt.fn), coll, frame.get(stmt.init)))
+            is not None
+        ):
+            return result
+        return self.fold(interp, frame, stmt, coll)
 
     def fold(self, interp: Interpreter, frame: Frame, stmt: Foldr | Foldl, coll):
         fn: ir.Method = frame.get(stmt.fn)
@@ -92,7 +128,7 @@ class IListInterpreter(MethodTable):
     def for_each(self, interp: Interpreter, frame: Frame, stmt: ForEach):
         fn: ir.Method = frame.get(stmt.fn)
         coll: IList = frame.get(stmt.collection)
-        for elem in coll.data:
+        for elem in coll:
             # NOTE: assume fn has been type checked
             interp.call(fn.code, fn, elem)
         return
@@ -113,4 +149,4 @@ class IListInterpreter(MethodTable):
         reverse: bool = frame.get(stmt.reverse)
         coll: IList = frame.get(stmt.collection)
 
-        return (IList(data=sorted(coll.data, key=key, reverse=reverse)),)
+        return (IList(data=sorted(coll, key=key, reverse=reverse)),)
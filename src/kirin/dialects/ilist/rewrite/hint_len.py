@@ -9,6 +9,7 @@ from .._dialect import dialect
 
 @dialect.post_inference
 class HintLen(RewriteRule):
+    matches = (py.Len,)
 
     def _get_collection_len(self, collection: ir.SSAValue):
         coll_type = collection.type
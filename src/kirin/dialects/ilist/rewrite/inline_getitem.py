@@ -16,6 +16,8 @@ class InlineGetItem(abc.RewriteRule):
 
     """
 
+    matches = (py.GetItem,)
+
     def rewrite_Statement(self, node: ir.Statement) -> abc.RewriteResult:
         if not isinstance(node, py.GetItem) or not isinstance(
             stmt := node.obj.owner, New
@@ -11,6 +11,7 @@ from .._dialect import dialect
 
 @dialect.post_inference
 class Unroll(RewriteRule):
+    matches = (Map, Scan, Foldr, Foldl, ForEach)
 
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         return getattr(
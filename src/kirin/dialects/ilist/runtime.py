@@ -62,6 +62,9 @@ class IList(ir.Data[Sequence[T]], Sequence[T], Generic[T, L]):
     def __iter__(self):
         return iter(self.data)
 
+    def __reversed__(self):
+        return reversed(self.data)
+
     @overload
     def __getitem__(self, index: int) -> T: ...
 
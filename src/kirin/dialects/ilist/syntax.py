@@ -0,0 +1,9 @@
+from kirin import parse
+
+from .runtime import IList
+from ._dialect import dialect
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+    namespace = {"IList": IList}
@@ -9,10 +9,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from kirin import ir, types, interp
+from kirin import ir, parse, types, interp
 from kirin.decl import info, statement
 from kirin.print import Printer
 from kirin.analysis import TypeInference
+from kirin.dialects.func.syntax import (
+    parse_purity,
+    parse_call_results,
+    parse_call_arguments,
+)
 
 dialect = ir.Dialect("module")
 
@@ -23,16 +28,10 @@ class ModuleEntryPoint(ir.EntryPointInterface["Module"]):
         return stmt.entry
 
     def get_entry_point(self, stmt: Module) -> ir.Statement:
-        name = self.get_entry_point_symbol(stmt)
-        for node in stmt.body.blocks[0].stmts:
-            trait = node.get_trait(ir.SymbolOpInterface)
-            if trait is None:
-                continue
-
-            node_name = trait.get_sym_name(node).unwrap()
-            if node_name == name:
-                return node
-        raise ir.ValidationError(stmt, "entry point not found")
+        node = ir.SymbolTable.lookup(stmt, self.get_entry_point_symbol(stmt))
+        if node is None:
+            raise ir.ValidationError(stmt, "entry point not found")
+        return node
 
 
 @statement(dialect=dialect)
@@ -113,6 +112,51 @@ class Invoke(ir.Statement):
         ), "keys and kwargs must have the same length"
 
 
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_Module(self, parser: parse.Parser, stmt_type: type[Module]) -> Module:
+        # module.module @main {
+        #   func.func @main() -> !Any {...} // func.func main
+        # } // entry: main
+        sym_name = parser.expect("symbol").text[1:]
+        block = ir.Block()
+        parser.expect("{")
+        parser.parse_statements(block)
+        parser.expect("}")
+        comment = parser.comment()
+        if comment is None or not comment.startswith("// entry: "):
+            raise parser.error("expected the entry point of the module")
+        return parser.statement(
+            stmt_type,
+            regions=(ir.Region(block),),
+            attributes={
+                "sym_name": sym_name,
+                "entry": comment.removeprefix("// entry: ").strip(),
+            },
+        )
+
+    def parse_Invoke(self, parser: parse.Parser, stmt_type: type[Invoke]) -> Invoke:
+        # module.invoke @foo(%x, y=%y) : !py.int maybe_pure=False
+        callee = parser.expect("symbol").text[1:]
+        inputs, keys, kwargs = parse_call_arguments(parser)
+        result_types = parse_call_results(parser)
+        return parser.statement(
+            stmt_type,
+            args=(*inputs, *kwargs),
+            attributes={
+                "callee": callee,
+                "keys": keys,
+                "purity": parse_purity(parser),
+            },
+            result_types=result_types,
+            args_slice={
+                "inputs": slice(0, len(inputs)),
+                "kwargs": slice(len(inputs), len(inputs) + len(kwargs)),
+            },
+        )
+
+
 @dialect.register
 class Concrete(interp.MethodTable):
 
@@ -120,13 +164,11 @@ class Concrete(interp.MethodTable):
     def interp_Invoke(
         self, interp_: interp.Interpreter, frame: interp.Frame, stmt: Invoke
     ):
-        callee = interp_.symbol_table.get(stmt.callee)
+        callee = interp_.dialects.symbol_method(stmt.callee)
         if callee is None:
             raise interp.InterpreterError(f"symbol {stmt.callee} not found")
 
-        _, ret = interp_.call(
-            callee, ir.Method(interp_.dialects, callee), *frame.get_values(stmt.inputs)
-        )
+        _, ret = interp_.call(callee.code, callee, *frame.get_values(stmt.inputs))
         return (ret,)
 
 
@@ -137,17 +179,13 @@ class TypeInfer(interp.MethodTable):
     def typeinfer_Invoke(
         self, interp_: TypeInference, frame: interp.Frame, stmt: Invoke
     ):
-        callee = interp_.symbol_table.get(stmt.callee)
+        callee = interp_.dialects.symbol_method(stmt.callee)
         if callee is None:
             return (types.Bottom,)
 
-        callee = interp_.symbol_table.get(stmt.callee)
-        if callee is None:
-            raise interp.InterpreterError(f"symbol {stmt.callee} not found")
-
         _, ret = interp_.call(
-            callee,
-            interp_.method_self(ir.Method(interp_.dialects, callee)),
+            callee.code,
+            interp_.method_self(callee),
             *frame.get_values(stmt.inputs),
         )
         return (ret,)
@@ -13,7 +13,7 @@ This dialect maps `ast.Assert` nodes to the `Assert` statement.
 
 import ast
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, parse, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.print import Printer
 
@@ -70,9 +70,35 @@ class Concrete(interp.MethodTable):
             raise AssertionError("Assertion failed")
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Assert)
+    def assert_stmt(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Assert):
+        frame.write_line(f"if {frame.get(stmt.condition)} is not True:")
+        with frame.indent():
+            frame.write_line(f"raise AssertionError({frame.get(stmt.message)})")
+        return ()
+
+
 @dialect.register(key="typeinfer")
 class TypeInfer(interp.MethodTable):
 
     @interp.impl(Assert)
     def assert_stmt(self, interp, frame, stmt: Assert):
         return (types.Bottom,)
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_Assert(self, parser: parse.Parser, stmt_type: type[Assert]) -> Assert:
+        # py.assert.assert %cond, %message
+        args = [parser.parse_value()]
+        if parser.accept(","):
+            args.append(parser.parse_value())
+        return parser.statement(
+            stmt_type,
+            args=args,
+            args_slice=dict(zip(("condition", "message"), range(len(args)))),
+        )
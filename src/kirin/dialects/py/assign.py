@@ -11,7 +11,7 @@ This dialects maps Python assignment syntax.
 
 import ast
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, parse, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.print import Printer
 
@@ -97,10 +97,45 @@ class Concrete(interp.MethodTable):
     @interp.impl(TypeAssert)
     def type_assert(self, interp_, frame: interp.Frame, stmt: TypeAssert):
         got = frame.get(stmt.got)
+        self.check_type(got, stmt.expected)
+        return (got,)
+
+    @staticmethod
+    def check_type(got, expected: types.TypeAttribute) -> None:
         got_type = types.PyClass(type(got))
-        if not got_type.is_subseteq(stmt.expected):
-            raise TypeError(f"Expected {stmt.expected}, got {got_type}")
-        return (frame.get(stmt.got),)
+        if not got_type.is_subseteq(expected):
+            raise TypeError(f"Expected {expected}, got {got_type}")
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Alias)
+    def alias(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Alias):
+        return (frame.get(stmt.value),)
+
+    @interp.impl(SetItem)
+    def setindex(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: SetItem):
+        obj, index, value = frame.get_values((stmt.obj, stmt.index, stmt.value))
+        frame.write_line(f"{obj}[{index}] = {value}")
+        return ()
+
+    @interp.impl(SetAttribute)
+    def set_attribute(
+        self, emit_: emit.Python, frame: emit.PythonFrame, stmt: SetAttribute
+    ):
+        obj, value = frame.get(stmt.obj), frame.get(stmt.value)
+        frame.write_line(f"setattr({obj}, {stmt.attr!r}, {value})")
+        return ()
+
+    @interp.impl(TypeAssert)
+    def type_assert(
+        self, emit_: emit.Python, frame: emit.PythonFrame, stmt: TypeAssert
+    ):
+        check = emit_.ref(Concrete.check_type, "check_type")
+        got = frame.get(stmt.got)
+        frame.write_line(f"{check}({got}, {emit_.ref(stmt.expected, 'type')})")
+        return (got,)
 
 
 @dialect.register(key="typeinfer")
@@ -198,3 +233,19 @@ class Lowering(lowering.FromPythonAST):
                     cls.assign_item_value(state, target, value)
             case _:
                 cls.assign_item_value(state, target, result.expect_one())
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_Alias(self, parser: parse.Parser, stmt_type: type[Alias]) -> Alias:
+        # py.assign.alias x = %y
+        target = parser.expect("name").text
+        parser.expect("=")
+        return parser.statement(
+            stmt_type,
+            args=(parser.parse_value(),),
+            attributes={"target": target},
+            result_types=(T,),
+            args_slice={"value": 0},
+        )
@@ -11,7 +11,7 @@ This dialect maps `ast.Attribute` nodes to the `GetAttr` statement.
 
 import ast
 
-from kirin import ir, interp, lowering
+from kirin import ir, emit, interp, lowering
 from kirin.decl import info, statement
 
 dialect = ir.Dialect("py.attr")
@@ -34,6 +34,18 @@ class Concrete(interp.MethodTable):
         return (getattr(frame.get(stmt.obj), stmt.attrname),)
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(GetAttr)
+    def getattr(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: GetAttr):
+        obj = frame.get(stmt.obj)
+        frame.write_line(
+            f"{frame.ssa[stmt.result]} = getattr({obj}, {stmt.attrname!r})"
+        )
+        return (frame.ssa[stmt.result],)
+
+
 @dialect.register
 class Lowering(lowering.FromPythonAST):
 
@@ -8,6 +8,7 @@ This module contains the dialect for binary operation semantics in Python, inclu
 - The concrete implementation of binary operations.
 - The type inference implementation of binary operations.
 - The Julia emitter for binary operations.
+- The Python emitter for binary operations.
 
 This dialect maps `ast.BinOp` nodes to the `Add`, `Sub`, `Mult`, `Div`, `FloorDiv`,
 `Mod`, `Pow`, `LShift`, `RShift`, `BitOr`, `BitXor`, and `BitAnd` statements.
@@ -16,6 +17,7 @@ This dialect maps `ast.BinOp` nodes to the `Add`, `Sub`, `Mult`, `Div`, `FloorDi
 from . import (
     _julia as _julia,
     interp as interp,
+    _python as _python,
     lowering as lowering,
     typeinfer as typeinfer,
 )
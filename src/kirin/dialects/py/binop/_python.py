@@ -0,0 +1,43 @@
+from kirin import emit, interp
+
+from . import stmts
+from ._dialect import dialect
+
+OPERATORS: dict[type[stmts.BinOp], str] = {
+    stmts.Add: "+",
+    stmts.Sub: "-",
+    stmts.Mult: "*",
+    stmts.Div: "/",
+    stmts.Mod: "%",
+    stmts.BitAnd: "&",
+    stmts.BitOr: "|",
+    stmts.BitXor: "^",
+    stmts.LShift: "<<",
+    stmts.RShift: ">>",
+    stmts.FloorDiv: "//",
+    stmts.Pow: "**",
+    stmts.MatMult: "@",
+}
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(stmts.Add)
+    @interp.impl(stmts.Sub)
+    @interp.impl(stmts.Mult)
+    @interp.impl(stmts.Div)
+    @interp.impl(stmts.Mod)
+    @interp.impl(stmts.BitAnd)
+    @interp.impl(stmts.BitOr)
+    @interp.impl(stmts.BitXor)
+    @interp.impl(stmts.LShift)
+    @interp.impl(stmts.RShift)
+    @interp.impl(stmts.FloorDiv)
+    @interp.impl(stmts.Pow)
+    @interp.impl(stmts.MatMult)
+    def binop(self, emit_: emit.Python, frame: emit.PythonFrame, node: stmts.BinOp):
+        lhs, rhs = frame.get(node.lhs), frame.get(node.rhs)
+        op = OPERATORS[type(node)]
+        frame.write_line(f"{frame.ssa[node.result]} = {lhs} {op} {rhs}")
+        return (frame.ssa[node.result],)
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from kirin import ir, types, lowering
 from kirin.decl import info, statement
 
@@ -6,6 +8,30 @@ from ._dialect import dialect
 T = types.TypeVar("T")
 
 
+@dataclass(frozen=True)
+class NumberCommutative(ir.Commutative):
+    """Commutative if both arguments are numbers, e.g. `+` is not commutative
+    on strings.
+    """
+
+    def is_commutative(self, stmt: ir.Statement) -> bool:
+        return all(arg.type.is_subseteq(types.Number) for arg in stmt.args)
+
+
+@dataclass(frozen=True)
+class NumberSpeculatable(ir.Speculatable):
+    """Speculatable if all the arguments are of one of `kinds`, e.g. `+`
+    raises on strings and integers, or integers too large for a float.
+    """
+
+    kinds: tuple[types.TypeAttribute, ...] = (types.Int, types.Float)
+
+    def is_speculatable(self, stmt: ir.Statement) -> bool:
+        return any(
+            all(arg.type.is_subseteq(kind) for arg in stmt.args) for kind in self.kinds
+        )
+
+
 @statement
 class BinOp(ir.Statement):
     traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
@@ -17,16 +43,33 @@ class BinOp(ir.Statement):
 @statement(dialect=dialect)
 class Add(BinOp):
     name = "add"
+    traits = frozenset(
+        {
+            ir.Pure(),
+            lowering.FromPythonCall(),
+            NumberCommutative(),
+            NumberSpeculatable(),
+        }
+    )
 
 
 @statement(dialect=dialect)
 class Sub(BinOp):
     name = "sub"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), NumberSpeculatable()})
 
 
 @statement(dialect=dialect)
 class Mult(BinOp):
     name = "mult"
+    traits = frozenset(
+        {
+            ir.Pure(),
+            lowering.FromPythonCall(),
+            NumberCommutative(),
+            NumberSpeculatable(),
+        }
+    )
 
 
 @statement(dialect=dialect)
@@ -57,16 +100,40 @@ class RShift(BinOp):
 @statement(dialect=dialect)
 class BitAnd(BinOp):
     name = "bitand"
+    traits = frozenset(
+        {
+            ir.Pure(),
+            lowering.FromPythonCall(),
+            NumberCommutative(),
+            NumberSpeculatable((types.Int,)),
+        }
+    )
 
 
 @statement(dialect=dialect)
 class BitOr(BinOp):
     name = "bitor"
+    traits = frozenset(
+        {
+            ir.Pure(),
+            lowering.FromPythonCall(),
+            NumberCommutative(),
+            NumberSpeculatable((types.Int,)),
+        }
+    )
 
 
 @statement(dialect=dialect)
 class BitXor(BinOp):
     name = "bitxor"
+    traits = frozenset(
+        {
+            ir.Pure(),
+            lowering.FromPythonCall(),
+            NumberCommutative(),
+            NumberSpeculatable((types.Int,)),
+        }
+    )
 
 
 @statement(dialect=dialect)
@@ -12,7 +12,7 @@ This dialect maps `ast.BoolOp` nodes to the `And` and `Or` statements.
 
 import ast
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, types, interp, lowering
 from kirin.decl import info, statement
 
 dialect = ir.Dialect("py.boolop")
@@ -66,3 +66,15 @@ class BoolOpMethod(interp.MethodTable):
     @interp.impl(Or)
     def or_(self, interp, frame: interp.Frame, stmt: Or):
         return (frame.get(stmt.lhs) or frame.get(stmt.rhs),)
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(And)
+    @interp.impl(Or)
+    def boolop(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: BoolOp):
+        lhs, rhs = frame.get(stmt.lhs), frame.get(stmt.rhs)
+        op = "and" if isinstance(stmt, And) else "or"
+        frame.write_line(f"{frame.ssa[stmt.result]} = {lhs} {op} {rhs}")
+        return (frame.ssa[stmt.result],)
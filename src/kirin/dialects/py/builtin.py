@@ -12,7 +12,7 @@ This dialect maps `ast.Call` nodes of builtin functions to the `Abs` and `Sum` s
 
 from ast import Call
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, types, interp, lowering
 from kirin.decl import info, statement
 
 dialect = ir.Dialect("py.builtin")
@@ -60,6 +60,20 @@ class Concrete(interp.MethodTable):
         return (sum(frame.get(stmt.value)),)
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Abs)
+    def abs(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Abs):
+        frame.write_line(f"{frame.ssa[stmt.result]} = abs({frame.get(stmt.value)})")
+        return (frame.ssa[stmt.result],)
+
+    @interp.impl(Sum)
+    def _sum(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Sum):
+        frame.write_line(f"{frame.ssa[stmt.result]} = sum({frame.get(stmt.value)})")
+        return (frame.ssa[stmt.result],)
+
+
 @dialect.register(key="typeinfer")
 class TypeInfer(interp.MethodTable):
 
@@ -6,11 +6,17 @@ This module contains the dialect for comparison semantics in Python, including:
 - The lowering pass for comparison operations.
 - The concrete implementation of comparison operations.
 - The Julia emitter for comparison operations.
+- The Python emitter for comparison operations.
 
 This dialect maps `ast.Compare` nodes to the `Eq`, `NotEq`, `Lt`, `LtE`,
 `Gt`, `GtE`, `Is`, and `IsNot` statements.
 """
 
-from . import _julia as _julia, interp as interp, lowering as lowering
+from . import (
+    _julia as _julia,
+    interp as interp,
+    _python as _python,
+    lowering as lowering,
+)
 from .stmts import *  # noqa: F403
 from ._dialect import dialect as dialect
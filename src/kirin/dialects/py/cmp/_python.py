@@ -0,0 +1,37 @@
+from kirin import emit, interp
+
+from . import stmts
+from ._dialect import dialect
+
+OPERATORS: dict[type[stmts.Cmp], str] = {
+    stmts.Eq: "==",
+    stmts.NotEq: "!=",
+    stmts.Lt: "<",
+    stmts.LtE: "<=",
+    stmts.Gt: ">",
+    stmts.GtE: ">=",
+    stmts.In: "in",
+    stmts.NotIn: "not in",
+    stmts.Is: "is",
+    stmts.IsNot: "is not",
+}
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(stmts.Eq)
+    @interp.impl(stmts.NotEq)
+    @interp.impl(stmts.Lt)
+    @interp.impl(stmts.LtE)
+    @interp.impl(stmts.Gt)
+    @interp.impl(stmts.GtE)
+    @interp.impl(stmts.In)
+    @interp.impl(stmts.NotIn)
+    @interp.impl(stmts.Is)
+    @interp.impl(stmts.IsNot)
+    def cmp(self, emit_: emit.Python, frame: emit.PythonFrame, node: stmts.Cmp):
+        lhs, rhs = frame.get(node.lhs), frame.get(node.rhs)
+        op = OPERATORS[type(node)]
+        frame.write_line(f"{frame.ssa[node.result]} = {lhs} {op} {rhs}")
+        return (frame.ssa[node.result],)
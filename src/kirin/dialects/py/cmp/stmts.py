@@ -1,8 +1,12 @@
 from kirin import ir, types, lowering
 from kirin.decl import info, statement
+from kirin.dialects.py.binop.stmts import NumberSpeculatable
 
 from ._dialect import dialect
 
+_REAL = NumberSpeculatable((types.Union(types.Int, types.Float),))
+"""The comparisons of integers and floats never raise."""
+
 
 @statement
 class Cmp(ir.Statement):
@@ -15,41 +19,49 @@ class Cmp(ir.Statement):
 @statement(dialect=dialect)
 class Eq(Cmp):
     name = "eq"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), _REAL})
 
 
 @statement(dialect=dialect)
 class NotEq(Cmp):
     name = "ne"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), _REAL})
 
 
 @statement(dialect=dialect)
 class Lt(Cmp):
     name = "lt"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), _REAL})
 
 
 @statement(dialect=dialect)
 class Gt(Cmp):
     name = "gt"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), _REAL})
 
 
 @statement(dialect=dialect)
 class LtE(Cmp):
     name = "lte"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), _REAL})
 
 
 @statement(dialect=dialect)
 class GtE(Cmp):
     name = "gte"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), _REAL})
 
 
 @statement(dialect=dialect)
 class Is(Cmp):
     name = "is"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), ir.Speculatable()})
 
 
 @statement(dialect=dialect)
 class IsNot(Cmp):
     name = "is_not"
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), ir.Speculatable()})
 
 
 @statement(dialect=dialect)
@@ -6,6 +6,7 @@ This module contains the dialect for the Python `constant` statement, including:
 - The lowering pass for the `constant` statement.
 - The concrete implementation of the `constant` statement.
 - The Julia emitter for the `constant` statement.
+- The binary serialization codec for the `constant` statement.
 
 This dialect maps `ast.Constant` nodes to the `Constant` statement.
 """
@@ -15,7 +16,7 @@ from __future__ import annotations
 import ast
 from typing import Generic, TypeVar
 
-from kirin import ir, emit, types, interp, lowering
+from kirin import ir, emit, parse, types, interp, lowering, serialization
 from kirin.decl import info, statement
 from kirin.print import Printer
 
@@ -83,3 +84,50 @@ class Julia(interp.MethodTable):
     @interp.impl(Constant)
     def constant(self, emit: emit.Julia, frame: emit.JuliaFrame, stmt: Constant):
         return (emit.get_attribute(frame, stmt.value),)
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Constant)
+    def constant(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Constant):
+        return (emit_.constant(stmt.value.unwrap()),)
+
+
+@dialect.register
+class Codec(serialization.Codec):
+
+    def encode_Constant(self, writer: serialization.Writer, stmt: Constant) -> None:
+        # NOTE: most constants are `PyAttr`, write their data and type only
+        if type(stmt.value) is ir.PyAttr:
+            writer.write_varint(1)
+            writer.write_ref(stmt.value.data)
+            writer.write_ref(stmt.value.type)
+        else:
+            writer.write_varint(0)
+            writer.write_ref(stmt.value)
+
+    def decode_Constant(
+        self, reader: serialization.Reader, stmt_type: type[Constant]
+    ) -> dict[str, ir.Attribute]:
+        if reader.read_varint():
+            return {"value": ir.PyAttr(reader.read_ref(), reader.read_ref())}
+        return {"value": reader.read_ref()}
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_Constant(
+        self, parser: parse.Parser, stmt_type: type[Constant]
+    ) -> Constant:
+        # py.constant.constant 1 : !py.int
+        value = parser.parse_python(":")
+        parser.expect(":")
+        if not isinstance(value, ir.Data):  # e.g. IList([1, 2])
+            value = ir.PyAttr(value)
+        return parser.statement(
+            stmt_type,
+            attributes={"value": value},
+            result_types=(parser.parse_type(),),
+        )
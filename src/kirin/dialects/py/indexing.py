@@ -18,7 +18,7 @@ from abc import abstractmethod
 from typing import Generic, TypeVar
 from dataclasses import dataclass
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.analysis import const
 from kirin.rewrite.abc import RewriteRule, RewriteResult
@@ -111,6 +111,27 @@ class Concrete(interp.MethodTable):
         return (frame.get(stmt.obj)[index_value],)
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(GetItem)
+    def getindex(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: GetItem):
+        obj, index = frame.get(stmt.obj), frame.get(stmt.index)
+        # NOTE: only slices need to be unwrapped, see `Concrete.getindex`
+        if not stmt.index.type.is_subseteq(types.Int):
+            index = f"{emit_.ref(self.unwrap_index, 'unwrap_index')}({index})"
+        frame.write_line(f"{frame.ssa[stmt.result]} = {obj}[{index}]")
+        return (frame.ssa[stmt.result],)
+
+    @staticmethod
+    def unwrap_index(index):
+        from kirin.dialects.py.slice import SliceAttribute
+
+        if isinstance(index, SliceAttribute):
+            return index.unwrap()
+        return index
+
+
 @dialect.register(key="typeinfer")
 class TypeInfer(interp.MethodTable):
 
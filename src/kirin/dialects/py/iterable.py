@@ -14,7 +14,7 @@ This dialect maps `iter()` and `next()` calls to the `Iter` and `Next` statement
 
 from ast import Call
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, types, interp, lowering
 from kirin.decl import info, statement
 
 dialect = ir.Dialect("py.iterable")
@@ -51,6 +51,22 @@ class Concrete(interp.MethodTable):
         return (next(frame.get(stmt.iter), None),)
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Iter)
+    def iter_(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Iter):
+        frame.write_line(f"{frame.ssa[stmt.iter]} = iter({frame.get(stmt.value)})")
+        return (frame.ssa[stmt.iter],)
+
+    @interp.impl(Next)
+    def next_(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Next):
+        frame.write_line(
+            f"{frame.ssa[stmt.value]} = next({frame.get(stmt.iter)}, None)"
+        )
+        return (frame.ssa[stmt.value],)
+
+
 @dialect.register(key="typeinfer")
 class TypeInfer(interp.MethodTable):
 
@@ -9,7 +9,7 @@ This dialect maps the `len()` call to the `Len` statement:
 
 import ast
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.analysis import const
 
@@ -32,6 +32,15 @@ class Concrete(interp.MethodTable):
         return (len(frame.get(stmt.value)),)
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Len)
+    def len(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Len):
+        frame.write_line(f"{frame.ssa[stmt.result]} = len({frame.get(stmt.value)})")
+        return (frame.ssa[stmt.result],)
+
+
 @dialect.register(key="constprop")
 class ConstProp(interp.MethodTable):
 
@@ -10,6 +10,11 @@ This module contains the dialect for list semantics in Python, including:
 This dialect maps `list()`, `ast.List` and `append()` calls to the `New` and `Append` statements.
 """
 
-from . import interp as interp, lowering as lowering, typeinfer as typeinfer
+from . import (
+    interp as interp,
+    _python as _python,
+    lowering as lowering,
+    typeinfer as typeinfer,
+)
 from .stmts import New as New, Append as Append
 from ._dialect import dialect as dialect
@@ -0,0 +1,26 @@
+from kirin import emit, types, interp
+from kirin.dialects.py.binop import Add
+
+from .stmts import New, Append
+from ._dialect import dialect
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(New)
+    def new(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: New):
+        values = ", ".join(frame.get_values(stmt.values))
+        frame.write_line(f"{frame.ssa[stmt.result]} = [{values}]")
+        return (frame.ssa[stmt.result],)
+
+    @interp.impl(Add, types.PyClass(list), types.PyClass(list))
+    def add(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Add):
+        lhs, rhs = frame.get(stmt.lhs), frame.get(stmt.rhs)
+        frame.write_line(f"{frame.ssa[stmt.result]} = {lhs} + {rhs}")
+        return (frame.ssa[stmt.result],)
+
+    @interp.impl(Append)
+    def append(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Append):
+        frame.write_line(f"{frame.get(stmt.list_)}.append({frame.get(stmt.value)})")
+        return ()
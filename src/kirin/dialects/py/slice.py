@@ -11,7 +11,7 @@ This dialect provides a `Slice` statement that represents a slice object in Pyth
 import ast
 from dataclasses import dataclass
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, parse, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.print.printer import Printer
 from kirin.dialects.py.constant import Constant
@@ -104,6 +104,17 @@ class Concrete(interp.MethodTable):
             return (SliceAttribute(start, stop, step),)
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Slice)
+    def _slice(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Slice):
+        args = ", ".join(frame.get_values(stmt.args))
+        slice_ = emit_.ref(SliceAttribute, "SliceAttribute")
+        frame.write_line(f"{frame.ssa[stmt.result]} = {slice_}({args})")
+        return (frame.ssa[stmt.result],)
+
+
 @dialect.register
 class Lowering(lowering.FromPythonAST):
 
@@ -144,3 +155,8 @@ def _lower_slice(state: lowering.State, node: ast.Call) -> lowering.Result:
         raise lowering.BuildError("slice() takes 1-3 arguments")
 
     return state.current_frame.push(Slice(start, stop, step))
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+    namespace = {"SliceAttribute": SliceAttribute}
@@ -14,7 +14,7 @@ This dialect maps `ast.Tuple` nodes to the `New` statement.
 
 import ast
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.analysis import const
 from kirin.dialects.eltype import ElType
@@ -25,7 +25,7 @@ dialect = ir.Dialect("py.tuple")
 
 @statement(dialect=dialect)
 class New(ir.Statement):
-    traits = frozenset({ir.Pure(), lowering.FromPythonCall()})
+    traits = frozenset({ir.Pure(), lowering.FromPythonCall(), ir.Speculatable()})
     result: ir.ResultValue = info.result()
 
     def __init__(self, values: tuple[ir.SSAValue, ...]) -> None:
@@ -46,6 +46,17 @@ class Concrete(interp.MethodTable):
         return (frame.get_values(stmt.args),)
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(New)
+    def new(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: New):
+        values = frame.get_values(stmt.args)
+        comma = "," if len(values) == 1 else ""
+        frame.write_line(f"{frame.ssa[stmt.result]} = ({', '.join(values)}{comma})")
+        return (frame.ssa[stmt.result],)
+
+
 @dialect.register(key="typeinfer")
 class TypeInfer(interp.MethodTable):
 
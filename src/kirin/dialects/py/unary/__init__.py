@@ -9,12 +9,14 @@ This module contains the dialect for unary semantics in Python, including:
 - The type inference implementation of unary operations.
 - The constant propagation implementation of unary operations.
 - The Julia emitter for unary operations.
+- The Python emitter for unary operations.
 
 This dialect maps `ast.UnaryOp` nodes to the `UAdd`, `USub`, `Not`, and `Invert` statements.
 """
 
 from . import (
     interp as interp,
+    _python as _python,
     lowering as lowering,
     constprop as constprop,
     typeinfer as typeinfer,
@@ -0,0 +1,25 @@
+from kirin import emit, interp
+
+from . import stmts
+from ._dialect import dialect
+
+OPERATORS: dict[type[stmts.UnaryOp], str] = {
+    stmts.UAdd: "+",
+    stmts.USub: "-",
+    stmts.Not: "not ",
+    stmts.Invert: "~",
+}
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(stmts.UAdd)
+    @interp.impl(stmts.USub)
+    @interp.impl(stmts.Not)
+    @interp.impl(stmts.Invert)
+    def unary(self, emit_: emit.Python, frame: emit.PythonFrame, node: stmts.UnaryOp):
+        value = frame.get(node.value)
+        op = OPERATORS[type(node)]
+        frame.write_line(f"{frame.ssa[node.result]} = {op}{value}")
+        return (frame.ssa[node.result],)
@@ -11,7 +11,7 @@ This module contains the dialect for the Python unpack semantics, including:
 
 import ast
 
-from kirin import ir, types, interp, lowering
+from kirin import ir, emit, parse, types, interp, lowering
 from kirin.decl import info, statement
 from kirin.print import Printer
 
@@ -48,6 +48,16 @@ class Concrete(interp.MethodTable):
         return tuple(frame.get(stmt.value))
 
 
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Unpack)
+    def unpack(self, emit_: emit.Python, frame: emit.PythonFrame, stmt: Unpack):
+        results = tuple(frame.ssa[result] for result in stmt.results)
+        frame.write_line(f"[{', '.join(results)}] = {frame.get(stmt.value)}")
+        return results
+
+
 @dialect.register(key="typeinfer")
 class TypeInfer(interp.MethodTable):
 
@@ -87,3 +97,18 @@ def unpacking(state: lowering.State, node: ast.expr, value: ir.SSAValue):
 
     for idx in continue_unpack:
         unpacking(state, node.elts[idx], stmt.results[idx])
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_Unpack(self, parser: parse.Parser, stmt_type: type[Unpack]) -> Unpack:
+        # %x, %y = py.unpack.unpack %value
+        names = tuple(parser.result_names)
+        return parser.statement(
+            stmt_type,
+            args=(parser.parse_value(),),
+            attributes={"names": ir.PyAttr(names)},
+            result_types=[types.Any] * len(names),
+            args_slice={"value": 0},
+        )
@@ -15,7 +15,9 @@ from . import (
     _julia as _julia,
     absint as absint,
     interp as interp,
+    syntax as syntax,
     unroll as unroll,
+    _python as _python,
     lowering as lowering,
     constprop as constprop,
     typeinfer as typeinfer,
@@ -0,0 +1,50 @@
+from kirin import ir, emit, interp
+
+from .stmts import For, Yield, IfElse
+from ._dialect import dialect
+
+
+@dialect.register(key="emit.python")
+class PythonEmit(interp.MethodTable):
+
+    @interp.impl(Yield)
+    def yield_stmt(self, emit_: emit.Python, frame: emit.PythonFrame, node: Yield):
+        emit_.emit_yield(frame, frame.get_values(node.values))
+        return ()
+
+    @interp.impl(IfElse)
+    def if_else(self, emit_: emit.Python, frame: emit.PythonFrame, node: IfElse):
+        cond = frame.get(node.cond)
+        results = tuple(frame.ssa[result] for result in node.results)
+        frame.write_line(f"if {cond}:")
+        with frame.indent():
+            self.emit_body(emit_, frame, node.then_body, cond, results)
+        if node.else_body.blocks:
+            frame.write_line("else:")
+            with frame.indent():
+                self.emit_body(emit_, frame, node.else_body, cond, results)
+        return results
+
+    @staticmethod
+    def emit_body(
+        emit_: emit.Python,
+        frame: emit.PythonFrame,
+        body: ir.Region,
+        cond: str,
+        results: tuple[str, ...],
+    ):
+        frame.set_values(body.blocks[0].args, (cond,))
+        emit_.emit_region(frame, body, results)
+
+    @interp.impl(For)
+    def for_loop(self, emit_: emit.Python, frame: emit.PythonFrame, node: For):
+        results = tuple(frame.ssa[result] for result in node.results)
+        emit_.assign(frame, results, frame.get_values(node.initializers))
+        # NOTE: the loop variables are the results, assigned by the yield
+        block = node.body.blocks[0]
+        value = frame.ssa[block.args[0]]
+        frame.set_values(block.args, (value, *results))
+        frame.write_line(f"for {value} in {frame.get(node.iterable)}:")
+        with frame.indent():
+            emit_.emit_region(frame, node.body, results)
+        return results
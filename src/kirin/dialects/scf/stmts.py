@@ -96,7 +96,7 @@ class IfElse(ir.Statement):
         with printer.rich(style="comment"):
             printer.plain_print(f" -> purity={self.purity}")
 
-    def verify(self) -> None:
+    def verify_node(self) -> None:
         from kirin.dialects.func import Return
 
         if len(self.then_body.blocks) != 1:
@@ -158,7 +158,7 @@ class For(ir.Statement):
             attributes={"purity": ir.PyAttr(False)},
         )
 
-    def verify(self) -> None:
+    def verify_node(self) -> None:
         from kirin.dialects.func import Return
 
         if len(self.body.blocks) != 1:
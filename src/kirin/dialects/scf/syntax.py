@@ -0,0 +1,97 @@
+from kirin import ir, parse, types
+
+from .stmts import For, Yield, IfElse
+from ._dialect import dialect
+
+
+@dialect.register
+class Syntax(parse.Syntax):
+
+    def parse_IfElse(self, parser: parse.Parser, stmt_type: type[IfElse]) -> IfElse:
+        # scf.if %cond {...} else {...} -> purity=False
+        cond = parser.parse_value()
+        then_body = parser.parse_region()
+        if parser.peek().text == "else":
+            parser.expect("name")
+            else_body = parser.parse_region()
+        else:  # NOTE: an empty else body is not printed
+            block = ir.Block()
+            block.args.append_from(types.Bool)
+            block.stmts.append(Yield())
+            else_body = ir.Region(block)
+
+        result_types: list[types.TypeAttribute] = []
+        for region in (then_body, else_body):
+            if region.blocks and isinstance(term := region.blocks[-1].last_stmt, Yield):
+                if not result_types:
+                    result_types = [value.type for value in term.values]
+                else:
+                    result_types = [
+                        typ.join(value.type)
+                        for typ, value in zip(result_types, term.values)
+                    ]
+
+        return parser.statement(
+            stmt_type,
+            args=(cond,),
+            regions=(then_body, else_body),
+            attributes={"purity": _purity(parser)},
+            result_types=result_types,
+            args_slice={"cond": 0},
+        )
+
+    def parse_For(self, parser: parse.Parser, stmt_type: type[For]) -> For:
+        # scf.for %i : !py.int in %iterable -> !py.int
+        #   iter_args(%x : !py.int = %init) {
+        #   ...
+        # } -> purity=False
+        block = ir.Block()
+        index = parser.expect("ssa").text
+        parser.define(index, block.args.append_from(_annotation(parser)))
+        parser.expect("name", "in")
+        iterable = parser.parse_value()
+        result_types = parser.parse_types() if parser.accept("->") else []
+
+        initializers: list[ir.SSAValue] = []
+        if parser.peek().text == "iter_args":
+            parser.expect("name")
+            parser.expect("(")
+            while True:
+                arg = parser.expect("ssa").text
+                typ = _annotation(parser)
+                parser.expect("=")
+                initializers.append(parser.parse_value())
+                parser.define(arg, block.args.append_from(typ))
+                if not parser.accept(","):
+                    break
+            parser.expect(")")
+
+        parser.expect("{")
+        parser.parse_statements(block)
+        parser.expect("}")
+        return parser.statement(
+            stmt_type,
+            args=(iterable, *initializers),
+            regions=(ir.Region(block),),
+            attributes={"purity": _purity(parser)},
+            result_types=result_types,
+            args_slice={"iterable": 0, "initializers": slice(1, None)},
+        )
+
+    def parse_Yield(self, parser: parse.Parser, stmt_type: type[Yield]) -> Yield:
+        # scf.yield %x, %y
+        values = parser.parse_values()
+        return parser.statement(
+            stmt_type, args=values, args_slice={"values": slice(None)}
+        )
+
+
+def _annotation(parser: parse.Parser) -> types.TypeAttribute:
+    return parser.parse_type() if parser.accept(":") else types.Any
+
+
+def _purity(parser: parse.Parser) -> bool:
+    parser.expect("->")
+    parser.expect("name", "purity")
+    parser.expect("=")
+    return parser.parse_python()
@@ -9,6 +9,8 @@ from ._dialect import dialect
 class UnusedYield(RewriteRule):
     """Trim unused results from `For` and `IfElse` statements."""
 
+    matches = (For, IfElse)
+
     def scan_unused(self, node: ir.Statement):
         any_unused = False
         uses: list[int] = []
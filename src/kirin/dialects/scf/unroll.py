@@ -8,6 +8,7 @@ from .stmts import For, Yield, IfElse
 
 
 class PickIfElse(RewriteRule):
+    matches = (IfElse,)
 
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, IfElse):
@@ -53,6 +54,7 @@ class PickIfElse(RewriteRule):
 
 
 class ForLoop(RewriteRule):
+    matches = (For,)
 
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, For):
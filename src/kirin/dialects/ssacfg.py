@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TypeVar
 
 from kirin import ir, interp, lattice
+from kirin.worklist import WorkList
+from kirin.analysis.cfg import reverse_postorder
 
 dialect = ir.Dialect("ssacfg")
 
@@ -12,6 +14,10 @@ class Concrete(interp.MethodTable):
 
     @interp.impl(ir.SSACFG())
     def ssacfg(self, interp_: interp.Interpreter, frame: interp.Frame, node: ir.Region):
+        if isinstance(interp_, interp.Interpreter) and interp_.compiled:
+            if not interp_.debug:
+                return self.ssacfg_compiled(interp_, frame, node)
+
         block = node.blocks[0]
         block_inputs = frame.get_values(block.args)
         while block is not None:
@@ -33,6 +39,38 @@ class Concrete(interp.MethodTable):
                         return values  # terminate the region
         return
 
+    def ssacfg_compiled(
+        self, interp_: interp.Interpreter, frame: interp.Frame, node: ir.Region
+    ):
+        """Same as `ssacfg` but runs the pre-resolved statements of each block,
+        see [`Interpreter.compile_block`][kirin.interp.Interpreter.compile_block].
+        """
+        block = node.blocks[0]
+        block_inputs = frame.get_values(block.args)
+        while block is not None:
+            frame.current_block = block
+            frame.set_values(block.args, block_inputs)
+            for stmt, method, table in interp_.compile_block(block):
+                frame.current_stmt = stmt
+                if method is None:
+                    stmt_results = interp_.frame_eval(frame, stmt)
+                else:
+                    stmt_results = method(table, interp_, frame, stmt)
+
+                if isinstance(stmt_results, tuple):
+                    frame.set_values(stmt._results, stmt_results)
+                elif stmt_results is None:
+                    continue
+                elif isinstance(stmt_results, interp.Successor):
+                    block, block_inputs = stmt_results.block, stmt_results.block_args
+                    break
+                elif isinstance(stmt_results, interp.ReturnValue):
+                    return stmt_results  # terminate the call frame
+                elif isinstance(stmt_results, interp.YieldValue):
+                    return stmt_results.values  # terminate the region
+            else:
+                return
+
 
 @dialect.register(key="abstract")
 class Abstract(interp.MethodTable):
@@ -47,27 +85,74 @@ class Abstract(interp.MethodTable):
         frame: FrameType,
         node: ir.Region,
     ):
-        result = None
-        frame.worklist.append(
-            interp.Successor(node.blocks[0], *frame.get_values(node.blocks[0].args))
-        )
-        while (succ := frame.worklist.pop()) is not None:
-            visited = frame.visited.setdefault(succ.block, set())
-            if succ in visited:
-                continue
-
-            block_result = self.run_succ(interp_, frame, succ)
-            if len(frame.visited[succ.block]) < 128:
-                frame.visited[succ.block].add(succ)
-            else:
-                continue
+        """Run the blocks of the region until their inputs are stable.
+
+        Blocks are numbered in reverse postorder and always processed in
+        that order. Each block keeps the join of the arguments of all the
+        successors targeting it, a block is (re)visited only when this
+        joined input strictly grows. After `interp_.widen_after` growths
+        through a back edge, the input of the loop head is widened with
+        [`AbstractInterpreter.widen`][kirin.interp.AbstractInterpreter.widen].
+        """
+        order = reverse_postorder(node)
+        states: list[tuple[lattice.BoundedLattice, ...] | None] = [None] * len(order)
+        widened: list[int] = [0] * len(order)
+        queue: WorkList[int] = WorkList(policy="priority", priority=int, unique=True)
+
+        def index(block: ir.Block) -> int:
+            # NOTE: successors may target blocks of other regions, e.g. scf
+            # bodies ending with a return, number them after the region.
+            if (idx := order.get(block)) is None:
+                idx = order[block] = len(order)
+                states.append(None)
+                widened.append(0)
+            return idx
 
-            if isinstance(block_result, interp.Successor):
-                raise interp.InterpreterError(
-                    "unexpected successor, successors should be in worklist"
+        def propagate(source: int, succ: interp.Successor):
+            idx = index(succ.block)
+            old = states[idx]
+            if old is None:
+                states[idx] = succ.block_args
+            elif all(new.is_subseteq(x) for x, new in zip(old, succ.block_args)):
+                return
+            elif source >= idx and widened[idx] >= interp_.widen_after:
+                states[idx] = tuple(
+                    interp_.widen(x, x.join(new))
+                    for x, new in zip(old, succ.block_args)
                 )
+            else:
+                if source >= idx:  # back edge
+                    widened[idx] += 1
+                states[idx] = tuple(x.join(new) for x, new in zip(old, succ.block_args))
+            queue.append(idx)
+
+        # NOTE: statements push successors to the frame's worklist, use a new
+        # one so that nested regions do not steal the successors of this region.
+        outer_worklist = frame.worklist
+        frame.worklist = WorkList()
+        blocks = list(order)
+        result = None
+        try:
+            entry = node.blocks[0]
+            propagate(-1, interp.Successor(entry, *frame.get_values(entry.args)))
+            while (idx := queue.pop()) is not None:
+                if idx >= len(blocks):
+                    blocks = list(order)
+
+                args = states[idx]
+                assert args is not None, "block scheduled without input"
+                succ = interp.Successor(blocks[idx], *args)
+                block_result = self.run_succ(interp_, frame, succ)
+                if isinstance(block_result, interp.Successor):
+                    raise interp.InterpreterError(
+                        "unexpected successor, successors should be in worklist"
+                    )
 
-            result = interp_.join_results(result, block_result)
+                result = interp_.join_results(result, block_result)
+                while (succ := frame.worklist.pop()) is not None:
+                    propagate(idx, succ)
+        finally:
+            frame.worklist = outer_worklist
 
         if isinstance(result, interp.YieldValue):
             return result.values
@@ -1,2 +1,3 @@
 from .abc import EmitABC as EmitABC, EmitFrame as EmitFrame
 from .julia import Julia as Julia, JuliaFrame as JuliaFrame
+from .python import Python as Python, PythonFrame as PythonFrame
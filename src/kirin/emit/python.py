@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import math
+import linecache
+from typing import Any, Callable, Iterable, Sequence
+from contextlib import contextmanager
+from dataclasses import field, dataclass
+
+from kirin import ir, interp
+from kirin.idtable import IdTable
+
+from .abc import EmitABC, EmitFrame
+
+
+@dataclass
+class Names(IdTable[ir.SSAValue]):
+    """Python identifiers of the SSA values, derived from their names."""
+
+    def add(self, value: ir.SSAValue) -> str:
+        name = value.name
+        if name is not None:
+            name = "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+            curr_ind = self.name_count.get(name, 0)
+            self.name_count[name] = curr_ind + 1
+            name = self.prefix + name + (f"_{curr_ind}" if curr_ind != 0 else "")
+        else:
+            name = f"{self.prefix}{self.next_id}"
+            self.next_id += 1
+        self.table[value] = name
+        return name
+
+
+@dataclass
+class RegionState:
+    """How the control flow of the region being emitted is laid out.
+
+    Blocks with a single predecessor are emitted inline at their branch,
+    the other blocks, the heads, are dispatched on by a `while` loop over
+    the index of the next head when there is more than one of them. A head
+    whose inlined blocks branch back to it is wrapped into its own loop.
+    """
+
+    yields: tuple[str, ...]
+    """names assigned by the `Yield`-like terminators of the region."""
+    heads: dict[ir.Block, int]
+    """index of the heads of the region, in the dispatch loop."""
+    inlined: set[ir.Block]
+    """blocks emitted inline at the branch to them."""
+    dispatch: str | None = None
+    """variable holding the index of the next head, if there is a dispatch loop."""
+    head: ir.Block | None = None
+    """the head being emitted."""
+    looping: bool = False
+    """if the head being emitted is wrapped into its own loop."""
+
+
+@dataclass
+class PythonFrame(EmitFrame[str]):
+    lines: list[str] = field(default_factory=list)
+    ssa: Names = field(default_factory=lambda: Names(prefix="v_"))
+    regions: list[RegionState] = field(default_factory=list)
+    _indent: int = 0
+
+    def write_line(self, value: str):
+        self.lines.append("    " * self._indent + value)
+
+    @contextmanager
+    def indent(self):
+        """Indent the lines written in the context, an empty body is
+        filled with `pass`."""
+        self._indent += 1
+        count = len(self.lines)
+        yield
+        if len(self.lines) == count:
+            self.write_line("pass")
+        self._indent -= 1
+
+
+@dataclass
+class Python(EmitABC[PythonFrame, str]):
+    """Python code generator for the IR.
+
+    This class generates the source of a Python function from a method, SSA
+    values are emitted as local variables, branches as `if` statements and
+    loops as `while` loops. See [`compile`][kirin.emit.Python.compile] to
+    turn a method into a Python function and [`kirin.jit`][kirin.jit] to do
+    it for the methods called often.
+
+    The code of each statement is emitted by the `"emit.python"` method table
+    of its dialect, the implementations write the lines computing the results
+    of the statement and return their names, or Python literals, the same way
+    as concrete interpreter implementations return values.
+    """
+
+    keys = ("emit.python",)
+    void = "None"
+
+    entry: str = field(default="", init=False)
+    """name of the function emitted by [`run`][kirin.emit.Python.run]."""
+    namespace: dict[str, Any] = field(init=False, repr=False)
+    """global variables of the emitted code, the objects it refers to."""
+    _refs: dict[int, str] = field(init=False, repr=False)
+    _counter: int = field(default=0, init=False, repr=False)
+
+    def initialize(self):
+        super().initialize()
+        self.namespace = {}
+        self._refs = {}
+        self._counter = 0
+        return self
+
+    def initialize_frame(
+        self, node: ir.Statement, *, has_parent_access: bool = False
+    ) -> PythonFrame:
+        return PythonFrame(node, has_parent_access=has_parent_access)
+
+    def run(self, node: ir.Method | ir.Statement) -> str:
+        """Return the source of a function running `node`.
+
+        The function takes the method itself as first argument, followed
+        by the arguments of the method.
+        """
+        if isinstance(node, ir.Method):
+            node = node.code
+
+        with self.eval_context():
+            self.entry = self.fresh("entry")
+            frame, _ = self.eval(node)
+        return "\n".join(frame.lines) + "\n"
+
+    def compile(self, method: ir.Method) -> Callable:
+        """Return a Python function running `method`.
+
+        The function is called as `function(method, *args)`, see
+        [`unsupported`][kirin.emit.Python.unsupported] to check beforehand
+        that all the statements of the method can be emitted.
+        """
+        source = self.run(method)
+        filename = f"<kirin.emit.python {method.sym_name or 'lambda'}>"
+        # NOTE: keep the source around for the tracebacks
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            filename,
+        )
+        namespace = dict(self.namespace)
+        exec(compile(source, filename, "exec"), namespace)
+        return namespace[self.entry]
+
+    def unsupported(self, method: ir.Method) -> ir.Statement | None:
+        """Return the first statement of the method that cannot be emitted.
+
+        A statement can be emitted if the implementation the concrete
+        interpreter dispatches it to has a counterpart for the same signature
+        in the `"emit.python"` method table of its dialect, so typed
+        implementations are emitted with the same semantics. Statements with
+        regions must interpret them as SSA CFGs.
+        """
+        from kirin.interp.concrete import Interpreter
+
+        concrete = self.dialects.registry.interpreter(keys=Interpreter.keys)
+        if interp.Signature(type(method.code)) not in self.registry:
+            return method.code
+        for stmt in method.callable_region.walk():
+            sig = interp.Signature(type(stmt), tuple(arg.type for arg in stmt.args))
+            if sig not in concrete:
+                sig = interp.Signature(type(stmt))
+            if sig not in concrete or sig not in self.registry:
+                return stmt
+            if stmt.regions and not stmt.has_trait(ir.SSACFG):
+                return stmt
+        return None
+
+    def fresh(self, prefix: str) -> str:
+        """Return a new name for a temporary variable."""
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def ref(self, obj: Any, prefix: str = "g") -> str:
+        """Return the name of a global variable holding `obj`."""
+        if (name := self._refs.get(id(obj))) is None:
+            name = self._refs[id(obj)] = self.fresh(prefix)
+            self.namespace[name] = obj
+        return name
+
+    def constant(self, value: Any) -> str:
+        """Return a Python expression of the constant `value`, a literal
+        for simple values or a global variable holding the value."""
+        if type(value) in (int, bool, str, type(None)) or (
+            type(value) is float and math.isfinite(value)
+        ):
+            literal = repr(value)
+            return f"({literal})" if literal.startswith("-") else literal
+        return self.ref(value, "c")
+
+    def assign(self, frame: PythonFrame, targets: Sequence[str], values: Sequence[str]):
+        """Assign `values` to the variables `targets` all at once."""
+        pairs = [(name, value) for name, value in zip(targets, values) if name != value]
+        if not pairs:
+            return
+        frame.write_line(
+            f"{', '.join(name for name, _ in pairs)} = "
+            f"{', '.join(value for _, value in pairs)}"
+        )
+
+    def emit_region(
+        self, frame: PythonFrame, region: ir.Region, yields: tuple[str, ...] = ()
+    ):
+        """Emit the blocks of the region.
+
+        The arguments of the entry block must be set in the frame, `yields`
+        are the variables the `Yield`-like terminators of the region assign.
+        """
+        entry = region.blocks[0]
+        preds: dict[ir.Block, int] = {entry: 0}
+        postorder: list[ir.Block] = []
+        stack = [(entry, iter(self.successors(entry)))]
+        while stack:
+            block, succs = stack[-1]
+            for succ in succs:
+                if succ not in preds:
+                    preds[succ] = 0
+                    stack.append((succ, iter(self.successors(succ))))
+                preds[succ] += 1
+                if stack[-1][0] is not block:
+                    break
+            else:
+                stack.pop()
+                postorder.append(block)
+
+        order = postorder[::-1]
+        inlined = {block for block in order[1:] if preds[block] == 1}
+        # NOTE: the entry is dispatched on last as it runs only once
+        heads = [block for block in order[1:] if block not in inlined] + [entry]
+        for block in order[1:]:
+            for arg in block.args:
+                frame.set(arg, frame.ssa[arg])
+        if preds[entry]:  # the inputs are variables assigned by branches
+            self.assign(
+                frame,
+                [frame.ssa[arg] for arg in entry.args],
+                frame.get_values(entry.args),
+            )
+            frame.set_values(entry.args, (frame.ssa[arg] for arg in entry.args))
+
+        state = RegionState(
+            yields, {head: idx for idx, head in enumerate(heads)}, inlined
+        )
+        frame.regions.append(state)
+        if len(heads) == 1:
+            self.emit_head(frame, entry)
+            frame.regions.pop()
+            return
+
+        state.dispatch = self.fresh("block")
+        frame.write_line(f"{state.dispatch} = {state.heads[entry]}")
+        # NOTE: the function body is left by returning
+        if len(frame.regions) == 1:
+            frame.write_line("while True:")
+        else:
+            frame.write_line(f"while {state.dispatch} >= 0:")
+
+        # NOTE: emit the heads in reverse postorder, so values are emitted
+        # before their uses, but write them in dispatch order
+        lines, indent, bodies = frame.lines, frame._indent, {}
+        frame._indent += 2
+        for head in [entry, *heads[:-1]]:
+            frame.lines = bodies[head] = []
+            self.emit_head(frame, head)
+        frame.lines, frame._indent = lines, indent
+        with frame.indent():
+            for idx, head in enumerate(heads):
+                if idx == 0:
+                    frame.write_line(f"if {state.dispatch} == {idx}:")
+                elif idx < len(heads) - 1:
+                    frame.write_line(f"elif {state.dispatch} == {idx}:")
+                else:
+                    frame.write_line("else:")
+                frame.lines.extend(bodies[head])
+        frame.regions.pop()
+
+    @staticmethod
+    def successors(block: ir.Block) -> list[ir.Block]:
+        last = block.last_stmt
+        return last.successors if last is not None else []
+
+    def emit_head(self, frame: PythonFrame, head: ir.Block):
+        state = frame.regions[-1]
+        state.head = head
+        state.looping = False
+        stack, seen = [head], {head}
+        while stack and not state.looping:
+            block = stack.pop()
+            for succ in self.successors(block):
+                if succ is head:
+                    state.looping = True
+                elif succ in state.inlined and succ not in seen:
+                    seen.add(succ)
+                    stack.append(succ)
+
+        if state.looping:
+            frame.write_line("while True:")
+            with frame.indent():
+                self.emit_block(frame, head)
+        else:
+            self.emit_block(frame, head)
+
+    def emit_block(self, frame: PythonFrame, block: ir.Block):
+        frame.current_block = block
+        for stmt in block.stmts:
+            frame.current_stmt = stmt
+            results = self.frame_eval(frame, stmt)
+            if isinstance(results, tuple):
+                frame.set_values(stmt._results, results)
+
+        last = block.last_stmt
+        if last is None or not last.has_trait(ir.IsTerminator):
+            # NOTE: falling off a region returns nothing
+            if len(frame.regions) == 1:
+                frame.write_line("return None")
+            else:
+                self.emit_yield(frame, ())
+
+    def emit_branch(self, frame: PythonFrame, block: ir.Block, values: Iterable[str]):
+        """Emit a branch to `block` with the arguments `values`."""
+        state = frame.regions[-1]
+        args = [
+            (frame.get(arg), value)
+            for arg, value in zip(block.args, values)
+            if arg.uses
+        ]
+        self.assign(frame, [arg for arg, _ in args], [value for _, value in args])
+        if block in state.inlined:
+            self.emit_block(frame, block)
+        elif block is state.head and state.looping:
+            frame.write_line("continue")
+        else:
+            frame.write_line(f"{state.dispatch} = {state.heads[block]}")
+            if state.looping:
+                frame.write_line("break")
+
+    def emit_yield(self, frame: PythonFrame, values: Iterable[str]):
+        """Emit leaving the region with the results `values`."""
+        state = frame.regions[-1]
+        self.assign(frame, state.yields, tuple(values))
+        if state.dispatch is not None:
+            frame.write_line(f"{state.dispatch} = -1")
+        if state.looping:
+            frame.write_line("break")
@@ -1,4 +1,13 @@
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterable, Optional, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    TypeVar,
+    Callable,
+    Iterable,
+    Optional,
+    Protocol,
+)
 
 if TYPE_CHECKING:
     from kirin import ir
@@ -32,3 +41,63 @@ class Graph(Protocol, Generic[Node]):
         printer: Optional["Printer"] = None,
         analysis: dict["ir.SSAValue", Any] | None = None,
     ) -> None: ...
+
+
+def strongly_connected_components(
+    nodes: Iterable[Node], successors: Callable[[Node], Iterable[Node]]
+) -> list[list[Node]]:
+    """Compute the strongly connected components of a graph (Tarjan).
+
+    Args:
+        nodes (Iterable[Node]): the nodes of the graph.
+        successors (Callable[[Node], Iterable[Node]]): return the successors
+            of a node, successors that are not in `nodes` are ignored.
+
+    Returns:
+        list[list[Node]]: the components, in reverse topological order: a
+            component comes after all the components reachable from it.
+    """
+    nodes = list(nodes)
+    members = set(nodes)
+    index: dict[Node, int] = {}
+    lowlink: dict[Node, int] = {}
+    stack: list[Node] = []
+    on_stack: set[Node] = set()
+    components: list[list[Node]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        # NOTE: iterative DFS, call graphs can be deeper than the recursion limit
+        work = [(root, iter(successors(root)))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in members:
+                    continue
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors(child))))
+                    break
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member is node:
+                            break
+                    components.append(component)
+    return components
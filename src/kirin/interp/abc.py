@@ -70,6 +70,11 @@ class InterpreterABC(ABC, Generic[FrameType, ValueType]):
         self.state = InterpreterState()
         return self
 
+    @property
+    def evaluating(self) -> bool:
+        """Whether the interpreter is currently evaluating."""
+        return self.__eval_lock
+
     @abstractmethod
     def initialize_frame(
         self, node: ir.Statement, *, has_parent_access: bool = False
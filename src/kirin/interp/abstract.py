@@ -29,7 +29,6 @@ class AbstractFrame(Frame[ResultType]):
     """
 
     worklist: WorkList[Successor[ResultType]] = field(default_factory=WorkList)
-    visited: dict[ir.Block, set[Successor[ResultType]]] = field(default_factory=dict)
 
 
 AbstractFrameType = TypeVar("AbstractFrameType", bound=AbstractFrame)
@@ -63,6 +62,10 @@ class AbstractInterpreter(InterpreterABC[AbstractFrameType, ResultType], ABC):
     lattice: type[BoundedLattice[ResultType]] = field(init=False)
     """lattice type for the abstract interpreter.
     """
+    widen_after: int = field(default=8, kw_only=True)
+    """The number of times the input of a loop head can grow before it is
+    widened, see [`widen`][kirin.interp.AbstractInterpreter.widen].
+    """
 
     def __init_subclass__(cls) -> None:
         if ABC in cls.__bases__:
@@ -79,6 +82,18 @@ class AbstractInterpreter(InterpreterABC[AbstractFrameType, ResultType], ABC):
     def recursion_limit_reached(self) -> ResultType:
         return self.lattice.bottom()
 
+    def widen(self, old: ResultType, new: ResultType) -> ResultType:
+        """Widening operator applied to the input of loop heads that keeps
+        growing, `new` is always greater or equal to `old`. The result must
+        be greater or equal to `new` and guarantee that the input stops
+        growing after a finite number of steps.
+
+        The default implementation returns top for any value that changed.
+        """
+        if new.is_subseteq(old):
+            return old
+        return self.lattice.top()
+
     # helper methods
     @overload
     @staticmethod
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from typing import Any
-from dataclasses import dataclass
+from typing import Any, Callable, TypeAlias
+from dataclasses import field, dataclass
 
 from kirin import ir
 
 from .abc import InterpreterABC
 from .frame import Frame
+from .table import Signature, MethodTable
+
+CompiledStmt: TypeAlias = tuple[
+    ir.Statement, Callable[..., Any] | None, MethodTable | None
+]
+"""A pre-resolved statement: the statement, the implementation function
+and its method table. The implementation is `None` if the statement has
+to be dispatched through [`frame_eval`][kirin.interp.InterpreterABC.frame_eval]
+on every execution.
+"""
 
 
 @dataclass
@@ -14,6 +24,15 @@ class Interpreter(InterpreterABC[Frame[Any], Any]):
     keys = ("main",)
     void = None
 
+    compiled: bool = field(default=False, kw_only=True)
+    """Pre-resolve the implementation of each statement in a block once and
+    reuse it on every execution of the block, instead of looking up the
+    registry per statement. See [`compile_block`][kirin.interp.Interpreter.compile_block].
+    """
+    _typed_heads: tuple[dict, frozenset[type]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def initialize_frame(
         self, node: ir.Statement, *, has_parent_access: bool = False
     ) -> Frame[Any]:
@@ -22,3 +41,47 @@ class Interpreter(InterpreterABC[Frame[Any], Any]):
 
     def run(self, method: ir.Method, *args, **kwargs):
         return self.call(method, method, *args, **kwargs)
+
+    def compile_block(self, block: ir.Block) -> tuple[CompiledStmt, ...]:
+        """Resolve the implementation of each statement in the block.
+
+        The result is cached on the block and dropped when statements are
+        inserted into or removed from the block. Statements whose dispatch
+        depends on argument types, or that have no implementation, are left
+        unresolved and go through `frame_eval` when executed, so changing
+        the types of the IR does not invalidate the compiled block.
+
+        Args:
+            block: the block to compile.
+
+        Returns:
+            tuple[CompiledStmt, ...]: the pre-resolved statements.
+        """
+        cached = block._compiled
+        if cached is not None and cached[0] is self.registry:
+            return cached[1]
+
+        typed_heads = self.__typed_heads()
+        compiled: list[CompiledStmt] = []
+        for stmt in block.stmts:
+            stmt_type = type(stmt)
+            method = None
+            if stmt_type not in typed_heads:
+                method = self.registry.get(Signature(stmt_type))
+
+            if method is None:
+                compiled.append((stmt, None, None))
+            else:
+                compiled.append((stmt, method.method, method.parent))
+
+        ret = tuple(compiled)
+        block._compiled = (self.registry, ret)
+        return ret
+
+    def __typed_heads(self) -> frozenset[type]:
+        if self._typed_heads is not None and self._typed_heads[0] is self.registry:
+            return self._typed_heads[1]
+
+        heads = frozenset(sig.head for sig in self.registry if sig.args)
+        self._typed_heads = (self.registry, heads)
+        return heads
@@ -6,7 +6,7 @@ from typing_extensions import Self
 
 from kirin.ir import Block, SSAValue, Statement
 
-from .undefined import Undefined, is_undefined
+from .undefined import Undefined
 from .exceptions import InterpreterError
 
 KeyType = TypeVar("KeyType")
@@ -114,7 +114,7 @@ class Frame(FrameABC[SSAValue, ValueType]):
             InterpreterError: If the value is not found. This will be catched by the interpreter.
         """
         value = self.entries.get(key, Undefined)
-        if is_undefined(value):
+        if value is Undefined:
             if self.has_parent_access and self.parent:
                 return self.parent.get(key)
             else:
@@ -191,3 +191,7 @@ class Frame(FrameABC[SSAValue, ValueType]):
 
     def set(self, key: SSAValue, value: ValueType) -> None:
         self.entries[key] = value
+
+    def set_values(self, keys: Iterable[SSAValue], values: Iterable[ValueType]) -> None:
+        # NOTE: same as `FrameABC.set_values` without calling `set` per value
+        self.entries.update(zip(keys, values, strict=True))
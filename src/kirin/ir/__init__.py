@@ -31,12 +31,14 @@ from kirin.ir.traits import (
     MaybePure as MaybePure,
     StmtTrait as StmtTrait,
     StaticCall as StaticCall,
+    Commutative as Commutative,
     RegionGraph as RegionGraph,
     SymbolTable as SymbolTable,
     ConstantLike as ConstantLike,
     HasSignature as HasSignature,
     IsTerminator as IsTerminator,
     NoTerminator as NoTerminator,
+    Speculatable as Speculatable,
     IsolatedFromAbove as IsolatedFromAbove,
     SymbolOpInterface as SymbolOpInterface,
     EntryPointInterface as EntryPointInterface,
@@ -51,4 +53,5 @@ from kirin.ir.exception import (
     TypeCheckError as TypeCheckError,
     ValidationError as ValidationError,
 )
+from kirin.ir.recompile import RecompileReport as RecompileReport
 from kirin.ir.attrs.data import Data as Data
@@ -1,4 +1,5 @@
 import typing
+import functools
 from abc import abstractmethod
 from dataclasses import dataclass
 from collections.abc import Hashable
@@ -16,7 +17,7 @@ from kirin.lattice import (
     SimpleMeetMixin,
 )
 
-from .abc import Attribute, LatticeAttributeMeta
+from .abc import Attribute, AttributeMeta, LatticeAttributeMeta
 from ._types import _TypeAttribute
 
 
@@ -40,7 +41,37 @@ class SingletonTypeMeta(TypeAttributeMeta, SingletonMeta):
 
 
 class UnionTypeMeta(TypeAttributeMeta, UnionMeta):
-    pass
+
+    def __init__(self, *args, **kwargs):
+        super(UnionTypeMeta, self).__init__(*args, **kwargs)
+        self._cache = {}
+
+    def __call__(self, typ, *others):
+        instance = super(UnionTypeMeta, self).__call__(typ, *others)
+        if not isinstance(instance, self):
+            return instance  # simplified to one of the types
+        return self._cache.setdefault(instance.types, instance)
+
+
+MEMO_SIZE = 4096
+"""The maximum number of entries in each of the memo tables of
+`TypeAttribute.join`, `TypeAttribute.meet` and `TypeAttribute.is_subseteq`.
+"""
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def _join(lhs: "TypeAttribute", rhs: "TypeAttribute") -> "TypeAttribute":
+    return lhs.join_impl(rhs)
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def _meet(lhs: "TypeAttribute", rhs: "TypeAttribute") -> "TypeAttribute":
+    return lhs.meet_impl(rhs)
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def _is_subseteq(lhs: "TypeAttribute", rhs: "TypeAttribute") -> bool:
+    return lhs.is_subseteq_impl(rhs)
 
 
 @dataclass
@@ -51,6 +82,15 @@ class TypeAttribute(
     BoundedLattice["TypeAttribute"],
     metaclass=TypeAttributeMeta,
 ):
+    """Base class of type attributes.
+
+    Type attributes are interned: constructing a type attribute that is
+    structurally equal to an existing one returns the existing object.
+    `join`, `meet` and `is_subseteq` are memoized on pairs of type
+    attributes in bounded LRU tables of size `MEMO_SIZE`, subclasses
+    implement `join_impl`, `meet_impl` and `is_subseteq_impl` (or the
+    `is_subseteq_<ClassName>` methods) instead.
+    """
 
     @classmethod
     def top(cls) -> "TypeAttribute":
@@ -61,6 +101,27 @@ class TypeAttribute(
         return BottomType()
 
     def join(self, other: "TypeAttribute") -> "TypeAttribute":
+        if self is other:
+            return self
+        return _join(self, other)
+
+    def meet(self, other: "TypeAttribute") -> "TypeAttribute":
+        if self is other:
+            return self
+        return _meet(self, other)
+
+    def is_subseteq(self, other: "TypeAttribute") -> bool:
+        if self is other:
+            return True
+        return _is_subseteq(self, other)
+
+    def is_subseteq_impl(self, other: "TypeAttribute") -> bool:
+        return super().is_subseteq(other)
+
+    def meet_impl(self, other: "TypeAttribute") -> "TypeAttribute":
+        return super().meet(other)
+
+    def join_impl(self, other: "TypeAttribute") -> "TypeAttribute":
         if self.is_subseteq(other):
             return other
         elif other.is_subseteq(self):
@@ -76,7 +137,9 @@ class TypeAttribute(
         return self.join(other)
 
     def __eq__(self, value: object) -> bool:
-        return isinstance(value, TypeAttribute) and self.is_equal(value)
+        return self is value or (
+            isinstance(value, TypeAttribute) and self.is_equal(value)
+        )
 
     @abstractmethod
     def __hash__(self) -> int: ...
@@ -99,7 +162,7 @@ class AnyType(TypeAttribute, metaclass=SingletonTypeMeta):
 class BottomType(TypeAttribute, metaclass=SingletonTypeMeta):
     name = "Bottom"
 
-    def is_subseteq(self, other: TypeAttribute) -> bool:
+    def is_subseteq_impl(self, other: TypeAttribute) -> bool:
         if isinstance(other, TypeVar):
             return self.is_subseteq(other.bound)
         return True
@@ -128,7 +191,7 @@ class PyClassMeta(TypeAttributeMeta):
         elif isinstance(typ, TypeVar):
             return hint2type(typ)
 
-        if isinstance(typ, type) and typ in self._cache:
+        if isinstance(typ, Hashable) and typ in self._cache:
             obj = self._cache[typ]
             if display_name != obj.display_name or prefix != obj.prefix:
                 raise ValueError(
@@ -184,8 +247,10 @@ class PyClass(TypeAttribute, typing.Generic[PyClassType], metaclass=PyClassMeta)
     def is_subseteq_TypeVar(self, other: "TypeVar") -> bool:
         return self.is_subseteq(other.bound)
 
-    def __hash__(self) -> int:
-        return hash((PyClass, self.typ))
+    __hash__ = object.__hash__  # interned
+
+    def __reduce__(self):
+        return (_pyclass, (self.typ, self.display_name, self.prefix))
 
     def __repr__(self) -> str:
         return self.typ.__name__
@@ -205,11 +270,14 @@ class LiteralMeta(TypeAttributeMeta):
             return data  # already a type
         elif not isinstance(data, Hashable):
             raise ValueError("Literal data must be hashable")
-        elif (data, datatype) in self._cache:
-            return self._cache[(data, datatype)]
+
+        # NOTE: 1 == True, use the Python type of data as part of the key
+        key = (type(data), data, datatype or PyClass(type(data)))
+        if key in self._cache:
+            return self._cache[key]
 
         instance = super(LiteralMeta, self).__call__(data, datatype)
-        self._cache[(data, datatype)] = instance
+        self._cache[key] = instance
         return instance
 
 
@@ -245,8 +313,10 @@ class Literal(TypeAttribute, typing.Generic[LiteralType], metaclass=LiteralMeta)
     def is_subseteq_fallback(self, other: TypeAttribute) -> bool:
         return self.type.is_subseteq(other)
 
-    def __hash__(self) -> int:
-        return hash((Literal, self.data))
+    __hash__ = object.__hash__  # interned
+
+    def __reduce__(self):
+        return (Literal, (self.data, self.type))
 
     def print_impl(self, printer: Printer) -> None:
         printer.plain_print("Literal(", repr(self.data), ",", self.type, ")")
@@ -278,12 +348,12 @@ class Union(TypeAttribute, metaclass=UnionTypeMeta):
         self.types = types
 
     def is_equal(self, other: TypeAttribute) -> bool:
-        return isinstance(other, Union) and self.types == other.types
+        return self is other
 
     def is_subseteq_fallback(self, other: TypeAttribute) -> bool:
         return all(t.is_subseteq(other) for t in self.types)
 
-    def join(self, other: TypeAttribute) -> TypeAttribute:
+    def join_impl(self, other: TypeAttribute) -> TypeAttribute:
         if self.is_subseteq(other):
             return other
         elif other.is_subseteq(self):
@@ -294,7 +364,7 @@ class Union(TypeAttribute, metaclass=UnionTypeMeta):
             return Union(self.types | {other})
         return BottomType()
 
-    def meet(self, other: TypeAttribute) -> TypeAttribute:
+    def meet_impl(self, other: TypeAttribute) -> TypeAttribute:
         if self.is_subseteq(other):
             return self
         elif other.is_subseteq(self):
@@ -305,17 +375,35 @@ class Union(TypeAttribute, metaclass=UnionTypeMeta):
             return Union(self.types & {other})
         return BottomType()
 
-    def __hash__(self) -> int:
-        return hash((Union, self.types))
+    __hash__ = object.__hash__  # interned
+
+    def __reduce__(self):
+        return (Union, (self.types,))
 
     def print_impl(self, printer: Printer) -> None:
         printer.print_name(self, prefix="!")
         printer.print_seq(self.types, delim=", ", prefix="[", suffix="]")
 
 
+class TypeVarMeta(TypeAttributeMeta):
+
+    def __init__(self, *args, **kwargs):
+        super(TypeVarMeta, self).__init__(*args, **kwargs)
+        self._cache = {}
+
+    def __call__(self, name: str, bound: TypeAttribute | None = None):
+        key = (name, bound or AnyType())
+        if key in self._cache:
+            return self._cache[key]
+
+        instance = super(TypeVarMeta, self).__call__(name, bound)
+        self._cache[key] = instance
+        return instance
+
+
 @typing.final
 @dataclass(eq=False)
-class TypeVar(TypeAttribute):
+class TypeVar(TypeAttribute, metaclass=TypeVarMeta):
     name = "TypeVar"
     varname: str
     bound: TypeAttribute
@@ -325,11 +413,7 @@ class TypeVar(TypeAttribute):
         self.bound = bound or AnyType()
 
     def is_equal(self, other: TypeAttribute) -> bool:
-        return (
-            isinstance(other, TypeVar)
-            and self.varname == other.varname
-            and self.bound.is_equal(other.bound)
-        )
+        return self is other
 
     def is_subseteq_TypeVar(self, other: "TypeVar") -> bool:
         return self.bound.is_subseteq(other.bound)
@@ -340,8 +424,10 @@ class TypeVar(TypeAttribute):
     def is_subseteq_fallback(self, other: TypeAttribute) -> bool:
         return self.bound.is_subseteq(other)
 
-    def __hash__(self) -> int:
-        return hash((TypeVar, self.varname, self.bound))
+    __hash__ = object.__hash__  # interned
+
+    def __reduce__(self):
+        return (TypeVar, (self.varname, self.bound))
 
     def print_impl(self, printer: Printer) -> None:
         printer.plain_print(f"~{self.varname}")
@@ -350,20 +436,34 @@ class TypeVar(TypeAttribute):
             printer.print(self.bound)
 
 
+class VarargMeta(AttributeMeta):
+
+    def __init__(self, *args, **kwargs):
+        super(VarargMeta, self).__init__(*args, **kwargs)
+        self._cache = {}
+
+    def __call__(self, typ: TypeAttribute):
+        if typ in self._cache:
+            return self._cache[typ]
+
+        instance = super(VarargMeta, self).__call__(typ)
+        self._cache[typ] = instance
+        return instance
+
+
 @typing.final
-@dataclass
-class Vararg(Attribute):
+@dataclass(eq=False)
+class Vararg(Attribute, metaclass=VarargMeta):
     name = "Vararg"
     typ: TypeAttribute
 
-    def __hash__(self) -> int:
-        return hash((Vararg, self.typ))
-
     def __eq__(self, value: object) -> bool:
-        if not isinstance(value, Vararg):
-            return False
+        return self is value or (isinstance(value, Vararg) and self.typ == value.typ)
+
+    __hash__ = object.__hash__  # interned
 
-        return self.typ == value.typ
+    def __reduce__(self):
+        return (Vararg, (self.typ,))
 
     def print_impl(self, printer: Printer) -> None:
         printer.plain_print("*")
@@ -374,9 +474,30 @@ TypeVarValue: typing.TypeAlias = TypeAttribute | Vararg | list
 TypeOrVararg: typing.TypeAlias = TypeAttribute | Vararg
 
 
+class GenericMeta(TypeAttributeMeta):
+
+    def __init__(self, *args, **kwargs):
+        super(GenericMeta, self).__init__(*args, **kwargs)
+        self._cache = {}
+
+    def __call__(self, body, *vars):
+        if not isinstance(body, PyClass):
+            body = PyClass(body)
+        args, vararg = _split_type_args(vars)
+        key = (body, args, vararg)
+        if key in self._cache:
+            return self._cache[key]
+
+        if vararg is not None:
+            args = (*args, vararg)
+        instance = super(GenericMeta, self).__call__(body, *args)
+        self._cache[key] = instance
+        return instance
+
+
 @typing.final
 @dataclass(eq=False)
-class Generic(TypeAttribute, typing.Generic[PyClassType]):
+class Generic(TypeAttribute, typing.Generic[PyClassType], metaclass=GenericMeta):
     name = "Generic"
     body: PyClass[PyClassType]
     vars: tuple[TypeAttribute, ...]
@@ -426,8 +547,12 @@ class Generic(TypeAttribute, typing.Generic[PyClassType]):
                 )
             )
 
-    def __hash__(self) -> int:
-        return hash((Generic, self.body, self.vars, self.vararg))
+    __hash__ = object.__hash__  # interned
+
+    def __reduce__(self):
+        if self.vararg is None:
+            return (Generic, (self.body, *self.vars))
+        return (Generic, (self.body, *self.vars, self.vararg))
 
     def __repr__(self) -> str:
         if self.vararg is None:
@@ -517,6 +642,10 @@ def _split_type_args(
     raise TypeError("Vararg must be the last argument")
 
 
+def _pyclass(typ: type, display_name: str, prefix: str) -> PyClass:
+    return PyClass(typ, display_name=display_name, prefix=prefix)
+
+
 T = typing.TypeVar("T")
 
 
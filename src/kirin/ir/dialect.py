@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeVar, ClassVar
 from dataclasses import field, dataclass
 
 from typing_extensions import dataclass_transform
@@ -11,9 +11,11 @@ from kirin.ir.attrs.abc import Attribute
 T = TypeVar("T")
 
 if TYPE_CHECKING:
+    from kirin.parse import Syntax
     from kirin.types import PyClass
     from kirin.rewrite.abc import RewriteRule
     from kirin.interp.table import MethodTable
+    from kirin.serialization import Codec
     from kirin.lowering.python.dialect import FromPythonAST
 
 
@@ -54,6 +56,14 @@ class Dialect:
     python_types: dict[tuple[str, str], "PyClass"] = field(
         default_factory=dict, init=True
     )
+    codec: Codec | None = field(default=None, init=True)
+    """The binary serialization codec of the dialect statements, if any."""
+    syntax: Syntax | None = field(default=None, init=True)
+    """The textual syntax of the dialect statements, if any."""
+    interps_epoch: ClassVar[int] = 0
+    """Global counter bumped whenever any dialect registers a method table.
+    Cached interpreter registries compare against it to detect staleness.
+    """
 
     def __post_init__(self) -> None:
         from kirin.lowering.python.dialect import NoSpecialLowering
@@ -75,7 +85,7 @@ class Dialect:
             key (str | None): The key to register the node to. Defaults to None.
 
         Raises:
-            ValueError: If the node is not a subclass of Statement, Attribute, DialectInterpreter, FromPythonAST, or DialectEmit.
+            ValueError: If the node is not a subclass of Statement, Attribute, DialectInterpreter, FromPythonAST, Codec, Syntax, or DialectEmit.
 
         Example:
             * Register a method table for concrete interpreter (by default key="main") to the dialect:
@@ -102,7 +112,9 @@ class Dialect:
 
 
         """
+        from kirin.parse import Syntax
         from kirin.interp.table import MethodTable
+        from kirin.serialization import Codec
         from kirin.lowering.python.dialect import FromPythonAST
 
         if key is None:
@@ -124,12 +136,25 @@ class Dialect:
                         f"Cannot register {node} to Dialect, key {key} exists in {self}"
                     )
                 self.interps[key] = node()
+                Dialect.interps_epoch += 1
             elif issubclass(node, FromPythonAST):
                 if key in self.lowering:
                     raise ValueError(
                         f"Cannot register {node} to Dialect, key {key} exists"
                     )
                 self.lowering[key] = node()
+            elif issubclass(node, Codec):
+                if self.codec is not None:
+                    raise ValueError(
+                        f"Cannot register {node} to Dialect, codec exists in {self}"
+                    )
+                self.codec = node()
+            elif issubclass(node, Syntax):
+                if self.syntax is not None:
+                    raise ValueError(
+                        f"Cannot register {node} to Dialect, syntax exists in {self}"
+                    )
+                self.syntax = node()
             else:
                 raise ValueError(f"Cannot register {node} to Dialect")
             return node
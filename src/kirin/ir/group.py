@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import threading
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -19,15 +20,18 @@ from collections.abc import Iterable
 from kirin.ir.method import Method
 from kirin.ir.traits import SymbolTable, SymbolOpInterface
 from kirin.ir.exception import CompilerError, ValidationError
+from kirin.ir.recompile import RecompileReport, invalidate
 
 if TYPE_CHECKING:
     from kirin.ir import Dialect, Statement
+    from kirin.interp import InterpreterABC
     from kirin.lowering import Python
     from kirin.registry import Registry
 
 PassParams = ParamSpec("PassParams")
 RunPass = Callable[Concatenate[Method, PassParams], None]
 RunPassGen = Callable[["DialectGroup"], RunPass[PassParams]]
+InterpreterType = TypeVar("InterpreterType", bound="InterpreterABC")
 
 
 @dataclass(init=False)
@@ -55,6 +59,21 @@ class DialectGroup(Generic[PassParams]):
     symbol_table: dict[str, Statement] = field(
         default_factory=dict, init=False, repr=False
     )
+    _symbol_methods: dict[str, Method] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """cached methods of the symbols, see
+    [`symbol_method`][kirin.ir.DialectGroup.symbol_method].
+    """
+
+    _registry: Registry | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """cached registry proxy, see [`registry`][kirin.ir.DialectGroup.registry]."""
+    _interpreters: dict[tuple[type, int], tuple[int, InterpreterABC]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """cached interpreter instances, keyed by interpreter class and thread."""
 
     def __init__(
         self,
@@ -62,6 +81,9 @@ class DialectGroup(Generic[PassParams]):
         run_pass: RunPassGen[PassParams] | None = None,
     ):
         self.symbol_table = {}
+        self._symbol_methods = {}
+        self._registry = None
+        self._interpreters = {}
         self.data = frozenset(self.map_module(dialect) for dialect in dialects)
         if run_pass is None:
             self.run_pass_gen = None
@@ -156,10 +178,47 @@ class DialectGroup(Generic[PassParams]):
 
         Returns:
             Registry: the registry object.
+
+        !!! note
+            The registry object is cached on the dialect group, and so are
+            the interpreter tables it builds. Since `add`, `union` and `discard`
+            return new dialect groups, their caches always start empty.
+        """
+        if self._registry is None:
+            from kirin.registry import Registry
+
+            self._registry = Registry(self)
+        return self._registry
+
+    def get_interpreter(self, interp_type: type[InterpreterType]) -> InterpreterType:
+        """return a cached interpreter of the given type for this dialect group.
+
+        The interpreter is constructed with its default options and reused
+        across calls, so repeated calls do not need to rebuild the method
+        table. A fresh interpreter is returned if the cached one is currently
+        evaluating (e.g. a re-entrant call), or if any dialect registered a new
+        method table since the interpreter was created.
+
+        Args:
+            interp_type (type[InterpreterABC]): the interpreter class.
+
+        Returns:
+            InterpreterABC: the interpreter instance.
         """
-        from kirin.registry import Registry
+        from kirin.ir.dialect import Dialect
+
+        key = (interp_type, threading.get_ident())
+        cached = self._interpreters.get(key)
+        if cached is not None:
+            epoch, interp = cached
+            if epoch == Dialect.interps_epoch:
+                if interp.evaluating:
+                    return interp_type(self)
+                return interp  # type: ignore
 
-        return Registry(self)
+        interp = interp_type(self)
+        self._interpreters[key] = (Dialect.interps_epoch, interp)
+        return interp
 
     @overload
     def __call__(
@@ -213,9 +272,37 @@ class DialectGroup(Generic[PassParams]):
                 lineno_offset = call_site_frame.f_lineno - 1
                 file = call_site_frame.f_code.co_filename
 
-            code = self.lowering.python_function(py_func, lineno_offset=lineno_offset)
+            from kirin.batch import current_batch
+            from kirin.cache import get_compile_cache, get_content_cache
+
+            batch = current_batch()
+            cache, key, cached = get_compile_cache(), None, None
+            if cache is not None:
+                key = cache.key(
+                    self, py_func, args, options, file=file, lineno_offset=lineno_offset
+                )
+            if cache is not None and key is not None:
+                # NOTE: recursive references in the cached IR point to this
+                # object, it is initialized below if this is a new method.
+                target = mt if mt else Method.__new__(Method)
+                cached = cache.load(key, self, py_func, target)
+
+            content, content_key, reused = get_content_cache(), None, None
+            if cached is None:
+                code = self.lowering.python_function(
+                    py_func, lineno_offset=lineno_offset
+                )
+                if content is not None and batch is None:
+                    content_key = content.key(self, code, args, options)
+                if content is not None and content_key is not None:
+                    reused = content.load(content_key, self, code)
+                if reused is not None:
+                    code, inferred = reused
+            else:
+                code, inferred = cached
             arg_names = ["#self#"] + inspect.getfullargspec(py_func).args
 
+            redefined = mt is not None
             if mt:
                 mt.mod = inspect.getmodule(py_func)
                 mt.dialects = self
@@ -227,10 +314,12 @@ class DialectGroup(Generic[PassParams]):
                 mt.file = file
                 mt.lineno_begin = lineno_offset
                 mt.run_passes = self.run_pass
+                mt.version += 1
                 mt.update_backedges()  # update the callee
-                self.recompile_callers(mt)
             else:
-                mt = Method(
+                # NOTE: on a cache hit, the IR may already refer to `target`
+                mt = target if cached is not None else Method.__new__(Method)
+                mt.__init__(
                     dialects=self,
                     code=code,
                     nargs=len(arg_names),
@@ -254,7 +343,24 @@ class DialectGroup(Generic[PassParams]):
                         raise e
 
             mt.run_passes = run_pass
-            run_pass(mt)
+            if cached is None and reused is None and batch is not None:
+                batch.add(mt)  # compiled, and cached, at the end of the batch
+            elif cached is None and reused is None:
+                run_pass(mt)
+                if content_key is not None and content is not None:
+                    content.store(content_key, mt)
+                if key is not None and cache is not None:
+                    cache.store(key, mt)
+            else:
+                mt.inferred = inferred
+                if reused is not None and key is not None and cache is not None:
+                    cache.store(key, mt)
+            if key is not None and cache is not None:
+                cache.register(mt, key)
+            if redefined and batch is not None:
+                batch.add_callers(mt)
+            elif redefined:
+                self.recompile_callers(mt)
             self.update_symbol_table(mt)
             return mt
 
@@ -262,13 +368,19 @@ class DialectGroup(Generic[PassParams]):
             return wrapper(py_func)
         return wrapper
 
-    def recompile_callers(self, method: Method) -> None:
-        for caller in method.backedges:
-            if caller.run_passes:
-                caller.run_passes(caller)
-            # propagate the changes to all callers
-            caller.dialects.recompile_callers(caller)
-        return
+    def recompile_callers(self, method: Method) -> RecompileReport:
+        """Recompile the methods calling a redefined method, directly or not.
+
+        Each caller is recompiled once, after the callers it calls, see
+        [`invalidate`][kirin.ir.recompile.invalidate].
+
+        Args:
+            method (Method): the method redefined.
+
+        Returns:
+            RecompileReport: the callers recompiled and the time spent.
+        """
+        return invalidate(method)
 
     def update_symbol_table(self, method: Method) -> None:
         trait = method.code.get_trait(SymbolTable)
@@ -288,6 +400,19 @@ class DialectGroup(Generic[PassParams]):
                 )
             self.symbol_table[name] = stmt
 
+    def symbol_method(self, name: str) -> Method | None:
+        """Return the method of the statement `name` in the symbol table, e.g.
+        the callee of a `module.invoke`, or `None` if there is no such symbol.
+
+        The method is created once per symbol statement and cached.
+        """
+        if (stmt := self.symbol_table.get(name)) is None:
+            return None
+        method = self._symbol_methods.get(name)
+        if method is None or method.code is not stmt:
+            method = self._symbol_methods[name] = Method(self, stmt)
+        return method
+
 
 def dialect_group(
     dialects: Iterable[Union["Dialect", ModuleType]],
@@ -16,6 +16,7 @@ from .traits import (
     EntryPointInterface,
     CallableStmtInterface,
 )
+from .tracking import ChangeTracker
 from .exception import ValidationError
 from .nodes.stmt import Statement
 from .attrs.types import Generic
@@ -53,9 +54,18 @@ class Method(Printable, typing.Generic[Param, RetType]):
     inferred: bool = False
     """if typeinfer has been run on this method
     """
+    version: int = field(default=0, init=False, repr=False)
+    """Incremented when the method has to be analysed again, e.g. when one of
+    its callees is recompiled. Used to invalidate cached analysis summaries.
+    """
     backedges: set[Method] = field(init=False, repr=False)
     """Cache for the backedges. (who calls this method)"""
     run_passes: typing.Callable[[Method], None] | None = field(init=False, repr=False)
+    _changes: ChangeTracker | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _jit: typing.Any = field(default=None, init=False, repr=False, compare=False)
+    """The compiled function of the method, see [`kirin.jit`][kirin.jit]."""
 
     def __init__(
         self,
@@ -100,22 +110,29 @@ class Method(Printable, typing.Generic[Param, RetType]):
         self.file = file
         self.lineno_begin = lineno_begin
         self.inferred = inferred
+        self.version = 0
         self.backedges = set()
         self.update_backedges()
         self.run_passes = None
+        self._changes = None
+        self._jit = None
 
     def __hash__(self) -> int:
         return id(self)
 
     def __call__(self, *args: Param.args, **kwargs: Param.kwargs) -> RetType:
+        from kirin.jit import get_jit
         from kirin.interp.concrete import Interpreter
 
         if len(args) + len(kwargs) != self.nargs - 1:
             raise ValueError(
                 f"Incorrect number of arguments, expected {self.nargs - 1}, got {len(args) + len(kwargs)}"
             )
+        if not kwargs and (jit := get_jit()) is not None:
+            if (function := jit.lookup(self)) is not None:
+                return function(self, *args)
         # NOTE: multi-return values will be wrapped in a tuple for Python
-        interp = Interpreter(self.dialects)
+        interp = self.dialects.get_interpreter(Interpreter)
         _, ret = interp.run(self, *args, **kwargs)
         return ret
 
@@ -168,17 +185,43 @@ class Method(Printable, typing.Generic[Param, RetType]):
             inferred=self.inferred,
         )
 
-    def verify(self) -> None:
+    def verify(self, *, incremental: bool = False, full_every: int = 0) -> None:
         """verify the method body.
 
         This will raise a ValidationError if the method body is not valid.
+
+        Args:
+            incremental (bool, optional): only verify the IR modified since the
+                last verification, and the statements containing it. The first
+                incremental verification verifies the whole body and starts
+                tracking its changes. Defaults to False.
+            full_every (int, optional): with `incremental`, verify the whole body
+                after `full_every` incremental verifications anyway, 0 never does.
+                This catches the changes that are not tracked, i.e. successors,
+                attributes and types modified in place. Defaults to 0.
         """
         try:
-            self.code.verify()
+            if incremental:
+                self.__verify_incremental(full_every)
+            else:
+                self.code.verify()
+                if self._changes is not None and self._changes.root is self.code:
+                    self._changes.clear()
         except ValidationError as e:
             e.attach(self)
             raise e
 
+    def __verify_incremental(self, full_every: int) -> None:
+        changes = self._changes
+        if changes is None or changes.root is not self.code or not changes.active:
+            self.code.verify()
+            self._changes = ChangeTracker(self.code)
+        elif changes.overflow or (full_every and changes.incremental >= full_every):
+            self.code.verify()
+            changes.clear()
+        else:
+            changes.verify()
+
     def verify_type(self) -> None:
         """verify the method type.
 
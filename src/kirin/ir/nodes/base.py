@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar, Iterator
-from dataclasses import field, dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar, Iterator, NamedTuple
 
 from typing_extensions import Self
 
@@ -12,22 +11,56 @@ from kirin.source import SourceInfo
 
 if TYPE_CHECKING:
     from kirin.ir.nodes.stmt import Statement
+    from kirin.ir.nodes.block import Block
+
+
+class StructuralHash(NamedTuple):
+    """The cached structural hash of a node."""
+
+    hash: int
+    free: tuple[SSAValue | Block, ...]
+    """The values and blocks used in the node but defined outside of it, in
+    the order of their first use. The hash refers to them by position."""
 
 
 ParentType = TypeVar("ParentType", bound="IRNode")
 
 
-@dataclass
+def attribute_hash(attr) -> int:
+    """Hash an attribute for [`IRNode.structural_hash`][kirin.ir.IRNode.structural_hash],
+    attributes wrapping unhashable data are hashed by their representation.
+    """
+    try:
+        return hash(attr)
+    except TypeError:
+        return hash((type(attr), repr(attr)))
+
+
 class IRNode(Generic[ParentType], ABC, Printable):
     """Base class for all IR nodes. All IR nodes are hashable and can be compared
     for equality. The hash of an IR node is the same as the id of the object.
 
+    The core IR nodes are slotted. Statement classes that do not declare
+    `__slots__` keep a `__dict__` for the attributes they add, the fields
+    declared with [`statement`][kirin.decl.statement] are stored in the slots
+    of `Statement`.
+
     !!! note "Pretty Printing"
         This object is pretty printable via
         [`.print()`][kirin.print.printable.Printable.print] method.
     """
 
-    source: SourceInfo | None = field(default=None, init=False, repr=False)
+    __slots__ = ("source", "_structural_hash")
+
+    source: SourceInfo | None
+    _structural_hash: StructuralHash | None
+
+    def __init__(self) -> None:
+        self.source = None
+        self._structural_hash = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}()"
 
     def assert_parent(self, type_: type[IRNode], parent) -> None:
         assert (
@@ -127,11 +160,47 @@ class IRNode(Generic[ParentType], ABC, Printable):
         """
         ...
 
+    def structural_hash(self) -> int:
+        """A hash of the structure of the node, the same for structurally equal
+        nodes.
+
+        The hash is a Merkle hash over the class and attributes of the
+        statements, the positions where their arguments and successors are
+        defined, and the nested regions. It is cached on each node and the
+        caches along the parent chain are dropped when the IR is modified.
+
+        !!! note
+            Block argument types, and attribute objects changed in place
+            rather than replaced in the attributes of a statement, are not
+            tracked, call
+            [`invalidate_structural_hash`][kirin.ir.IRNode.invalidate_structural_hash]
+            after such changes.
+        """
+        return self._structural().hash
+
+    def invalidate_structural_hash(self) -> None:
+        """Drop the cached structural hash of the node and of its ancestors."""
+        self._structural_hash = None
+        node = self.parent_node
+        # NOTE: the ancestors of a node without a cached hash have none either
+        while node is not None and node._structural_hash is not None:
+            node._structural_hash = None
+            node = node.parent_node
+
+    def _structural(self) -> StructuralHash:
+        if (cached := self._structural_hash) is None:
+            cached = self._structural_hash = self._compute_structural_hash()
+        return cached
+
+    @abstractmethod
+    def _compute_structural_hash(self) -> StructuralHash:
+        """Compute the structural hash of the node from the ones of its children."""
+        ...
+
     def __eq__(self, other) -> bool:
         return self is other
 
-    def __hash__(self) -> int:
-        return id(self)
+    __hash__ = object.__hash__
 
     @abstractmethod
     def walk(
@@ -146,6 +215,11 @@ class IRNode(Generic[ParentType], ABC, Printable):
         """run mandatory validation checks. This is not same as verify_type, which may be optional."""
         ...
 
+    @abstractmethod
+    def verify_node(self) -> None:
+        """run the validation checks of the node only, not of the nodes nested in it."""
+        ...
+
     @abstractmethod
     def verify_type(self) -> None:
         """verify the type of the node."""
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable, Iterator
-from dataclasses import field, dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+from dataclasses import dataclass
 from collections.abc import Sequence
 
 from typing_extensions import Self
@@ -9,9 +9,11 @@ from typing_extensions import Self
 from kirin.print import Printer
 from kirin.ir.ssa import SSAValue, BlockArgument, DeletedSSAValue
 from kirin.source import SourceInfo
+from kirin.ir.tracking import mark
 from kirin.ir.exception import ValidationError
-from kirin.ir.nodes.base import IRNode
+from kirin.ir.nodes.base import IRNode, StructuralHash
 from kirin.ir.nodes.view import View, MutableSequenceView
+from kirin.ir.traits.symbol import SymbolOpInterface
 
 if TYPE_CHECKING:
     from kirin.ir.nodes.stmt import Statement
@@ -49,6 +51,7 @@ class BlockArguments(MutableSequenceView[tuple, "Block", BlockArgument]):
             new_arg.name = name
 
         self.node._args += (new_arg,)
+        mark(self.node)
         return new_arg
 
     def insert_from(
@@ -78,6 +81,7 @@ class BlockArguments(MutableSequenceView[tuple, "Block", BlockArgument]):
         for arg in self.node._args[idx:]:
             arg.index += 1
         self.node._args = self.node._args[:idx] + (new_arg,) + self.node._args[idx:]
+        mark(self.node)
         return new_arg
 
     def delete(self, arg: BlockArgument, safe: bool = True) -> None:
@@ -101,6 +105,7 @@ class BlockArguments(MutableSequenceView[tuple, "Block", BlockArgument]):
             block_arg.index -= 1
         self.node._args = (*self.field[: arg.index], *self.field[arg.index + 1 :])
         arg.replace_by(DeletedSSAValue(arg))
+        mark(self.node)
 
     def __delitem__(self, idx: int) -> None:
         self.delete(self.field[idx])
@@ -225,13 +230,14 @@ class BlockStmts(View["Block", "Statement"]):
             self.node._first_stmt = value
             self.node._last_stmt = value
             self.node._stmt_len += 1
+            self.node.stmts_changed(value)
+            mark(value, deep=True)
         elif self.node._last_stmt:
             value.insert_after(self.node._last_stmt)
         else:
             raise ValueError("Invalid block, last_stmt is None")
 
 
-@dataclass
 class Block(IRNode["Region"]):
     """
     Block consist of a list of Statements and optionally input arguments.
@@ -241,16 +247,35 @@ class Block(IRNode["Region"]):
         [`.print()`][kirin.print.printable.Printable.print] method.
     """
 
+    __slots__ = (
+        "_args",
+        "_first_stmt",
+        "_last_stmt",
+        "_stmt_len",
+        "parent",
+        "_compiled",
+        "_symbols",
+    )
+
     _args: tuple[BlockArgument, ...]
 
     # NOTE: we need linked list since stmts are inserted frequently
-    _first_stmt: Statement | None = field(repr=False)
-    _last_stmt: Statement | None = field(repr=False)
-    _stmt_len: int = field(default=0, repr=False)
+    _first_stmt: Statement | None
+    _last_stmt: Statement | None
+    _stmt_len: int
 
-    parent: Region | None = field(default=None, repr=False)
+    parent: Region | None
     """Parent Region of the Block."""
 
+    _compiled: Any
+    """Cache of the pre-resolved statement implementations of this Block,
+    see [`Interpreter.compile_block`][kirin.interp.Interpreter.compile_block].
+    """
+    _symbols: dict[str, Statement] | None
+    """Cache of the symbol statements of this Block by name, see
+    [`SymbolTable.symbols`][kirin.ir.SymbolTable.symbols].
+    """
+
     def __init__(
         self,
         stmts: Sequence[Statement] = (),
@@ -271,9 +296,10 @@ class Block(IRNode["Region"]):
 
         self._first_stmt = None
         self._last_stmt = None
-        self._first_branch = None
-        self._last_branch = None
         self._stmt_len = 0
+        self.parent = None
+        self._compiled = None
+        self._symbols = None
         self.stmts.extend(stmts)
 
     @property
@@ -333,6 +359,34 @@ class Block(IRNode["Region"]):
         """
         return BlockStmts(self)
 
+    def stmts_changed(
+        self, stmt: Statement | None = None, removed: bool = False
+    ) -> None:
+        """Notify the Block that a Statement was inserted into or removed from it.
+
+        Args:
+            stmt (Statement | None): The Statement inserted or removed, if known.
+                Defaults to None.
+            removed (bool): Whether `stmt` was removed. Defaults to False.
+
+        Note:
+            This is called by the Statement insertion/detach APIs, it drops
+            caches derived from the list of Statements, and updates the index
+            of symbols if any.
+        """
+        self._compiled = None
+        if (symbols := self._symbols) is None:
+            return
+        elif stmt is None:
+            self._symbols = None
+        elif (trait := stmt.get_trait(SymbolOpInterface)) is not None:
+            name = trait.get_sym_name(stmt).unwrap()
+            # NOTE: rebuild on duplicates, the first definition in the block wins
+            if removed or name in symbols:
+                self._symbols = None
+            else:
+                symbols[name] = stmt
+
     def drop_all_references(self) -> None:
         """Remove all the dependency that reference/uses this Block."""
         self.parent = None
@@ -348,6 +402,7 @@ class Block(IRNode["Region"]):
         if self.parent is None:
             return
 
+        mark(self)
         idx = self.parent[self]
         del self.parent._blocks[idx]
         del self.parent._block_idx[self]
@@ -403,8 +458,34 @@ class Block(IRNode["Region"]):
 
         return True
 
-    def __hash__(self) -> int:
-        return id(self)
+    def _compute_structural_hash(self) -> StructuralHash:
+        # values used in the block are identified by their position: the
+        # block itself (-1,), its arguments (-2, idx), the results of its
+        # statements (stmt_idx, idx) or the values defined outside (free_idx,)
+        free: dict[SSAValue | Block, int] = {}
+        local: dict[SSAValue | Block, tuple[int, ...]] = {self: (-1,)}
+        for idx, arg in enumerate(self._args):
+            local[arg] = (-2, idx)
+
+        stmts = []
+        stmt, stmt_idx = self._first_stmt, 0
+        while stmt is not None:
+            stmt_hash, stmt_free = stmt._structural_hash or stmt._structural()
+            used = []
+            for value in stmt_free:
+                if (position := local.get(value)) is None:
+                    position = (free.setdefault(value, len(free)),)
+                used.append(position)
+            stmts.append((stmt_hash, tuple(used)))
+            for idx, result in enumerate(stmt._results):
+                local[result] = (stmt_idx, idx)
+            stmt, stmt_idx = stmt._next_stmt, stmt_idx + 1
+
+        arg_types = tuple(arg.type for arg in self._args)
+        return StructuralHash(hash((arg_types, tuple(stmts))), tuple(free))
+
+    def __repr__(self) -> str:
+        return f"Block(_args={self._args!r})"
 
     def walk(
         self, *, reverse: bool = False, region_first: bool = False
@@ -448,6 +529,16 @@ class Block(IRNode["Region"]):
     def verify(self) -> None:
         """Verify the correctness of the Block.
 
+        Raises:
+            ValidationError: If the Block is not correct.
+        """
+        self.verify_node()
+        for stmt in self.stmts:
+            stmt.verify()
+
+    def verify_node(self) -> None:
+        """Verify the Block itself, without its Statements.
+
         Raises:
             ValidationError: If the Block is not correct.
         """
@@ -456,9 +547,6 @@ class Block(IRNode["Region"]):
         if not isinstance(self.parent, Region):
             raise ValidationError(self, "Parent is not a region")
 
-        for stmt in self.stmts:
-            stmt.verify()
-
     def verify_type(self) -> None:
         """Verify the types of the Block.
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Iterable, Iterator
-from dataclasses import field, dataclass
+from dataclasses import dataclass
 
 from typing_extensions import Self
 
-from kirin.ir.ssa import SSAValue
+from kirin.ir.ssa import SSAValue, ResultValue, BlockArgument
 from kirin.source import SourceInfo
+from kirin.ir.tracking import mark
 from kirin.ir.exception import ValidationError
-from kirin.ir.nodes.base import IRNode
+from kirin.ir.nodes.base import IRNode, StructuralHash
 from kirin.ir.nodes.view import MutableSequenceView
 from kirin.ir.nodes.block import Block
 
@@ -41,6 +42,7 @@ class RegionBlocks(MutableSequenceView[list[Block], "Region", Block]):
             block_or_blocks.attach(self.node)
             self.field[idx] = block_or_blocks
             self.node._block_idx[block_or_blocks] = idx
+            mark(block_or_blocks, deep=True)
         elif isinstance(idx, slice) and isinstance(block_or_blocks, Iterable):
             for block in block_or_blocks:
                 block.attach(self.node)
@@ -48,6 +50,8 @@ class RegionBlocks(MutableSequenceView[list[Block], "Region", Block]):
             self.node._block_idx = {
                 block: i for i, block in enumerate(self.field)
             }  # reindex
+            for block in block_or_blocks:
+                mark(block, deep=True)
         else:
             raise ValueError("Invalid assignment")
 
@@ -68,8 +72,9 @@ class RegionBlocks(MutableSequenceView[list[Block], "Region", Block]):
         """
         value.attach(self.node)
         self.field.insert(idx, value)
-        for i, value in enumerate(self.field[idx:], idx):
-            self.node._block_idx[value] = i
+        for i, block in enumerate(self.field[idx:], idx):
+            self.node._block_idx[block] = i
+        mark(value, deep=True)
 
     def append(self, value: Block) -> None:
         """Append a Block to the Region.
@@ -80,9 +85,9 @@ class RegionBlocks(MutableSequenceView[list[Block], "Region", Block]):
         value.attach(self.node)
         self.node._block_idx[value] = len(self.field)
         self.field.append(value)
+        mark(value, deep=True)
 
 
-@dataclass
 class Region(IRNode["Statement"]):
     """Region consist of a list of Blocks
 
@@ -91,9 +96,11 @@ class Region(IRNode["Statement"]):
         [`.print()`][kirin.print.printable.Printable.print] method.
     """
 
-    _blocks: list[Block] = field(default_factory=list, repr=False)
-    _block_idx: dict[Block, int] = field(default_factory=dict, repr=False)
-    _parent: Statement | None = field(default=None, repr=False)
+    __slots__ = ("_blocks", "_block_idx", "_parent")
+
+    _blocks: list[Block]
+    _block_idx: dict[Block, int]
+    _parent: Statement | None
 
     def __init__(
         self,
@@ -112,6 +119,7 @@ class Region(IRNode["Statement"]):
         self.source = source
         self._blocks = []
         self._block_idx = {}
+        self._parent = None
         self.parent_node = parent
         if isinstance(blocks, Block):
             blocks = (blocks,)
@@ -134,9 +142,6 @@ class Region(IRNode["Statement"]):
             raise ValueError("Block does not belong to the region")
         return self._block_idx[block]
 
-    def __hash__(self) -> int:
-        return id(self)
-
     def clone(self, ssamap: dict[SSAValue, SSAValue] | None = None) -> Region:
         """Clone a region. This will clone all blocks and statements in the region.
         `SSAValue` defined outside the region will not be cloned unless provided in `ssamap`.
@@ -216,6 +221,7 @@ class Region(IRNode["Statement"]):
         if self.parent_node is None:
             return
 
+        mark(self)
         if index is not None:
             region_idx = index
         else:
@@ -273,6 +279,36 @@ class Region(IRNode["Statement"]):
 
         return True
 
+    def _compute_structural_hash(self) -> StructuralHash:
+        # values defined in the blocks of the region are identified by their
+        # position, see Block._compute_structural_hash
+        block_idx = self._block_idx
+        free: dict[SSAValue | Block, int] = {}
+        stmt_idx: dict[Block, dict[Statement, int]] = {}
+
+        def position(value: SSAValue | Block) -> tuple[int, ...]:
+            if isinstance(value, Block):
+                if value.parent is self:
+                    return (-1, block_idx[value])
+            elif isinstance(value, BlockArgument):
+                if value.block.parent is self:
+                    return (-2, block_idx[value.block], value.index)
+            elif isinstance(value, ResultValue):
+                block = value.stmt.parent
+                if block is not None and block.parent is self:
+                    if (idx := stmt_idx.get(block)) is None:
+                        idx = stmt_idx[block] = {
+                            stmt: idx for idx, stmt in enumerate(block.stmts)
+                        }
+                    return (block_idx[block], idx[value.stmt], value.index)
+            return (free.setdefault(value, len(free)),)
+
+        blocks = []
+        for block in self._blocks:
+            block_hash, block_free = block._structural()
+            blocks.append((block_hash, tuple(position(value) for value in block_free)))
+        return StructuralHash(hash(tuple(blocks)), tuple(free))
+
     def walk(
         self, *, reverse: bool = False, region_first: bool = False
     ) -> Iterator[Statement]:
@@ -323,6 +359,16 @@ class Region(IRNode["Statement"]):
     def verify(self) -> None:
         """Verify the correctness of the Region.
 
+        Raises:
+            ValidationError: If the Region is not correct.
+        """
+        self.verify_node()
+        for block in self.blocks:
+            block.verify()
+
+    def verify_node(self) -> None:
+        """Verify the Region itself, without its Blocks.
+
         Raises:
             ValidationError: If the Region is not correct.
         """
@@ -333,9 +379,6 @@ class Region(IRNode["Statement"]):
                 self, "expect Region to have a parent of type Statement"
             )
 
-        for block in self.blocks:
-            block.verify()
-
     def verify_type(self) -> None:
         for block in self.blocks:
             block.verify_type()
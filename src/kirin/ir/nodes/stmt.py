@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Mapping, TypeVar, ClassVar, Iterator, Sequence
-from dataclasses import field, dataclass
+from dataclasses import dataclass
 
 from typing_extensions import Self
 
@@ -9,12 +9,14 @@ from kirin.print import Printer, Printable
 from kirin.ir.ssa import SSAValue, ResultValue
 from kirin.ir.use import Use
 from kirin.ir.traits import Trait
+from kirin.ir.tracking import mark
 from kirin.ir.attrs.abc import Attribute
 from kirin.ir.exception import TypeCheckError, ValidationError
-from kirin.ir.nodes.base import IRNode
+from kirin.ir.nodes.base import IRNode, StructuralHash, attribute_hash
 from kirin.ir.nodes.view import MutableSequenceView
 from kirin.ir.nodes.block import Block
 from kirin.ir.nodes.region import Region
+from kirin.ir.traits.symbol import SymbolOpInterface
 
 if TYPE_CHECKING:
     from kirin.source import SourceInfo
@@ -44,6 +46,7 @@ class ArgumentList(
         new_args = (*self.field[:idx], *self.field[idx + 1 :])
         self.node._args = new_args
         self.field = new_args
+        mark(self.node)
 
     def set_item(self, idx: int, value: SSAValue) -> None:
         """Set the argument SSAVAlue at the specified index.
@@ -58,6 +61,7 @@ class ArgumentList(
         new_args = (*args[:idx], value, *args[idx + 1 :])
         self.node._args = new_args
         self.field = new_args
+        mark(self.node)
 
     def insert(self, idx: int, value: SSAValue) -> None:
         """Insert the argument SSAValue at the specified index.
@@ -71,6 +75,7 @@ class ArgumentList(
         new_args = (*args[:idx], value, *args[idx:])
         self.node._args = new_args
         self.field = new_args
+        mark(self.node)
 
     def get_slice(self, name: str) -> slice:
         """Get the slice of the arguments.
@@ -122,7 +127,68 @@ class ResultList(MutableSequenceView[list[ResultValue], "Statement", ResultValue
         return [result.type for result in self.field]
 
 
-@dataclass(repr=False)
+class Attributes(dict[str, Attribute]):
+    """The attributes of a statement, changing them drops the cached
+    structural hash of the statement and of its ancestors, and the index of
+    symbols of its block when the symbol name may have changed."""
+
+    __slots__ = ("owner",)
+
+    owner: Statement
+
+    def __init__(self, owner: Statement, attributes: Mapping[str, Attribute] = {}):
+        super().__init__(attributes)
+        self.owner = owner
+
+    def _changed(self, key: str | None = None) -> None:
+        owner = self.owner
+        owner.invalidate_structural_hash()
+        if (
+            key in (None, "sym_name")
+            and (parent := owner.parent) is not None
+            and owner.has_trait(SymbolOpInterface)
+        ):
+            parent._symbols = None
+
+    def __setitem__(self, key: str, value: Attribute) -> None:
+        super().__setitem__(key, value)
+        self._changed(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._changed(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def pop(self, key: str, *default):
+        value = super().pop(key, *default)
+        self._changed(key)
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed(item[0])
+        return item
+
+    def setdefault(self, key: str, default=None):
+        value = super().setdefault(key, default)
+        self._changed(key)
+        return value
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+
 class Statement(IRNode["Block"]):
     """The Statment is an instruction in the IR
 
@@ -131,29 +197,39 @@ class Statement(IRNode["Block"]):
         [`.print()`][kirin.print.printable.Printable.print] method.
     """
 
+    __slots__ = (
+        "_args",
+        "_results",
+        "successors",
+        "_regions",
+        "attributes",
+        "parent",
+        "_next_stmt",
+        "_prev_stmt",
+        "_name_args_slice",
+    )
+
     name: ClassVar[str]
-    dialect: ClassVar[Dialect | None] = field(default=None, init=False, repr=False)
+    dialect: ClassVar[Dialect | None] = None
     traits: ClassVar[frozenset[Trait["Statement"]]] = frozenset()
     _arg_groups: ClassVar[frozenset[str]] = frozenset()
 
-    _args: tuple[SSAValue, ...] = field(init=False)
-    _results: list[ResultValue] = field(init=False, default_factory=list)
-    successors: list[Block] = field(init=False)
-    _regions: list[Region] = field(init=False)
-    attributes: dict[str, Attribute] = field(init=False)
+    _args: tuple[SSAValue, ...]
+    _results: list[ResultValue]
+    successors: list[Block]
+    _regions: list[Region]
+    attributes: Attributes
 
-    parent: Block | None = field(default=None, init=False, repr=False)
-    _next_stmt: Statement | None = field(default=None, init=False, repr=False)
-    _prev_stmt: Statement | None = field(default=None, init=False, repr=False)
+    parent: Block | None
+    _next_stmt: Statement | None
+    _prev_stmt: Statement | None
 
-    source: SourceInfo | None = field(default=None, init=False, repr=False)
+    source: SourceInfo | None
     """The source information of the Statement for debugging/stacktracing."""
 
     # NOTE: This is only for syntax sugar to provide
     # access to args via the properties
-    _name_args_slice: dict[str, int | slice] = field(
-        init=False, repr=False, default_factory=dict
-    )
+    _name_args_slice: dict[str, int | slice]
 
     @property
     def parent_stmt(self) -> Statement | None:
@@ -267,9 +343,11 @@ class Statement(IRNode["Block"]):
 
         if self.parent:
             self.parent._stmt_len += 1
+            self.parent.stmts_changed(self)
 
             if self._next_stmt is None:
                 self.parent._last_stmt = self
+            mark(self, deep=True)
 
     def insert_before(self, stmt: Statement) -> None:
         """Insert the current Statement before the input Statement.
@@ -302,9 +380,11 @@ class Statement(IRNode["Block"]):
 
         if self.parent:
             self.parent._stmt_len += 1
+            self.parent.stmts_changed(self)
 
             if self._prev_stmt is None:
                 self.parent._first_stmt = self
+            mark(self, deep=True)
 
     def replace_by(self, stmt: Statement) -> None:
         """Replace the current Statement by the input Statement.
@@ -341,6 +421,7 @@ class Statement(IRNode["Block"]):
         for idx, arg in enumerate(new):
             arg.add_use(Use(self, idx))
         self._args = new
+        mark(self)
 
     @property
     def results(self) -> ResultList:
@@ -368,6 +449,9 @@ class Statement(IRNode["Block"]):
         for region in regions:
             region._parent = self
         self._regions = regions
+        mark(self)
+        for region in regions:
+            mark(region, deep=True)
 
     def drop_all_references(self) -> None:
         """Remove all the dependency that reference/uses this Statement."""
@@ -397,6 +481,7 @@ class Statement(IRNode["Block"]):
             return
 
         parent: Block = self.parent
+        mark(parent)
         prev_stmt = self.prev_stmt
         next_stmt = self.next_stmt
 
@@ -420,6 +505,7 @@ class Statement(IRNode["Block"]):
 
         self.parent = None
         parent._stmt_len -= 1
+        parent.stmts_changed(self, removed=True)
         return
 
     def __post_init__(self):
@@ -454,7 +540,14 @@ class Statement(IRNode["Block"]):
         """
         self._args = ()
         self._regions = []
-        self._name_args_slice = dict(args_slice)
+        self.parent = None
+        self._next_stmt = None
+        self._prev_stmt = None
+        # NOTE: the slices are never mutated, share them between the
+        # statements of the same class instead of copying them.
+        self._name_args_slice = (
+            args_slice if type(args_slice) is dict else dict(args_slice)
+        )
         self.source = source
         self.args = args
 
@@ -474,12 +567,8 @@ class Statement(IRNode["Block"]):
             self._results = list(results)
 
         self.successors = list(successors)
-        self.attributes = dict(attributes)
+        self.attributes = Attributes(self, attributes)
         self.regions = list(regions)
-
-        self.parent = None
-        self._next_stmt = None
-        self._prev_stmt = None
         self.__post_init__()
 
     @classmethod
@@ -595,8 +684,44 @@ class Statement(IRNode["Block"]):
 
         return True
 
-    def __hash__(self) -> int:
-        return id(self)
+    def _compute_structural_hash(self) -> StructuralHash:
+        free: dict[SSAValue | Block, int] = dict.fromkeys(self._args)  # type: ignore
+        if len(free) == len(self._args):  # NOTE: fast path, distinct arguments
+            args: int | tuple[int, ...] = len(free)
+            for idx, arg in enumerate(free):
+                free[arg] = idx
+        else:
+            free = {}
+            args = tuple(free.setdefault(arg, len(free)) for arg in self._args)
+
+        extra = None
+        if self.successors or self._regions:
+            successors = tuple(
+                free.setdefault(block, len(free)) for block in self.successors
+            )
+            regions = []
+            for region in self._regions:
+                region_hash, region_free = region._structural()
+                used = tuple(free.setdefault(value, len(free)) for value in region_free)
+                regions.append((region_hash, used))
+            extra = (successors, tuple(regions))
+
+        attributes = self.attributes
+        try:
+            if len(attributes) == 1:
+                attrs_hash = hash(next(iter(attributes.items())))
+            else:
+                attrs_hash = hash(frozenset(attributes.items()))
+        except TypeError:
+            attrs_hash = hash(
+                frozenset(
+                    (name, attribute_hash(attr)) for name, attr in attributes.items()
+                )
+            )
+        return StructuralHash(
+            hash((type(self), attrs_hash, args, len(self._results), extra)),
+            tuple(free),
+        )
 
     def print_impl(self, printer: Printer) -> None:
         from kirin.decl import fields as stmt_fields
@@ -780,6 +905,33 @@ class Statement(IRNode["Block"]):
         return
 
     def verify(self) -> None:
+        """Verify the statement and the IR nested in its regions.
+
+        The checks specific to a statement go in
+        [`verify_node`][kirin.ir.Statement.verify_node], which is all the
+        incremental verification runs on a modified statement, see
+        [`Method.verify`][kirin.ir.Method.verify].
+
+        !!! note
+            Overriding `verify` is still supported: the incremental
+            verification then calls `verify` instead of `verify_node` on the
+            statement. Unlike before, the generated `check` does not verify
+            the regions of the statement anymore, an override that does not
+            call `super().verify()` has to verify them itself.
+
+        Raises:
+            ValidationError: If the IR is not correct.
+        """
+        self.verify_node()
+        for region in self._regions:
+            region.verify()
+
+    def verify_node(self) -> None:
+        """Verify the statement itself, without the IR nested in its regions.
+
+        Raises:
+            ValidationError: If the statement is not correct.
+        """
         try:
             self.check()
         except ValidationError as e:
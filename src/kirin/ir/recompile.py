@@ -0,0 +1,102 @@
+"""Recompile the callers of redefined methods.
+
+When a method is redefined, the methods calling it, directly or not, are
+compiled against its old IR. [`invalidate`][kirin.ir.recompile.invalidate]
+collects them once, orders them bottom-up over the strongly connected
+components of the call graph, and runs the passes of each of them exactly
+once, after the callers it calls.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Iterable
+from dataclasses import field, dataclass
+
+from kirin.graph import strongly_connected_components
+from kirin.ir.method import Method
+
+
+@dataclass
+class RecompileReport:
+    """The callers recompiled after methods have been redefined."""
+
+    redefined: list[Method] = field(default_factory=list)
+    """The methods redefined."""
+    components: list[list[Method]] = field(default_factory=list)
+    """The strongly connected components of the callers, in the order they
+    have been recompiled."""
+    times: dict[Method, float] = field(default_factory=dict)
+    """The time spent running the passes of each caller, in seconds."""
+    elapsed: float = 0.0
+    """The wall time of the whole recompilation, in seconds."""
+
+    @property
+    def recompiled(self) -> list[Method]:
+        """The callers recompiled, in order."""
+        return [method for component in self.components for method in component]
+
+    def summary(self) -> str:
+        """Return a table of the callers recompiled, slowest first."""
+        names = ", ".join(method.sym_name or "<lambda>" for method in self.redefined)
+        lines = [
+            f"recompiled {len(self.times)} callers of {names} "
+            f"in {self.elapsed * 1e3:.2f} ms"
+        ]
+        for method, elapsed in sorted(self.times.items(), key=lambda x: -x[1]):
+            lines.append(f"  {method.sym_name or '<lambda>':24} {elapsed * 1e3:10.2f}")
+        return "\n".join(lines)
+
+
+def transitive_callers(methods: Iterable[Method]) -> list[list[Method]]:
+    """Return the methods calling the given methods, directly or not, grouped
+    by strongly connected components, callees first.
+
+    The given methods are not part of the result, even when they call each
+    other.
+    """
+    roots = list(methods)
+    callers: dict[Method, None] = {}
+    stack = [caller for method in roots for caller in method.backedges]
+    while stack:
+        caller = stack.pop()
+        if caller in callers:
+            continue
+        callers[caller] = None
+        stack.extend(caller.backedges)
+    for method in roots:
+        callers.pop(method, None)
+
+    callees: dict[Method, list[Method]] = {caller: [] for caller in callers}
+    for callee in callers:
+        for caller in callee.backedges:
+            if caller in callees:
+                callees[caller].append(callee)
+    return strongly_connected_components(callers, callees.__getitem__)
+
+
+def invalidate(*methods: Method) -> RecompileReport:
+    """Recompile the callers of redefined methods, each of them once.
+
+    The version of each caller is bumped, and its passes are run once all
+    the callers it calls have been recompiled.
+
+    Args:
+        *methods (Method): the methods redefined.
+
+    Returns:
+        RecompileReport: the callers recompiled and the time spent.
+    """
+    start = time.perf_counter()
+    report = RecompileReport(redefined=list(methods))
+    for component in transitive_callers(methods):
+        for caller in component:
+            caller.version += 1
+        for caller in component:
+            if caller.run_passes:
+                caller_start = time.perf_counter()
+                caller.run_passes(caller)
+                report.times[caller] = time.perf_counter() - caller_start
+        report.components.append(component)
+    report.elapsed = time.perf_counter() - start
+    return report
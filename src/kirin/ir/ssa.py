@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, ClassVar
-from dataclasses import field, dataclass
+from typing import TYPE_CHECKING, ClassVar, AbstractSet
 
 from typing_extensions import Self
 
@@ -16,22 +15,48 @@ if TYPE_CHECKING:
     from kirin.ir.nodes.stmt import Statement
     from kirin.ir.nodes.block import Block
 
+_NO_USES: frozenset[Use] = frozenset()
+
 
-@dataclass
 class SSAValue(ABC, Printable):
-    """Base class for all SSA values in the IR."""
+    """Base class for all SSA values in the IR.
+
+    SSA values are slotted and compared by identity. The `hints` and `uses`
+    containers are only allocated once they are needed, `uses` is a shared
+    empty `frozenset` until the first use is added.
+    """
+
+    __slots__ = ("type", "_hints", "uses", "_name")
 
-    type: TypeAttribute = field(default_factory=AnyType, init=False, repr=True)
+    type: TypeAttribute
     """The type of this SSA value."""
-    hints: dict[str, Attribute] = field(default_factory=dict, init=False, repr=False)
-    """Hints for this SSA value."""
-    uses: set[Use] = field(init=False, default_factory=set, repr=False)
-    """The uses of this SSA value."""
-    _name: str | None = field(init=False, default=None, repr=True)
+    _hints: dict[str, Attribute] | None
+    uses: AbstractSet[Use]
+    """The uses of this SSA value, use [`add_use`][kirin.ir.SSAValue.add_use]
+    and [`remove_use`][kirin.ir.SSAValue.remove_use] to modify them.
+    """
+    _name: str | None
     """The name of this SSA value."""
     name_pattern: ClassVar[re.Pattern[str]] = re.compile(r"([A-Za-z_$.-][\w$.-]*)")
     """The pattern that the name of this SSA value must match."""
 
+    def __init__(self) -> None:
+        self.type = AnyType()
+        self._hints = None
+        self.uses = _NO_USES
+        self._name = None
+
+    @property
+    def hints(self) -> dict[str, Attribute]:
+        """Hints for this SSA value."""
+        if (hints := self._hints) is None:
+            hints = self._hints = {}
+        return hints
+
+    @hints.setter
+    def hints(self, hints: dict[str, Attribute]) -> None:
+        self._hints = hints
+
     @property
     @abstractmethod
     def owner(self) -> Statement | Block:
@@ -54,25 +79,23 @@ class SSAValue(ABC, Printable):
             return f"{type(self).__name__}({self.name})"
         return f"{type(self).__name__}({id(self)})"
 
-    def __hash__(self) -> int:
-        return id(self)
-
     def add_use(self, use: Use) -> Self:
         """Add a use to this SSA value."""
-        self.uses.add(use)
+        if (uses := self.uses) is _NO_USES:
+            self.uses = {use}
+        else:
+            uses.add(use)  # type: ignore
         return self
 
     def remove_use(self, use: Use) -> Self:
         """Remove a use from this SSA value."""
-        # print(use)
-        # assert use in self.uses, "Use not found"
-        if use in self.uses:
-            self.uses.remove(use)
+        if (uses := self.uses) is not _NO_USES:
+            uses.discard(use)  # type: ignore
         return self
 
     def replace_by(self, other: SSAValue) -> None:
         """Replace this SSA value with another SSA value. Update all uses."""
-        for use in self.uses.copy():
+        for use in tuple(self.uses):
             use.stmt.args[use.index] = other
 
         if other.name is None and self.name is not None:
@@ -91,13 +114,14 @@ class SSAValue(ABC, Printable):
         printer.plain_print(printer.state.ssa_id[self])
 
 
-@dataclass
 class ResultValue(SSAValue):
     """SSAValue that is a result of a [`Statement`][kirin.ir.nodes.stmt.Statement]."""
 
-    stmt: Statement = field(init=False)
+    __slots__ = ("stmt", "index")
+
+    stmt: Statement
     """The statement that this value is a result of."""
-    index: int = field(init=False)
+    index: int
     """The index of this value in the statement's result list."""
 
     # NOTE: we will assign AnyType unless specified.
@@ -115,9 +139,6 @@ class ResultValue(SSAValue):
     def owner(self) -> Statement:
         return self.stmt
 
-    def __hash__(self) -> int:
-        return id(self)
-
     def __repr__(self) -> str:
         if self.type is self.type.top():
             type_str = ""
@@ -131,13 +152,14 @@ class ResultValue(SSAValue):
         return f"<{type(self).__name__}{type_str} stmt: {self.stmt.name}, uses: {len(self.uses)}>"
 
 
-@dataclass
 class BlockArgument(SSAValue):
     """SSAValue that is an argument to a [`Block`][kirin.ir.Block]."""
 
-    block: Block = field(init=False)
+    __slots__ = ("block", "index")
+
+    block: Block
     """The block that this argument belongs to."""
-    index: int = field(init=False)
+    index: int
     """The index of this argument in the block's argument list."""
 
     def __init__(
@@ -155,9 +177,6 @@ class BlockArgument(SSAValue):
     def delete(self, safe: bool = True) -> None:
         self.block.args.delete(self, safe=safe)
 
-    def __hash__(self) -> int:
-        return id(self)
-
     def __repr__(self) -> str:
         if self.name:
             return f"<{type(self).__name__}[{self.type}] {self.name}, uses: {len(self.uses)}>"
@@ -171,18 +190,16 @@ class BlockArgument(SSAValue):
                 printer.print(self.type)
 
 
-@dataclass
 class DeletedSSAValue(SSAValue):
-    value: SSAValue = field(init=False)
+    __slots__ = ("value",)
+
+    value: SSAValue
 
     def __init__(self, value: SSAValue) -> None:
         super().__init__()
         self.value = value
         self.type = value.type
 
-    def __hash__(self) -> int:
-        return id(self)
-
     def __repr__(self) -> str:
         return f"<{type(self).__name__}[{self.type}] value: {self.value}, uses: {len(self.uses)}>"
 
@@ -191,17 +208,15 @@ class DeletedSSAValue(SSAValue):
         return self.value.owner
 
 
-@dataclass
 class TestValue(SSAValue):
     """Test SSAValue for testing IR construction."""
 
+    __slots__ = ()
+
     def __init__(self, type: TypeAttribute = AnyType()) -> None:
         super().__init__()
         self.type = type
 
-    def __hash__(self) -> int:
-        return id(self)
-
     @property
     def owner(self) -> Statement | Block:
         raise NotImplementedError
@@ -0,0 +1,148 @@
+"""Tracking of the IR modified since the last verification.
+
+The IR nodes call [`mark`][kirin.ir.tracking.mark] when they are mutated.
+This is a no-op unless a [`ChangeTracker`][kirin.ir.tracking.ChangeTracker]
+watches the IR the node belongs to, so that the cost of tracking is only paid
+by the IR verified incrementally, see
+[`Method.verify`][kirin.ir.Method.verify].
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING
+from dataclasses import field, dataclass
+
+if TYPE_CHECKING:
+    from kirin.ir.nodes.base import IRNode
+    from kirin.ir.nodes.stmt import Statement
+
+_trackers: dict[int, weakref.ref[ChangeTracker]] = {}
+"""Active trackers, by id of their root."""
+
+
+@dataclass(eq=False)
+class ChangeTracker:
+    """Record the nodes of the IR under `root` that have been modified.
+
+    A node is recorded as dirty together with the closest statement
+    containing it, whose own checks (number of blocks, terminator of the
+    body, etc.) may depend on it. Inserted nodes are verified with all the
+    IR nested in them, other nodes are verified on their own, except the
+    statements overriding `verify` instead of `verify_node`, see
+    [`Statement.verify`][kirin.ir.Statement.verify].
+
+    ### Parameters
+    - `root`: the statement whose IR is watched.
+    - `max_dirty`: the maximum number of dirty nodes recorded, once exceeded
+        the tracker gives up and [`overflow`][kirin.ir.tracking.ChangeTracker.overflow]
+        is set. Default is 16384.
+    """
+
+    root: Statement
+    max_dirty: int = field(default=1 << 14, kw_only=True)
+    dirty: dict[IRNode, bool] = field(default_factory=dict, init=False)
+    """The dirty nodes, mapped to `True` if the IR nested in them is dirty too."""
+    overflow: bool = field(default=False, init=False)
+    """Whether too many nodes have been modified to be recorded."""
+    incremental: int = field(default=0, init=False)
+    """Number of incremental verifications since the whole IR was verified."""
+
+    def __post_init__(self):
+        key = id(self.root)
+
+        def remove(ref: weakref.ref[ChangeTracker]) -> None:
+            if _trackers.get(key) is ref:
+                del _trackers[key]
+
+        _trackers[key] = weakref.ref(self, remove)
+
+    @property
+    def active(self) -> bool:
+        """Whether the tracker still records the changes of its root, a newer
+        tracker of the same root replaces it.
+        """
+        ref = _trackers.get(id(self.root))
+        return ref is not None and ref() is self
+
+    def add(self, node: IRNode, deep: bool = False) -> None:
+        """Record a dirty node.
+
+        Args:
+            node (IRNode): the node modified.
+            deep (bool, optional): whether the IR nested in the node has to be
+                verified too. Defaults to False.
+        """
+        if self.overflow:
+            return
+        dirty = self.dirty
+        dirty[node] = deep or dirty.get(node, False)
+        if len(dirty) > self.max_dirty:
+            dirty.clear()
+            self.overflow = True
+
+    def verify(self) -> None:
+        """Verify the dirty nodes still in the IR of the root, then forget them.
+
+        Raises:
+            ValidationError: if a dirty node is not correct, the dirty nodes
+                are kept in this case.
+        """
+        root = self.root
+        for node, deep in self.dirty.items():
+            if not root.is_ancestor(node):  # removed from the IR
+                continue
+            if deep or _overrides_verify(node):
+                node.verify()
+            else:
+                node.verify_node()
+        self.dirty.clear()
+        self.incremental += 1
+
+    def clear(self) -> None:
+        """Forget the dirty nodes after verifying the whole IR."""
+        self.dirty.clear()
+        self.overflow = False
+        self.incremental = 0
+
+
+def _overrides_verify(node: IRNode) -> bool:
+    """Whether `node` is a statement overriding `verify` rather than
+    `verify_node`, its checks are then only run by `verify`.
+    """
+    from kirin.ir.nodes.stmt import Statement
+
+    return isinstance(node, Statement) and type(node).verify is not Statement.verify
+
+
+def mark(node: IRNode, deep: bool = False) -> None:
+    """Record that a node has been modified: drop the cached structural
+    hashes and add the node to the active change tracker.
+
+    Args:
+        node (IRNode): the node modified, it must be attached to the IR.
+        deep (bool, optional): whether the IR nested in the node is new, e.g.
+            an inserted statement. Defaults to False.
+    """
+    node.invalidate_structural_hash()
+    if not _trackers:
+        return
+
+    owner = None
+    root = node
+    if (parent := node.parent_node) is not None:  # NOTE: skip new statements
+        from kirin.ir.nodes.region import Region
+
+        while parent is not None:
+            if owner is None and type(root) is Region:
+                owner = parent
+            root, parent = parent, parent.parent_node
+
+    if (ref := _trackers.get(id(root))) is None:
+        return
+    tracker = ref()
+    if tracker is None or tracker.root is not root:
+        return
+    tracker.add(node, deep)
+    if owner is not None:
+        tracker.add(owner)
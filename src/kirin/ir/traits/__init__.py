@@ -20,9 +20,11 @@ from .basic import (
     Pure as Pure,
     HasParent as HasParent,
     MaybePure as MaybePure,
+    Commutative as Commutative,
     ConstantLike as ConstantLike,
     IsTerminator as IsTerminator,
     NoTerminator as NoTerminator,
+    Speculatable as Speculatable,
     IsolatedFromAbove as IsolatedFromAbove,
 )
 from .symbol import (
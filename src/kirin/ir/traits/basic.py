@@ -47,6 +47,33 @@ class MaybePure(StmtTrait):
         stmt.attributes["purity"] = PyAttr(True)
 
 
+@dataclass(frozen=True)
+class Commutative(StmtTrait):
+    """A trait that indicates that the two arguments of a statement can be
+    swapped without changing its results, e.g. `x * y` and `y * x`.
+    """
+
+    def is_commutative(self, stmt: "Statement") -> bool:
+        """Check if the arguments of a statement with this trait can be
+        swapped, e.g. depending on their types.
+        """
+        return True
+
+
+@dataclass(frozen=True)
+class Speculatable(StmtTrait):
+    """A trait that indicates that a pure statement never raises, so that it
+    can be executed where the program would not, e.g. hoisted out of a loop
+    that may not run.
+    """
+
+    def is_speculatable(self, stmt: "Statement") -> bool:
+        """Check if a statement with this trait never raises, e.g. depending
+        on the types of its arguments.
+        """
+        return True
+
+
 @dataclass(frozen=True)
 class ConstantLike(StmtTrait):
     """A trait that indicates that a statement is constant-like, i.e., it
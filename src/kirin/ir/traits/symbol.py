@@ -38,6 +38,9 @@ class SymbolOpInterface(StmtTrait):
 class SymbolTable(StmtTrait):
     """
     Statement with SymbolTable trait can only have one region with one block.
+
+    The symbol statements of the block are indexed by name, see
+    [`symbols`][kirin.ir.SymbolTable.symbols].
     """
 
     @staticmethod
@@ -46,6 +49,29 @@ class SymbolTable(StmtTrait):
             if stmt.has_trait(SymbolOpInterface):
                 yield stmt
 
+    @staticmethod
+    def symbols(stmt: Statement) -> dict[str, Statement]:
+        """Return the symbol statements of the table by name.
+
+        The index is cached on the block of the table and kept up to date
+        when statements are inserted into or removed from the block, or when
+        the name of a symbol is changed.
+        """
+        block = stmt.regions[0].blocks[0]
+        if (symbols := block._symbols) is None:
+            symbols = {}
+            for node in SymbolTable.walk(stmt):
+                trait = node.get_present_trait(SymbolOpInterface)
+                # NOTE: the first definition wins, as with a linear scan
+                symbols.setdefault(trait.get_sym_name(node).unwrap(), node)
+            block._symbols = symbols
+        return symbols
+
+    @staticmethod
+    def lookup(stmt: Statement, name: str) -> Statement | None:
+        """Return the symbol statement named `name` in the table, if any."""
+        return SymbolTable.symbols(stmt).get(name)
+
     def verify(self, node: Statement):
         if len(node.regions) != 1:
             raise ValidationError(
@@ -59,7 +85,12 @@ class SymbolTable(StmtTrait):
                 f"Statement {node.name} with SymbolTable trait must have exactly one block",
             )
 
-        # TODO: check uniqueness of symbol names
+        symbols = self.symbols(node)
+        if len(symbols) != sum(1 for _ in self.walk(node)):
+            raise ValidationError(
+                node,
+                f"Statement {node.name} with SymbolTable trait has duplicate symbols",
+            )
 
 
 StmtType = TypeVar("StmtType", bound="Statement")
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from kirin.ir.nodes.stmt import Statement
 
 
-@dataclass(frozen=True)
-class Use:
+class Use(NamedTuple):
     """A use of an SSA value in a statement."""
 
     stmt: Statement
@@ -0,0 +1,124 @@
+"""Compile the methods called often into Python functions.
+
+The JIT is opt-in, enable it with [`set_jit`][kirin.jit.set_jit]:
+
+```python
+from kirin.jit import JIT, set_jit
+
+set_jit(JIT(threshold=2))
+```
+
+When the JIT is enabled, [`Method.__call__`][kirin.ir.Method.__call__] counts
+the calls of each method and, once a method has been run `threshold` times by
+the interpreter, emits its IR as the source of a Python function with
+[`emit.Python`][kirin.emit.Python] and runs this function instead. SSA values
+become local variables and branches become `if` statements and `while` loops,
+so the statements no longer go through the interpreter.
+
+The function is cached on the method and compiled again when the method is
+redefined, when it is recompiled because one of its callees is redefined, or
+when its IR is modified through the IR API, including the attributes of its
+statements. The methods with a statement that the `"emit.python"` method
+table of its dialect does not implement, or that are called with keyword
+arguments, keep being run by the interpreter.
+
+!!! note
+    Changes are detected with the structural hash of the IR, see
+    [`structural_hash`][kirin.ir.IRNode.structural_hash]. The result and
+    block argument types, which are part of the dispatch of the statements,
+    and attribute objects modified in place are not part of it, call
+    [`invalidate`][kirin.jit.JIT.invalidate] after changing them.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+from dataclasses import dataclass
+
+from kirin import ir
+from kirin.ir.nodes.base import StructuralHash
+
+
+@dataclass
+class Entry:
+    """The compiled function of a method, and what it was compiled from."""
+
+    code: ir.Statement
+    version: int
+    calls: int = 0
+    """number of calls run by the interpreter since the entry was created."""
+    hash: StructuralHash | None = None
+    """the cached structural hash of `code` when it was compiled."""
+    function: Callable | None = None
+    """the compiled function, `None` if the method cannot be compiled."""
+    compiled: bool = False
+
+
+@dataclass
+class JIT:
+    """Compile the methods called more than `threshold` times.
+
+    ### Parameters
+    - `threshold`: the number of calls run by the interpreter before a method
+        is compiled, 0 compiles the methods on their first call.
+    """
+
+    threshold: int = 2
+
+    def lookup(self, method: ir.Method) -> Callable | None:
+        """Return the compiled function of `method`, compiling it if the
+        method is hot, or `None` if the call has to be interpreted."""
+        entry: Entry | None = method._jit
+        if (
+            entry is None
+            or entry.code is not method.code
+            or entry.version != method.version
+            or (entry.compiled and method.code._structural_hash is not entry.hash)
+        ):
+            entry = method._jit = Entry(method.code, method.version)
+
+        if entry.compiled:
+            return entry.function
+        if entry.calls < self.threshold:
+            entry.calls += 1
+            return None
+
+        method.code.structural_hash()
+        entry.hash = method.code._structural_hash
+        entry.function = self.compile(method)
+        entry.compiled = True
+        return entry.function
+
+    def compile(self, method: ir.Method) -> Callable | None:
+        """Return a Python function running `method`, called with the method
+        itself followed by its arguments, or `None` if the method contains
+        statements that cannot be emitted."""
+        from kirin.emit.python import Python
+
+        emit = Python(method.dialects)
+        if emit.unsupported(method) is not None:
+            return None
+        try:
+            return emit.compile(method)
+        except (SyntaxError, RecursionError):
+            # NOTE: too deeply nested for the Python compiler
+            return None
+
+    @staticmethod
+    def invalidate(method: ir.Method) -> None:
+        """Drop the compiled function of `method`."""
+        method._jit = None
+
+
+_jit: JIT | None = None
+
+
+def set_jit(jit: JIT | None) -> None:
+    """Set the JIT used by all methods, `None` disables it."""
+    global _jit
+    _jit = jit
+
+
+def get_jit() -> JIT | None:
+    """Return the current JIT, if any."""
+    return _jit
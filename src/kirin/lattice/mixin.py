@@ -1,9 +1,11 @@
-from typing import TypeVar
+from typing import Any, TypeVar, Callable
 
 from .abc import BoundedLattice
 
 BoundedLatticeType = TypeVar("BoundedLatticeType", bound="BoundedLattice")
 
+_SUBSETEQ_DISPATCH: dict[tuple[type, type], Callable[[Any, Any], bool] | None] = {}
+
 
 class IsSubsetEqMixin(BoundedLattice[BoundedLatticeType]):
     """A special mixin for lattices that provides a default implementation for `is_subseteq`
@@ -19,13 +21,18 @@ class IsSubsetEqMixin(BoundedLattice[BoundedLatticeType]):
         elif other is self.bottom():
             return False
 
-        method = getattr(
-            self,
-            "is_subseteq_" + other.__class__.__name__,
-            getattr(self, "is_subseteq_fallback", None),
-        )
+        # NOTE: resolve the method once per pair of classes
+        key = (type(self), type(other))
+        if key in _SUBSETEQ_DISPATCH:
+            method = _SUBSETEQ_DISPATCH[key]
+        else:
+            method = _SUBSETEQ_DISPATCH[key] = getattr(
+                type(self),
+                "is_subseteq_" + other.__class__.__name__,
+                getattr(type(self), "is_subseteq_fallback", None),
+            )
         if method is not None:
-            return method(other)
+            return method(self, other)
         return False
 
 
@@ -0,0 +1,47 @@
+"""Parser of the textual IR written by the printer.
+
+```python
+from kirin import parse
+
+method = parse.parse_method(method.print_str(), method.dialects)
+```
+
+Use [`Parser`][kirin.parse.Parser] directly to read several methods from the
+same text, or to resolve references to other methods.
+"""
+
+from kirin import ir
+
+from .lexer import Token as Token, tokenize as tokenize
+from .parser import Parser as Parser
+from .syntax import Syntax as Syntax
+from .exception import ParseError as ParseError
+
+
+def parse_method(
+    text: str,
+    dialects: ir.DialectGroup,
+    methods: dict[str, ir.Method] | None = None,
+) -> ir.Method:
+    """Parse the text of a method, e.g. the output of `method.print_str()`.
+
+    Args:
+        text (str): the text of the method.
+        dialects (ir.DialectGroup): the dialect group of the method.
+        methods (dict[str, ir.Method] | None): methods called by the method,
+            by name. Defaults to None.
+    """
+    parser = Parser(text, dialects, methods=methods if methods is not None else {})
+    method = parser.parse_method()
+    if not parser.at_end():
+        raise parser.error("expected the end of the text")
+    return method
+
+
+def parse_statement(text: str, dialects: ir.DialectGroup) -> ir.Statement:
+    """Parse the text of a statement that does not refer to other methods."""
+    parser = Parser(text, dialects)
+    stmt = parser.parse_statement()
+    if not parser.at_end():
+        raise parser.error("expected the end of the text")
+    return stmt
@@ -0,0 +1,4 @@
+class ParseError(ValueError):
+    """Raised when the text is not valid IR."""
+
+    pass
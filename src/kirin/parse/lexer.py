@@ -0,0 +1,60 @@
+import re
+from typing import NamedTuple
+
+_TOKENS = re.compile(
+    # NOTE: leading whitespace is matched with the token, `nl` if it has a newline
+    r"(?:[ \t\r│]*(?P<nl>\n))?[ \t\r\n│]*"
+    r"(?:(?P<comment>//[^\n]*|#[^\n]*)"
+    r"|(?P<ssa>%[^\s,()\[\]{}:=]+)"
+    r"|(?P<block>\^[^\s,()\[\]{}:=]+)"
+    r"|(?P<symbol>@[^\s,()\[\]{}:=]+)"
+    r"|(?P<string>[rbuRBU]{0,2}(?:'(?:[^'\\\n]|\\.)*'|\"(?:[^\"\\\n]|\\.)*\"))"
+    r"|(?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?j?)"
+    r"|(?P<name>[A-Za-z_][\w.]*)"
+    r"|(?P<punct>->|\.\.\.|.)"
+    r"|(?P<eof>\Z))"
+)
+
+
+class Token(NamedTuple):
+    kind: str
+    """`ssa` (`%x`), `block` (`^0`), `symbol` (`@main`), `string`, `number`,
+    `name` (dotted identifiers, e.g. `py.binop.add`), `eof`, or the
+    punctuation itself, e.g. `(`, `->` or `...`.
+    """
+    text: str
+    """The text of the token."""
+    pos: int
+    """The offset of the token in the text."""
+    newline: bool
+    """Whether the token is the first of its line."""
+
+
+def tokenize(text: str) -> tuple[list[Token], dict[int, str]]:
+    """Split the text of the printer into tokens, in a single pass.
+
+    Returns:
+        tuple[list[Token], dict[int, str]]: the tokens, ending with an `eof`
+            token, and the comments (`// ...` or `# ...`) by the index of the
+            token following them.
+    """
+    tokens: list[Token] = []
+    comments: dict[int, str] = {}
+    append = tokens.append
+    newline = True
+    for match in _TOKENS.finditer(text):
+        kind = match.lastgroup
+        newline = newline or match.start("nl") >= 0
+        if kind == "eof":
+            break
+        pos = match.start(kind)
+        value = match.group(kind)
+        if kind == "comment":
+            comments[len(tokens)] = value
+            continue
+        elif kind == "punct":
+            kind = value
+        append(Token(kind, value, pos, newline))  # type: ignore
+        newline = False
+    append(Token("eof", "", len(text), True))
+    return tokens, comments
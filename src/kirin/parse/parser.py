@@ -0,0 +1,632 @@
+from __future__ import annotations
+
+import ast
+import math
+from typing import Any, TypeVar, Callable, Sequence
+from dataclasses import field, dataclass
+
+from kirin import ir, types
+from kirin.decl import fields as stmt_fields
+
+from .lexer import Token, tokenize
+from .exception import ParseError
+
+StmtType = TypeVar("StmtType", bound=ir.Statement)
+
+_OPEN = frozenset("([{")
+_CLOSE = frozenset(")]}")
+_BUILTINS: dict[str, Any] = {
+    "inf": math.inf,
+    "nan": math.nan,
+    "Ellipsis": ...,
+    "range": range,
+    "slice": slice,
+    "complex": complex,
+    "set": set,
+    "frozenset": frozenset,
+}
+
+
+@dataclass
+class Parser:
+    """Parse the text written by the [`Printer`][kirin.print.Printer] back into IR.
+
+    The text is split into tokens once, then read from left to right without
+    backtracking: statements are parsed in the generic format of
+    [`Statement.print_impl`][kirin.ir.Statement.print_impl], or by the
+    [`Syntax`][kirin.parse.Syntax] registered by the dialect of statements
+    printed in a custom format. SSA values and blocks are named after the ids
+    of the printer, `%x` and `^0`; a value or a block may be used before it is
+    defined in the text.
+
+    The printed text does not contain everything: the types of block
+    arguments are read from their uses, e.g. `%x : !py.int`, and the constants
+    are read back from their `repr` with the names of
+    [`namespace`][kirin.parse.Parser.namespace] and the dialect syntaxes, e.g.
+    `IList([1, 2])`. The methods are resolved by name with
+    [`resolve_method`][kirin.parse.Parser.resolve_method].
+
+    !!! note
+        The names of SSA values are recovered from the ids of the printer: a
+        `_<n>` suffix is dropped when the id without the suffix is also in the
+        text, e.g. `%x` and `%x_1` are both named `x`.
+    """
+
+    text: str
+    """The text to parse."""
+    dialects: ir.DialectGroup
+    """The dialect group of the statements."""
+    methods: dict[str, ir.Method] = field(default_factory=dict, kw_only=True)
+    """Methods referenced by name in the text, e.g. by `func.invoke`. The
+    methods read by `parse_method` are added to it.
+    """
+    namespace: dict[str, Any] = field(default_factory=dict, kw_only=True)
+    """Additional names of the Python objects in the `repr` of constants."""
+
+    _tokens: list[Token] = field(init=False, repr=False)
+    _comments: dict[int, str] = field(init=False, repr=False)
+    _index: int = field(default=0, init=False, repr=False)
+    _ssa_names: set[str] = field(init=False, repr=False)
+    _values: dict[str, ir.SSAValue] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _forward: dict[str, ir.SSAValue] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _blocks: dict[str, ir.Block] = field(default_factory=dict, init=False, repr=False)
+    _placed: set[str] = field(default_factory=set, init=False, repr=False)
+    _stmt_types: dict[str, type[ir.Statement]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _parsers: dict[type[ir.Statement], Callable | None] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _arg_fields: dict[type[ir.Statement], list[tuple[str, bool]] | None] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _pyclasses: dict[str, types.PyClass] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _scope: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _results: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._tokens, self._comments = tokenize(self.text)
+        self._ssa_names = {tok.text for tok in self._tokens if tok.kind == "ssa"}
+
+        scope = dict(_BUILTINS)
+        for dialect in self.dialects.data:
+            for stmt_type in dialect.stmts:
+                self._stmt_types[f"{dialect.name}.{stmt_type.name}"] = stmt_type
+            if dialect.syntax is not None:
+                scope.update(dialect.syntax.namespace)
+        scope.update(self.namespace)
+        scope["Method"] = self.resolve_method
+        self._scope = scope
+
+    def at_end(self) -> bool:
+        """Return `True` if there is no statement left in the text."""
+        return self._tokens[self._index].kind == "eof"
+
+    def parse_method(self) -> ir.Method:
+        """Parse the next statement as the code of a method, e.g. a
+        `func.func` statement.
+
+        References to the method itself in its code, e.g. in recursive
+        calls, resolve to the method returned.
+        """
+        target = ir.Method.__new__(ir.Method)
+        if (symbol := self.peek(1)).kind == "symbol":
+            self.methods[symbol.text[1:]] = target
+
+        code = self.parse_statement()
+        # NOTE: the argument names of a kernel, see `DialectGroup.__call__`
+        slots = code.attributes.get("slots")
+        ir.Method.__init__(
+            target,
+            dialects=self.dialects,
+            code=code,
+            arg_names=(
+                ["#self#", *slots.data] if isinstance(slots, ir.PyAttr) else None
+            ),
+        )
+        if target.sym_name is not None:
+            self.methods[target.sym_name] = target
+        return target
+
+    def parse_statement(self) -> ir.Statement:
+        """Parse the next statement, including its regions."""
+        stmt = self.__statement()
+        if self._forward:
+            raise ParseError(f"undefined SSA value {next(iter(self._forward))}")
+        if undefined := self._blocks.keys() - self._placed:
+            raise ParseError(f"undefined block {undefined.pop()}")
+        self._values.clear()
+        self._blocks.clear()
+        self._placed.clear()
+        return stmt
+
+    def resolve_method(self, name: str) -> ir.Method:
+        """Return the method named `name` in the text, e.g. the callee of a
+        `func.invoke` or a `Method("name")` constant.
+        """
+        if (method := self.methods.get(name)) is None:
+            raise self.error(f"cannot resolve reference to method {name!r}")
+        return method
+
+    # tokens, used by syntaxes
+
+    def peek(self, offset: int = 0) -> Token:
+        """Return the next token, or the one `offset` tokens after it."""
+        return self._tokens[min(self._index + offset, len(self._tokens) - 1)]
+
+    def accept(self, kind: str) -> Token | None:
+        """Consume the next token and return it if it is of the given kind."""
+        token = self._tokens[self._index]
+        if token.kind != kind:
+            return None
+        self._index += 1
+        return token
+
+    def expect(self, kind: str, text: str | None = None) -> Token:
+        """Consume the next token, which must be of the given kind and text."""
+        token = self._tokens[self._index]
+        if token.kind != kind or (text is not None and token.text != text):
+            raise self.error(f"expected {text or kind!r}, got {token.text!r}")
+        self._index += 1
+        return token
+
+    def comment(self) -> str | None:
+        """Return the comment preceding the next token, if any."""
+        return self._comments.get(self._index)
+
+    def error(self, message: str) -> ParseError:
+        """Return an error at the next token."""
+        pos = self._tokens[self._index].pos
+        line = self.text.count("\n", 0, pos) + 1
+        column = pos - self.text.rfind("\n", 0, pos)
+        return ParseError(f"{message} at line {line}, column {column}")
+
+    # IR
+
+    @property
+    def result_names(self) -> list[str | None]:
+        """The names of the results of the statement being parsed."""
+        return [self.__name(each) for each in self._results]
+
+    def define(self, id: str, value: ir.SSAValue) -> None:
+        """Define the SSA value printed as `id`, e.g. `%x`, and name it."""
+        if (old := self._values.get(id)) is not None:
+            if self._forward.pop(id, None) is None:
+                raise self.error(f"redefinition of SSA value {id}")
+            if not isinstance(value, ir.ResultValue) and old.type is not types.Any:
+                value.type = old.type
+            old.replace_by(value)
+        self._values[id] = value
+        value._name = self.__name(id)
+
+    def parse_value(self) -> ir.SSAValue:
+        """Parse a use of an SSA value, with its type, e.g. `%x : !py.int`."""
+        token = self.expect("ssa")
+        if (value := self._values.get(token.text)) is None:
+            value = self._values[token.text] = ir.TestValue()
+            self._forward[token.text] = value
+        if self._tokens[self._index].kind == ":":
+            self._index += 1
+            typ = self.parse_type()
+            if not isinstance(value, ir.ResultValue):
+                value.type = typ
+        return value
+
+    def parse_values(self) -> list[ir.SSAValue]:
+        """Parse a possibly empty list of SSA values separated by commas,
+        until the end of the line.
+        """
+        values = []
+        token = self._tokens[self._index]
+        if token.kind != "ssa" or token.newline:
+            return values
+        values.append(self.parse_value())
+        while self.accept(","):
+            values.append(self.parse_value())
+        return values
+
+    def parse_arguments(self) -> list[ir.SSAValue]:
+        """Parse a list of SSA values in parentheses, e.g. `(%x, %y)`."""
+        self.expect("(")
+        values = self.parse_values()
+        self.expect(")")
+        return values
+
+    def parse_block(self) -> ir.Block:
+        """Parse a reference to a block, e.g. `^1`."""
+        return self.__block(self.expect("block").text)
+
+    def parse_region(self) -> ir.Region:
+        """Parse a region and its blocks in braces."""
+        self.expect("{")
+        region = ir.Region()
+        while not self.accept("}"):
+            label = self.expect("block").text
+            if label in self._placed:
+                raise self.error(f"redefinition of block {label}")
+            block = self.__block(label)
+            self._placed.add(label)
+            region.blocks.append(block)
+
+            self.expect("(")
+            if self._tokens[self._index].kind != ")":
+                self.define(self.expect("ssa").text, block.args.append_from(types.Any))
+                while self.accept(","):
+                    arg = block.args.append_from(types.Any)
+                    self.define(self.expect("ssa").text, arg)
+            self.expect(")")
+            self.expect(":")
+            self.parse_statements(block)
+        return region
+
+    def parse_statements(self, block: ir.Block) -> None:
+        """Parse the statements of a block, until the next block or `}`."""
+        tokens = self._tokens
+        while (kind := tokens[self._index].kind) != "}" and kind != "block":
+            if kind == "eof":
+                raise self.error("unexpected end of text")
+            block.stmts.append(self.__statement())
+
+    def statement(
+        self,
+        stmt_type: type[StmtType],
+        *,
+        args: Sequence[ir.SSAValue] = (),
+        regions: Sequence[ir.Region] = (),
+        successors: Sequence[ir.Block] = (),
+        attributes: dict[str, ir.Attribute | Any] = {},
+        result_types: Sequence[types.TypeAttribute] = (),
+        args_slice: dict[str, int | slice] = {},
+    ) -> StmtType:
+        """Create a statement of the given class from its fields, without
+        calling the `__init__` of the class.
+
+        As in the `__init__` of the class, the attributes declared with a
+        Python type may be given as Python values, e.g. `{"purity": False}`.
+        """
+        if not all(isinstance(each, ir.Attribute) for each in attributes.values()):
+            declared = stmt_fields(stmt_type).attributes
+            attributes = {
+                name: (
+                    value
+                    if isinstance(value, ir.Attribute)
+                    else ir.PyAttr(value, declared[name].type)
+                )
+                for name, value in attributes.items()
+            }
+        stmt = stmt_type.__new__(stmt_type)
+        ir.Statement.__init__(
+            stmt,
+            args=args,
+            regions=regions,
+            successors=successors,
+            attributes=attributes,
+            result_types=result_types,
+            args_slice=args_slice,
+        )
+        return stmt
+
+    # attributes
+
+    def parse_type(self) -> types.TypeAttribute:
+        """Parse a type, e.g. `!py.int`, `~T` or `Literal(1,int)`."""
+        token = self._tokens[self._index]
+        self._index += 1
+        if token.kind == "!":
+            name = self.expect("name").text
+            if name == "Any":
+                return types.Any
+            elif name == "Bottom":
+                return types.Bottom
+            elif name == "Union":
+                self.expect("[")
+                typ = types.Union(self.parse_types())
+                self.expect("]")
+                return typ
+
+            body = self.__pyclass(name)
+            token = self._tokens[self._index]
+            if token.kind != "[" or token.newline:
+                return body
+            self._index += 1
+            params: list[types.TypeAttribute | types.Vararg] = []
+            while self._tokens[self._index].kind != "]":
+                params.append(self.parse_type())
+                if not self.accept(","):
+                    break
+                if self.accept("..."):
+                    params[-1] = types.Vararg(params[-1])  # type: ignore
+                    break
+            self.expect("]")
+            return types.Generic(body, *params)
+        elif token.kind == "~":
+            name = self.expect("name").text
+            if self.accept(":"):
+                return types.TypeVar(name, self.parse_type())
+            return types.TypeVar(name)
+        elif token.kind == "name" and token.text == "Literal":
+            self.expect("(")
+            data = self.parse_python(",")
+            self.expect(",")
+            if self._tokens[self._index].kind == "name":  # NOTE: printed by repr
+                datatype = self.__pyclass(self.expect("name").text)
+            else:
+                datatype = self.parse_type()
+            self.expect(")")
+            return types.Literal(data, datatype)
+        self._index -= 1
+        raise self.error(f"expected a type, got {token.text!r}")
+
+    def parse_types(self) -> list[types.TypeAttribute]:
+        """Parse a possibly empty list of types separated by commas, until
+        the end of the line.
+        """
+        values = []
+        token = self._tokens[self._index]
+        if token.newline or not (token.kind in ("!", "~") or token.text == "Literal"):
+            return values
+        values.append(self.parse_type())
+        while self.accept(","):
+            values.append(self.parse_type())
+        return values
+
+    def parse_attribute(self) -> ir.Attribute:
+        """Parse an attribute: a type, or a Python value and its type, e.g.
+        `1 : !py.int`.
+        """
+        token = self._tokens[self._index]
+        if token.kind in ("!", "~") or (
+            token.text == "Literal" and self.peek(1).kind == "("
+        ):
+            return self.parse_type()
+        elif token.kind == "*":
+            self._index += 1
+            return types.Vararg(self.parse_type())
+
+        data = self.parse_python(":", ",")
+        if self.accept(":"):
+            return ir.PyAttr(data, self.parse_type())
+        elif isinstance(data, ir.Attribute):
+            return data
+        return ir.PyAttr(data)
+
+    def parse_python(self, *stops: str) -> Any:
+        """Parse the `repr` of a Python value, until one of the `stops`
+        tokens, a closing bracket or the end of the line.
+        """
+        tokens = self._tokens
+        start = index = self._index
+        depth = 0
+        while True:
+            token = tokens[index]
+            kind = token.kind
+            if depth == 0 and (
+                kind in stops
+                or kind in _CLOSE
+                or kind == "eof"
+                or (token.newline and index > start)
+            ):
+                break
+            if kind in _OPEN:
+                depth += 1
+            elif kind in _CLOSE:
+                depth -= 1
+            index += 1
+
+        if index == start:
+            raise self.error("expected a Python value")
+        self._index = index
+
+        first = tokens[start]
+        if index == start + 1:  # NOTE: fast path, a single token
+            if first.kind == "number" and first.text.isdigit():
+                return int(first.text)
+            elif first.kind in ("number", "string"):
+                return ast.literal_eval(first.text)
+            elif first.kind == "name" and first.text in ("None", "True", "False"):
+                return ast.literal_eval(first.text)
+
+        last = tokens[index - 1]
+        source = self.text[first.pos : last.pos + len(last.text)]
+        try:
+            return self.__evaluate(ast.parse(source, mode="eval").body)
+        except SyntaxError:
+            raise ParseError(f"cannot read Python value {source!r}") from None
+
+    # implementation
+
+    def __statement(self) -> ir.Statement:
+        tokens = self._tokens
+        results: list[str] = []
+        if tokens[self._index].kind == "ssa":
+            results.append(self.expect("ssa").text)
+            while self.accept(","):
+                results.append(self.expect("ssa").text)
+            self.expect("=")
+
+        token = self._tokens[self._index]
+        if (
+            token.kind != "name"
+            or (stmt_type := self._stmt_types.get(token.text)) is None
+        ):
+            raise self.error(f"unknown statement {token.text!r}")
+        self._index += 1
+
+        if (parse := self._parsers.get(stmt_type, False)) is False:
+            parse = None
+            dialect = stmt_type.dialect
+            if dialect is not None and dialect.syntax is not None:
+                parse = dialect.syntax.parser(stmt_type)
+            self._parsers[stmt_type] = parse
+
+        self._results = results
+        if parse is not None:
+            stmt = parse(self, stmt_type)
+        else:
+            stmt = self.__generic(stmt_type)
+
+        if results:
+            if len(results) != len(stmt._results):
+                raise self.error(
+                    f"{stmt_type.__name__} has {len(stmt._results)} results, "
+                    f"got {len(results)} names"
+                )
+            for id, result in zip(results, stmt._results):
+                self.define(id, result)
+        return stmt
+
+    def __generic(self, stmt_type: type[ir.Statement]) -> ir.Statement:
+        # (name=%x, %y, group=(%z, %w))[^1, ^2] ({...} {...}){name=attr} : types
+        self.expect("(")
+        groups: list[ir.SSAValue | list[ir.SSAValue]] = []
+        while self._tokens[self._index].kind != ")":
+            if self.peek().kind == "name" and self.peek(1).kind == "=":
+                self._index += 2
+            if self._tokens[self._index].kind == "(":
+                groups.append(self.parse_arguments())
+            else:
+                groups.append(self.parse_value())
+            if not self.accept(","):
+                break
+        self.expect(")")
+
+        args: list[ir.SSAValue] = []
+        args_slice: dict[str, int | slice] = {}
+        arg_fields = self.__arg_fields(stmt_type)
+        if arg_fields is not None and len(arg_fields) == len(groups):
+            for (name, group), values in zip(arg_fields, groups):
+                if isinstance(values, list):
+                    args_slice[name] = slice(len(args), len(args) + len(values))
+                    args.extend(values)
+                else:
+                    args_slice[name] = len(args)
+                    args.append(values)
+        else:
+            for values in groups:
+                args.extend(values if isinstance(values, list) else (values,))
+
+        successors: list[ir.Block] = []
+        if self.accept("["):
+            successors.append(self.parse_block())
+            while self.accept(","):
+                successors.append(self.parse_block())
+            self.expect("]")
+
+        regions: list[ir.Region] = []
+        if self.accept("("):
+            while not self.accept(")"):
+                regions.append(self.parse_region())
+
+        attributes: dict[str, ir.Attribute] = {}
+        if self.accept("{"):
+            while self._tokens[self._index].kind != "}":
+                name = self.expect("name").text
+                self.expect("=")
+                attributes[name] = self.parse_attribute()
+                if not self.accept(","):
+                    break
+            self.expect("}")
+
+        result_types = []
+        if self._results:
+            self.expect(":")
+            result_types = self.parse_types()
+
+        return self.statement(
+            stmt_type,
+            args=args,
+            regions=regions,
+            successors=successors,
+            attributes=attributes,
+            result_types=result_types,
+            args_slice=args_slice,
+        )
+
+    def __arg_fields(
+        self, stmt_type: type[ir.Statement]
+    ) -> list[tuple[str, bool]] | None:
+        if stmt_type in self._arg_fields:
+            return self._arg_fields[stmt_type]
+        try:
+            fields = [
+                (name, f.group) for name, f in stmt_fields(stmt_type).args.items()
+            ]
+        except AttributeError:  # NOTE: not declared with `@statement`
+            fields = None
+        self._arg_fields[stmt_type] = fields
+        return fields
+
+    def __block(self, label: str) -> ir.Block:
+        if (block := self._blocks.get(label)) is None:
+            block = self._blocks[label] = ir.Block()
+        return block
+
+    def __name(self, id: str) -> str | None:
+        name = id[1:]
+        if name.isdigit():
+            return None
+        base, sep, suffix = name.rpartition("_")
+        if (
+            sep
+            and suffix.isdigit()
+            and suffix[0] != "0"
+            and f"%{base}" in self._ssa_names
+        ):
+            return base
+        return name
+
+    def __pyclass(self, name: str) -> types.PyClass:
+        if (typ := self._pyclasses.get(name)) is None:
+            # NOTE: type attributes are interned, look for new ones
+            pyclasses = [
+                *types.PyClass._cache.values(),
+                *(t for d in self.dialects.data for t in d.python_types.values()),
+            ]
+            for each in pyclasses:
+                self._pyclasses.setdefault(f"{each.prefix}.{each.display_name}", each)
+                self._pyclasses.setdefault(each.typ.__name__, each)
+            if (typ := self._pyclasses.get(name)) is None:
+                raise self.error(f"unknown type {name}")
+        return typ
+
+    def __evaluate(self, node: ast.expr) -> Any:
+        evaluate = self.__evaluate
+        if isinstance(node, ast.Constant):
+            return node.value
+        elif isinstance(node, ast.Tuple):
+            return tuple(evaluate(each) for each in node.elts)
+        elif isinstance(node, ast.List):
+            return [evaluate(each) for each in node.elts]
+        elif isinstance(node, ast.Set):
+            return {evaluate(each) for each in node.elts}
+        elif isinstance(node, ast.Dict):
+            return {
+                evaluate(key): evaluate(value)  # type: ignore
+                for key, value in zip(node.keys, node.values)
+            }
+        elif isinstance(node, ast.UnaryOp) and isinstance(
+            node.op, (ast.USub, ast.UAdd)
+        ):
+            operand = evaluate(node.operand)
+            return -operand if isinstance(node.op, ast.USub) else operand
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+            lhs, rhs = evaluate(node.left), evaluate(node.right)
+            return lhs + rhs if isinstance(node.op, ast.Add) else lhs - rhs
+        elif isinstance(node, ast.Name) and node.id in self._scope:
+            return self._scope[node.id]
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in self._scope
+        ):
+            return self._scope[node.func.id](
+                *(evaluate(arg) for arg in node.args),
+                **{kw.arg: evaluate(kw.value) for kw in node.keywords if kw.arg},
+            )
+        raise ParseError(f"cannot read Python value {ast.unparse(node)!r}")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from abc import ABC
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    from kirin import ir
+
+    from .parser import Parser
+
+
+@dataclass
+class Syntax(ABC):
+    """Dialect-specific syntax of statements in the textual IR.
+
+    By default, statements are parsed in the generic format of
+    [`Statement.print_impl`][kirin.ir.Statement.print_impl]. A dialect whose
+    statements override `print_impl` registers a `Syntax` with
+    [`Dialect.register`][kirin.ir.Dialect.register] to read them back. The
+    syntax defines a method per statement class, named after the class:
+
+    - `parse_<ClassName>(self, parser, stmt_type)` reads the tokens following
+        the name of the statement with the `parse_*` methods of the
+        [`Parser`][kirin.parse.Parser] and returns the statement. The results
+        of the statement are named by the parser.
+
+    Example:
+        ```python
+        @dialect.register
+        class MySyntax(parse.Syntax):
+
+            def parse_MyStmt(self, parser: parse.Parser, stmt_type: type[MyStmt]):
+                # my.stmt %x, 2 : !py.int
+                value = parser.parse_value()
+                parser.expect(",")
+                n = parser.parse_python(":")
+                parser.expect(":")
+                return parser.statement(
+                    stmt_type,
+                    args=(value,),
+                    attributes={"n": n},
+                    result_types=(parser.parse_type(),),
+                    args_slice={"value": 0},
+                )
+        ```
+    """
+
+    namespace: ClassVar[dict[str, Any]] = {}
+    """Names of the Python objects of the dialect appearing in the `repr` of
+    constants, e.g. `{"IList": IList}`.
+    """
+
+    def parser(
+        self, stmt_type: type[ir.Statement]
+    ) -> Callable[[Parser, Any], ir.Statement] | None:
+        """Return the parser of the statement class, if any."""
+        return getattr(self, f"parse_{stmt_type.__name__}", None)
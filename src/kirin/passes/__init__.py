@@ -1,5 +1,11 @@
 from kirin.passes.abc import Pass as Pass
 from kirin.passes.fold import Fold as Fold
+from kirin.passes.licm import LICM as LICM
+from kirin.passes.manager import (
+    PassStats as PassStats,
+    PassManager as PassManager,
+    AnalysisCache as AnalysisCache,
+)
 from kirin.passes.typeinfer import TypeInfer as TypeInfer
 
 from .default import Default as Default
@@ -5,6 +5,8 @@ from dataclasses import field, dataclass
 from kirin.ir import Method, DialectGroup
 from kirin.rewrite.abc import RewriteResult
 
+from .manager import PassManager
+
 
 @dataclass
 class Pass(ABC):
@@ -20,25 +22,51 @@ class Pass(ABC):
     A Kirin compile unit is a `ir.Method` object, which is always equivalent
     to a LLVM/MLIR module if it were lowered to LLVM/MLIR just like other JIT
     compilers.
+
+    Passes run through a [`PassManager`][kirin.passes.PassManager], which
+    caches the analyses shared by passes, e.g. constant propagation, and
+    records the time spent in each pass.
     """
 
     name: ClassVar[str]
+    preserves: ClassVar[frozenset[type]] = frozenset()
+    """The analyses whose cached results are still valid after the pass
+    changed the method. Passes run by this pass through the manager
+    invalidate the analyses for themselves.
+    """
     dialects: DialectGroup
     no_raise: bool = field(default=True, kw_only=True)
+    manager: PassManager = field(
+        default_factory=PassManager, kw_only=True, repr=False, compare=False
+    )
+    incremental_verify: bool = field(default=False, kw_only=True)
+    """Only verify the IR modified by the pass, see
+    [`Method.verify`][kirin.ir.Method.verify].
+    """
+    full_verify_every: int = field(default=0, kw_only=True)
+    """With `incremental_verify`, verify the whole method after this many
+    incremental verifications, 0 never does.
+    """
 
     def __call__(self, mt: Method) -> RewriteResult:
-        result = self.unsafe_run(mt)
-        mt.code.verify()
+        result = self.manager.run(self, mt)
+        if self.incremental_verify:
+            mt.verify(incremental=True, full_every=self.full_verify_every)
+        else:
+            mt.code.verify()
         return result
 
     def fixpoint(self, mt: Method, max_iter: int = 32) -> RewriteResult:
         result = RewriteResult()
-        for _ in range(max_iter):
-            result_ = self.unsafe_run(mt)
-            result = result_.join(result)
-            if not result.has_done_something:
-                break
-        mt.verify()
+        with self.manager.scope():
+            for _ in range(max_iter):
+                result_ = self.manager.run(self, mt)
+                result = result_.join(result)
+                if not result_.has_done_something:
+                    break
+        mt.verify(
+            incremental=self.incremental_verify, full_every=self.full_verify_every
+        )
         return result
 
     @abstractmethod
@@ -23,11 +23,12 @@ class Fold(Pass):
     hint_const: HintConst = field(init=False)
 
     def __post_init__(self):
-        self.hint_const = HintConst(self.dialects)
-        self.hint_const.no_raise = self.no_raise
+        self.hint_const = HintConst(
+            self.dialects, no_raise=self.no_raise, manager=self.manager
+        )
 
     def unsafe_run(self, mt: Method) -> RewriteResult:
-        result = self.hint_const.unsafe_run(mt)
+        result = self.manager.run(self.hint_const, mt)
         rule = Chain(
             ConstantFold(),
             Call2Invoke(),
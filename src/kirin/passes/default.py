@@ -1,9 +1,13 @@
 from dataclasses import field, dataclass
 
+from kirin.analysis import CFG, CallGraph, const
+from kirin.dialects import cf
 from kirin.ir.method import Method
 from kirin.passes.fold import Fold
 from kirin.rewrite.abc import RewriteResult
 from kirin.passes.aggressive import Fold as AggressiveFold
+from kirin.analysis.typeinfer import TypeInference
+from kirin.dialects.cf.rewrite import RangeLoop
 
 from .abc import Pass
 from .typeinfer import TypeInfer
@@ -13,6 +17,14 @@ from .canonicalize import Canonicalize
 
 @dataclass
 class Default(Pass):
+    """Canonicalize, infer the types and fold a method.
+
+    The passes share the manager of this pass, so that the analyses computed
+    by one of them are reused by the next ones until the method changes.
+    """
+
+    # NOTE: the IR is only changed by the passes run through the manager
+    preserves = frozenset({const.Propagate, TypeInference, CFG, CallGraph})
     verify: bool = field(default=True, kw_only=True)
     fold: bool = field(default=True, kw_only=True)
     aggressive: bool = field(default=False, kw_only=True)
@@ -25,22 +37,49 @@ class Default(Pass):
 
     def __post_init__(self):
         # TODO: cleanup no_raise
-        self.typeinfer_pass = TypeInfer(self.dialects, no_raise=self.no_raise)
-        self.canonicalize = Canonicalize(self.dialects, no_raise=self.no_raise)
+        self.typeinfer_pass = TypeInfer(
+            self.dialects,
+            no_raise=self.no_raise,
+            incremental_verify=self.incremental_verify,
+            full_verify_every=self.full_verify_every,
+            manager=self.manager,
+        )
+        self.canonicalize = Canonicalize(
+            self.dialects,
+            no_raise=self.no_raise,
+            incremental_verify=self.incremental_verify,
+            full_verify_every=self.full_verify_every,
+            manager=self.manager,
+        )
 
-        self.hint_const_pass = HintConst(self.dialects, no_raise=self.no_raise)
-        if self.aggressive:
-            self.fold_pass = AggressiveFold(self.dialects, no_raise=self.no_raise)
-        else:
-            self.fold_pass = Fold(self.dialects, no_raise=self.no_raise)
+        self.hint_const_pass = HintConst(
+            self.dialects, no_raise=self.no_raise, manager=self.manager
+        )
+        fold_pass = AggressiveFold if self.aggressive else Fold
+        self.fold_pass = fold_pass(
+            self.dialects,
+            no_raise=self.no_raise,
+            incremental_verify=self.incremental_verify,
+            full_verify_every=self.full_verify_every,
+            manager=self.manager,
+        )
 
     def unsafe_run(self, mt: Method) -> RewriteResult:
         if self.verify:
-            mt.verify()
+            mt.verify(
+                incremental=self.incremental_verify,
+                full_every=self.full_verify_every,
+            )
 
         result = self.canonicalize.fixpoint(mt)
         if self.typeinfer:
             result = self.typeinfer_pass(mt).join(result)
+            # NOTE: RangeLoop only applies once the bounds are known to be ints
+            if cf.dialect in self.dialects:
+                changed = RangeLoop().rewrite(mt.code)
+                if changed.has_done_something:
+                    self.manager.analyses(mt).invalidate()
+                    result = self.typeinfer_pass(mt).join(changed).join(result)
             if self.verify:
                 mt.verify_type()
 
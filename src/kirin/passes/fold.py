@@ -4,6 +4,7 @@ from kirin.ir import HasCFG, Method
 from kirin.rewrite import (
     Walk,
     Chain,
+    Greedy,
     Fixpoint,
     Call2Invoke,
     ConstantFold,
@@ -28,32 +29,34 @@ class Fold(Pass):
     - `InlineGetItem`
     - `Call2Invoke`
     - `DeadCodeElimination`
+
+    The rewrites are applied with `Fixpoint(Walk(...))`, set `greedy=True` to
+    use the worklist-driven `Greedy` driver instead, which is faster on long
+    chains of dead code but slower when a single walk is enough.
     """
 
+    greedy: bool = field(default=False, kw_only=True)
     hint_const: HintConst = field(init=False)
 
     def __post_init__(self):
-        self.hint_const = HintConst(self.dialects)
-        self.hint_const.no_raise = self.no_raise
+        self.hint_const = HintConst(
+            self.dialects, no_raise=self.no_raise, manager=self.manager
+        )
 
     def unsafe_run(self, mt: Method) -> RewriteResult:
-        result = self.hint_const.unsafe_run(mt)
-        result = (
-            Fixpoint(
-                Walk(
-                    Chain(
-                        ConstantFold(),
-                        InlineGetItem(),
-                        Call2Invoke(),
-                        DeadCodeElimination(),
-                    )
-                )
-            )
-            .rewrite(mt.code)
-            .join(result)
-        )
+        result = self.manager.run(self.hint_const, mt)
+        rules = (ConstantFold(), InlineGetItem(), Call2Invoke(), DeadCodeElimination())
+        if self.greedy:
+            rule = Greedy(rules)
+        else:
+            rule = Fixpoint(Walk(Chain(rules)))
+        result = rule.rewrite(mt.code).join(result)
 
         if mt.code.has_trait(HasCFG):
             result = Walk(CFGCompactify()).rewrite(mt.code).join(result)
 
-        return Fixpoint(Walk(DeadCodeElimination())).rewrite(mt.code).join(result)
+        if self.greedy:
+            rule = Greedy(DeadCodeElimination())
+        else:
+            rule = Fixpoint(Walk(DeadCodeElimination()))
+        return rule.rewrite(mt.code).join(result)
@@ -1,19 +1,37 @@
-from dataclasses import dataclass
+from dataclasses import field, dataclass
 
 from kirin.ir import Method
 from kirin.rewrite import Walk, WrapConst
-from kirin.analysis import const
+from kirin.analysis import CFG, CallGraph, const
 from kirin.passes.abc import Pass
 from kirin.rewrite.abc import RewriteResult
+from kirin.analysis.typeinfer import TypeInference
 
 
 @dataclass
 class HintConst(Pass):
+    """Store the results of constant propagation in the hints of the SSA
+    values. The analysis is shared with the other passes of the manager.
+    """
+
+    # NOTE: only hints and purity attributes are modified
+    preserves = frozenset({const.Propagate, TypeInference, CFG, CallGraph})
+    constprop: const.Propagate = field(init=False)
+    """The constant propagation analysis, the summaries of called methods
+    are reused across runs of the pass.
+    """
+
+    def __post_init__(self):
+        self.constprop = const.Propagate(self.dialects)
 
     def unsafe_run(self, mt: Method) -> RewriteResult:
-        constprop = const.Propagate(self.dialects)
+        frame = self.manager.analyses(mt).get(const.Propagate, lambda: self.run(mt))
+        return Walk(WrapConst(frame)).rewrite(mt.code)
+
+    def run(self, mt: Method) -> const.Frame:
+        """Run constant propagation on the method, bypassing the cache."""
         if self.no_raise:
-            frame, _ = constprop.run_no_raise(mt)
+            frame, _ = self.constprop.run_no_raise(mt)
         else:
-            frame, _ = constprop.run(mt)
-        return Walk(WrapConst(frame)).rewrite(mt.code)
+            frame, _ = self.constprop.run(mt)
+        return frame
@@ -3,7 +3,14 @@ from dataclasses import field, dataclass
 
 from kirin import ir
 from kirin.passes import Pass
-from kirin.rewrite import Walk, Inline, Fixpoint, CFGCompactify, DeadCodeElimination
+from kirin.rewrite import (
+    Walk,
+    Greedy,
+    Inline,
+    Fixpoint,
+    CFGCompactify,
+    DeadCodeElimination,
+)
 from kirin.rewrite.abc import RewriteResult
 
 
@@ -14,6 +21,10 @@ def aggresive(x: ir.IRNode) -> bool:
 @dataclass
 class InlinePass(Pass):
     heuristic: Callable[[ir.IRNode], bool] = field(default=aggresive)
+    greedy: bool = field(default=False, kw_only=True)
+    """Use the `Greedy` driver for dead code elimination instead of
+    `Fixpoint(Walk(...))`.
+    """
 
     def unsafe_run(self, mt: ir.Method) -> RewriteResult:
 
@@ -22,4 +33,5 @@ class InlinePass(Pass):
 
         # dce
         dce = DeadCodeElimination()
-        return Fixpoint(Walk(dce)).rewrite(mt.code).join(result)
+        rule = Greedy(dce) if self.greedy else Fixpoint(Walk(dce))
+        return rule.rewrite(mt.code).join(result)
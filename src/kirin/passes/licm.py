@@ -0,0 +1,33 @@
+from dataclasses import field, dataclass
+
+from kirin.ir import Method
+from kirin.rewrite import LoopInvariantCodeMotion
+from kirin.analysis import CFG, CallGraph
+from kirin.passes.abc import Pass
+from kirin.rewrite.abc import RewriteResult
+
+from .hint_const import HintConst
+
+
+@dataclass
+class LICM(Pass):
+    """Hoist the loop-invariant pure statements out of the loops of a method,
+    see [`LoopInvariantCodeMotion`][kirin.rewrite.LoopInvariantCodeMotion].
+
+    Constant propagation runs first, so that the `MaybePure` statements it
+    proves pure, e.g. calls to pure methods, are hoisted too out of the loops
+    that are known to run, and the constant ranges of the loops are known.
+    """
+
+    # NOTE: statements move between existing blocks, the edges are unchanged
+    preserves = frozenset({CFG, CallGraph})
+    hint_const: HintConst = field(init=False)
+
+    def __post_init__(self):
+        self.hint_const = HintConst(
+            self.dialects, no_raise=self.no_raise, manager=self.manager
+        )
+
+    def unsafe_run(self, mt: Method) -> RewriteResult:
+        result = self.manager.run(self.hint_const, mt)
+        return LoopInvariantCodeMotion().rewrite(mt.code).join(result)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, TypeVar, Callable, Hashable, Iterable
+from weakref import WeakKeyDictionary
+from contextlib import contextmanager
+from dataclasses import field, dataclass
+
+from kirin import ir
+from kirin.analysis import CFG, CallGraph
+from kirin.rewrite.abc import RewriteResult
+
+if TYPE_CHECKING:
+    from .abc import Pass
+
+T = TypeVar("T")
+
+
+@dataclass
+class AnalysisCache:
+    """The analysis results of a method shared by the passes run by a
+    [`PassManager`][kirin.passes.PassManager].
+
+    Results are identified by the class of the analysis and the parameters
+    it ran with, e.g. `(TypeInference, arg_types)`. They stay valid until a
+    pass changes the method without preserving the analysis.
+    """
+
+    method: ir.Method
+    results: dict[tuple[type, Hashable], Any] = field(default_factory=dict)
+    hits: int = 0
+    """The number of results reused."""
+    misses: int = 0
+    """The number of results computed."""
+
+    def get(self, analysis: type, compute: Callable[[], T], params: Hashable = ()) -> T:
+        """Return the cached result of an analysis, computing it on a miss.
+
+        Args:
+            analysis (type): the class of the analysis, passes list it in
+                [`Pass.preserves`][kirin.passes.Pass.preserves].
+            compute (Callable[[], T]): run the analysis.
+            params (Hashable, optional): the parameters of the analysis.
+                Defaults to ().
+        """
+        key = (analysis, params)
+        if key in self.results:
+            self.hits += 1
+            return self.results[key]
+        self.misses += 1
+        result = self.results[key] = compute()
+        return result
+
+    def cfg(self, region: ir.Region) -> CFG:
+        """Return the control flow graph of a region of the method."""
+        return self.get(CFG, lambda: CFG(region), region)
+
+    def callgraph(self) -> CallGraph:
+        """Return the call graph of the method."""
+        return self.get(CallGraph, lambda: CallGraph(self.method))
+
+    def invalidate(self, preserved: Iterable[type] = ()) -> None:
+        """Drop the results of the analyses that are not preserved."""
+        preserved = frozenset(preserved)
+        for key in [key for key in self.results if key[0] not in preserved]:
+            del self.results[key]
+
+
+@dataclass
+class PassStats:
+    """Statistics of a pass run by a [`PassManager`][kirin.passes.PassManager]."""
+
+    runs: int = 0
+    """The number of runs."""
+    changes: int = 0
+    """The number of runs that changed the method."""
+    time: float = 0.0
+    """The total wall time in seconds, including the passes it runs."""
+
+
+@dataclass
+class PassManager:
+    """Run passes and cache the analyses they share.
+
+    Passes run through the manager with [`run`][kirin.passes.PassManager.run],
+    which records their [`PassStats`][kirin.passes.PassStats] and invalidates
+    the analyses they do not preserve when they report a change. Passes
+    running other passes share their manager with them.
+
+    The analysis cache of a method lives as long as the outermost run (or
+    [`scope`][kirin.passes.PassManager.scope]), changes made outside of the
+    passes are thus never hidden by a stale result.
+    """
+
+    stats: dict[str, PassStats] = field(default_factory=dict)
+    """The statistics of each pass, by class name."""
+    _caches: WeakKeyDictionary[ir.Method, AnalysisCache] = field(
+        default_factory=WeakKeyDictionary, init=False, repr=False
+    )
+    _depth: int = field(default=0, init=False, repr=False)
+
+    def analyses(self, mt: ir.Method) -> AnalysisCache:
+        """Return the analysis cache of a method."""
+        cache = self._caches.get(mt)
+        if cache is None:
+            cache = self._caches[mt] = AnalysisCache(mt)
+        return cache
+
+    def run(self, pass_: Pass, mt: ir.Method) -> RewriteResult:
+        """Run a pass on a method without verifying it."""
+        stats = self.stats.get(name := type(pass_).__name__)
+        if stats is None:
+            stats = self.stats[name] = PassStats()
+
+        with self.scope():
+            start = time.perf_counter()
+            result = pass_.unsafe_run(mt)
+            stats.time += time.perf_counter() - start
+            stats.runs += 1
+            if result.has_done_something:
+                stats.changes += 1
+                if (cache := self._caches.get(mt)) is not None:
+                    cache.invalidate(pass_.preserves)
+        return result
+
+    @contextmanager
+    def scope(self):
+        """Keep the analysis caches alive until the end of the block, e.g. across
+        the iterations of a fixpoint.
+        """
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._caches.clear()
+
+    def summary(self) -> str:
+        """Return a table of the statistics, slowest pass first."""
+        lines = [f"{'pass':24} {'runs':>6} {'changes':>8} {'time (ms)':>10}"]
+        for name, stats in sorted(self.stats.items(), key=lambda x: -x[1].time):
+            lines.append(
+                f"{name:24} {stats.runs:6} {stats.changes:8} {stats.time * 1e3:10.2f}"
+            )
+        return "\n".join(lines)
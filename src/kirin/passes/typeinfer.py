@@ -2,6 +2,7 @@ from dataclasses import field, dataclass
 
 from kirin.ir import Method, HasSignature
 from kirin.rewrite import Walk, Chain
+from kirin.analysis import CFG, CallGraph, const
 from kirin.passes.abc import Pass
 from kirin.rewrite.abc import RewriteResult
 from kirin.dialects.func import Signature
@@ -15,20 +16,26 @@ from .post_inference import PostInference
 
 @dataclass
 class TypeInfer(Pass):
+    # NOTE: types are applied and redundant type asserts removed, which does
+    # not change the results of the analyses.
+    preserves = frozenset({const.Propagate, TypeInference, CFG, CallGraph})
     hint_const: HintConst = field(init=False)
     inference: PostInference = field(init=False)
 
     def __post_init__(self):
         self.infer = TypeInference(self.dialects)
-        self.hint_const = HintConst(self.dialects, no_raise=self.no_raise)
-        self.post_inference = PostInference(self.dialects, no_raise=self.no_raise)
+        self.hint_const = HintConst(
+            self.dialects, no_raise=self.no_raise, manager=self.manager
+        )
+        self.post_inference = PostInference(
+            self.dialects, no_raise=self.no_raise, manager=self.manager
+        )
 
     def unsafe_run(self, mt: Method) -> RewriteResult:
-        result = self.hint_const.unsafe_run(mt)
-        if self.no_raise:
-            frame, return_type = self.infer.run_no_raise(mt, *mt.arg_types)
-        else:
-            frame, return_type = self.infer.run(mt, *mt.arg_types)
+        result = self.manager.run(self.hint_const, mt)
+        frame, return_type = self.manager.analyses(mt).get(
+            TypeInference, lambda: self.run(mt), mt.arg_types
+        )
 
         if trait := mt.code.get_trait(HasSignature):
             trait.set_signature(mt.code, Signature(mt.arg_types, return_type))
@@ -44,3 +51,9 @@ class TypeInfer(Pass):
         result = self.post_inference.fixpoint(mt).join(result)
         mt.inferred = True
         return result
+
+    def run(self, mt: Method):
+        """Run type inference on the method, bypassing the cache."""
+        if self.no_raise:
+            return self.infer.run_no_raise(mt, *mt.arg_types)
+        return self.infer.run(mt, *mt.arg_types)
@@ -11,5 +11,6 @@ object to a string. The [`Printer`][kirin.print.Printer] class provides methods
 types of objects.
 """
 
+from kirin.print.plain import PlainPrinter as PlainPrinter
 from kirin.print.printer import Printer as Printer
 from kirin.print.printable import Printable as Printable
@@ -0,0 +1,86 @@
+import io
+import sys
+from typing import IO, Any, Generator
+from contextlib import contextmanager
+from dataclasses import field, dataclass
+
+from kirin.print.printer import Printer
+
+
+def _default_stream() -> IO[str]:
+    return sys.stdout
+
+
+@dataclass
+class PlainPrinter(Printer):
+    """A printer writing the text of an uncoloured [`Printer`][kirin.print.Printer]
+    straight to a text stream.
+
+    The text is the same as the one of a `Printer` writing to a file or a string,
+    using the same `IdTable` naming, but skips the Rich markup, segments and theme
+    lookups: styles are ignored, and the text is buffered and written to the
+    stream after each block, so that large dumps start immediately.
+
+    !!! note
+        Rich strips the control characters and expands the tabs of printed
+        strings, the text here is written as is. Printed values are usually
+        `repr` of Python objects, where these characters are escaped.
+    """
+
+    stream: IO[str] = field(default_factory=_default_stream, kw_only=True)
+    """Text stream to write to, default to `sys.stdout`"""
+    buffer: list[str] = field(default_factory=list, init=False, repr=False)
+    """Text not yet written to the stream"""
+
+    def __post_init__(self):
+        self._write = self.buffer.append
+
+    def print(self, object):
+        from kirin.ir import Block
+
+        super().print(object)
+        if isinstance(object, Block) and self.buffer:
+            self.stream.write("".join(self.buffer))
+            self.buffer.clear()
+
+    def plain_print(self, *objects, sep="", end="", style=None, highlight=None):
+        """print objects without any formatting, styles are ignored.
+
+        Args:
+            *objects: objects to print
+
+        Keyword Args:
+            sep(str): separator between objects, default to ""
+            end(str): end character, default to ""
+            style(str): ignored, default to None
+            highlight(bool): ignored, default to None
+        """
+        if len(objects) == 1:
+            self._write(str(objects[0]))
+        else:
+            self._write(sep.join(map(str, objects)))
+        if end:
+            self._write(end)
+
+    def flush(self) -> None:
+        """write the buffered text to the stream."""
+        if self.buffer:
+            self.stream.write("".join(self.buffer))
+            self.buffer.clear()
+        self.stream.flush()
+
+    @contextmanager
+    def string_io(self) -> Generator[io.StringIO, Any, None]:
+        """Temporary string IO for capturing output.
+
+        Yields:
+            io.StringIO: the string IO object.
+        """
+        stream = io.StringIO()
+        old_write = self._write
+        self._write = stream.write
+        try:
+            yield stream
+        finally:
+            self._write = old_write
+            stream.close()
@@ -31,6 +31,8 @@ class Printable:
     and should be implemented by the derived classes.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def __get_printer(
         printer: Printer | None = None,
@@ -103,6 +105,7 @@ class Printable:
         printer = self.__get_printer(printer, **options)
         self.print_impl(printer)
         printer.plain_print(end)
+        printer.flush()
 
     def print_str(
         self,
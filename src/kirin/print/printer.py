@@ -245,6 +245,10 @@ class Printer:
             highlight=highlight or self.state.rich_highlight,
         )
 
+    def flush(self) -> None:
+        """flush the output of the console."""
+        self.console.file.flush()
+
     ElemType = TypeVar("ElemType")
 
     def print_seq(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import inspect
 from typing import TYPE_CHECKING, Iterable
-from dataclasses import dataclass
+from dataclasses import field, dataclass
 
 if TYPE_CHECKING:
     import ast
@@ -37,6 +37,10 @@ class Registry:
 
     dialects: "DialectGroup"
     """The dialect group to build the registry from."""
+    _interp_cache: dict[
+        tuple[str, ...], tuple[int, dict["Signature", "BoundedDef"]]
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Cache of interpreter registries, keyed by the interpreter keys."""
 
     def ast(self, keys: Iterable[str]) -> LoweringRegistry:
         """select the dialect lowering interpreters for the given key.
@@ -82,7 +86,26 @@ class Registry:
         Returns:
             a map of statement signatures to their interpretation functions,
             and a map of dialects to their fallback interpreters.
+
+        !!! note
+            The result is cached per key tuple and shared between callers,
+            it should be treated as read-only. The cache is invalidated
+            when any dialect registers a new method table.
         """
+        from kirin.ir.dialect import Dialect
+
+        keys = tuple(keys)
+        cached = self._interp_cache.get(keys)
+        if cached is not None and cached[0] == Dialect.interps_epoch:
+            return cached[1]
+
+        registry = self._build_interpreter(keys)
+        self._interp_cache[keys] = (Dialect.interps_epoch, registry)
+        return registry
+
+    def _build_interpreter(
+        self, keys: tuple[str, ...]
+    ) -> dict["Signature", "BoundedDef"]:
         from kirin.interp.table import BoundedDef
 
         registry: dict[Signature, BoundedDef] = {}
@@ -1,9 +1,12 @@
 from .cse import CommonSubexpressionElimination as CommonSubexpressionElimination
 from .dce import DeadCodeElimination as DeadCodeElimination
+from .gvn import GlobalValueNumbering as GlobalValueNumbering
 from .fold import ConstantFold as ConstantFold
+from .licm import LoopInvariantCodeMotion as LoopInvariantCodeMotion
 from .walk import Walk as Walk
 from .alias import InlineAlias as InlineAlias
 from .chain import Chain as Chain
+from .greedy import Greedy as Greedy
 from .inline import Inline as Inline
 from .getitem import InlineGetItem as InlineGetItem
 from .fixpoint import Fixpoint as Fixpoint
@@ -1,7 +1,8 @@
 from abc import ABC
+from typing import ClassVar
 from dataclasses import field, dataclass
 
-from kirin.ir import Pure, Block, IRNode, Region, MaybePure, Statement
+from kirin.ir import Pure, Block, IRNode, Region, MaybePure, Statement, StmtTrait
 
 
 @dataclass
@@ -26,8 +27,41 @@ class RewriteRule(ABC):
     The rewrite rule should mutate the node instead of returning a new node. A `RewriteResult` should
     be returned to indicate whether the rewrite rule has done something, whether the rewrite rule
     should terminate, and whether the rewrite rule has exceeded the maximum number of iterations.
+
+    A rule that only rewrites some statements can declare them in `matches`, so that
+    [`Chain`][kirin.rewrite.Chain] and [`Greedy`][kirin.rewrite.Greedy] skip the rule for
+    other nodes.
+    """
+
+    matches: ClassVar[tuple[type[Statement] | type[StmtTrait], ...] | None] = None
+    """The statement classes and statement trait classes matched by the rule.
+    If not `None`, the rule does nothing on regions, blocks and statements that
+    are neither an instance of one of the classes nor have one of the traits.
     """
 
+    def is_applicable(self, node_type: type[IRNode]) -> bool:
+        """Check if the rule may do something on nodes of the given type
+        according to `matches`.
+
+        Args:
+            node_type (type[IRNode]): The type of the node.
+
+        Returns:
+            bool: False if the rule does nothing on nodes of this type.
+        """
+        if self.matches is None:
+            return True
+        elif not issubclass(node_type, Statement):
+            return False
+
+        for each in self.matches:
+            if issubclass(each, Statement):
+                if issubclass(node_type, each):
+                    return True
+            elif node_type.has_trait(each):
+                return True
+        return False
+
     def rewrite(self, node: IRNode) -> RewriteResult:
         if isinstance(node, Region):
             return self.rewrite_Region(node)
@@ -7,6 +7,7 @@ from kirin.dialects.py.assign import Alias
 
 @dataclass
 class InlineAlias(RewriteRule):
+    matches = (Alias,)
 
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, Alias):
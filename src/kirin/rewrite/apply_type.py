@@ -12,8 +12,8 @@ class ApplyType(RewriteRule):
     def rewrite_Block(self, node: ir.Block) -> RewriteResult:
         has_done_something = False
         for arg in node.args:
-            if arg in self.results:
-                arg.type = self.results[arg]
+            if (typ := self.results.get(arg)) is not None and typ != arg.type:
+                arg.type = typ
                 has_done_something = True
 
         return RewriteResult(has_done_something=has_done_something)
@@ -21,8 +21,8 @@ class ApplyType(RewriteRule):
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         has_done_something = False
         for result in node._results:
-            if result in self.results:
-                result.type = self.results[result]
+            if (typ := self.results.get(result)) is not None and typ != result.type:
+                result.type = typ
                 has_done_something = True
 
         if (trait := node.get_trait(ir.HasSignature)) is not None and (
@@ -41,7 +41,8 @@ class ApplyType(RewriteRule):
                 )
                 and output_.is_subseteq(types.MethodType)
             ):
-                output_ = output_.vars[1]
-                trait.set_signature(node, Signature(inputs, output_))
-                has_done_something = True
+                signature = Signature(inputs, output_.vars[1])
+                if trait.get_signature(node) != signature:
+                    trait.set_signature(node, signature)
+                    has_done_something = True
         return RewriteResult(has_done_something=has_done_something)
@@ -10,6 +10,8 @@ from kirin.dialects.func import Call, Invoke
 class Call2Invoke(RewriteRule):
     """Rewrite a `Call` statement to an `Invoke` statement."""
 
+    matches = (Call,)
+
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, Call):
             return RewriteResult()
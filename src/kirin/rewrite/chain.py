@@ -1,5 +1,5 @@
 from typing import Iterable
-from dataclasses import dataclass
+from dataclasses import field, dataclass
 
 from kirin.ir import IRNode
 from kirin.rewrite.abc import RewriteRule, RewriteResult
@@ -10,9 +10,15 @@ class Chain(RewriteRule):
     """Chain multiple rewrites together.
 
     The chain will apply each rewrite in order until one of the rewrites terminates.
+    Rules are skipped on nodes they do not match according to their
+    [`matches`][kirin.rewrite.abc.RewriteRule.matches] declaration, the applicable
+    rules are computed once per node type.
     """
 
     rules: list[RewriteRule]
+    _dispatch: dict[type[IRNode], list[RewriteRule]] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __init__(self, rule: RewriteRule | Iterable[RewriteRule], *others: RewriteRule):
         if isinstance(rule, RewriteRule):
@@ -22,10 +28,22 @@ class Chain(RewriteRule):
                 others == ()
             ), "Cannot pass multiple positional arguments if the first argument is an iterable"
             self.rules = list(rule)
+        self._dispatch = {}
+
+    def rules_for(self, node_type: type[IRNode]) -> list[RewriteRule]:
+        """The rules that may do something on nodes of the given type."""
+        rules = self._dispatch.get(node_type)
+        if rules is None:
+            rules = [rule for rule in self.rules if rule.is_applicable(node_type)]
+            self._dispatch[node_type] = rules
+        return rules
+
+    def is_applicable(self, node_type: type[IRNode]) -> bool:
+        return bool(self.rules_for(node_type))
 
     def rewrite(self, node: IRNode) -> RewriteResult:
         has_done_something = False
-        for rule in self.rules:
+        for rule in self.rules_for(type(node)):
             result = rule.rewrite(node)
             if result.terminated:
                 return result
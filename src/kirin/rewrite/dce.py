@@ -6,6 +6,7 @@ from kirin.rewrite.abc import RewriteRule, RewriteResult
 
 @dataclass
 class DeadCodeElimination(RewriteRule):
+    matches = (ir.Pure, ir.MaybePure)
 
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if self.is_pure(node):
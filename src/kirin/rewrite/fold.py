@@ -2,13 +2,14 @@ from dataclasses import dataclass
 
 from kirin import ir
 from kirin.analysis import const
-from kirin.dialects import cf
 from kirin.rewrite.abc import RewriteRule, RewriteResult
+from kirin.dialects.cf.stmts import Branch, RangeBranch, ConditionalBranch
 from kirin.dialects.py.constant import Constant
 
 
 @dataclass
 class ConstantFold(RewriteRule):
+    matches = (ir.Pure, ir.MaybePure, ConditionalBranch, RangeBranch)
 
     def get_const(self, value: ir.SSAValue):
         ret = value.hints.get("const")
@@ -20,8 +21,10 @@ class ConstantFold(RewriteRule):
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if node.has_trait(ir.ConstantLike):
             return RewriteResult()
-        elif isinstance(node, cf.ConditionalBranch):
+        elif isinstance(node, ConditionalBranch):
             return self.rewrite_cf_ConditionalBranch(node)
+        elif isinstance(node, RangeBranch):
+            return self.rewrite_cf_RangeBranch(node)
 
         if not self.is_pure(node):
             return RewriteResult()
@@ -38,15 +41,15 @@ class ConstantFold(RewriteRule):
                 has_done_something = True
         return RewriteResult(has_done_something=has_done_something)
 
-    def rewrite_cf_ConditionalBranch(self, node: cf.ConditionalBranch):
+    def rewrite_cf_ConditionalBranch(self, node: ConditionalBranch):
         if (value := self.get_const(node.cond)) is not None:
             if value.data is True:
-                cf.Branch(
+                Branch(
                     arguments=node.then_arguments,
                     successor=node.then_successor,
                 ).insert_before(node)
             elif value.data is False:
-                cf.Branch(
+                Branch(
                     arguments=node.else_arguments,
                     successor=node.else_successor,
                 ).insert_before(node)
@@ -55,3 +58,24 @@ class ConstantFold(RewriteRule):
             node.delete()
             return RewriteResult(has_done_something=True)
         return RewriteResult()
+
+    def rewrite_cf_RangeBranch(self, node: RangeBranch):
+        bounds = [self.get_const(arg) for arg in (node.index, node.stop, node.step)]
+        if any(value is None for value in bounds):
+            return RewriteResult()
+
+        start, stop, step = (value.data for value in bounds)  # type: ignore
+        if not step:  # NOTE: raises when entering the loop
+            return RewriteResult()
+        elif start < stop if step > 0 else start > stop:
+            Branch(
+                arguments=(node.index, *node.body_arguments),
+                successor=node.body_successor,
+            ).insert_before(node)
+        else:
+            Branch(
+                arguments=node.exit_arguments,
+                successor=node.exit_successor,
+            ).insert_before(node)
+        node.delete()
+        return RewriteResult(has_done_something=True)
@@ -7,6 +7,7 @@ from kirin.rewrite.abc import RewriteRule, RewriteResult
 
 @dataclass
 class InlineGetField(RewriteRule):
+    matches = (func.GetField,)
 
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, func.GetField):
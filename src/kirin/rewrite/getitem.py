@@ -9,6 +9,11 @@ from kirin.rewrite.abc import RewriteRule, RewriteResult
 @dataclass
 class InlineGetItem(RewriteRule):
 
+    def is_applicable(self, node_type: type[ir.IRNode]) -> bool:
+        # NOTE: not declared in `matches`, the rule is imported while the
+        # py dialect is defined
+        return issubclass(node_type, py.indexing.GetItem)
+
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, py.indexing.GetItem):
             return RewriteResult()
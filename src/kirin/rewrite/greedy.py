@@ -0,0 +1,178 @@
+from typing import Iterable
+from dataclasses import field, dataclass
+
+from kirin.ir import Block, Region, Statement
+from kirin.worklist import WorkList
+from kirin.rewrite.abc import RewriteRule, RewriteResult
+from kirin.ir.nodes.base import IRNode
+
+
+@dataclass
+class Greedy(RewriteRule):
+    """Apply rewrite rules greedily until a fixpoint is reached.
+
+    This is a worklist-driven alternative to `Fixpoint(Walk(Chain(...)))`.
+    All nodes are visited once, after that only the nodes around a
+    successful rewrite are revisited:
+
+    - the rewritten statement itself if it is still in the IR,
+    - statements inserted next to it by the rule,
+    - the users of its results and the owners of its arguments,
+    - the whole region if the rule added or removed blocks, or the whole
+      node if the rewritten node is a region, a block or a statement
+      with regions.
+
+    Like [`Chain`][kirin.rewrite.Chain], all rules are applied to a node
+    in order, except that the remaining rules are skipped once a statement
+    is removed from the IR. Rules that modify the IR outside of the
+    neighbourhood above should keep using `Fixpoint(Walk(...))`.
+
+    ### Parameters
+    - `rules`: the rewrite rules to apply.
+    - `max_iter`: the total number of successful rewrites is bounded by
+        `max_iter` times the number of nodes initially in the IR.
+        Default is 32.
+
+    ### Attributes
+    - `hits`: the number of successful rewrites of each rule in the last
+        call of `rewrite`, in the same order as `rules`.
+    """
+
+    rules: list[RewriteRule]
+    max_iter: int
+    hits: list[int] = field(init=False, repr=False)
+    _dispatch: dict[type[IRNode], list[tuple[int, RewriteRule]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __init__(
+        self,
+        rule: RewriteRule | Iterable[RewriteRule],
+        *others: RewriteRule,
+        max_iter: int = 32,
+    ):
+        if isinstance(rule, RewriteRule):
+            self.rules = [rule, *others]
+        else:
+            assert (
+                others == ()
+            ), "Cannot pass multiple positional arguments if the first argument is an iterable"
+            self.rules = list(rule)
+        self.max_iter = max_iter
+        self.hits = [0] * len(self.rules)
+        self._dispatch = {}
+
+    def rewrite(self, node: IRNode) -> RewriteResult:
+        self.hits = [0] * len(self.rules)
+        worklist: WorkList[IRNode] = WorkList(unique=True)
+        self.populate_worklist(worklist, node)
+        budget = self.max_iter * max(len(worklist), 1)
+
+        has_done_something = False
+        while (subnode := worklist.pop()) is not None:
+            # NOTE: Region and Block are not subclassed, avoid the slow
+            # isinstance check on the abstract IRNode hierarchy.
+            is_stmt = type(subnode) is not Region and type(subnode) is not Block
+            rules = self._dispatch.get(type(subnode))
+            if rules is None:
+                rules = [
+                    (idx, rule)
+                    for idx, rule in enumerate(self.rules)
+                    if rule.is_applicable(type(subnode))
+                ]
+                self._dispatch[type(subnode)] = rules
+            if not rules:
+                continue
+
+            if is_stmt and subnode.parent is None and subnode is not node:
+                continue  # deleted
+            elif not node.is_ancestor(subnode):  # removed from the IR
+                continue
+
+            if is_stmt:
+                parent_block = subnode.parent
+                prev_stmt = subnode._prev_stmt
+                n_stmts = parent_block._stmt_len if parent_block is not None else 0
+                region = subnode.parent_region
+                n_blocks = len(region._blocks) if region is not None else 0
+                users = [use.stmt for result in subnode._results for use in result.uses]
+                defs = [arg.owner for arg in subnode._args]
+
+            changed = False
+            for idx, rule in rules:
+                result = rule.rewrite(subnode)
+                if result.terminated:
+                    return result
+                if result.has_done_something:
+                    self.hits[idx] += 1
+                    changed = True
+                if is_stmt and subnode.parent is None:
+                    break  # deleted by the rule
+
+            if not changed:
+                continue
+
+            has_done_something = True
+            budget -= 1
+            if budget < 0:
+                return RewriteResult(
+                    has_done_something=has_done_something, exceeded_max_iter=True
+                )
+
+            if not is_stmt:
+                self.populate_worklist(worklist, subnode)
+                continue
+
+            if region is not None and len(region._blocks) != n_blocks:
+                self.populate_worklist(worklist, region)
+                continue
+
+            if subnode._regions:
+                self.populate_worklist(worklist, subnode)
+            elif subnode.parent is not None:
+                worklist.append(subnode)
+
+            # statements inserted around the rewritten statement
+            if parent_block is not None:
+                n_inserted = parent_block._stmt_len - n_stmts
+                if subnode.parent is None:
+                    n_inserted += 1
+                if prev_stmt is not None and prev_stmt.parent is parent_block:
+                    stmt = prev_stmt._next_stmt
+                else:
+                    stmt = parent_block._first_stmt
+                while n_inserted > 0 and stmt is not None:
+                    if stmt is not subnode:
+                        self.populate_worklist(worklist, stmt)
+                        n_inserted -= 1
+                    stmt = stmt._next_stmt
+
+            worklist.extend(users)
+            for owner in defs:
+                if isinstance(owner, Statement):
+                    worklist.append(owner)
+        return RewriteResult(has_done_something=has_done_something)
+
+    def populate_worklist(self, worklist: WorkList[IRNode], node: IRNode) -> None:
+        """Add the node and all its descendants to the worklist, in the same
+        order as [`Walk`][kirin.rewrite.Walk].
+        """
+        if isinstance(node, Statement):
+            for region in node.regions:
+                self.populate_worklist(worklist, region)
+            worklist.append(node)
+        elif isinstance(node, Region):
+            worklist.append(node)
+            for block in reversed(node.blocks):
+                self.populate_worklist(worklist, block)
+        elif isinstance(node, Block):
+            worklist.append(node)
+            stmt = node.first_stmt
+            while stmt is not None:
+                self.populate_worklist(worklist, stmt)
+                stmt = stmt.next_stmt
+        else:
+            raise NotImplementedError(f"populate_worklist_{node.__class__.__name__}")
+
+    def __repr__(self):
+        return f"Greedy({' -> '.join(map(str, self.rules))})"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Hashable
+from dataclasses import dataclass
+
+from kirin import ir
+from kirin.analysis import CFG
+from kirin.rewrite.abc import RewriteRule, RewriteResult
+
+
+@dataclass
+class GlobalValueNumbering(RewriteRule):
+    """Eliminate the pure statements computing the same value as a statement
+    dominating them.
+
+    Unlike [`CommonSubexpressionElimination`][kirin.rewrite.CommonSubexpressionElimination],
+    which looks for duplicates within a block, the blocks of each region are
+    visited once along its [`DominatorTree`][kirin.analysis.dominance.DominatorTree]
+    with a scoped table of the available values, so a statement is replaced
+    by an equivalent statement of any block dominating it, or of a region
+    enclosing it. Regions of statements that are
+    [`IsolatedFromAbove`][kirin.ir.IsolatedFromAbove] start with an empty
+    table.
+
+    The arguments of statements with the [`Commutative`][kirin.ir.Commutative]
+    trait are sorted, so `x + y` and `y + x` are equivalent when the addition
+    is commutative.
+
+    !!! note
+        The rule rewrites all the regions nested in the node it is applied
+        to, it does not need to be wrapped in `Walk` or `Fixpoint`.
+    """
+
+    def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
+        return _Numbering().statement_regions(node, isolated=True)
+
+    def rewrite_Region(self, node: ir.Region) -> RewriteResult:
+        return _Numbering().region(node)
+
+
+class _Numbering:
+    """The scoped table of available values of a rewrite."""
+
+    def __init__(self) -> None:
+        self.table: dict[Hashable, ir.Statement] = {}
+        self.log: list[Hashable] = []
+        self.changed = False
+
+    def statement_regions(
+        self, stmt: ir.Statement, isolated: bool = False
+    ) -> RewriteResult:
+        if not stmt.regions:
+            return RewriteResult()
+        if isolated or stmt.has_trait(ir.IsolatedFromAbove):
+            table, log = self.table, self.log
+            self.table, self.log = {}, []
+            for region in stmt.regions:
+                self.region(region)
+            self.table, self.log = table, log
+        else:
+            for region in stmt.regions:
+                self.region(region)
+        return RewriteResult(has_done_something=self.changed)
+
+    def region(self, region: ir.Region) -> RewriteResult:
+        if len(region.blocks) == 1:  # NOTE: fast path, no need for a CFG
+            mark = len(self.log)
+            self.block(region.blocks[0])
+            self.undo(mark)
+            return RewriteResult(has_done_something=self.changed)
+
+        tree = CFG(region).dominators
+        if tree.root is None:
+            return RewriteResult(has_done_something=self.changed)
+
+        # NOTE: iterative, dominator trees of long block chains are deep
+        stack: list[tuple[ir.Block, int]] = [(tree.root, -1)]
+        while stack:
+            block, mark = stack.pop()
+            if mark >= 0:  # leaving the block
+                self.undo(mark)
+                continue
+            stack.append((block, len(self.log)))
+            self.block(block)
+            stack.extend((child, -1) for child in reversed(tree.children[block]))
+        return RewriteResult(has_done_something=self.changed)
+
+    def block(self, block: ir.Block) -> None:
+        stmt = block.first_stmt
+        while stmt is not None:
+            next_stmt = stmt.next_stmt
+            if stmt.regions:
+                mark = len(self.log)
+                self.statement_regions(stmt)
+                self.undo(mark)
+            elif (key := self.key(stmt)) is not None:
+                if (old := self.table.get(key)) is None:
+                    self.table[key] = stmt
+                    self.log.append(key)
+                else:
+                    for result, old_result in zip(stmt._results, old._results):
+                        result.replace_by(old_result)
+                    stmt.delete()
+                    self.changed = True
+            stmt = next_stmt
+
+    def key(self, stmt: ir.Statement) -> Hashable | None:
+        if not stmt.has_trait(ir.Pure) or stmt.successors:
+            return None
+
+        args = stmt._args
+        if (
+            len(args) == 2
+            and (trait := stmt.get_trait(ir.Commutative)) is not None
+            and trait.is_commutative(stmt)
+            and id(args[1]) < id(args[0])
+        ):
+            args = (args[1], args[0])
+        key = (type(stmt), args, tuple(stmt.attributes.items()), len(stmt._results))
+        try:
+            hash(key)
+        except TypeError:  # NOTE: attributes wrapping unhashable data
+            return None
+        return key
+
+    def undo(self, mark: int) -> None:
+        table, log = self.table, self.log
+        while len(log) > mark:
+            del table[log.pop()]
@@ -13,6 +13,8 @@ from kirin.dialects.py.constant import Constant
 
 @dataclass
 class Inline(RewriteRule):
+    matches = (func.Invoke, func.Call)
+
     heuristic: Callable[[ir.Statement], bool]
     """inline heuristic that determines whether a function should be inlined
     """
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from typing import Iterable
+from dataclasses import dataclass
+from collections.abc import Sequence
+
+from kirin import ir
+from kirin.analysis import CFG, const
+from kirin.dialects import cf, py, scf
+from kirin.rewrite.abc import RewriteRule, RewriteResult
+from kirin.analysis.loops import Loop
+
+
+@dataclass
+class LoopInvariantCodeMotion(RewriteRule):
+    """Hoist the pure statements computing the same value at every iteration
+    out of loops.
+
+    The loops are the bodies of [`scf.For`][kirin.dialects.scf.For]
+    statements and the natural loops of the
+    [`CFG.loops`][kirin.analysis.CFG.loops] of multi-block regions, e.g.
+    after `scf2cf`. They are visited innermost first, so that statements
+    hoisted out of an inner loop may be hoisted out of the loops enclosing
+    it. A statement is hoisted if it is pure, i.e. it has the
+    [`Pure`][kirin.ir.Pure] trait or is a [`MaybePure`][kirin.ir.MaybePure]
+    statement marked pure, e.g. by [`HintConst`][kirin.passes.HintConst],
+    has no region or successor, and its arguments are defined outside of
+    the loop or by hoisted statements.
+
+    Hoisting must not raise where the loop would not, e.g. `a // b` in a
+    loop running zero times. The statements that may raise, i.e. that are
+    not constant-like or [`Speculatable`][kirin.ir.Speculatable], are only
+    hoisted if they run whenever the loop is entered, which is the case of
+    the body of an `scf.For` statement iterating over a constant non-empty
+    collection and of the blocks dominating all the exits of a loop entered
+    unconditionally, e.g. by a `cf.RangeBranch` over a constant non-empty
+    range.
+
+    The loop-carried values passed unchanged from one iteration to the next,
+    which the lowering of Python loops produces for every variable read in
+    the loop, are replaced by their initial value first.
+
+    Statements are hoisted in front of the `scf.For` statement, or before the
+    terminator of the only predecessor of the loop header outside of the
+    loop; loops entered from several blocks are left as is.
+
+    !!! note
+        The rule rewrites all the loops nested in the node it is applied
+        to, it does not need to be wrapped in `Walk` or `Fixpoint`.
+    """
+
+    def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
+        result = RewriteResult()
+        for region in node.regions:
+            result = self.rewrite_Region(region).join(result)
+        return result
+
+    def rewrite_Region(self, node: ir.Region) -> RewriteResult:
+        # NOTE: walk is in preorder, inner loops come last
+        loops = [stmt for stmt in node.walk() if isinstance(stmt, scf.For)]
+        changed = False
+        for stmt in reversed(loops):
+            changed = self.hoist_for(stmt) or changed
+
+        regions = [region for stmt in node.walk() for region in stmt.regions]
+        for region in (node, *regions):
+            if len(region.blocks) > 1:
+                changed = self.hoist_cfg(region) or changed
+        return RewriteResult(has_done_something=changed)
+
+    def hoist_for(self, node: scf.For) -> bool:
+        body = node.body.blocks[0]
+        changed = False
+        yield_stmt = body.last_stmt
+        while isinstance(yield_stmt, scf.Yield):
+            # NOTE: replacing an argument may make other yielded values invariant
+            carried = False
+            for idx, init in enumerate(node.initializers):
+                arg, value = body.args[idx + 1], yield_stmt.values[idx]
+                if value is not arg and value is not init:
+                    continue
+                for each in (arg, node.results[idx]):
+                    if each.uses:
+                        each.replace_by(init)
+                        carried = changed = True
+            if not carried:
+                break
+
+        runs = _nonempty(node.iterable)
+        variant: set[ir.SSAValue] = set(body.args)
+        stmt = body.first_stmt
+        while stmt is not None:
+            next_stmt = stmt.next_stmt
+            if self.is_invariant(stmt, lambda value: value not in variant, runs):
+                stmt.detach()
+                stmt.insert_before(node)
+                changed = True
+            else:
+                variant.update(stmt._results)
+            stmt = next_stmt
+        return changed
+
+    def hoist_cfg(self, region: ir.Region) -> bool:
+        cfg = CFG(region)
+        changed = self.carried(cfg)
+        order = cfg.reverse_postorder
+        for loop in reversed(cfg.loops.loops):  # innermost first
+            outside = [
+                pred
+                for pred in cfg.predecessors.get(loop.header, ())
+                if pred not in loop.blocks
+            ]
+            if len(outside) != 1 or (terminator := outside[0].last_stmt) is None:
+                continue
+
+            def defined_outside(value: ir.SSAValue, loop: Loop = loop) -> bool:
+                if isinstance(value, ir.BlockArgument):
+                    return value.owner not in loop.blocks
+                elif isinstance(value, ir.ResultValue):
+                    return value.owner.parent_block not in loop.blocks
+                return True
+
+            exiting = [
+                block
+                for block in loop.blocks
+                if any(succ not in loop for succ in cfg.successors.get(block, ()))
+            ]
+            entered = bool(exiting) and _enters(terminator, loop.header)
+            for block in sorted(loop.blocks, key=order.__getitem__):
+                runs = entered and all(
+                    cfg.dominators.dominates(block, each) for each in exiting
+                )
+                stmt = block.first_stmt
+                while stmt is not None:
+                    next_stmt = stmt.next_stmt
+                    if self.is_invariant(stmt, defined_outside, runs):
+                        stmt.detach()
+                        stmt.insert_before(terminator)
+                        changed = True
+                    stmt = next_stmt
+        return changed
+
+    def carried(self, cfg: CFG) -> bool:
+        """Replace the block arguments receiving the same value from all the
+        predecessors, but themselves, by this value."""
+        preds: dict[ir.Block, list[ir.Statement | None]] = {}
+        for block, block_preds in cfg.predecessors.items():
+            terminators = [pred.last_stmt for pred in block_preds]
+            if block.args and all(
+                isinstance(
+                    each,
+                    (cf.Branch, cf.ConditionalBranch, cf.RangeBranch, cf.RangeNext),
+                )
+                for each in terminators
+            ):
+                preds[block] = terminators
+
+        changed = True
+        has_done_something = False
+        while changed:
+            changed = False
+            for block, terminators in preds.items():
+                edges = [
+                    args
+                    for terminator in terminators
+                    for args in _incoming(terminator, block)
+                ]
+                for idx, arg in enumerate(block.args):
+                    if not arg.uses:
+                        continue
+                    values = {args[idx] for args in edges if args[idx] is not arg}
+                    if len(values) == 1 and (value := values.pop()) is not None:
+                        arg.replace_by(value)
+                        changed = has_done_something = True
+        return has_done_something
+
+    def is_invariant(self, stmt: ir.Statement, outside, runs: bool) -> bool:
+        """Whether `stmt` can be hoisted, `runs` if it runs whenever the loop
+        is entered."""
+        if stmt.regions or stmt.successors or stmt.has_trait(ir.IsTerminator):
+            return False
+        if not self.is_pure(stmt) or not all(outside(arg) for arg in stmt._args):
+            return False
+        return runs or self.is_speculatable(stmt)
+
+    @staticmethod
+    def is_speculatable(stmt: ir.Statement) -> bool:
+        if stmt.has_trait(ir.ConstantLike):
+            return True
+        trait = stmt.get_trait(ir.Speculatable)
+        return trait is not None and trait.is_speculatable(stmt)
+
+
+def _incoming(
+    terminator: ir.Statement | None, block: ir.Block
+) -> list[tuple[ir.SSAValue | None, ...]]:
+    """The arguments passed to a block by the terminator of a predecessor,
+    `None` for the induction variable of a counted loop."""
+    if isinstance(terminator, cf.Branch):
+        return [terminator.arguments]
+    elif isinstance(terminator, cf.ConditionalBranch):
+        incoming: Iterable[tuple[ir.Block, tuple[ir.SSAValue, ...]]] = (
+            (terminator.then_successor, terminator.then_arguments),
+            (terminator.else_successor, terminator.else_arguments),
+        )
+        return [args for succ, args in incoming if succ is block]
+    elif isinstance(terminator, (cf.RangeBranch, cf.RangeNext)):
+        incoming = (
+            (terminator.body_successor, (None, *terminator.body_arguments)),
+            (terminator.exit_successor, terminator.exit_arguments),
+        )
+        return [args for succ, args in incoming if succ is block]
+    return []
+
+
+def _const(value: ir.SSAValue):
+    """The constant value of an SSA value, `None` if it is unknown."""
+    if isinstance(hint := value.hints.get("const"), const.Value):
+        return hint.data
+    if (
+        isinstance(value, ir.ResultValue)
+        and isinstance(value.owner, py.Constant)
+        and isinstance(value.owner.value, ir.PyAttr)
+    ):
+        return value.owner.value.data
+    return None
+
+
+def _nonempty(value: ir.SSAValue) -> bool:
+    """Whether an SSA value is a constant non-empty collection."""
+    data = _const(value)
+    return isinstance(data, Sequence) and len(data) > 0
+
+
+def _enters(terminator: ir.Statement, header: ir.Block) -> bool:
+    """Whether the terminator of the block before a loop always branches to
+    the header of the loop."""
+    if isinstance(terminator, cf.Branch):
+        return terminator.successor is header
+    elif isinstance(terminator, cf.RangeBranch):
+        start, stop, step = (
+            _const(terminator.index),
+            _const(terminator.stop),
+            _const(terminator.step),
+        )
+        return (
+            terminator.body_successor is header
+            and all(type(each) is int for each in (start, stop, step))
+            and step != 0
+            and len(range(start, stop, step)) > 0  # type: ignore
+        )
+    return False
@@ -7,6 +7,7 @@ from kirin.dialects.py.assign import TypeAssert
 
 @dataclass
 class InlineTypeAssert(RewriteRule):
+    matches = (TypeAssert,)
 
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, TypeAssert):
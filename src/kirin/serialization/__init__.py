@@ -0,0 +1,46 @@
+"""Streaming binary serialization of the IR.
+
+```python
+from kirin import serialization
+
+data = serialization.dumps(method)
+method = serialization.loads(data, method.dialects)
+```
+
+Use [`Writer`][kirin.serialization.Writer] and
+[`Reader`][kirin.serialization.Reader] directly to stream several methods
+to the same file, or to resolve references to other methods.
+"""
+
+import io
+
+from kirin import ir
+
+from . import format as format
+from .codec import Codec as Codec
+from .reader import Reader as Reader
+from .writer import Writer as Writer
+
+
+def dumps(node: ir.Statement | ir.Method) -> bytes:
+    """Serialize a statement or a method that does not call other methods."""
+    stream = io.BytesIO()
+    writer = Writer(stream)
+    if isinstance(node, ir.Method):
+        writer.write_method(node)
+    else:
+        writer.write(node)
+    return stream.getvalue()
+
+
+def loads(
+    data: bytes, dialects: ir.DialectGroup | None = None, *, trusted: bool = False
+):
+    """Deserialize the output of [`dumps`][kirin.serialization.dumps], a
+    method if `dialects` is given, a statement otherwise. See
+    [`Reader.trusted`][kirin.serialization.Reader.trusted] for `trusted`.
+    """
+    reader = Reader(io.BytesIO(data), dialects, trusted=trusted)
+    if dialects is None:
+        return reader.read()
+    return reader.read_method()
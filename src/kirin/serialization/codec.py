@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from abc import ABC
+from typing import TYPE_CHECKING, Any, Callable
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    from kirin import ir
+
+    from .reader import Reader
+    from .writer import Writer
+
+
+@dataclass
+class Codec(ABC):
+    """Dialect-specific encoding of the attributes of statements.
+
+    By default, the attributes of a statement are written as a dictionary
+    of attributes. A dialect can register a `Codec` with
+    [`Dialect.register`][kirin.ir.Dialect.register] to write them in a more
+    compact form. The codec defines a pair of methods per statement class,
+    named after the class:
+
+    - `encode_<ClassName>(self, writer, stmt)` writes the attributes of
+        `stmt` with the `write_*` methods of the [`Writer`][kirin.serialization.Writer],
+    - `decode_<ClassName>(self, reader, stmt_type)` reads them back with the
+        `read_*` methods of the [`Reader`][kirin.serialization.Reader] and
+        returns the attributes of the statement.
+
+    Example:
+        ```python
+        @dialect.register
+        class MyCodec(serialization.Codec):
+
+            def encode_MyStmt(self, writer: Writer, stmt: MyStmt) -> None:
+                writer.write_int(stmt.n)
+
+            def decode_MyStmt(self, reader: Reader, stmt_type: type[MyStmt]):
+                return {"n": ir.PyAttr(reader.read_int())}
+        ```
+    """
+
+    def encoder(
+        self, stmt_type: type[ir.Statement]
+    ) -> Callable[[Writer, Any], None] | None:
+        """Return the encoder of the statement class, if any."""
+        return getattr(self, f"encode_{stmt_type.__name__}", None)
+
+    def decoder(
+        self, stmt_type: type[ir.Statement]
+    ) -> Callable[[Reader, Any], dict[str, ir.Attribute]] | None:
+        """Return the decoder of the statement class, if any."""
+        return getattr(self, f"decode_{stmt_type.__name__}", None)
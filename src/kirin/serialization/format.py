@@ -0,0 +1,57 @@
+"""Constants of the binary IR format.
+
+A stream starts with `MAGIC` and the format `VERSION`, followed by records.
+Each record starts with one of the opcodes below:
+
+- `DEF`: defines the next entry of the constant pool, an object kind
+    followed by its payload. The entries are numbered from 0 in the
+    order of definition, they are shared by all the records of the stream
+    and are always defined before they are used.
+- `METHOD`: the header of a method, followed by its code (a `STMT`).
+- `STMT`: the header of a statement, followed by its regions.
+- `REGION`: the header of a region and of all its blocks.
+- `BLOCK`: the start of the statements of the next block of the region.
+
+References to pool entries are encoded as `index + 1`, 0 means `None`.
+SSA values and blocks are numbered by the writer on first use.
+"""
+
+MAGIC = b"KIRB"
+VERSION = 1
+
+# records
+DEF = 0x01
+METHOD = 0x02
+STMT = 0x03
+REGION = 0x04
+BLOCK = 0x05
+
+# object kinds
+STR = 0x01
+BYTES = 0x02
+INT = 0x03
+FLOAT = 0x04
+TRUE = 0x05
+FALSE = 0x06
+TUPLE = 0x07
+DICT = 0x08
+SLICE = 0x09
+CLASS = 0x0A
+PICKLE = 0x0B
+METHOD_REF = 0x0C
+SELF = 0x0D
+SOURCE = 0x0E
+# attributes
+ANY = 0x20
+BOTTOM = 0x21
+PYCLASS = 0x22
+LITERAL = 0x23
+UNION = 0x24
+GENERIC = 0x25
+TYPEVAR = 0x26
+VARARG = 0x27
+PYATTR = 0x28
+
+# statement attributes
+GENERIC_ATTRS = 0x00
+CODEC_ATTRS = 0x01
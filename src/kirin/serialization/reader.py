@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import io
+import sys
+import pickle
+import struct
+import importlib
+from typing import IO, Any, Callable, Hashable
+from dataclasses import field, dataclass
+
+from kirin import ir, types
+from kirin.source import SourceInfo
+
+from . import format
+
+
+@dataclass
+class Reader:
+    """Read IR written by a [`Writer`][kirin.serialization.Writer].
+
+    The stream is read in chunks and statements are attached to their
+    block as soon as they are decoded. Methods referenced by the IR are
+    resolved with [`resolve_method`][kirin.serialization.Reader.resolve_method],
+    which raises by default.
+
+    !!! warning
+        Unless `trusted` is set, the pickled objects of the stream are limited
+        to builtin types and attribute classes, and its classes to builtin
+        types, attribute and statement classes, of the modules already
+        imported, as unpickling untrusted data runs arbitrary code.
+    """
+
+    file: IO[bytes]
+    """The binary stream to read from."""
+    dialects: ir.DialectGroup | None = None
+    """The dialect group of the methods read, required by `read_method`."""
+    chunk_size: int = field(default=1 << 16, kw_only=True)
+    """Number of bytes read from the file at once."""
+    trusted: bool = field(default=False, kw_only=True)
+    """If the stream comes from a trusted source, e.g. the current process,
+    read pickled objects of any class."""
+
+    _data: bytes = field(default=b"", init=False, repr=False)
+    _pos: int = field(default=0, init=False, repr=False)
+    _pool: list[Any] = field(default_factory=list, init=False, repr=False)
+    _values: dict[int, ir.SSAValue] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _blocks: dict[int, ir.Block] = field(default_factory=dict, init=False, repr=False)
+    _pending: list[tuple[ir.Statement, list[int]]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _decoders: dict[type[ir.Statement], Callable] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _method: ir.Method | None = field(default=None, init=False, repr=False)
+    _started: bool = field(default=False, init=False, repr=False)
+
+    def read(self) -> ir.Statement:
+        """Read the next statement, including its regions."""
+        self.__start()
+        self.__expect(format.STMT)
+        return self.__read_top()
+
+    def read_method(self, method: ir.Method | None = None) -> ir.Method:
+        """Read the next method.
+
+        Args:
+            method (ir.Method | None, optional): the method object to read
+                into, references to the method itself in its code resolve to
+                it. The object may be created with `Method.__new__`, it is
+                initialized in this case. Defaults to a new method.
+
+        Returns:
+            ir.Method: the method read.
+        """
+        if self.dialects is None:
+            raise ValueError("reading a method requires a dialect group")
+
+        self.__start()
+        self.__expect(format.METHOD)
+        sym_name = self.read_ref()
+        arg_names = list(self.read_ref())
+        nargs = self.read_varint()
+        inferred = bool(self.read_varint())
+
+        target = method if method is not None else ir.Method.__new__(ir.Method)
+        self._method = target
+        try:
+            self.__expect(format.STMT)
+            code = self.__read_top()
+        finally:
+            self._method = None
+
+        if not hasattr(target, "code"):
+            ir.Method.__init__(
+                target,
+                dialects=self.dialects,
+                code=code,
+                nargs=nargs,
+                sym_name=sym_name,
+                arg_names=arg_names,
+            )
+        else:
+            target.code = code
+            target.nargs = nargs
+            target.sym_name = sym_name
+            target.arg_names = arg_names
+            target.update_backedges()
+        target.inferred = inferred
+        return target
+
+    def at_end(self) -> bool:
+        """Return `True` if there is no record left in the stream."""
+        self.__start()
+        return not self.__fill(1)
+
+    def resolve_method(self, ref: Hashable) -> ir.Method:
+        """Return the method identified by the key returned by
+        [`Writer.method_ref`][kirin.serialization.Writer.method_ref].
+        """
+        raise TypeError(f"cannot resolve reference to method {ref!r}")
+
+    # primitives, used by codecs
+
+    def read_varint(self) -> int:
+        """Read a non-negative integer (LEB128)."""
+        data, pos = self._data, self._pos
+        # NOTE: fast path, most ids and lengths fit in a single byte
+        if pos < len(data) and data[pos] < 0x80:
+            self._pos = pos + 1
+            return data[pos]
+
+        result = shift = 0
+        while True:
+            if pos >= len(data):
+                self._pos = pos
+                self.__need(1)
+                data, pos = self._data, self._pos
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self._pos = pos
+                return result
+            shift += 7
+
+    def read_int(self) -> int:
+        """Read a signed integer (zigzag LEB128)."""
+        value = self.read_varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def read_ref(self) -> Any:
+        """Read a reference to an object of the constant pool."""
+        data, pos = self._data, self._pos
+        if pos < len(data) and (idx := data[pos]) < 0x80:
+            self._pos = pos + 1
+        else:
+            idx = self.read_varint()
+        return self._pool[idx - 1] if idx else None
+
+    # buffer
+
+    def __fill(self, size: int) -> bool:
+        if len(self._data) - self._pos >= size:
+            return True
+        rest = self._data[self._pos :]
+        while len(rest) < size:
+            chunk = self.file.read(max(self.chunk_size, size - len(rest)))
+            if not chunk:
+                break
+            rest += chunk
+        self._data, self._pos = rest, 0
+        return len(rest) >= size
+
+    def __need(self, size: int) -> None:
+        if not self.__fill(size):
+            raise EOFError("unexpected end of IR stream")
+
+    def __byte(self) -> int:
+        if self._pos >= len(self._data):
+            self.__need(1)
+        byte = self._data[self._pos]
+        self._pos += 1
+        return byte
+
+    def __bytes(self, size: int) -> bytes:
+        self.__need(size)
+        data = self._data[self._pos : self._pos + size]
+        self._pos += size
+        return data
+
+    # records
+
+    def __start(self) -> None:
+        if self._started:
+            return
+        self.__need(len(format.MAGIC) + 1)
+        if self.__bytes(len(format.MAGIC)) != format.MAGIC:
+            raise ValueError("not a kirin IR stream")
+        if (version := self.__byte()) != format.VERSION:
+            raise ValueError(f"unsupported IR format version {version}")
+        self._started = True
+
+    def __expect(self, opcode: int) -> None:
+        while (record := self.__byte()) == format.DEF:
+            self._pool.append(self.__decode())
+        if record != opcode:
+            raise ValueError(f"expected record {opcode}, got {record}")
+
+    def __read_top(self) -> ir.Statement:
+        stmt = self.__read_stmt()
+        values = self._values
+        for each, ids in self._pending:
+            try:
+                each.args = [values[idx] for idx in ids]
+            except KeyError as e:
+                raise ValueError(f"undefined SSA value {e.args[0]}") from None
+        self._pending.clear()
+        return stmt
+
+    def __read_value(self, value: ir.SSAValue) -> None:
+        self._values[self.read_varint()] = value
+        value.type = self.read_ref()
+        value._name = self.read_ref()
+        if (hints := self.read_ref()) is not None:
+            value.hints = dict(hints)
+
+    def __read_stmt(self) -> ir.Statement:
+        read_varint = self.read_varint
+        stmt_type: type[ir.Statement] = self.read_ref()
+        arg_ids = [read_varint() for _ in range(read_varint())]
+
+        stmt = stmt_type.__new__(stmt_type)
+        n_results = read_varint()
+        results = [ir.ResultValue(stmt, idx) for idx in range(n_results)]
+        for result in results:
+            self.__read_value(result)
+
+        blocks = self._blocks
+        successors = [blocks[read_varint()] for _ in range(read_varint())]
+        slices = self.read_ref()
+        source = self.read_ref()
+
+        if self.__byte() == format.CODEC_ATTRS:
+            attributes = self.__decoder(stmt_type)(self, stmt_type)
+        else:
+            attributes = self.read_ref()
+
+        values = self._values
+        try:
+            args = [values[idx] for idx in arg_ids]
+        except KeyError:  # NOTE: forward reference, e.g. a value of a later block
+            args = ()
+            self._pending.append((stmt, arg_ids))
+
+        ir.Statement.__init__(
+            stmt,
+            args=args,
+            results=results,
+            successors=successors,
+            attributes=attributes or {},
+            args_slice=slices or {},
+            source=source,
+        )
+
+        n_regions = read_varint()
+        if n_regions:
+            stmt.regions = [self.__read_region() for _ in range(n_regions)]
+        return stmt
+
+    def __decoder(self, stmt_type: type[ir.Statement]):
+        if (decoder := self._decoders.get(stmt_type)) is not None:
+            return decoder
+
+        dialect = stmt_type.dialect
+        if dialect is not None and dialect.codec is not None:
+            decoder = dialect.codec.decoder(stmt_type)
+        if decoder is None:
+            raise ValueError(f"no codec to decode {stmt_type.__name__}")
+        self._decoders[stmt_type] = decoder
+        return decoder
+
+    def __read_region(self) -> ir.Region:
+        self.__expect(format.REGION)
+        read_varint = self.read_varint
+        region = ir.Region(source=self.read_ref())
+        blocks = []
+        for _ in range(read_varint()):
+            block_id = read_varint()
+            block = ir.Block(source=self.read_ref())
+            block._args = tuple(
+                ir.BlockArgument(block, idx) for idx in range(read_varint())
+            )
+            for arg in block._args:
+                self.__read_value(arg)
+            self._blocks[block_id] = block
+            blocks.append(block)
+
+        for block in blocks:
+            region.blocks.append(block)
+            self.__expect(format.BLOCK)
+            for _ in range(read_varint()):
+                self.__expect(format.STMT)
+                block.stmts.append(self.__read_stmt())
+        return region
+
+    # constant pool
+
+    def __decode(self) -> Any:
+        kind = self.__byte()
+        if kind == format.STR:
+            return self.__bytes(self.read_varint()).decode()
+        elif kind == format.INT:
+            return self.read_int()
+        elif kind == format.TRUE:
+            return True
+        elif kind == format.FALSE:
+            return False
+        elif kind == format.FLOAT:
+            return struct.unpack("<d", self.__bytes(8))[0]
+        elif kind == format.BYTES:
+            return self.__bytes(self.read_varint())
+        elif kind == format.TUPLE:
+            return self.__decode_seq()
+        elif kind == format.DICT:
+            read_ref = self.read_ref
+            return {read_ref(): read_ref() for _ in range(self.read_varint())}
+        elif kind == format.SLICE:
+            return slice(self.read_ref(), self.read_ref(), self.read_ref())
+        elif kind == format.SOURCE:
+            return SourceInfo(
+                file=self.read_ref(),
+                lineno=self.read_int(),
+                col_offset=self.read_int(),
+                end_lineno=self.read_ref(),
+                end_col_offset=self.read_ref(),
+                lineno_begin=self.read_int(),
+                col_indent=self.read_int(),
+            )
+        elif kind == format.SELF:
+            if self._method is None:
+                raise ValueError("self reference outside of a method")
+            return self._method
+        elif kind == format.METHOD_REF:
+            return self.resolve_method(self.read_ref())
+        elif kind == format.ANY:
+            return types.Any
+        elif kind == format.BOTTOM:
+            return types.Bottom
+        elif kind == format.PYCLASS:
+            typ, display_name, prefix = (
+                self.read_ref(),
+                self.read_ref(),
+                self.read_ref(),
+            )
+            return types.PyClass(typ, display_name=display_name, prefix=prefix)
+        elif kind == format.LITERAL:
+            return types.Literal(self.read_ref(), self.read_ref())
+        elif kind == format.UNION:
+            return types.Union(self.__decode_seq())
+        elif kind == format.GENERIC:
+            body, params, vararg = self.read_ref(), self.__decode_seq(), self.read_ref()
+            return types.Generic(body, *params, *((vararg,) if vararg else ()))
+        elif kind == format.TYPEVAR:
+            return types.TypeVar(self.read_ref(), self.read_ref())
+        elif kind == format.VARARG:
+            return types.Vararg(self.read_ref())
+        elif kind == format.PYATTR:
+            data, typ = self.read_ref(), self.read_ref()
+            return ir.PyAttr(data, typ)
+        elif kind == format.CLASS:
+            module, qualname = self.read_ref(), self.read_ref()
+            if not self.trusted:
+                return _find_class(
+                    module, qualname, (ir.Attribute, ir.Statement), ValueError
+                )
+            obj = importlib.import_module(module)
+            for name in qualname.split("."):
+                obj = getattr(obj, name)
+            return obj
+        elif kind == format.PICKLE:
+            data = self.__bytes(self.read_varint())
+            return _Unpickler(io.BytesIO(data), self).load()
+        raise ValueError(f"unknown object kind {kind}")
+
+    def __decode_seq(self) -> tuple:
+        read_ref = self.read_ref
+        return tuple(read_ref() for _ in range(self.read_varint()))
+
+
+_ALLOWED = frozenset(
+    {
+        ("builtins", "bool"),
+        ("builtins", "bytearray"),
+        ("builtins", "bytes"),
+        ("builtins", "complex"),
+        ("builtins", "dict"),
+        ("builtins", "float"),
+        ("builtins", "frozenset"),
+        ("builtins", "int"),
+        ("builtins", "list"),
+        ("builtins", "range"),
+        ("builtins", "set"),
+        ("builtins", "slice"),
+        ("builtins", "str"),
+        ("builtins", "tuple"),
+        ("builtins", "type"),
+        ("kirin.ir.attrs.types", "_pyclass"),
+        ("kirin.ir.method", "Method"),
+        ("kirin.source", "SourceInfo"),
+    }
+)
+"""The objects an untrusted stream may refer to, other than the attribute
+and statement classes."""
+
+
+def _find_class(
+    module: str, name: str, bases: tuple[type, ...], error: type[Exception]
+) -> Any:
+    """Find an object an untrusted stream may refer to, the objects of
+    `_ALLOWED` and the subclasses of `bases`, in a module already imported.
+    """
+    if "." in name or (found := sys.modules.get(module)) is None:
+        raise error(f"{module}.{name} is not allowed")
+    obj = getattr(found, name, None)
+    if (module, name) in _ALLOWED or (isinstance(obj, type) and issubclass(obj, bases)):
+        return obj
+    raise error(f"{module}.{name} is not allowed")
+
+
+class _Unpickler(pickle.Unpickler):
+
+    def __init__(self, file, reader: Reader):
+        super().__init__(file)
+        self.reader = reader
+
+    def find_class(self, module: str, name: str):
+        if self.reader.trusted:
+            return super().find_class(module, name)
+        return _find_class(module, name, (ir.Attribute,), pickle.UnpicklingError)
+
+    def persistent_load(self, pid):
+        match pid:
+            case ("self",) if self.reader._method is not None:
+                return self.reader._method
+            case ("method", ref):
+                return self.reader.resolve_method(ref)
+            case ("dialect", name) if self.reader.dialects is not None:
+                for dialect in self.reader.dialects.data:
+                    if dialect.name == name:
+                        return dialect
+            case ("group",) if self.reader.dialects is not None:
+                return self.reader.dialects
+        raise pickle.UnpicklingError(f"cannot resolve persistent id {pid!r}")
@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import io
+import sys
+import math
+import pickle
+import struct
+from typing import IO, Any, Hashable
+from dataclasses import field, dataclass
+
+from kirin import ir, types
+from kirin.source import SourceInfo
+from kirin.lattice import SingletonMeta
+
+from . import format
+
+
+@dataclass
+class Writer:
+    """Write IR to a binary stream, see [`format`][kirin.serialization.format].
+
+    Statements are written record by record and the buffer is flushed to the
+    file after each block, so writing a method does not build an intermediate
+    representation of it in memory. The constant pool is shared by all the
+    statements and methods written to the same writer.
+
+    Python objects that have no dedicated encoding are pickled. Methods
+    referenced by the IR are written as the key returned by
+    [`method_ref`][kirin.serialization.Writer.method_ref], which raises by
+    default, override it to ship IR calling other methods.
+    """
+
+    file: IO[bytes]
+    """The binary stream to write to."""
+    flush_size: int = field(default=1 << 16, kw_only=True)
+    """Flush the buffer to the file once it is larger than this size."""
+
+    _out: bytearray = field(default_factory=bytearray, init=False, repr=False)
+    _record: bytearray = field(default_factory=bytearray, init=False, repr=False)
+    _pool: dict[Hashable, int] = field(default_factory=dict, init=False, repr=False)
+    _values: dict[ir.SSAValue, int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _blocks: dict[ir.Block, int] = field(default_factory=dict, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    _method: ir.Method | None = field(default=None, init=False, repr=False)
+    _started: bool = field(default=False, init=False, repr=False)
+
+    def write(self, node: ir.Statement) -> None:
+        """Write a statement, including its regions."""
+        self.__start()
+        self.__write_stmt(node)
+        self.flush()
+
+    def write_method(self, method: ir.Method) -> None:
+        """Write a method. References to the method itself in its code are
+        resolved to the method object created by
+        [`Reader.read_method`][kirin.serialization.Reader.read_method].
+        """
+        self.__start()
+        self._method = method
+        try:
+            self._record.append(format.METHOD)
+            self.write_ref(method.sym_name)
+            self.write_ref(tuple(method.arg_names or ()))
+            self.write_varint(method.nargs)
+            self.write_varint(int(method.inferred))
+            self.__end_record()
+            self.__write_stmt(method.code)
+        finally:
+            self._method = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        if self._out:
+            self.file.write(self._out)
+            self._out.clear()
+
+    def method_ref(self, method: ir.Method) -> Hashable:
+        """Return a key identifying a method referenced by the IR, it is
+        passed to [`Reader.resolve_method`][kirin.serialization.Reader.resolve_method]
+        when reading the IR back.
+        """
+        raise TypeError(f"cannot serialize reference to method {method.sym_name}")
+
+    # primitives, used by codecs
+
+    def write_varint(self, value: int) -> None:
+        """Write a non-negative integer (LEB128)."""
+        record = self._record
+        while value > 0x7F:
+            record.append((value & 0x7F) | 0x80)
+            value >>= 7
+        record.append(value)
+
+    def write_int(self, value: int) -> None:
+        """Write a signed integer (zigzag LEB128)."""
+        self.write_varint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def write_ref(self, obj: Any) -> None:
+        """Write a reference to an object of the constant pool, adding the
+        object to the pool if it is not there yet.
+        """
+        if obj is None:
+            self._record.append(0)
+        else:
+            self.write_varint(self.__define(obj, _pool_key(obj)) + 1)
+
+    # records
+
+    def __start(self) -> None:
+        if not self._started:
+            self._out += format.MAGIC
+            self._out.append(format.VERSION)
+            self._started = True
+
+    def __end_record(self) -> None:
+        self._out += self._record
+        self._record.clear()
+        if len(self._out) >= self.flush_size:
+            self.flush()
+
+    def __value_id(self, value: ir.SSAValue) -> int:
+        if (idx := self._values.get(value)) is None:
+            idx = self._values[value] = len(self._values)
+        return idx
+
+    def __block_id(self, block: ir.Block) -> int:
+        if (idx := self._blocks.get(block)) is None:
+            idx = self._blocks[block] = len(self._blocks)
+        return idx
+
+    def __write_value(self, value: ir.SSAValue) -> None:
+        self.write_varint(self.__value_id(value))
+        self.write_ref(value.type)
+        self.write_ref(value.name)
+        self.write_ref(value._hints or None)
+
+    def __write_stmt(self, stmt: ir.Statement) -> None:
+        self._record.append(format.STMT)
+        stmt_type = type(stmt)
+        self.write_ref(stmt_type)
+        self.write_varint(len(stmt._args))
+        for arg in stmt._args:
+            self.write_varint(self.__value_id(arg))
+        self.write_varint(len(stmt._results))
+        for result in stmt._results:
+            self.__write_value(result)
+        self.write_varint(len(stmt.successors))
+        for succ in stmt.successors:
+            self.write_varint(self.__block_id(succ))
+        self.__write_slices(stmt._name_args_slice)
+        self.write_ref(stmt.source)
+
+        dialect = stmt_type.dialect
+        encoder = None
+        if dialect is not None and dialect.codec is not None:
+            encoder = dialect.codec.encoder(stmt_type)
+        if encoder is None:
+            self._record.append(format.GENERIC_ATTRS)
+            self.write_ref(dict(stmt.attributes) or None)
+        else:
+            self._record.append(format.CODEC_ATTRS)
+            encoder(self, stmt)
+
+        self.write_varint(len(stmt._regions))
+        self.__end_record()
+        for region in stmt._regions:
+            self.__write_region(region)
+
+    def __write_region(self, region: ir.Region) -> None:
+        self._record.append(format.REGION)
+        self.write_ref(region.source)
+        self.write_varint(len(region._blocks))
+        for block in region._blocks:
+            self.write_varint(self.__block_id(block))
+            self.write_ref(block.source)
+            self.write_varint(len(block._args))
+            for arg in block._args:
+                self.__write_value(arg)
+        self.__end_record()
+
+        for block in region._blocks:
+            self._record.append(format.BLOCK)
+            self.write_varint(block._stmt_len)
+            self.__end_record()
+            stmt = block._first_stmt
+            while stmt is not None:
+                self.__write_stmt(stmt)
+                stmt = stmt._next_stmt
+            self.flush()
+
+    def __write_slices(self, slices: dict[str, int | slice]) -> None:
+        if not slices:
+            self._record.append(0)
+            return
+
+        # NOTE: slices are not hashable, key on their bounds
+        key = (slice, tuple((name, _slice_key(idx)) for name, idx in slices.items()))
+        self.write_varint(self.__define(slices, key) + 1)
+
+    # constant pool
+
+    def __define(self, obj: Any, key: Hashable | None) -> int:
+        if key is not None and (idx := self._pool.get(key)) is not None:
+            return idx
+
+        # NOTE: encode the payload first, it may define other entries
+        record = self._record
+        self._record = payload = bytearray()
+        try:
+            self.__encode(obj)
+        finally:
+            self._record = record
+
+        self._out.append(format.DEF)
+        self._out += payload
+        idx = self._count
+        self._count += 1
+        if key is not None:
+            self._pool[key] = idx
+        return idx
+
+    def __encode(self, obj: Any) -> None:
+        record = self._record
+        if isinstance(obj, str):
+            data = obj.encode()
+            record.append(format.STR)
+            self.write_varint(len(data))
+            record += data
+        elif obj is True:
+            record.append(format.TRUE)
+        elif obj is False:
+            record.append(format.FALSE)
+        elif type(obj) is int:
+            record.append(format.INT)
+            self.write_int(obj)
+        elif type(obj) is float:
+            record.append(format.FLOAT)
+            record += struct.pack("<d", obj)
+        elif type(obj) is bytes:
+            record.append(format.BYTES)
+            self.write_varint(len(obj))
+            record += obj
+        elif type(obj) is tuple:
+            record.append(format.TUPLE)
+            self.__encode_seq(obj)
+        elif type(obj) is dict:
+            record.append(format.DICT)
+            self.write_varint(len(obj))
+            for key, value in obj.items():
+                self.write_ref(key)
+                self.write_ref(value)
+        elif type(obj) is slice:
+            record.append(format.SLICE)
+            self.write_ref(obj.start)
+            self.write_ref(obj.stop)
+            self.write_ref(obj.step)
+        elif type(obj) is SourceInfo:
+            record.append(format.SOURCE)
+            self.write_ref(obj.file)
+            self.write_int(obj.lineno)
+            self.write_int(obj.col_offset)
+            self.write_ref(obj.end_lineno)
+            self.write_ref(obj.end_col_offset)
+            self.write_int(obj.lineno_begin)
+            self.write_int(obj.col_indent)
+        elif isinstance(obj, ir.Method):
+            if obj is self._method:
+                record.append(format.SELF)
+            else:
+                record.append(format.METHOD_REF)
+                self.write_ref(self.method_ref(obj))
+        elif isinstance(obj, types.TypeAttribute) and self.__encode_type(obj):
+            pass
+        elif type(obj) is types.Vararg:
+            record.append(format.VARARG)
+            self.write_ref(obj.typ)
+        elif type(obj) is ir.PyAttr:
+            record.append(format.PYATTR)
+            self.write_ref(obj.data)
+            self.write_ref(obj.type)
+        elif isinstance(obj, type) and _importable(obj):
+            record.append(format.CLASS)
+            self.write_ref(obj.__module__)
+            self.write_ref(obj.__qualname__)
+        else:
+            stream = io.BytesIO()
+            try:
+                _Pickler(stream, self).dump(obj)
+            except Exception as e:
+                raise TypeError(f"cannot serialize {obj!r}") from e
+            record.append(format.PICKLE)
+            data = stream.getvalue()
+            self.write_varint(len(data))
+            self._record += data
+
+    def __encode_seq(self, objs) -> None:
+        self.write_varint(len(objs))
+        for each in objs:
+            self.write_ref(each)
+
+    def __encode_type(self, obj: types.TypeAttribute) -> bool:
+        record = self._record
+        if obj is types.Any:
+            record.append(format.ANY)
+        elif obj is types.Bottom:
+            record.append(format.BOTTOM)
+        elif isinstance(obj, types.PyClass):
+            record.append(format.PYCLASS)
+            self.write_ref(obj.typ)
+            self.write_ref(obj.display_name)
+            self.write_ref(obj.prefix)
+        elif isinstance(obj, types.Literal):
+            record.append(format.LITERAL)
+            self.write_ref(obj.data)
+            self.write_ref(obj.type)
+        elif isinstance(obj, types.Union):
+            record.append(format.UNION)
+            self.__encode_seq(tuple(obj.types))
+        elif isinstance(obj, types.Generic):
+            record.append(format.GENERIC)
+            self.write_ref(obj.body)
+            self.__encode_seq(obj.vars)
+            self.write_ref(obj.vararg)
+        elif isinstance(obj, types.TypeVar):
+            record.append(format.TYPEVAR)
+            self.write_ref(obj.varname)
+            self.write_ref(obj.bound)
+        else:
+            return False
+        return True
+
+
+def _slice_key(idx: int | slice):
+    if isinstance(idx, slice):
+        return (idx.start, idx.stop, idx.step)
+    return idx
+
+
+def _pool_key(obj: Any) -> Hashable | None:
+    """Key of an object in the constant pool, `None` if it is not shared."""
+    obj_type = type(obj)
+    if obj_type is float and math.isnan(obj):
+        return None
+    elif obj_type in (str, int, float, bool, bytes, SourceInfo):
+        # NOTE: 1 == 1.0 == True, the type is part of the key
+        return (obj_type, obj) if obj_type is not SourceInfo else _source_key(obj)
+    elif obj_type is tuple:
+        keys = tuple(_pool_key(each) if each is not None else None for each in obj)
+        if any(key is None and each is not None for key, each in zip(keys, obj)):
+            return None
+        return (tuple, keys)
+    elif obj_type is dict:
+        items = tuple((key, _pool_key(value)) for key, value in obj.items())
+        if any(key is None for _, key in items):
+            return None
+        return (dict, items)
+    elif isinstance(obj, ir.Method):
+        return None  # resolved by the reader, self references depend on context
+    elif isinstance(obj, (types.TypeAttribute, type)):
+        return obj  # interned
+    elif isinstance(obj, ir.Attribute):
+        try:
+            hash(obj)
+        except TypeError:
+            return None
+        return (obj_type, obj)
+    return None
+
+
+def _source_key(source: SourceInfo) -> Hashable:
+    return (
+        SourceInfo,
+        source.file,
+        source.lineno,
+        source.col_offset,
+        source.end_lineno,
+        source.end_col_offset,
+        source.lineno_begin,
+        source.col_indent,
+    )
+
+
+def _importable(obj: type) -> bool:
+    """Whether the class can be found by its module and qualified name."""
+    if (
+        obj.__module__ == "__main__"
+        or (found := sys.modules.get(obj.__module__)) is None
+    ):
+        return False
+    for name in obj.__qualname__.split("."):
+        found = getattr(found, name, None)
+    return found is obj
+
+
+class _Pickler(pickle.Pickler):
+    """Pickle methods, dialects and dialect groups by reference, and
+    singleton lattice elements by their class.
+    """
+
+    def __init__(self, file, writer: Writer):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.writer = writer
+
+    def persistent_id(self, obj: Any):
+        if isinstance(obj, ir.Method):
+            if obj is self.writer._method:
+                return ("self",)
+            return ("method", self.writer.method_ref(obj))
+        elif isinstance(obj, ir.Dialect):
+            return ("dialect", obj.name)
+        elif isinstance(obj, ir.DialectGroup):
+            method = self.writer._method
+            if method is None or obj is not method.dialects:
+                raise pickle.PicklingError("only the method dialect group is pickled")
+            return ("group",)
+        return None
+
+    def reducer_override(self, obj: Any):
+        if isinstance(type(obj), SingletonMeta):
+            return type(obj), ()
+        return NotImplemented
@@ -2,7 +2,7 @@
 
 from typing import List
 
-from kirin.ir import Method, Statement
+from kirin.ir import Block, Method, SSAValue, Statement, BlockArgument
 from kirin.dialects import func
 
 
@@ -16,6 +16,18 @@ def assert_statements_same(
         statement_2 (Statement): Second statement to compare.
         check_args (bool): Recursively check arguments if True.
     """
+    _assert_statements_same(statement_1, statement_2, check_args, set())
+
+
+def _assert_statements_same(
+    statement_1: Statement,
+    statement_2: Statement,
+    check_args: bool,
+    seen: set[tuple[Statement, Statement]],
+):
+    # NOTE: statements used by several others are compared once
+    if (statement_1, statement_2) in seen:
+        return
     assert type(statement_1) is type(
         statement_2
     ), "Statements have different type: {} vs {}".format(
@@ -31,7 +43,30 @@ def assert_statements_same(
         for arg_1, arg_2 in zip(statement_1.args.field, statement_2.args.field):
             assert isinstance(arg_1.owner, Statement)
             assert isinstance(arg_2.owner, Statement)
-            assert_statements_same(arg_1.owner, arg_2.owner, check_args=True)
+            _assert_statements_same(arg_1.owner, arg_2.owner, True, seen)
+    seen.add((statement_1, statement_2))
+
+
+def _sequence_hash(stmts: List[Statement]) -> int:
+    """The structural hash of a sequence of statements, as if they were the
+    statements of a block."""
+    local: dict[SSAValue, tuple[int, ...]] = {}
+    free: dict[SSAValue | Block, int] = {}
+    parts = []
+    for idx, stmt in enumerate(stmts):
+        stmt_hash, stmt_free = stmt._structural()
+        used = []
+        for value in stmt_free:
+            if (position := local.get(value)) is None:  # type: ignore
+                if isinstance(value, BlockArgument):
+                    position = (-2, value.index)
+                else:
+                    position = (free.setdefault(value, len(free)),)
+            used.append(position)
+        parts.append((stmt_hash, tuple(used)))
+        for result_idx, result in enumerate(stmt._results):
+            local[result] = (idx, result_idx)
+    return hash(tuple(parts))
 
 
 def assert_structurally_same(
@@ -52,6 +87,12 @@ def assert_structurally_same(
     assert isinstance(method.code, func.Function)
     new_stmts = list(method.code.body.blocks[0].stmts)
     assert len(new_stmts) == len(expected_stmts), "Methods different lengths"
+    # NOTE: equal hashes do not imply the same statements, the hash only
+    # rejects early the sequences that are structurally different
+    if check_args and not debug:
+        assert _sequence_hash(new_stmts) == _sequence_hash(
+            expected_stmts
+        ), "Methods are structurally different"
     for new_stmt, expected_stmt in zip(new_stmts, expected_stmts):
         if debug:
             new_stmt.print()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar, Iterable
+import heapq
+from typing import Generic, Literal, TypeVar, Callable, Iterable
+from collections import deque
 from dataclasses import field, dataclass
 
 ElemType = TypeVar("ElemType")
@@ -10,24 +12,92 @@ ElemType = TypeVar("ElemType")
 class WorkList(Generic[ElemType]):
     """The worklist data structure.
 
-    The worklist is a stack that allows for O(1) removal of elements from the stack.
+    All policies support O(1) `append` and `pop` (O(log n) for `"priority"`).
+
+    ### Parameters
+    - `policy`: the order in which elements are popped, one of
+        - `"fifo"` (default): first in, first out.
+        - `"lifo"`: last in, first out.
+        - `"priority"`: smallest `priority(elem)` first, ties are popped
+            in insertion order. E.g. use the reverse-postorder index of
+            blocks so dataflow analysis converges in fewer iterations.
+    - `priority`: the key function for the `"priority"` policy.
+    - `unique`: if `True`, appending an element that is already waiting
+        in the worklist is a no-op. The element can be appended again
+        once it is popped.
     """
 
-    _stack: list[ElemType] = field(default_factory=list, init=False)
+    policy: Literal["fifo", "lifo", "priority"] = field(default="fifo", kw_only=True)
+    priority: Callable[[ElemType], int] | None = field(default=None, kw_only=True)
+    unique: bool = field(default=False, kw_only=True)
+
+    _queue: deque[ElemType] = field(default_factory=deque, init=False, repr=False)
+    _heap: list[tuple[int, int, ElemType]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _count: int = field(default=0, init=False, repr=False)
+    _members: set[ElemType] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.policy not in ("fifo", "lifo", "priority"):
+            raise ValueError(f"unknown worklist policy: {self.policy}")
+        if self.policy == "priority" and self.priority is None:
+            raise ValueError("priority policy requires a priority function")
 
     def __len__(self) -> int:
-        return len(self._stack)
+        if self.policy == "priority":
+            return len(self._heap)
+        return len(self._queue)
 
     def __bool__(self) -> bool:
-        return bool(self._stack)
+        return len(self) > 0
+
+    def __contains__(self, item: ElemType) -> bool:
+        if self.unique:
+            return item in self._members
+        if self.policy == "priority":
+            return any(each == item for _, _, each in self._heap)
+        return item in self._queue
 
     def append(self, item: ElemType) -> None:
-        self._stack.append(item)
+        if self.unique:
+            if item in self._members:
+                return
+            self._members.add(item)
+
+        if self.policy == "priority":
+            assert self.priority is not None
+            heapq.heappush(self._heap, (self.priority(item), self._count, item))
+            self._count += 1
+        else:
+            self._queue.append(item)
 
     def extend(self, items: Iterable[ElemType]) -> None:
-        self._stack.extend(items)
+        if self.unique or self.policy == "priority":
+            for item in items:
+                self.append(item)
+        else:
+            self._queue.extend(items)
 
     def pop(self) -> ElemType | None:
-        if self._stack:
-            return self._stack.pop(0)
-        return None
+        if self.policy == "fifo":
+            if not self._queue:
+                return None
+            item = self._queue.popleft()
+        elif self.policy == "lifo":
+            if not self._queue:
+                return None
+            item = self._queue.pop()
+        else:
+            if not self._heap:
+                return None
+            _, _, item = heapq.heappop(self._heap)
+
+        if self.unique:
+            self._members.discard(item)
+        return item
+
+    def clear(self) -> None:
+        self._queue.clear()
+        self._heap.clear()
+        self._members.clear()
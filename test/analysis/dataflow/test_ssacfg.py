@@ -0,0 +1,62 @@
+from kirin import types, lowering
+from kirin.prelude import basic_no_opt
+from kirin.analysis import const, reverse_postorder
+from kirin.dialects import func
+from kirin.analysis.typeinfer import TypeInference
+
+lower = lowering.Python(basic_no_opt)
+
+
+def deadblock(x):
+    if x:
+        return x + 1
+    else:
+        return x + 2
+    return x + 3
+
+
+def test_reverse_postorder():
+    code = lower.python_function(deadblock, compactify=False)
+    assert isinstance(code, func.Function)
+    order = reverse_postorder(code.body)
+    assert order[code.body.blocks[0]] == 0
+    assert code.body.blocks[-1] not in order
+    for block, idx in order.items():
+        if block.last_stmt is None:
+            continue
+        for succ in block.last_stmt.successors:
+            assert order[succ] > idx
+
+
+@basic_no_opt
+def nest(n: int):
+    x = 1
+    for i in range(n):
+        x = (x,)
+    return x
+
+
+@basic_no_opt
+def accumulate(n: int):
+    x = 0
+    for i in range(n):
+        x = x + i
+    return x
+
+
+def test_loop_converges():
+    infer = TypeInference(basic_no_opt)
+    _, ret = infer.run(accumulate, types.Int)
+    assert ret.is_equal(types.Int)
+
+    constprop = const.Propagate(basic_no_opt)
+    _, ret = constprop.run(accumulate, const.Value(3))
+    assert isinstance(ret, const.Unknown)
+
+
+def test_loop_widening():
+    # the type of x grows at every iteration: int, tuple[int], tuple[tuple[int]]...
+    infer = TypeInference(basic_no_opt, widen_after=2)
+    _, ret = infer.run(nest, types.Int)
+    assert types.Int.is_subseteq(ret)
+    assert types.Tuple[types.Int].is_subseteq(ret)
@@ -0,0 +1,68 @@
+from kirin import types
+from kirin.prelude import basic_no_opt
+from kirin.analysis import const
+from kirin.analysis.typeinfer import TypeInference
+
+
+@basic_no_opt
+def helper(x: int) -> int:
+    return x * 2 + 1
+
+
+@basic_no_opt
+def many_calls(x: int):
+    return helper(x) + helper(x) + helper(x) + helper(1) + helper(1)
+
+
+@basic_no_opt
+def fib(n: int) -> int:
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+
+@basic_no_opt
+def call_fib(n: int):
+    return fib(n)
+
+
+def test_constprop_summary():
+    constprop = const.Propagate(basic_no_opt)
+    _, ret = constprop.run(many_calls)
+    assert isinstance(ret, const.Unknown)
+    # helper(x) and helper(1)
+    assert constprop.summary_misses == 2
+    assert constprop.summary_hits == 3
+    assert len(constprop.summaries) == 2
+
+    constprop.run(many_calls)
+    assert constprop.summary_misses == 2
+    assert constprop.summary_hits == 8
+
+    helper.version += 1
+    constprop.run(many_calls)
+    assert constprop.summary_misses == 4
+
+    constprop.invalidate(helper)
+    assert not constprop.summaries
+
+
+def test_constprop_summary_purity():
+    constprop = const.Propagate(basic_no_opt)
+    frame, _ = constprop.run(many_calls)
+    # all calls to helper are pure, including the cached ones
+    assert len(frame.should_be_pure) == 5
+
+
+def test_recursive_summary():
+    constprop = const.Propagate(basic_no_opt)
+    _, ret = constprop.run(call_fib)
+    assert isinstance(ret, const.Unknown)
+
+    _, ret = constprop.run(call_fib, const.Value(10))
+    assert ret.is_equal(const.Value(55))
+
+    infer = TypeInference(basic_no_opt)
+    _, ret = infer.run(call_fib, types.Int)
+    assert ret.is_subseteq(types.Int)
+    assert infer.summary_misses > 0
@@ -0,0 +1,77 @@
+from kirin import ir, types
+from kirin.prelude import basic_no_opt
+from kirin.analysis import CFG
+from kirin.dialects import cf, py, func
+
+
+def test_diamond():
+    @basic_no_opt
+    def main(x: int):
+        if x > 0:
+            y = 1
+        else:
+            y = 2
+        return y
+
+    cfg = CFG(main.callable_region)
+    assert cfg.dominators is cfg.dominators
+    entry, then, else_, exit_ = main.callable_region.blocks
+    assert cfg.dominators.idom[exit_] is entry
+    assert cfg.dominance_frontiers[then] == {exit_}
+    assert cfg.dominance_frontiers[else_] == {exit_}
+    assert cfg.dominance_frontiers[entry] == set()
+
+    post = cfg.post_dominators
+    assert post.roots == [exit_]
+    assert post.idom[entry] is exit_
+    assert post.idom[then] is exit_
+    assert post.dominates(exit_, entry)
+    assert not post.dominates(then, entry)
+    # the branches are control dependent on the entry block
+    assert post.frontiers()[then] == {entry}
+    assert len(cfg.loops) == 0
+
+
+def test_nested_loops():
+    @basic_no_opt
+    def main(n: int):
+        x = 0
+        for i in range(n):
+            for j in range(i):
+                x = x + j
+        return x
+
+    cfg = CFG(main.callable_region)
+    nest = cfg.loops
+    assert len(nest) == 2
+    outer, inner = nest.loops
+    assert nest.top_level == [outer]
+    assert inner.parent is outer and outer.children == [inner]
+    assert inner.depth == 2 and outer.depth == 1
+    assert inner.blocks < outer.blocks
+    assert all(cfg.dominators.dominates(outer.header, b) for b in outer.blocks)
+    assert nest.loop_of(inner.header) is inner
+    assert nest.depth(cfg.entry) == 0  # type: ignore
+    assert all(block not in outer for block in outer.exits(cfg))
+    assert main(4) == 4
+
+
+def test_post_dominators_forest():
+    # entry -> a | b, a returns, b loops forever
+    entry = ir.Block(argtypes=(types.MethodType, types.Bool))
+    a, b = ir.Block(), ir.Block()
+    entry.stmts.append(
+        cf.ConditionalBranch(entry.args[1], (), (), then_successor=a, else_successor=b)
+    )
+    const = py.Constant(1)
+    a.stmts.append(const)
+    a.stmts.append(func.Return(const.result))
+    b.stmts.append(cf.Branch((), successor=b))
+    cfg = CFG(ir.Region([entry, a, b]))
+
+    post = cfg.post_dominators
+    assert post.roots == [a]
+    assert post.idom[entry] is a
+    assert b not in post.idom
+    assert [loop.header for loop in cfg.loops] == [b]
+    assert cfg.loops.loops[0].latches == [b]
@@ -0,0 +1,127 @@
+import sys
+import subprocess
+from typing import Any
+
+import pytest
+
+from kirin import ir, types
+from kirin.passes import Fold, TypeInfer
+from kirin.prelude import basic, structural, basic_no_opt
+from kirin.rewrite import Walk
+from kirin.dialects import cf, py, ilist
+from kirin.dialects.scf import scf2cf
+
+
+def count(mt: ir.Method, stmt_type: type[ir.Statement]) -> int:
+    return sum(isinstance(stmt, stmt_type) for stmt in mt.callable_region.walk())
+
+
+def test_range_loop_rewrite():
+    @basic_no_opt
+    def main(n: int, step: int):
+        x = 0
+        for i in range(n, -n, step):
+            for j in range(i):
+                x = x + i * j
+            x = x + 1
+        return x
+
+    inputs = [(5, -1), (5, -2), (4, 1), (0, -1), (3, 3)]
+    expected = [main(*args) for args in inputs]
+    assert count(main, py.iterable.Next) == 4
+    # the bounds must be known to be integers
+    assert not cf.rewrite.RangeLoop().rewrite(main.code).has_done_something
+    TypeInfer(main.dialects)(main)
+
+    result = cf.rewrite.RangeLoop().rewrite(main.code)
+    assert result.has_done_something
+    main.verify()
+    assert count(main, py.iterable.Iter) == count(main, py.iterable.Next) == 0
+    assert count(main, cf.RangeBranch) == count(main, cf.RangeNext) == 2
+    assert [main(*args) for args in inputs] == expected
+    with pytest.raises(ValueError, match="must not be zero"):
+        main(3, 0)
+
+
+def test_iterator_not_rewritten():
+    @basic_no_opt
+    def main(xs: ilist.IList[int, Any]):
+        x = 0
+        for i in xs:
+            x = x + i
+        return x
+
+    assert not cf.rewrite.RangeLoop().rewrite(main.code).has_done_something
+    assert count(main, cf.RangeBranch) == 0
+
+
+def test_scf2cf():
+    @structural(typeinfer=True, fold=False)
+    def main(n: int):
+        x = 0
+        for i in range(1, n):
+            x = x + i
+        return x
+
+    Walk(scf2cf.ScfToCfRule()).rewrite(main.code)
+    main = main.similar(basic)
+    assert cf.rewrite.RangeLoop().rewrite(main.code).has_done_something
+    main.verify()
+    assert count(main, cf.RangeNext) == 1
+    assert main(10) == 45
+
+
+def test_default_pipeline():
+    @basic(typeinfer=True)
+    def main(n: int, y: float):
+        for i in range(n):
+            y = y + i
+        return y
+
+    # the loops are canonicalized before type inference
+    assert count(main, py.iterable.Next) == 0
+    assert main.return_type.is_subseteq(types.Float)
+    branch = next(s for s in main.callable_region.walk() if isinstance(s, cf.RangeNext))
+    assert branch.index.type.is_subseteq(types.Int)
+    assert main(4, 0.5) == 6.5
+
+
+def test_constant_range():
+    @basic_no_opt
+    def main(x: int):
+        for i in range(3, 0):
+            x = x + i
+        for i in range(0, 3):
+            x = x + i
+        return x
+
+    cf.rewrite.RangeLoop().rewrite(main.code)
+    Fold(main.dialects)(main)
+    main.verify()
+    # the first loop is removed, the second one is entered unconditionally
+    assert count(main, cf.RangeBranch) == 0
+    assert count(main, cf.RangeNext) == 1
+    assert main(1) == 4
+
+
+def test_untyped_bounds():
+    @basic
+    def main(n):
+        x = 0
+        for i in range(n):
+            x = x + i
+        return x
+
+    # the bounds may not be integers, the range statement is kept
+    assert count(main, cf.RangeBranch) == 0
+    assert main(3) == 3
+    with pytest.raises(TypeError):
+        main(2.5)
+
+
+@pytest.mark.parametrize(
+    "module", ["kirin.dialects.cf", "kirin.dialects.py", "kirin.rewrite"]
+)
+def test_import_first(module: str):
+    # the dialects and the rewrite rules import each other
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
@@ -0,0 +1,89 @@
+import pytest
+
+from kirin import types
+from kirin.prelude import basic
+from kirin.dialects import math, ilist
+from kirin.dialects.ilist import array
+
+dialects = basic.add(math)
+
+
+@pytest.fixture
+def numpy_backend():
+    array.set_numpy_backend(True)
+    yield
+    array.set_numpy_backend(False)
+
+
+@dialects(typeinfer=True)
+def affine(x: int):
+    return x * 3 - 1
+
+
+@dialects(typeinfer=True)
+def wave(x: int):
+    return math.sin(x) * 0.5 + x / 4
+
+
+@dialects(typeinfer=True)
+def sum_squares(acc: int, x: int):
+    return acc + x * x
+
+
+@dialects(typeinfer=True)
+def inverse(x: int):
+    return 1 / x
+
+
+@dialects(typeinfer=True)
+def kernels(n: int):
+    xs = ilist.map(affine, ilist.range(n))
+    return ilist.foldl(sum_squares, xs, 0), ilist.map(wave, xs)
+
+
+@dialects(typeinfer=True)
+def build(n: int):
+    xs = []
+    for i in range(n):
+        xs = xs + [i * 2]
+    return xs
+
+
+def test_vectorized(numpy_backend):
+    array.set_numpy_backend(False)
+    expected = kernels(100)
+    array.set_numpy_backend(True)
+    total, waves = kernels(100)
+    assert isinstance(waves, array.ArrayIList)
+    assert type(total) is int and total == expected[0]
+    assert waves == expected[1]
+    assert type(waves[0]) is float
+    assert array.kernel(affine) is array.kernel(affine)
+    assert array.kernel(sum_squares, fold=True) is not None
+    assert array.kernel(sum_squares) is None
+
+
+def test_fallback(numpy_backend):
+    @dialects(typeinfer=True)
+    def main(n: int):
+        return ilist.map(inverse, ilist.range(n))
+
+    assert main(0) == ilist.IList([])
+    with pytest.raises(ZeroDivisionError):
+        main(3)
+
+
+def test_persistent_append(numpy_backend):
+    a = array.ArrayIList.new([1, 2], types.Int)
+    assert isinstance(a, array.ArrayIList)
+    b = a.push(3)
+    c = a.push(4)
+    d = b.push(5)
+    assert list(a) == [1, 2]
+    assert list(b) == [1, 2, 3] and list(c) == [1, 2, 4] and list(d) == [1, 2, 3, 5]
+    assert d._buffer is b._buffer
+    assert isinstance(a.push(1.5), ilist.IList) and list(a.push(1.5)) == [1, 2, 1.5]
+
+    xs = build(1000)
+    assert isinstance(xs, array.ArrayIList)
+    assert xs == ilist.IList(list(range(0, 2000, 2)))
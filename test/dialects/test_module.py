@@ -49,3 +49,83 @@ def test_module():
 
     dialects.update_symbol_table(method)
     assert method() == 1
+
+
+def make_function(name: str, value: int) -> func.Function:
+    return func.Function(
+        sym_name=name,
+        slots=(),
+        body=ir.Region(
+            ir.Block(
+                [x := py.Constant(value), func.Return(x.result)],
+                argtypes=(types.Any,),
+            )
+        ),
+        signature=func.Signature(inputs=(), output=types.Int),
+    )
+
+
+def test_symbol_index():
+    foo, bar = make_function("foo", 1), make_function("bar", 2)
+    mod = module.Module(
+        sym_name="test_module", entry="bar", body=ir.Region(ir.Block([foo, bar]))
+    )
+    assert ir.SymbolTable.symbols(mod) == {"foo": foo, "bar": bar}
+    assert module.ModuleEntryPoint().get_entry_point(mod) is bar
+
+    baz = make_function("baz", 3)
+    baz.insert_before(foo)
+    assert ir.SymbolTable.lookup(mod, "baz") is baz
+
+    # the first definition of a symbol wins
+    other = make_function("foo", 4)
+    other.insert_before(foo)
+    assert ir.SymbolTable.lookup(mod, "foo") is other
+    with pytest.raises(ir.ValidationError, match="duplicate symbols"):
+        mod.verify()
+
+    other.delete()
+    bar.delete()
+    assert ir.SymbolTable.symbols(mod) == {"baz": baz, "foo": foo}
+    with pytest.raises(ir.ValidationError, match="entry point not found"):
+        module.ModuleEntryPoint().get_entry_point(mod)
+
+
+def test_symbol_rename():
+    foo, bar = make_function("foo", 1), make_function("bar", 2)
+    mod = module.Module(
+        sym_name="test_module", entry="foo", body=ir.Region(ir.Block([foo, bar]))
+    )
+    assert ir.SymbolTable.lookup(mod, "foo") is foo
+
+    foo.sym_name = "baz"
+    assert ir.SymbolTable.lookup(mod, "foo") is None
+    assert ir.SymbolTable.lookup(mod, "baz") is foo
+
+    bar.attributes.update(sym_name=ir.PyAttr("foo"))
+    assert ir.SymbolTable.symbols(mod) == {"baz": foo, "foo": bar}
+
+
+def test_symbol_method_cache():
+    fn1 = make_function("foo", 1)
+    invoke = module.Invoke((), (), callee="foo")
+    fn2 = func.Function(
+        sym_name="main",
+        slots=(),
+        body=ir.Region(
+            ir.Block([invoke, func.Return(invoke.result)], argtypes=(types.Any,))
+        ),
+        signature=func.Signature(inputs=(), output=types.Int),
+    )
+    mod = module.Module(
+        sym_name="test_module", entry="main", body=ir.Region(ir.Block([fn1, fn2]))
+    )
+    dialects = basic.add(module)
+    method = ir.Method(dialects=dialects, code=mod)
+    dialects.update_symbol_table(method)
+
+    callee = dialects.symbol_method("foo")
+    assert callee is not None and callee.code is fn1
+    assert method() == 1
+    assert dialects.symbol_method("foo") is callee
+    assert dialects.symbol_method("missing") is None
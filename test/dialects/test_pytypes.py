@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from kirin.types import (
@@ -11,6 +13,7 @@ from kirin.types import (
     String,
     Vararg,
     AnyType,
+    Generic,
     Literal,
     PyClass,
     TypeVar,
@@ -112,3 +115,25 @@ def test_generic_topbottom():
     assert t.meet(TypeAttribute.bottom()).is_subseteq(TypeAttribute.bottom())
     assert t.join(TypeAttribute.top()).is_equal(TypeAttribute.top())
     assert t.meet(TypeAttribute.top()).is_equal(t)
+
+
+def test_interned():
+    assert Union(Int, Float) is Union(Float, Int)
+    assert Union(Int, Union(Float, String)) is Union(Int, Float, String)
+    assert Tuple[Int, Float] is Generic(tuple, Int, Float)
+    assert Tuple[Vararg(Int)] is Generic(tuple, Vararg(Int))
+    assert Vararg(Union(Int, Float)) is Vararg(Union(Float, Int))
+    assert TypeVar("T") is TypeVar("T", AnyType())
+    assert TypeVar("T") is not TypeVar("T", Int)
+    assert Literal(1) is Literal(1, Int)
+    assert Literal(1) is not Literal(True)
+    assert Int.join(Float) is Float.join(Int)
+
+    for typ in (
+        Int,
+        Literal(1),
+        Union(Int, Float),
+        Vararg(Int),
+        Generic(tuple, Int, Vararg(Float)),
+    ):
+        assert pickle.loads(pickle.dumps(typ)) is typ
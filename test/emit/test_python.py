@@ -0,0 +1,112 @@
+import pytest
+
+from kirin import emit
+from kirin.prelude import basic, structural, basic_no_opt
+from kirin.dialects import func, ilist
+
+
+@basic(typeinfer=True)
+def loops(n: int, step: int):
+    x = 0
+    for i in range(n, -n, step):
+        for j in range(i):
+            x = x + i * j
+        if x % 2 == 0:
+            x = x + 1
+        else:
+            x = x - 1
+    return x
+
+
+@basic_no_opt
+def branches(n: int):
+    x = 0
+    xs = [1, 2]
+    for i in range(n):
+        xs = xs + [i]
+        if i > 5:
+            x = x + len(xs)
+        elif i > 2:
+            x = x - 1
+            if x < 0:
+                return x
+    return x
+
+
+@structural(typeinfer=True, fold=False)
+def structured(n: int):
+    x = 0
+    for i in range(n):
+        if i > 2:
+            x = x + i
+        else:
+            x = x - 1
+    return x
+
+
+@basic(typeinfer=True)
+def lists(n: int):
+    xs = ilist.range(n)
+    ys = []
+    for x in xs:
+        ys = ys + [x * 2]
+    pair = (ys[0], ys[len(ys) - 1])
+    return pair[0] + pair[1] + len(ys)
+
+
+def compile(method):
+    python = emit.Python(method.dialects)
+    assert python.unsupported(method) is None
+    return python.compile(method)
+
+
+@pytest.mark.parametrize(
+    "method, inputs",
+    [
+        (loops, [(5, -1), (5, -2), (4, 1), (0, -1), (3, 3)]),
+        (branches, [(0,), (4,), (10,)]),
+        (structured, [(0,), (3,), (10,)]),
+        (lists, [(1,), (5,)]),
+    ],
+)
+def test_compile(method, inputs):
+    function = compile(method)
+    for args in inputs:
+        assert function(method, *args) == method(*args)
+
+
+def test_zero_step():
+    function = compile(loops)
+    with pytest.raises(ValueError, match="must not be zero"):
+        function(loops, 3, 0)
+
+
+def test_source():
+    source = emit.Python(loops.dialects).run(loops)
+    assert source.startswith("def _entry1(v_loops_self, v_n, v_step):")
+    # the counted loops need no iterator
+    assert "iter(" not in source and "next(" not in source
+    compile(loops)
+
+
+def test_callee():
+    @basic(typeinfer=True)
+    def callee_fib(n: int) -> int:
+        if n < 2:
+            return n
+        return callee_fib(n - 1) + callee_fib(n - 2)
+
+    function = compile(callee_fib)
+    assert function(callee_fib, 10) == 55
+
+
+def test_unsupported():
+    @basic(typeinfer=True)
+    def with_lambda(x: int):
+        def inner(y: int):
+            return x + y
+
+        return inner(1)
+
+    stmt = emit.Python(with_lambda.dialects).unsupported(with_lambda)
+    assert isinstance(stmt, func.Lambda)
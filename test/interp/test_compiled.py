@@ -0,0 +1,51 @@
+from kirin import interp
+from kirin.prelude import basic, basic_no_opt
+from kirin.dialects import py
+
+
+@basic_no_opt
+def kernel(n: int):
+    acc = 0
+    for i in range(n):
+        acc = acc + i * 2 - 1
+        if acc > 100:
+            acc = acc - 100
+    return acc
+
+
+@basic
+def closure(x: int):
+    def inner(y: int):
+        return x + y
+
+    return inner(1) + inner(2)
+
+
+def test_compiled_same_result():
+    plain = interp.Interpreter(basic_no_opt)
+    fast = interp.Interpreter(basic_no_opt, compiled=True)
+    for n in (0, 1, 10, 57):
+        assert plain.run(kernel, n)[1] == fast.run(kernel, n)[1]
+
+    fast = interp.Interpreter(basic, compiled=True)
+    assert fast.run(closure, 3)[1] == closure(3)
+
+
+def test_compiled_block_invalidation():
+    @basic_no_opt
+    def main(x: int):
+        return x + 1
+
+    fast = interp.Interpreter(basic_no_opt, compiled=True)
+    assert fast.run(main, 1)[1] == 2
+
+    block = main.callable_region.blocks[0]
+    compiled = fast.compile_block(block)
+    assert fast.compile_block(block) is compiled
+
+    stmt = block.stmts.at(1)
+    assert isinstance(stmt, py.binop.Add)
+    new_stmt = py.binop.Mult(stmt.lhs, stmt.rhs)
+    stmt.replace_by(new_stmt)
+    assert fast.compile_block(block) is not compiled
+    assert fast.run(main, 3)[1] == 3
@@ -1,4 +1,4 @@
-from kirin.ir import DialectGroup
+from kirin.ir import Dialect, DialectGroup
 from kirin.prelude import basic
 from kirin.analysis import const
 from kirin.dialects import cf, func
@@ -84,3 +84,75 @@ def test_recompile():
         return 3
 
     assert isinstance(ret.hints.get("const"), const.Value)
+
+
+def test_recompile_callers_once():
+    @basic
+    def leaf(x: int) -> int:  # type: ignore
+        return x + 1
+
+    @basic
+    def left(x: int) -> int:
+        return leaf(x) * 2
+
+    @basic
+    def right(x: int) -> int:
+        return leaf(x) + leaf(x)
+
+    @basic
+    def top(n: int) -> int:
+        return left(n) + right(n)
+
+    versions = {mt: mt.version for mt in (left, right, top)}
+    report = basic.recompile_callers(leaf)
+    assert report.redefined == [leaf]
+    assert report.recompiled.index(left) < report.recompiled.index(top)
+    assert report.recompiled.index(right) < report.recompiled.index(top)
+    assert sorted(mt.sym_name for mt in report.times) == ["left", "right", "top"]
+    assert all(mt.version == versions[mt] + 1 for mt in versions)
+    assert "recompiled 3 callers of leaf" in report.summary()
+
+    @basic
+    def leaf(x: int) -> int:  # noqa: F811
+        return x + 2
+
+    assert top(3) == 5 * 2 + 5 + 5
+    assert all(mt.version == versions[mt] + 2 for mt in versions)
+
+
+def test_interpreter_cache():
+    from kirin import interp
+
+    group = DialectGroup([base, cf])
+    assert group.registry is group.registry
+    table = group.registry.interpreter(keys=("main",))
+    assert group.registry.interpreter(keys=["main"]) is table
+    assert group.get_interpreter(interp.Interpreter) is group.get_interpreter(
+        interp.Interpreter
+    )
+    assert group.get_interpreter(interp.Interpreter).registry is table
+
+    # new groups start with fresh caches
+    assert group.add(func).registry is not group.registry
+
+    # registering a new method table invalidates the cache
+    dialect = Dialect("test_interpreter_cache")
+
+    @dialect.register
+    class Table(interp.MethodTable):
+        pass
+
+    assert group.registry.interpreter(keys=("main",)) is not table
+
+
+def test_method_call_reuses_interpreter():
+    from kirin import interp
+
+    @basic
+    def foo(x):
+        return x + 1
+
+    assert foo(1) == 2
+    cached = basic.get_interpreter(interp.Interpreter)
+    assert foo(2) == 3
+    assert basic.get_interpreter(interp.Interpreter) is cached
@@ -1,5 +1,6 @@
 from kirin import ir, types
-from kirin.dialects import func
+from kirin.prelude import basic_no_opt
+from kirin.dialects import py, func
 
 
 def test_is_equal_ignoring_hint():
@@ -26,3 +27,40 @@ def test_is_equal_ignoring_hint():
     )
 
     assert expected_func.is_equal(source_func)
+
+
+def make_kernel(n: int):
+    @basic_no_opt
+    def kernel(x: int):
+        y = x + n
+        if y > 2:
+            return y * x
+        return x
+
+    return kernel
+
+
+def test_structural_hash():
+    a, b, c = make_kernel(1), make_kernel(1), make_kernel(2)
+    assert a.code is not b.code
+    assert a.code.structural_hash() == b.code.structural_hash()
+    assert a.code.structural_hash() != c.code.structural_hash()
+    assert a.callable_region.is_equal(b.callable_region)
+
+    # swapping operands changes the positions the arguments are defined at
+    stmt = next(s for s in b.code.walk() if isinstance(s, py.Mult))
+    before = b.code.structural_hash()
+    stmt.args = (stmt.args[1], stmt.args[0])
+    assert b.code._structural_hash is None
+    assert b.code.structural_hash() != before
+
+    # the caches along the parent chain are dropped on changes
+    const = next(s for s in c.code.walk() if isinstance(s, py.Constant))
+    block = const.parent
+    assert block is not None and block._structural_hash is not None
+    const.value = ir.PyAttr(1)
+    assert block._structural_hash is None
+    assert c.code.structural_hash() == a.code.structural_hash()
+
+    py.Constant(3).insert_before(const)
+    assert c.code.structural_hash() != a.code.structural_hash()
@@ -1,5 +1,6 @@
 import pytest
 
+from kirin import ir
 from kirin.ir import Block
 from kirin.dialects import py
 
@@ -50,3 +51,47 @@ def test_stmt_from_stmt():
     y = x.from_stmt(x)
 
     assert y.result.hints["const"] == py.constant.types.Int
+
+
+def test_compact_layout():
+    x = py.Constant(1)
+    y = py.Constant(2)
+    z = py.Add(lhs=x.result, rhs=y.result)
+    block = Block([x, y, z])
+
+    for node in (z.result, block, ir.Region(block)):
+        assert not hasattr(node, "__dict__")
+    # the fields of statements are stored in the slots of `Statement`
+    assert "__dict__" not in vars(ir.Statement)
+    assert all(name in ir.Statement.__slots__ for name in ("_args", "attributes"))
+    assert z.result.uses == frozenset() and z.result._hints is None
+    assert x.result.uses == {ir.Use(z, 0)}
+    # statements of the same class share their argument slices
+    assert z._name_args_slice is py.Add(lhs=y.result, rhs=x.result)._name_args_slice
+
+    z.delete()
+    assert ir.Use(z, 0) not in x.result.uses
+    z.result.hints["const"] = ir.PyAttr(3)
+    assert z.result.hints == {"const": ir.PyAttr(3)}
+
+
+def test_statement_attributes():
+    class Tagged(py.Constant):
+        def __init__(self, value, tag: str):
+            super().__init__(value)
+            self.tag = tag
+
+    # subclasses that do not declare `__slots__` can store attributes
+    stmt = Tagged(1, "a")
+    assert stmt.tag == "a"
+    assert stmt.value.unwrap() == 1
+
+
+def test_attributes_invalidate_hash():
+    stmt = py.Constant(1)
+    block = Block([stmt])
+    before = block.structural_hash()
+    stmt.attributes["value"] = ir.PyAttr(2)
+    assert block._structural_hash is None
+    assert block.structural_hash() != before
+    assert block.structural_hash() == Block([py.Constant(2)]).structural_hash()
@@ -0,0 +1,145 @@
+import pytest
+
+from kirin import ir, parse, types
+from kirin.prelude import basic, structural, basic_no_opt
+from kirin.dialects import py, func, ilist, module
+
+
+@basic(typeinfer=True)
+def helper(x: int) -> int:
+    return x * 2
+
+
+@basic(typeinfer=True)
+def kernel(x: int, y: float):
+    z = (x, y, "a\nb", None, -1.5, 2j)
+    if x > 2:
+        w = helper(x) + 1
+    else:
+        w = -x
+    for i in range(w):
+        y = y + i
+    assert y > 0, "negative"
+    return z, y, kernel
+
+
+@structural(typeinfer=True, fold=False)
+def loops(n: int):
+    xs = []
+    for i in range(n):
+        if i > 2:
+            xs = xs + [i * 2.0]
+
+    def shift(x: float):
+        return x - n
+
+    return ilist.map(shift, xs), xs[1:2]
+
+
+def roundtrip(mt: ir.Method, **methods: ir.Method) -> ir.Method:
+    text = mt.print_str()
+    loaded = parse.parse_method(text, mt.dialects, methods)
+    loaded.verify()
+    assert loaded.print_str() == text
+    return loaded
+
+
+def test_roundtrip_method():
+    loaded = roundtrip(helper)
+    assert loaded.sym_name == "helper"
+    assert loaded.arg_names == ["#self#", "x"]
+    assert loaded(21) == 42
+
+
+def test_self_and_method_refs():
+    with pytest.raises(parse.ParseError, match="helper"):
+        parse.parse_method(kernel.print_str(), basic)
+
+    loaded = roundtrip(kernel, helper=helper)
+    assert loaded in helper.backedges
+    z, y, self = loaded(3, 1.0)
+    assert (z, y) == kernel(3, 1.0)[:2]
+    assert self is loaded
+
+
+def test_several_methods():
+    parser = parse.Parser(helper.print_str() + kernel.print_str(), basic)
+    loaded_helper = parser.parse_method()
+    loaded = parser.parse_method()
+    assert parser.at_end()
+    assert parser.methods == {"helper": loaded_helper, "kernel": loaded}
+    assert loaded in loaded_helper.backedges
+    assert loaded(4, 2.0)[:2] == kernel(4, 2.0)[:2]
+
+
+def test_structural():
+    loaded = roundtrip(loops)
+    assert loaded(5) == loops(5)
+
+    # the types of unused block arguments are recovered from the signature
+    entry = loaded.callable_region.blocks[0]
+    assert entry.args[1].type == types.Int
+    assert entry.args[0].type.is_subseteq(types.MethodType)
+
+
+def test_names():
+    @basic_no_opt
+    def names(x: int):
+        if x > 1:
+            x = x + 1
+        else:
+            x = x + 2
+        return x
+
+    loaded = roundtrip(names)
+    assert [arg.name for arg in loaded.callable_region.blocks[-1].args] == ["x"]
+
+
+def test_module():
+    body = ir.Block([x := py.Constant(1), func.Return(x.result)])
+    body.args.append_from(types.Any)
+    foo = func.Function(
+        sym_name="foo",
+        body=ir.Region(body),
+        signature=func.Signature(inputs=(), output=types.Int),
+    )
+    body = ir.Block([x := module.Invoke((), (), callee="foo"), func.Return(x.result)])
+    body.args.append_from(types.Any)
+    main = func.Function(
+        sym_name="main",
+        body=ir.Region(body),
+        signature=func.Signature(inputs=(), output=types.Int),
+    )
+    mod = module.Module(
+        sym_name="test_module", entry="main", body=ir.Region(ir.Block([foo, main]))
+    )
+    dialects = basic.add(module)
+    method = ir.Method(dialects=dialects, code=mod)
+
+    loaded = roundtrip(method)
+    assert isinstance(loaded.code, module.Module)
+    assert loaded.code.entry == "main"
+    dialects.update_symbol_table(loaded)
+    assert loaded() == 1
+
+
+def test_statement():
+    stmt = parse.parse_statement(
+        "%x = py.constant.constant IList([1, 2]) : !py.IList[!py.int, Literal(2,int)]",
+        basic.add(ilist),
+    )
+    assert isinstance(stmt, py.Constant)
+    assert stmt.value == ilist.IList([1, 2])
+    assert stmt.result.name == "x"
+    assert stmt.result.type == ilist.IListType[types.Int, types.Literal(2)]
+
+
+def test_errors():
+    with pytest.raises(parse.ParseError, match="unknown statement 'py.foo'"):
+        parse.parse_statement("%x = py.foo(%y) : !py.int", basic)
+
+    with pytest.raises(parse.ParseError, match="undefined SSA value %y"):
+        parse.parse_statement("%x = py.binop.add(%y, %y) : !py.int", basic)
+
+    with pytest.raises(parse.ParseError, match="line 2, column 3"):
+        parse.parse_statement("%x = py.constant.constant 1 : !py.int\n  )", basic)
@@ -0,0 +1,100 @@
+from kirin import ir
+from kirin.passes import Fold, Pass, Default, HintConst, TypeInfer, PassManager
+from kirin.prelude import basic_no_opt
+from kirin.analysis import const
+from kirin.rewrite.abc import RewriteResult
+
+
+@basic_no_opt
+def foo(x: int):
+    y = x + 1
+    z = 2 * 3
+    if y > z:
+        return y
+    return z + x
+
+
+def test_default_shares_analyses():
+    mt = foo.similar()
+    default = Default(mt.dialects)
+    with default.manager.scope():
+        cache = default.manager.analyses(mt)
+        default.fixpoint(mt)
+
+    stats = default.manager.stats
+    assert stats["Default"].runs == stats["Default"].changes + 1
+    # TypeInfer and Fold both run HintConst on each iteration, Fold reuses
+    # the constant propagation of TypeInfer
+    assert stats["HintConst"].runs == 2 * stats["Default"].runs
+    assert cache.hits >= stats["Default"].runs
+    assert mt(3) == 9
+
+
+def test_fixpoint_stops():
+    @basic_no_opt
+    def bar(x: int):
+        return x + 1
+
+    default = Default(bar.dialects)
+    default.fixpoint(bar)
+    default.fixpoint(bar)
+    assert default.manager.stats["Default"].runs <= 4
+
+
+def test_default_reinfers_range_loops():
+    @basic_no_opt
+    def loop(n: int):
+        x = 0
+        # the type of the bound is only known after inference
+        for i in range(n + 1):
+            x = x + i
+        return x
+
+    for mt, runs in ((foo.similar(), 1), (loop.similar(), 2)):
+        default = Default(mt.dialects)
+        default(mt)
+        # only the loops rewritten by RangeLoop are inferred a second time
+        assert default.manager.stats["TypeInfer"].runs == runs
+
+    assert loop(4) == 10
+
+
+def test_invalidate():
+    manager = PassManager()
+    mt = foo.similar()
+    hint_const = HintConst(mt.dialects, manager=manager)
+    fold = Fold(mt.dialects, manager=manager)
+    with manager.scope():
+        cache = manager.analyses(mt)
+        manager.run(hint_const, mt)
+        manager.run(hint_const, mt)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        assert manager.run(fold, mt).has_done_something
+        # reused by the folding, then invalidated
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert not cache.results
+
+    # dropped at the end of the outermost run
+    assert manager.analyses(mt) is not cache
+
+
+def test_preserves():
+    class Nothing(Pass):
+        preserves = frozenset({const.Propagate})
+
+        def unsafe_run(self, mt: ir.Method) -> RewriteResult:
+            return RewriteResult(has_done_something=True)
+
+    mt = foo.similar()
+    typeinfer = TypeInfer(mt.dialects)
+    manager = typeinfer.manager
+    with manager.scope():
+        cache = manager.analyses(mt)
+        typeinfer(mt)
+        assert len(cache.results) == 2
+        manager.run(Nothing(mt.dialects), mt)
+        assert [key[0] for key in cache.results] == [const.Propagate]
+
+    assert manager.stats["Nothing"].changes == 1
+    assert "TypeInfer" in manager.summary()
@@ -0,0 +1,73 @@
+import io
+
+from kirin import ir
+from kirin.print import Printer, PlainPrinter
+from kirin.prelude import basic, structural
+from kirin.analysis import TypeInference
+from kirin.dialects import ilist
+
+
+@basic
+def closure(start, stop):
+    def foo(aod):
+        def moo(aod):
+            return start, aod
+
+        return moo
+
+    return foo(stop)
+
+
+@basic
+def branches(x: int):
+    y = x + 1
+    if y > 10:
+        z = y
+    else:
+        z = y + 1.2
+    return z
+
+
+@structural(typeinfer=True)
+def loops(n: int):
+    xs = []
+    for i in range(n):
+        if i > 2:
+            xs = xs + [i * 2.0]
+
+    def shift(x: float):
+        return x - 1
+
+    return ilist.map(shift, xs), "a\nb"
+
+
+def rich_str(node: ir.IRNode | ir.Method, end: str = "\n", **options) -> str:
+    return node.print_str(Printer(**options), end=end)
+
+
+def test_same_text():
+    for mt in (closure, branches, loops):
+        for node in (mt, mt.code, mt.callable_region, mt.callable_region.blocks[0]):
+            assert node.print_str(PlainPrinter()) == rich_str(node)
+        assert mt.print_str(PlainPrinter(show_indent_mark=False)) == rich_str(
+            mt, show_indent_mark=False
+        )
+
+    frame, _ = TypeInference(loops.dialects).run(loops)
+    assert loops.print_str(PlainPrinter(analysis=frame.entries)) == rich_str(
+        loops, analysis=frame.entries
+    )
+    assert loops.print_str(PlainPrinter(hint="const")) == rich_str(loops, hint="const")
+
+
+def test_stream():
+    stream = io.StringIO()
+    printer = PlainPrinter(stream=stream)
+    printer.print(branches.callable_region.blocks[0])
+    # blocks are written as soon as they are printed
+    assert stream.getvalue() == rich_str(branches.callable_region.blocks[0], end="")
+    assert not printer.buffer
+
+    stream = io.StringIO()
+    branches.print(PlainPrinter(stream=stream))
+    assert stream.getvalue() == rich_str(branches)
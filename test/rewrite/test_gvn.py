@@ -0,0 +1,90 @@
+from kirin import ir, types
+from kirin.prelude import basic_no_opt, structural_no_opt
+from kirin.rewrite import GlobalValueNumbering
+from kirin.analysis import CFG, DominatorTree
+from kirin.dialects import py
+
+
+def count(mt: ir.Method, stmt_type: type[ir.Statement]) -> int:
+    return sum(isinstance(stmt, stmt_type) for stmt in mt.code.walk())
+
+
+def test_across_blocks():
+    @basic_no_opt
+    def main(x: int, y: int):
+        a = x * y
+        if a > 0:
+            b = y * x
+            c = (x + y) * (y + x)
+        else:
+            b = x * y
+            c = y + x
+        return a + b + c + (x + y)
+
+    before = main(2, 3)
+    assert count(main, py.Mult) == 4
+    assert count(main, py.Add) == 7
+    result = GlobalValueNumbering().rewrite(main.code)
+    assert result.has_done_something
+    main.verify()
+    # the multiplications in the branches are dominated by the first one,
+    # the additions in the branches do not dominate each other
+    assert count(main, py.Mult) == 2
+    assert count(main, py.Add) == 6
+    assert main(2, 3) == before
+    assert not GlobalValueNumbering().rewrite(main.code).has_done_something
+
+
+def test_not_commutative():
+    @basic_no_opt
+    def main(x: str, y: str):
+        return (x + y) + (y + x) + (x + y)
+
+    GlobalValueNumbering().rewrite(main.code)
+    assert count(main, py.Add) == 4
+    assert main("a", "b") == "abbaab"
+
+
+def test_nested_region():
+    @structural_no_opt
+    def main(x: int):
+        a = x * 2
+        if x > 0:
+            b = x * 2
+        else:
+            b = 1
+        return a + b
+
+    before = main(3)
+    GlobalValueNumbering().rewrite(main.code)
+    main.verify()
+    assert count(main, py.Mult) == 1
+    assert main(3) == before
+
+
+def test_dominator_tree():
+    @basic_no_opt
+    def main(x: int):
+        if x > 0:
+            y = 1
+        else:
+            y = 2
+        return y
+
+    region = main.callable_region
+    tree = DominatorTree(CFG(region))
+    entry, *_, exit_ = region.blocks
+    assert tree.root is entry
+    assert all(tree.dominates(entry, block) for block in region.blocks)
+    assert not any(
+        tree.strictly_dominates(block, exit_)
+        for block in region.blocks
+        if block is not entry
+    )
+    assert list(tree.preorder())[0] is entry
+    assert tree.idom[entry] is None
+
+    unreachable = ir.Block(argtypes=(types.Int,))
+    region.blocks.append(unreachable)
+    tree = DominatorTree(CFG(region))
+    assert not tree.dominates(entry, unreachable)
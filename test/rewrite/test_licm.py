@@ -0,0 +1,148 @@
+from kirin import ir
+from kirin.passes import LICM, TypeInfer
+from kirin.prelude import basic, basic_no_opt, structural_no_opt
+from kirin.rewrite import LoopInvariantCodeMotion
+from kirin.analysis import CFG
+from kirin.dialects import cf, py, scf, func
+
+
+def depths(mt: ir.Method, stmt_type: type[ir.Statement]) -> list[int]:
+    """The loop depth of each statement of a type in a CFG region."""
+    loops = CFG(mt.callable_region).loops
+    return sorted(
+        loops.depth(stmt.parent_block)  # type: ignore
+        for stmt in mt.callable_region.stmts()
+        if isinstance(stmt, stmt_type)
+    )
+
+
+def test_cf_loops():
+    @basic_no_opt
+    def main(n: int, m: int):
+        x = 0
+        for i in range(n):
+            for j in range(n):
+                x = x + (m * 2 + 1) * i + j * (m - 3)
+        return x
+
+    before = main(5, 7)
+    assert depths(main, py.Mult) == [2, 2, 2]
+    TypeInfer(main.dialects)(main)
+    result = LoopInvariantCodeMotion().rewrite(main.code)
+    assert result.has_done_something
+    main.verify()
+    # m * 2 and m - 3 leave both loops, (m * 2 + 1) * i may raise as the
+    # type of i is unknown, it stays in the inner loop which may not run
+    assert depths(main, py.Mult) == [0, 2, 2]
+    assert depths(main, py.Sub) == [0]
+    assert main(5, 7) == before
+    assert main(0, 7) == 0
+
+
+def test_counted_loops():
+    @basic_no_opt
+    def main(n: int, m: int):
+        x = 0
+        for i in range(n):
+            for j in range(n):
+                x = x + (m * 2 + 1) * i + j * (m - 3)
+        return x
+
+    before = main(5, 7)
+    TypeInfer(main.dialects)(main)
+    cf.rewrite.RangeLoop().rewrite(main.code)
+    LoopInvariantCodeMotion().rewrite(main.code)
+    main.verify()
+    assert depths(main, py.Mult) == [0, 1, 2]
+    assert depths(main, py.Sub) == [0]
+    assert main(5, 7) == before
+
+
+def test_scf_for():
+    @structural_no_opt
+    def main(n: int, m: int):
+        x = 0
+        for i in range(n):
+            for j in range(n):
+                x = x + (m * 2 + 1) * i + j * (m - 3)
+        return x
+
+    before = main(5, 7)
+    TypeInfer(main.dialects)(main)
+    LoopInvariantCodeMotion().rewrite(main.code)
+    main.verify()
+    outer = next(s for s in main.callable_region.walk() if isinstance(s, scf.For))
+    inner = next(s for s in outer.body.walk() if isinstance(s, scf.For))
+    assert sum(isinstance(s, py.Mult) for s in outer.body.blocks[0].stmts) == 1
+    assert sum(isinstance(s, py.Mult) for s in inner.body.blocks[0].stmts) == 1
+    assert not any(isinstance(s, py.Sub) for s in outer.body.walk())
+    assert main(5, 7) == before
+
+
+def test_maybe_pure_call():
+    @basic
+    def square(x: int) -> int:
+        return x * x
+
+    @basic_no_opt
+    def main(n: int, m: int):
+        x = 0
+        for i in range(4):
+            x = x + square(m) * i
+        return x
+
+    before = main(4, 3)
+    TypeInfer(main.dialects)(main)
+    cf.rewrite.RangeLoop().rewrite(main.code)
+    assert depths(main, func.Invoke) == [1]
+    LICM(main.dialects)(main)
+    # the call may raise, it is hoisted because the loop runs
+    assert depths(main, func.Invoke) == [0]
+    assert main(4, 3) == before
+
+
+def test_zero_trip_division():
+    @basic_no_opt
+    def main(n: int, a: int, b: int):
+        x = 0
+        for i in range(n):
+            x = x + a // b
+        return x
+
+    TypeInfer(main.dialects)(main)
+    LoopInvariantCodeMotion().rewrite(main.code)
+    assert depths(main, py.FloorDiv) == [1]
+    assert main(0, 1, 0) == 0
+
+    cf.rewrite.RangeLoop().rewrite(main.code)
+    LoopInvariantCodeMotion().rewrite(main.code)
+    assert depths(main, py.FloorDiv) == [1]
+    assert main(0, 1, 0) == 0
+
+
+def test_scf_zero_trip_division():
+    @structural_no_opt
+    def main(n: int, a: int, b: int):
+        x = 0
+        for i in range(n):
+            x = x + a // b
+        return x
+
+    @structural_no_opt
+    def runs(a: int, b: int):
+        x = 0
+        for i in range(3):
+            x = x + a // b
+        return x
+
+    for method in (main, runs):
+        LICM(method.dialects)(method)
+    assert any(isinstance(s, py.FloorDiv) for s in loop_body(main))
+    assert main(0, 1, 0) == 0
+    assert not any(isinstance(s, py.FloorDiv) for s in loop_body(runs))
+    assert runs(7, 2) == 9
+
+
+def loop_body(mt: ir.Method) -> list[ir.Statement]:
+    loop = next(s for s in mt.callable_region.walk() if isinstance(s, scf.For))
+    return list(loop.body.walk())
@@ -0,0 +1,53 @@
+from dataclasses import field, dataclass
+
+from kirin import ir
+from kirin.prelude import basic_no_opt
+from kirin.rewrite import Walk, Chain
+from kirin.dialects import py, func
+from kirin.rewrite.abc import RewriteRule, RewriteResult
+
+
+@dataclass
+class Record(RewriteRule):
+    visited: list[type[ir.IRNode]] = field(default_factory=list)
+
+    def rewrite(self, node: ir.IRNode) -> RewriteResult:
+        self.visited.append(type(node))
+        return RewriteResult()
+
+
+@dataclass
+class RecordAdd(Record):
+    matches = (py.Add,)
+
+
+@dataclass
+class RecordPure(Record):
+    matches = (ir.Pure,)
+
+
+@basic_no_opt
+def main(x: int):
+    y = x + 1
+    return y - 2
+
+
+def test_chain_dispatch():
+    anything, add, pure = Record(), RecordAdd(), RecordPure()
+    chain = Chain(anything, add, pure)
+    Walk(chain).rewrite(main.code)
+
+    assert set(anything.visited) == {
+        ir.Region,
+        ir.Block,
+        func.Function,
+        py.Constant,
+        py.Add,
+        py.Sub,
+        func.Return,
+    }
+    assert add.visited == [py.Add]
+    assert set(pure.visited) == {py.Constant, py.Add, py.Sub}
+    assert chain.rules_for(func.Return) == [anything]
+    assert not Chain(add, pure).is_applicable(ir.Block)
+    assert Chain(add, pure).is_applicable(py.Constant)
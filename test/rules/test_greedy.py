@@ -0,0 +1,67 @@
+from kirin import ir
+from kirin.passes import Fold
+from kirin.prelude import basic_no_opt
+from kirin.rewrite import Walk, Chain, Greedy, Fixpoint
+from kirin.analysis import const
+from kirin.dialects import py
+from kirin.rewrite.dce import DeadCodeElimination
+from kirin.rewrite.fold import ConstantFold
+from kirin.rewrite.wrap_const import WrapConst
+
+
+def make_foldable():
+    @basic_no_opt
+    def foldable(x: int) -> int:
+        y = 1
+        b = y + 2
+        c = y + b
+        d = c + 4
+        return d + x
+
+    frame, _ = const.Propagate(foldable.dialects).run(foldable)
+    Walk(WrapConst(frame)).rewrite(foldable.code)
+    return foldable
+
+
+def stmt_types(mt: ir.Method):
+    return [type(stmt) for stmt in mt.callable_region.walk()]
+
+
+def test_greedy_same_as_fixpoint():
+    expected = make_foldable()
+    Fixpoint(Walk(Chain(ConstantFold(), DeadCodeElimination()))).rewrite(expected.code)
+
+    mt = make_foldable()
+    greedy = Greedy(ConstantFold(), DeadCodeElimination())
+    result = greedy.rewrite(mt.code)
+    mt.code.verify()
+
+    assert result.has_done_something
+    assert stmt_types(mt) == stmt_types(expected)
+    assert mt(1) == expected(1) == 9
+    # 3 additions folded, then the 3 additions and 5 constants are dead
+    assert greedy.hits == [3, 8]
+    assert not greedy.rewrite(mt.code).has_done_something
+    assert greedy.hits == [0, 0]
+
+
+def test_greedy_cascade():
+    @basic_no_opt
+    def dead(x: int):
+        a = x + 1
+        b = a + 2
+        c = b + 3  # noqa: F841
+        return x
+
+    greedy = Greedy(DeadCodeElimination())
+    greedy.rewrite(dead.code)
+    assert not any(isinstance(stmt, py.Add) for stmt in dead.callable_region.walk())
+    assert greedy.hits[0] >= 3
+
+
+def test_fold_pass_greedy():
+    expected, mt = make_foldable(), make_foldable()
+    Fold(expected.dialects)(expected)
+    Fold(mt.dialects, greedy=True)(mt)
+    assert stmt_types(mt) == stmt_types(expected)
+    assert mt(1) == expected(1) == 9
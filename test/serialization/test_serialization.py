@@ -0,0 +1,169 @@
+import io
+import pickle
+from dataclasses import dataclass
+
+import pytest
+
+from kirin import ir, types, serialization
+from kirin.prelude import basic, basic_no_opt
+from kirin.dialects import py, func
+from kirin.serialization import format
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int
+    y: int
+
+
+class Exploit:
+    def __reduce__(self):
+        return (print, ("unpickled",))
+
+
+@basic(typeinfer=True)
+def helper(x: int) -> int:
+    return x * 2
+
+
+@basic(typeinfer=True)
+def kernel(x: int, y: float):
+    z = (x, y, "a", None, 1.5)
+    if x > 2:
+        w = helper(x) + 1
+    else:
+        w = -x
+    for i in range(w):
+        y = y + i
+    return z, y, kernel
+
+
+def test_roundtrip_method():
+    data = serialization.dumps(helper)
+    assert data.startswith(serialization.format.MAGIC)
+
+    loaded = serialization.loads(data, basic)
+    assert isinstance(loaded, ir.Method)
+    assert loaded.print_str() == helper.print_str()
+    assert loaded.inferred
+    assert loaded(21) == 42
+
+
+def test_self_and_method_refs():
+    class Writer(serialization.Writer):
+        def method_ref(self, method: ir.Method):
+            return method.sym_name
+
+    class Reader(serialization.Reader):
+        def resolve_method(self, ref):
+            return {"helper": helper}[ref]
+
+    with pytest.raises(TypeError):
+        serialization.dumps(kernel)
+
+    stream = io.BytesIO()
+    Writer(stream).write_method(kernel)
+    stream.seek(0)
+    loaded = Reader(stream, basic).read_method()
+    assert loaded.print_str() == kernel.print_str()
+    assert loaded in helper.backedges
+    z, y, self = loaded(3, 1.0)
+    assert (z, y) == kernel(3, 1.0)[:2]
+    assert self is loaded
+
+
+def test_stream_statements():
+    stream = io.BytesIO()
+    writer = serialization.Writer(stream, flush_size=16)
+    stmts = [py.Constant(1), py.Constant(ir.PyAttr(2.0, types.Float)), func.Return()]
+    for stmt in stmts:
+        writer.write(stmt)
+    stream.seek(0)
+
+    reader = serialization.Reader(stream, chunk_size=3)
+    for stmt in stmts:
+        assert not reader.at_end()
+        loaded = reader.read()
+        assert loaded.is_structurally_equal(stmt)
+    assert reader.at_end()
+
+
+def test_large_method():
+    block = ir.Block(argtypes=(types.MethodType, types.Int))
+    value: ir.SSAValue = block.args[1]
+    for i in range(10_000):
+        const = py.Constant(i)
+        add = py.Add(value, const.result)
+        block.stmts.append(const)
+        block.stmts.append(add)
+        value = add.result
+    block.stmts.append(func.Return(value))
+    code = func.Function(
+        sym_name="large",
+        signature=func.Signature((types.Int,), types.Int),
+        body=ir.Region(block),
+    )
+    method = ir.Method(
+        dialects=basic_no_opt, code=code, arg_names=["#self#", "x"], sym_name="large"
+    )
+
+    loaded = serialization.loads(serialization.dumps(method), basic_no_opt)
+    assert loaded.code.is_structurally_equal(method.code)
+    assert loaded(1) == method(1)
+
+
+def test_invalid_stream():
+    with pytest.raises(ValueError):
+        serialization.loads(b"nope!")
+    with pytest.raises(EOFError):
+        serialization.loads(serialization.dumps(helper)[:-3], basic)
+
+
+def test_untrusted_pickle(capsys):
+    data = serialization.dumps(py.Constant(Point(1, 2)))
+    with pytest.raises(ValueError, match="Point is not allowed"):
+        serialization.loads(data)
+    loaded = serialization.loads(data, trusted=True)
+    assert loaded.value.unwrap() == Point(1, 2)
+
+    # kirin types are allowed
+    signature = func.Signature((types.Int,), types.Int)
+    data = serialization.dumps(py.Constant(signature))
+    assert serialization.loads(data).value.unwrap() == signature
+
+    with pytest.raises(ValueError, match="Exploit is not allowed"):
+        serialization.loads(serialization.dumps(py.Constant(Exploit())))
+    assert capsys.readouterr().out == ""
+
+
+def pool(*records: bytes) -> bytes:
+    stream = format.MAGIC + bytes([format.VERSION])
+    for record in records:
+        stream += bytes([format.DEF]) + record
+    return stream + bytes([format.STMT])
+
+
+def test_untrusted_dotted_name(tmp_path):
+    import kirin.cache  # noqa: F401, imports io
+
+    target = tmp_path / "created"
+    payload = f"ckirin.cache\nio.FileIO\n(S'{target}'\nS'w'\ntR.".encode()
+    stream = pool(bytes([format.PICKLE, len(payload)]) + payload)
+    with pytest.raises(pickle.UnpicklingError, match="not allowed"):
+        serialization.Reader(io.BytesIO(stream)).read()
+    assert not target.exists()
+
+    stream = pool(
+        bytes([format.STR, len(b"kirin.cache")]) + b"kirin.cache",
+        bytes([format.STR, len(b"io.FileIO")]) + b"io.FileIO",
+        bytes([format.CLASS, 1, 2]),
+    )
+    with pytest.raises(ValueError, match="not allowed"):
+        serialization.Reader(io.BytesIO(stream)).read()
+
+    # classes with side effects are not allowed either
+    payload = f"ckirin.cache\nCompileCache\n(S'{target}'\ntR.".encode()
+    stream = pool(bytes([format.PICKLE, len(payload)]) + payload)
+    with pytest.raises(pickle.UnpicklingError, match="not allowed"):
+        serialization.Reader(io.BytesIO(stream)).read()
+    assert not target.exists()
@@ -0,0 +1,189 @@
+import threading
+import importlib.util
+
+import pytest
+
+from kirin import batch
+from kirin.prelude import basic, basic_no_opt
+
+SOURCE = """
+from kirin.prelude import basic
+
+
+@basic
+def g(x: int) -> int:
+    return x + 3
+
+
+@basic(typeinfer=True)
+def f(x: int):
+    for i in range(x):
+        x = g(x) + i
+    return x
+
+
+@basic
+def fib(n: int) -> int:
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+
+@basic
+def h(n: int):
+    return f(n) + g(n) + fib(n)
+"""
+
+
+def load(tmp_path, name: str):
+    path = tmp_path / "kernels.py"
+    path.write_text(SOURCE)
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_compile_module(tmp_path):
+    expected = load(tmp_path, "kernels_serial")
+    with batch.compiling(max_workers=2) as b:
+        mod = load(tmp_path, "kernels_batch")
+
+    report = b.report
+    assert report is not None
+    assert set(report.times) == {mod.g, mod.f, mod.fib, mod.h}
+    assert len(report.components) == 4
+    assert report.workers == 2
+    assert report.in_process == []
+    # callees are compiled first
+    order = [m for component in report.components for m in component]
+    assert order.index(mod.g) < order.index(mod.f) < order.index(mod.h)
+    assert order.index(mod.fib) < order.index(mod.h)
+
+    for name in ("g", "f", "fib", "h"):
+        assert getattr(mod, name).print_str() == getattr(expected, name).print_str()
+    assert mod.f.inferred
+    assert mod.h(4) == expected.h(4)
+    assert mod.fib(10) == 55
+
+
+def test_compile_methods_in_process():
+    @basic_no_opt
+    def foo(x: int):
+        return x + 1
+
+    calls = []
+    run_passes = foo.run_passes
+    foo.run_passes = lambda mt: (calls.append(mt), run_passes(mt))  # type: ignore
+
+    report = batch.compile_methods([foo, foo], max_workers=1)
+    assert calls == [foo]
+    assert report.in_process == [foo]
+    assert report.workers == 0
+    assert "1 methods" in report.summary()
+
+
+def test_redefine_in_batch():
+    @basic
+    def callee(x: int) -> int:
+        return x + 1
+
+    @basic
+    def caller(x: int):
+        return callee(x)
+
+    with batch.compiling(max_workers=1) as b:
+
+        @basic
+        def callee(x: int) -> int:  # noqa: F811
+            return x + 2
+
+    assert b.report is not None
+    assert [m.sym_name for c in b.report.components for m in c] == [
+        "callee",
+        "caller",
+    ]
+    assert caller(1) == 3
+
+
+def test_error_in_block():
+    with pytest.raises(ZeroDivisionError):
+        with batch.compiling(max_workers=1) as b:
+
+            @basic_no_opt
+            def before_error(x: int):
+                return x + 1
+
+            1 / 0
+
+    assert b.report is not None
+    assert b.report.in_process == [before_error]
+    assert before_error(1) == 2
+
+
+def test_worker_error(monkeypatch):
+    @basic
+    def first(x: int):
+        return x + 1
+
+    @basic
+    def second(x: int):
+        return x * 2
+
+    def write_method(self, method):
+        raise TypeError("cannot serialize")
+
+    # NOTE: inherited by the forked workers
+    monkeypatch.setattr(batch._Writer, "write_method", write_method)
+    report = batch.compile_methods([first, second], max_workers=2)
+    if report.workers == 0:
+        pytest.skip("no worker processes")
+    assert set(report.in_process) == {first, second}
+    assert len(report.errors) == 2
+    assert all("cannot serialize" in error for error in report.errors)
+    assert first(1) == 2 and second(2) == 4
+
+
+def test_other_thread():
+    defined = []
+
+    def define():
+        @basic_no_opt
+        def in_thread(x: int):
+            return x + 1
+
+        defined.append(in_thread)
+
+    with batch.compiling(max_workers=1) as b:
+        thread = threading.Thread(target=define)
+        thread.start()
+        thread.join()
+        assert batch.current_batch() is b
+        assert not b.methods
+    assert b.report is not None and not b.report.components
+    assert defined[0](1) == 2
+
+
+def test_interrupted_block():
+    with pytest.raises(KeyboardInterrupt):
+        with batch.compiling(max_workers=1) as b:
+
+            @basic_no_opt
+            def interrupted(x: int):
+                return x + 1
+
+            raise KeyboardInterrupt
+    assert b.report is None and interrupted in b.methods
+    assert batch.current_batch() is None
+
+
+def test_compile_error_in_block(monkeypatch):
+    def compile_methods(methods, max_workers=None):
+        raise RuntimeError("compilation failed")
+
+    monkeypatch.setattr(batch, "compile_methods", compile_methods)
+    with pytest.raises(ZeroDivisionError) as info:
+        with batch.compiling(max_workers=1):
+            1 / 0
+    assert isinstance(info.value.__context__, RuntimeError)
@@ -0,0 +1,111 @@
+import importlib.util
+
+from kirin.cache import (
+    CompileCache,
+    ContentCache,
+    set_compile_cache,
+    set_content_cache,
+)
+
+SOURCE = """
+from kirin.prelude import basic
+
+N = {n}
+
+
+@basic
+def g(x: int) -> int:
+    return x + N
+
+
+@basic(typeinfer=True)
+def f(x: int):
+    for i in range(x):
+        x = g(x) + i
+    return x
+
+
+@basic
+def fib(n: int) -> int:
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+"""
+
+
+def load(tmp_path, name: str, n: int = 3):
+    path = tmp_path / "kernels.py"
+    path.write_text(SOURCE.format(n=n))
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_compile_cache(tmp_path):
+    cache = CompileCache(tmp_path / "cache")
+    set_compile_cache(cache)
+    try:
+        first = load(tmp_path, "kernels_1")
+        assert (cache.hits, cache.misses) == (0, 3)
+
+        second = load(tmp_path, "kernels_2")
+        assert (cache.hits, cache.misses) == (3, 3)
+        assert second.f(3) == first.f(3) == 15
+        assert second.fib(10) == 55
+        assert second.f.inferred
+        assert second.f.print_str() == first.f.print_str()
+        assert second.fib.print_str() == first.fib.print_str()
+        # callees are resolved to the methods of the new module
+        assert second.f in second.g.backedges
+        assert second.fib in second.fib.backedges
+
+        # g changes, and so does f which calls g
+        third = load(tmp_path, "kernels_3", n=4)
+        assert (cache.hits, cache.misses) == (4, 5)
+        assert third.f(3) == 18
+
+        for entry in (tmp_path / "cache").iterdir():
+            entry.write_bytes(b"corrupted")
+        fourth = load(tmp_path, "kernels_4")
+        assert (cache.hits, cache.misses) == (4, 8)
+        assert fourth.f(3) == 15
+    finally:
+        set_compile_cache(None)
+
+
+def test_content_cache():
+    from kirin.prelude import basic
+
+    @basic
+    def g(x: int) -> int:  # type: ignore
+        return x + 1
+
+    def make_kernel(n: int):
+        @basic(typeinfer=True)
+        def kernel(x: int):
+            return g(x) * n
+
+        return kernel
+
+    cache = ContentCache()
+    set_content_cache(cache)
+    try:
+        first, second, third = make_kernel(2), make_kernel(2), make_kernel(3)
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert second.code is not first.code
+        assert second.print_str() == first.print_str()
+        assert second.inferred
+        assert (second(1), third(1)) == (4, 6)
+
+        @basic
+        def g(x: int) -> int:  # noqa: F811
+            return x + 2
+
+        # the cached code was compiled against the old `g`
+        fourth = make_kernel(2)
+        assert cache.hits == 1
+        assert fourth(1) == 6
+    finally:
+        set_content_cache(None)
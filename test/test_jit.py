@@ -0,0 +1,128 @@
+import pytest
+
+from kirin import ir
+from kirin.jit import JIT, set_jit
+from kirin.prelude import basic
+from kirin.dialects import py
+
+
+@pytest.fixture
+def jit():
+    jit = JIT(threshold=2)
+    set_jit(jit)
+    try:
+        yield jit
+    finally:
+        set_jit(None)
+
+
+def test_threshold(jit: JIT):
+    @basic(typeinfer=True)
+    def hot(n: int):
+        x = 0
+        for i in range(n):
+            x = x + i
+        return x
+
+    for _ in range(jit.threshold):
+        assert hot(10) == 45
+        assert hot._jit.function is None
+    assert hot(10) == 45
+    function = hot._jit.function
+    assert function is not None
+    assert hot(5) == 10
+    assert hot._jit.function is function
+    # keyword arguments are interpreted
+    assert hot(n=4) == 6
+
+
+def test_fallback(jit: JIT):
+    @basic(typeinfer=True)
+    def cold(x: int):
+        def inner(y: int):
+            return x + y
+
+        return inner(1)
+
+    for _ in range(jit.threshold + 2):
+        assert cold(1) == 2
+    assert cold._jit.compiled and cold._jit.function is None
+
+
+def test_invalidate_on_rewrite(jit: JIT):
+    @basic
+    def changed(x: int):
+        return x + 1
+
+    for _ in range(jit.threshold + 1):
+        assert changed(1) == 2
+    entry = changed._jit
+    assert entry.function is not None
+
+    const = next(
+        stmt for stmt in changed.callable_region.walk() if isinstance(stmt, py.Constant)
+    )
+    const.replace_by(py.Constant(2))
+    assert changed(1) == 3
+    assert changed._jit is not entry
+
+
+def test_invalidate_on_version(jit: JIT):
+    @basic
+    def bumped(x: int):
+        return x * 2
+
+    for _ in range(jit.threshold + 1):
+        bumped(1)
+    entry = bumped._jit
+    assert entry.compiled
+    bumped.version += 1
+    assert bumped(2) == 4
+    assert bumped._jit is not entry and not bumped._jit.compiled
+
+    JIT.invalidate(bumped)
+    assert bumped._jit is None
+
+
+def test_disabled():
+    @basic
+    def plain(x: int):
+        return x - 1
+
+    for _ in range(5):
+        assert plain(1) == 0
+    assert plain._jit is None
+
+
+def test_code_replaced(jit: JIT):
+    @basic
+    def replaced(x: int):
+        return x + 1
+
+    @basic
+    def other(x: int):
+        return x + 10
+
+    for _ in range(jit.threshold + 1):
+        replaced(1)
+    assert replaced._jit.function is not None
+    replaced.code = other.code
+    assert replaced(1) == 11
+
+
+def test_invalidate_on_attribute(jit: JIT):
+    @basic
+    def attribute(n: int):
+        return n + 5
+
+    for _ in range(jit.threshold + 1):
+        assert attribute(1) == 6
+    assert attribute._jit.function is not None
+
+    const = next(
+        stmt
+        for stmt in attribute.callable_region.walk()
+        if isinstance(stmt, py.Constant)
+    )
+    const.attributes["value"] = ir.PyAttr(10)
+    assert attribute(1) == 11
@@ -0,0 +1,42 @@
+import pytest
+
+from kirin.worklist import WorkList
+
+
+def test_fifo():
+    worklist: WorkList[int] = WorkList()
+    worklist.extend([1, 2, 3])
+    worklist.append(4)
+    assert len(worklist) == 4
+    assert [worklist.pop() for _ in range(4)] == [1, 2, 3, 4]
+    assert worklist.pop() is None
+    assert not worklist
+
+
+def test_lifo():
+    worklist: WorkList[int] = WorkList(policy="lifo")
+    worklist.extend([1, 2, 3])
+    assert [worklist.pop() for _ in range(3)] == [3, 2, 1]
+    assert worklist.pop() is None
+
+
+def test_priority():
+    worklist: WorkList[str] = WorkList(policy="priority", priority=len)
+    worklist.extend(["ccc", "a", "bb", "d"])
+    assert 4 == len(worklist)
+    assert [worklist.pop() for _ in range(4)] == ["a", "d", "bb", "ccc"]
+    assert worklist.pop() is None
+
+    with pytest.raises(ValueError):
+        WorkList(policy="priority")
+
+
+def test_unique():
+    worklist: WorkList[int] = WorkList(unique=True)
+    worklist.extend([1, 2, 1, 3, 2])
+    assert len(worklist) == 3
+    assert 1 in worklist
+    assert worklist.pop() == 1
+    assert 1 not in worklist
+    worklist.append(1)
+    assert [worklist.pop() for _ in range(3)] == [2, 3, 1]
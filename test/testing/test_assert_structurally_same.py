@@ -1,7 +1,8 @@
 import pytest
 
-from kirin.testing import assert_structurally_same
+from kirin import ir, types
 from kirin.prelude import structural_no_opt
+from kirin.testing import assert_structurally_same
 from kirin.dialects import py, func
 
 
@@ -97,3 +98,19 @@ def test_wrong_statement_raises_assertion_error(simple_example):
     ]
     with pytest.raises(AssertionError):
         assert_structurally_same(main, expected_statements)
+
+
+def test_block_argument_fails():
+    @structural_no_opt
+    def add_one(x: int):
+        return x + 1
+
+    # same structure as the method, but block arguments are not compared
+    arg = ir.Block().args.append_from(types.Int, "x")
+    expected_statements = [
+        one := py.Constant(1),
+        z := py.Add(arg, one.result),
+        func.Return(z.result),
+    ]
+    with pytest.raises(AssertionError):
+        assert_structurally_same(add_one, expected_statements)
@@ -0,0 +1,157 @@
+import pytest
+
+from kirin import ir, types
+from kirin.decl import statement
+from kirin.passes import Default
+from kirin.prelude import basic_no_opt
+from kirin.dialects import py, scf, func
+
+dialect = ir.Dialect("incremental")
+
+
+@statement(dialect=dialect)
+class Checked(ir.Statement):
+    valid = True
+    checked = 0
+
+    def check(self):
+        Checked.checked += 1
+        if not Checked.valid:
+            raise ValueError("invalid statement")
+
+
+@statement(dialect=dialect)
+class Legacy(ir.Statement):
+    valid = True
+
+    def verify(self):
+        if not Legacy.valid:
+            raise ir.ValidationError(self, "invalid statement")
+        super().verify()
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    Checked.valid = True
+    Checked.checked = 0
+    Legacy.valid = True
+
+
+@basic_no_opt
+def callee(x: int) -> int:
+    return x
+
+
+@basic_no_opt
+def main(x: int):
+    y = x + 1
+    z = y * 2
+    return callee(z)
+
+
+def stmts(method: ir.Method) -> list[ir.Statement]:
+    return list(method.callable_region.blocks[0].stmts)
+
+
+def test_invalid_change():
+    method = main.similar()
+    method.verify(incremental=True)
+    invoke = next(stmt for stmt in stmts(method) if isinstance(stmt, func.Invoke))
+    invoke.args = (*invoke.args, invoke.args[0])
+    with pytest.raises(ir.ValidationError):
+        method.verify(incremental=True)
+
+    # the dirty statement is verified again until it is fixed
+    with pytest.raises(ir.ValidationError):
+        method.verify(incremental=True)
+    invoke.args = invoke.args[:1]
+    method.verify(incremental=True)
+
+
+def test_only_dirty_nodes():
+    method = main.similar()
+    block = method.callable_region.blocks[0]
+    for _ in range(10):
+        Checked().insert_before(block.last_stmt)  # type: ignore
+
+    method.verify(incremental=True)
+    assert Checked.checked == 10
+
+    Checked.checked = 0
+    method.verify(incremental=True)
+    assert Checked.checked == 0
+
+    Checked().insert_before(block.last_stmt)  # type: ignore
+    method.verify(incremental=True)
+    assert Checked.checked == 1
+
+    Checked.checked = 0
+    first = next(stmt for stmt in stmts(method) if isinstance(stmt, Checked))
+    first.delete()
+    method.verify(incremental=True)
+    assert Checked.checked == 0
+
+
+def test_full_every():
+    method = main.similar()
+    block = method.callable_region.blocks[0]
+    Checked().insert_before(block.last_stmt)  # type: ignore
+    method.verify(incremental=True, full_every=2)
+
+    # not tracked, only caught by a full verification
+    Checked.valid = False
+    method.verify(incremental=True, full_every=2)
+    method.verify(incremental=True, full_every=2)
+    with pytest.raises(ir.ValidationError):
+        method.verify(incremental=True, full_every=2)
+    with pytest.raises(ir.ValidationError):
+        method.verify()
+
+
+def test_new_region():
+    method = main.similar()
+    method.verify(incremental=True)
+
+    body = ir.Region(ir.Block())
+    body.blocks[0].args.append_from(types.Any)
+    body.blocks[0].stmts.append(Checked())
+    iterable = py.Constant(range(3))
+    iterable.insert_before(stmts(method)[0])
+    scf.For(iterable.result, body).insert_after(iterable)
+    with pytest.raises(ir.ValidationError):
+        method.verify(incremental=True)  # no terminator in the body
+
+    Checked.checked = 0
+    body.blocks[0].stmts.append(scf.Yield())
+    method.verify(incremental=True)
+    assert Checked.checked == 1
+
+
+def test_replaced_code():
+    method = main.similar()
+    method.verify(incremental=True)
+    method.code = main.similar().code
+    Checked.valid = False
+    Checked().insert_before(method.callable_region.blocks[0].last_stmt)  # type: ignore
+    with pytest.raises(ir.ValidationError):
+        method.verify(incremental=True)
+
+
+def test_pass():
+    method = main.similar()
+    Default(method.dialects, incremental_verify=True, full_verify_every=4)(method)
+    assert method(1) == 4
+
+
+def test_verify_override():
+    method = main.similar()
+    legacy = Legacy()
+    legacy.insert_before(method.callable_region.blocks[0].last_stmt)  # type: ignore
+    method.verify(incremental=True)
+
+    Legacy.valid = False
+    legacy.args = ()  # only the statement itself is dirty
+    with pytest.raises(ir.ValidationError, match="invalid statement"):
+        method.verify(incremental=True)
+    with pytest.raises(ir.ValidationError, match="invalid statement"):
+        method.verify()